@@ -30,6 +30,7 @@ from flexget.terminal import capture_console
 from flexget.utils import json, requests
 from flexget.utils.lazy_dict import LazyLookup
 from flexget.utils.requests import parse_header
+from flexget.utils.serialization import DeferredValue
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -613,7 +614,14 @@ def finish_task(task):
             update_stream(task, status='complete')
 
         if task.stream['args'].get('entry_dump'):
-            entries = [entry.store for entry in task.entries]
+            # Entries loaded from the db hold fields which are not deserialized yet
+            entries = [
+                {
+                    k: entry[k] if isinstance(v, DeferredValue) else v
+                    for k, v in entry.store.items()
+                }
+                for entry in task.entries
+            ]
             task.stream['queue'].put(
                 EntryDecoder().encode({'entry_dump': entries, 'task_id': task.id})
             )
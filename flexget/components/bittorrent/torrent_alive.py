@@ -1,8 +1,8 @@
 import binascii
-import itertools
 import socket
 import struct
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from http.client import BadStatusLine
 from random import randrange
 from urllib.error import URLError
@@ -15,44 +15,16 @@ from flexget import plugin
 from flexget.event import event
 from flexget.utils import requests
 from flexget.utils.bittorrent import bdecode
+from flexget.utils.tools import TimedDict
 
 logger = logger.bind(name='torrent_alive')
 
-
-class TorrentAliveThread(threading.Thread):
-    _counter = itertools.count()
-
-    def __init__(self, tracker, info_hash):
-        threading.Thread.__init__(self, name=f'torrent_alive-{next(self._counter)}')
-        self.tracker = tracker
-        self.info_hash = info_hash
-        self.tracker_seeds = 0
-
-    def run(self):
-        self.tracker_seeds = get_tracker_seeds(self.tracker, self.info_hash)
-        logger.debug(
-            '{} seeds found from {}',
-            self.tracker_seeds,
-            get_scrape_url(self.tracker, self.info_hash),
-        )
-
-
-def max_seeds_from_threads(threads):
-    """Join the threads and return the maximum seeds found from any of them.
-
-    :param threads: A list of started `TorrentAliveThread`
-    :return: Maximum seeds found from any of the threads
-    """
-    seeds = 0
-    for background in threads:
-        logger.debug('Coming up next: {}', background.tracker)
-        background.join()
-        seeds = max(seeds, background.tracker_seeds)
-        logger.debug('Current highest number of seeds found: {}', seeds)
-    return seeds
+# Most trackers limit how many info hashes one scrape may ask for, UDP fits 74 in a packet
+SCRAPE_BATCH_SIZE = 50
 
 
 def get_scrape_url(tracker_url, info_hash):
+    """Return the scrape url for `info_hash`, which may also be a list of info hashes."""
     if 'announce' in tracker_url:
         v = urlsplit(tracker_url)
         result = urlunsplit([
@@ -66,18 +38,24 @@ def get_scrape_url(tracker_url, info_hash):
         logger.debug('`announce` not contained in tracker url, guessing scrape address.')
         result = tracker_url + '/scrape'
 
+    if isinstance(info_hash, str):
+        info_hash = [info_hash]
     result += '&' if '?' in result else '?'
-    result += f'info_hash={quote(binascii.unhexlify(info_hash))}'
+    result += '&'.join(f'info_hash={quote(binascii.unhexlify(h))}' for h in info_hash)
     return result
 
 
-def get_udp_seeds(url, info_hash):
+def get_udp_seeds_many(url, info_hashes):
+    """Scrape seeds for several info hashes with a single UDP scrape request.
+
+    :return: Dict mapping upper case info hash to seeds for the hashes the tracker answered.
+    """
     try:
         parsed_url = urlparse(url)
         port = parsed_url.port
     except ValueError:
         logger.error('UDP Port Error, url was {}', url)
-        return 0
+        return {}
 
     logger.debug('Checking for seeds from {}', url)
 
@@ -86,88 +64,215 @@ def get_udp_seeds(url, info_hash):
 
     if port is None:
         logger.error('UDP Port Error, port was None')
-        return 0
+        return {}
 
     if port < 0 or port > 65535:
         logger.error('UDP Port Error, port was {}', port)
-        return 0
+        return {}
 
     # Create the socket
     try:
-        clisocket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        clisocket.settimeout(5.0)
-        clisocket.connect((parsed_url.hostname, port))
-
-        # build packet with connection_ID, using 0 value for action, giving our transaction ID for this packet
-        packet = struct.pack(b'>QLL', connection_id, 0, transaction_id)
-        clisocket.send(packet)
-
-        # set 16 bytes ["QLL" = 16 bytes] for the fmq for unpack
-        res = clisocket.recv(16)
-        # check recieved packet for response
-        action, transaction_id, connection_id = struct.unpack(b'>LLQ', res)
-
-        # build packet hash out of decoded info_hash
-        packet_hash = binascii.unhexlify(info_hash)
-
-        # construct packet for scrape with decoded info_hash setting action byte to 2 for scape
-        packet = struct.pack(b'>QLL', connection_id, 2, transaction_id) + packet_hash
-
-        clisocket.send(packet)
-        # set recieve size of 8 + 12 bytes
-        res = clisocket.recv(20)
-
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as clisocket:
+            clisocket.settimeout(5.0)
+            clisocket.connect((parsed_url.hostname, port))
+
+            # build packet with connection_ID, using 0 value for action, giving our transaction ID for this packet
+            packet = struct.pack(b'>QLL', connection_id, 0, transaction_id)
+            clisocket.send(packet)
+
+            # set 16 bytes ["QLL" = 16 bytes] for the fmq for unpack
+            res = clisocket.recv(16)
+            # check recieved packet for response
+            action, transaction_id, connection_id = struct.unpack(b'>LLQ', res)
+
+            # construct packet for scrape with decoded info_hashes setting action byte to 2 for scape
+            packet = struct.pack(b'>QLL', connection_id, 2, transaction_id)
+            packet += b''.join(binascii.unhexlify(info_hash) for info_hash in info_hashes)
+
+            clisocket.send(packet)
+            # receive 8 bytes header + 12 bytes for each requested torrent
+            res = clisocket.recv(8 + 12 * len(info_hashes))
     except OSError as e:
         logger.warning('Socket Error: {}', e)
-        return 0
+        return {}
     # Check for UDP error packet
     (action,) = struct.unpack(b'>L', res[:4])
     if action == 3:
         logger.error('There was a UDP Packet Error 3')
-        return 0
+        return {}
+
+    # first 8 bytes are followed by seeders, completed and leechers for each requested torrent
+    result = {}
+    for index, info_hash in enumerate(info_hashes):
+        offset = 8 + 12 * index
+        if len(res) < offset + 12:
+            break
+        seeders, _, _ = struct.unpack(b'>LLL', res[offset : offset + 12])
+        result[info_hash.upper()] = seeders
+    logger.debug('get_udp_seeds_many is returning: {}', result)
+    return result
 
-    # first 8 bytes are followed by seeders, completed and leechers for requested torrent
-    seeders, _, _ = struct.unpack(b'>LLL', res[8:20])
-    logger.debug('get_udp_seeds is returning: {}', seeders)
-    clisocket.close()
-    return seeders
 
+def get_udp_seeds(url, info_hash):
+    return get_udp_seeds_many(url, [info_hash]).get(info_hash.upper(), 0)
 
-def get_http_seeds(url, info_hash):
-    url = get_scrape_url(url, info_hash)
+
+def get_http_seeds_many(url, info_hashes):
+    """Scrape seeds for several info hashes with a single HTTP scrape request.
+
+    :return: Dict mapping upper case info hash to seeds for the hashes the tracker answered.
+    """
+    url = get_scrape_url(url, info_hashes)
     if not url:
         logger.debug('if not url is true returning 0')
-        return 0
+        return {}
     logger.debug('Checking for seeds from {}', url)
 
     try:
         data = bdecode(requests.get(url).content).get('files')
     except RequestException as e:
         logger.debug('Error scraping: {}', e)
-        return 0
+        return {}
     except SyntaxError as e:
         logger.warning('Error decoding tracker response: {}', e)
-        return 0
+        return {}
     except BadStatusLine as e:
         logger.warning('Error BadStatusLine: {}', e)
-        return 0
+        return {}
     except OSError as e:
         logger.warning('Server error: {}', e)
-        return 0
+        return {}
     if not data:
         logger.debug('No data received from tracker scrape.')
-        return 0
-    logger.debug('get_http_seeds is returning: {}', next(iter(data.values()))['complete'])
-    return next(iter(data.values()))['complete']
+        return {}
+
+    result = {}
+    for key, stats in data.items():
+        if not isinstance(stats, dict) or 'complete' not in stats:
+            continue
+        # Binary keys come back from the decoder as bytes, unless they happen to be valid utf-8
+        raw = key.encode('utf-8') if isinstance(key, str) else bytes(key)
+        if len(raw) == 20:
+            result[binascii.hexlify(raw).decode().upper()] = stats['complete']
+        elif len(info_hashes) == 1:
+            # Some trackers mangle the key, with a single request we still know whose stats these are
+            result[info_hashes[0].upper()] = stats['complete']
+    logger.debug('get_http_seeds_many is returning: {}', result)
+    return result
 
 
-def get_tracker_seeds(url, info_hash):
+def get_http_seeds(url, info_hash):
+    return get_http_seeds_many(url, [info_hash]).get(info_hash.upper(), 0)
+
+
+def get_tracker_seeds_many(url, info_hashes):
     if url.startswith('udp'):
-        return get_udp_seeds(url, info_hash)
+        return get_udp_seeds_many(url, info_hashes)
     if url.startswith('http'):
-        return get_http_seeds(url, info_hash)
+        return get_http_seeds_many(url, info_hashes)
     logger.warning('There is a problem with the get_tracker_seeds')
-    return 0
+    return {}
+
+
+def get_tracker_seeds(url, info_hash):
+    return get_tracker_seeds_many(url, [info_hash]).get(info_hash.upper(), 0)
+
+
+class TrackerScraper:
+    """Scrapes trackers concurrently from a bounded pool shared by all tasks.
+
+    Info hashes going to the same tracker are asked for in batches. Results are cached for a
+    short while, so reruns triggered by rejected torrents don't scrape the same trackers again.
+    """
+
+    def __init__(self, max_workers=10, cache_time='5 minutes', single_only_time='1 hour'):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        # {(tracker, info_hash): seeds}
+        self._cache = TimedDict(cache_time)
+        # Trackers which didn't answer batched scrapes get one request per info hash for a while
+        self._single_only = TimedDict(single_only_time)
+
+    @property
+    def executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='torrent_alive'
+                )
+            return self._executor
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def clear(self):
+        self._cache.clear()
+        self._single_only.clear()
+
+    def _scrape(self, tracker, info_hashes):
+        try:
+            if len(info_hashes) > 1 and tracker not in self._single_only:
+                result = get_tracker_seeds_many(tracker, info_hashes)
+                if result:
+                    return result
+                logger.debug('{} did not answer batched scrape, asking one by one', tracker)
+                self._single_only[tracker] = True
+            result = {}
+            for info_hash in info_hashes:
+                result.update(get_tracker_seeds_many(tracker, [info_hash]))
+        except URLError as e:
+            logger.debug('Error scraping {}: {}', tracker, e)
+            return {}
+        except Exception as e:
+            # A broken tracker only loses its own count
+            logger.warning('Error scraping {}: {}', tracker, e)
+            return {}
+        return result
+
+    def scrape(self, torrents):
+        """Find the highest number of seeds reported for each torrent.
+
+        :param torrents: Dict mapping info hash to a list of tracker urls.
+        :return: Dict mapping info hash to highest number of seeds found.
+        """
+        seeds = dict.fromkeys(torrents, 0)
+        pending = {}
+        for info_hash, trackers in torrents.items():
+            for tracker in trackers:
+                key = (tracker, info_hash.upper())
+                if key in self._cache:
+                    seeds[info_hash] = max(seeds[info_hash], self._cache[key])
+                else:
+                    pending.setdefault(tracker, set()).add(info_hash.upper())
+
+        jobs = []
+        for tracker, info_hashes in pending.items():
+            info_hashes = sorted(info_hashes)
+            for i in range(0, len(info_hashes), SCRAPE_BATCH_SIZE):
+                chunk = info_hashes[i : i + SCRAPE_BATCH_SIZE]
+                logger.debug('Scraping {} for {} torrent(s)', tracker, len(chunk))
+                jobs.append((tracker, chunk, self.executor.submit(self._scrape, tracker, chunk)))
+
+        found = {}
+        for tracker, chunk, future in jobs:
+            result = future.result()
+            for info_hash in chunk:
+                tracker_seeds = result.get(info_hash, 0)
+                found[info_hash] = max(found.get(info_hash, 0), tracker_seeds)
+                # Only trackers which answered are remembered, torrents they don't know count as
+                # no seeds. Trackers which failed are asked again next time.
+                if result:
+                    self._cache[(tracker, info_hash)] = tracker_seeds
+        for info_hash, cached in seeds.items():
+            seeds[info_hash] = max(cached, found.get(info_hash.upper(), 0))
+        return seeds
+
+
+scraper = TrackerScraper()
 
 
 class TorrentAlive:
@@ -216,6 +321,7 @@ class TorrentAlive:
         config = self.prepare_config(config)
         min_seeds = config['min_seeds']
 
+        checked = []
         for entry in task.accepted:
             # If torrent_seeds is filled, we will have already filtered in filter phase
             if entry.get('torrent_seeds'):
@@ -223,58 +329,42 @@ class TorrentAlive:
                     'Not checking trackers for seeds, as torrent_seeds is already filled.'
                 )
                 continue
-            logger.debug('Checking for seeds for {}:', entry['title'])
             torrent = entry.get('torrent')
-            if torrent:
-                logger.debug('started examining torrent: {}', torrent)
-                seeds = 0
-                info_hash = torrent.info_hash
-                announce_list = torrent.content.get('announce-list')
-                if announce_list:
-                    # Multitracker torrent
-                    threadlist = []
-                    for tier in announce_list:
-                        for tracker in tier:
-                            background = TorrentAliveThread(tracker, info_hash)
-                            try:
-                                background.start()
-                                threadlist.append(background)
-                            except threading.ThreadError:
-                                # If we can't start a new thread, wait for current ones to complete and continue
-                                logger.debug('Reached max threads, finishing current threads.')
-                                seeds = max(seeds, max_seeds_from_threads(threadlist))
-                                background.start()
-                                threadlist = [background]
-                            logger.debug(
-                                'Started thread to scrape {} with info hash {}', tracker, info_hash
-                            )
-
-                    seeds = max(seeds, max_seeds_from_threads(threadlist))
-                    logger.debug('Highest number of seeds found: {}', seeds)
-                elif torrent.content.get('announce'):
-                    # Single tracker
-                    tracker = torrent.content['announce']
-                    try:
-                        seeds = get_tracker_seeds(tracker, info_hash)
-                    except URLError as e:
-                        logger.debug('Error scraping {}: {}', tracker, e)
-                else:
-                    logger.warning(
-                        'Torrent {} does not seem to have a tracker specified, cannot check for seeders',
-                        entry['title'],
-                    )
-                    return
+            if not torrent:
+                continue
+            logger.debug('Checking for seeds for {}: {}', entry['title'], torrent)
+            trackers = [tracker for tracker in torrent.trackers if tracker]
+            if not trackers:
+                logger.warning(
+                    'Torrent {} does not seem to have a tracker specified, cannot check for seeders',
+                    entry['title'],
+                )
+                continue
+            checked.append((entry, torrent.info_hash, trackers))
 
-                # Reject if needed
-                if seeds < min_seeds:
-                    entry.reject(
-                        reason=f'Tracker(s) had < {min_seeds} required seeds. ({seeds})',
-                        remember_time=config['reject_for'],
-                    )
-                    # Maybe there is better match that has enough seeds
-                    task.rerun(plugin='torrent_alive', reason='Not enough seeds')
-                else:
-                    logger.debug('Found {} seeds from trackers', seeds)
+        if not checked:
+            return
+        torrents = {}
+        for _, info_hash, trackers in checked:
+            torrents.setdefault(info_hash, []).extend(trackers)
+        seeds_found = scraper.scrape(torrents)
+
+        for entry, info_hash, _ in checked:
+            seeds = seeds_found[info_hash]
+            logger.debug('Highest number of seeds found for {}: {}', entry['title'], seeds)
+            # Reject if needed
+            if seeds < min_seeds:
+                entry.reject(
+                    reason=f'Tracker(s) had < {min_seeds} required seeds. ({seeds})',
+                    remember_time=config['reject_for'],
+                )
+                # Maybe there is better match that has enough seeds
+                task.rerun(plugin='torrent_alive', reason='Not enough seeds', delta=True)
+
+
+@event('manager.shutdown')
+def shutdown(manager):
+    scraper.shutdown()
 
 
 @event('plugin.register')
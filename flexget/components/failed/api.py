@@ -12,6 +12,7 @@ from flexget.api.app import (
     pagination_headers,
     success_response,
 )
+from flexget.utils.database import read_only
 
 from . import db
 
@@ -51,6 +52,7 @@ failed_parser = api.pagination_parser(sort_choices=sort_choices)
 
 @retry_failed_api.route('/')
 class RetryFailed(APIResource):
+    @read_only
     @etag
     @api.response(NotFoundError)
     @api.response(200, model=retry_entries_list_schema)
@@ -124,6 +126,7 @@ class RetryFailed(APIResource):
 @retry_failed_api.route('/<int:failed_entry_id>/')
 @api.response(NotFoundError)
 class RetryFailedID(APIResource):
+    @read_only
     @etag
     @api.doc(params={'failed_entry_id': 'ID of the failed entry'})
     @api.response(200, model=retry_failed_entry_schema)
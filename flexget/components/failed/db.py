@@ -6,7 +6,7 @@ from sqlalchemy.schema import Index
 
 from flexget import db_schema
 from flexget.event import event
-from flexget.utils.sqlalchemy_utils import table_add_column
+from flexget.utils.sqlalchemy_utils import delete_in_chunks, table_add_column
 
 SCHEMA_VER = 3
 FAIL_LIMIT = 100
@@ -68,9 +68,10 @@ Index('failed_title_url', columns.title, columns.url, columns.count)
 @event('manager.db_cleanup')
 def db_cleanup(manager, session):
     # Delete everything older than 30 days
-    session.query(FailedEntry).filter(
-        FailedEntry.tof < datetime.now() - timedelta(days=30)
-    ).delete()
+    delete_in_chunks(
+        session,
+        session.query(FailedEntry).filter(FailedEntry.tof < datetime.now() - timedelta(days=30)),
+    )
     # Of the remaining, always keep latest 25. Drop any after that if fail was more than a week ago.
     keep_num = 25
     keep_ids = [
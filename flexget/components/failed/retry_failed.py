@@ -109,7 +109,7 @@ class PluginFailed:
                 plugin.get('backlog', self).add_backlog(
                     entry.task, entry, amount=retry_time, session=session
                 )
-            entry.task.rerun(plugin='retry_failed')
+            entry.task.rerun(plugin='retry_failed', delta=True)
 
     @plugin.priority(plugin.PRIORITY_FIRST)
     def on_task_filter(self, task, config):
@@ -6,6 +6,7 @@ from sqlalchemy import asc, desc
 
 from flexget.api import APIResource, api
 from flexget.api.app import BadRequest, NotFoundError, etag, pagination_headers
+from flexget.utils.database import read_only
 
 from . import db
 
@@ -45,6 +46,7 @@ history_parser.add_argument('task', help='Filter by task name')
 @history_api.route('/')
 @api.doc(expect=[history_parser])
 class HistoryAPI(APIResource):
+    @read_only
     @etag
     @api.response(NotFoundError)
     @api.response(200, model=history_list_schema)
@@ -2,14 +2,14 @@ from sqlalchemy import desc
 
 from flexget import options
 from flexget.event import event
-from flexget.manager import Session
+from flexget.manager import ReadSession
 from flexget.terminal import TerminalTable, console, table_parser
 
 from . import db
 
 
 def do_cli(manager, options):
-    with Session() as session:
+    with ReadSession() as session:
         query = session.query(db.History)
         if options.search:
             search_term = options.search.replace(' ', '%').replace('.', '%')
@@ -5,6 +5,7 @@ from sqlalchemy import Column, DateTime, Integer, String, Unicode
 
 from flexget.event import event
 from flexget.manager import Base
+from flexget.utils.sqlalchemy_utils import delete_in_chunks
 
 logger = logger.bind(name='history.db')
 
@@ -41,8 +42,8 @@ class History(Base):
 @event('manager.db_cleanup')
 def db_cleanup(manager, session):
     # Purge task executions older than 1 year
-    result = (
-        session.query(History).filter(History.time < datetime.now() - timedelta(days=365)).delete()
+    result = delete_in_chunks(
+        session, session.query(History).filter(History.time < datetime.now() - timedelta(days=365))
     )
     if result:
         logger.verbose('Removed {} accepted entries from history older than 1 year', result)
@@ -14,6 +14,7 @@ from flexget.config_schema import one_or_more, register_config_key
 from flexget.entry import Entry
 from flexget.event import event
 from flexget.manager import manager
+from flexget.task import Task
 from flexget.utils import requests
 from flexget.utils.tools import get_config_hash
 
@@ -26,6 +27,9 @@ except ImportError:
 
 logger = logger.bind(name='irc')
 
+# Warm tasks are closed and started again after this long, which runs their exit phase
+WARM_TASK_LIFETIME = timedelta(hours=1)
+
 MESSAGE_CLEAN = re.compile(r'\x0f|\x1f|\x02|\x03(?:[\d]{1,2}(?:,[\d]{1,2})?)?', re.MULTILINE)
 URL_MATCHER = re.compile(r'(https?://[\da-z\.-]+\.[a-z\.]{2,6}[/\w\.-\?&]*/?)', re.MULTILINE)
 
@@ -77,6 +81,7 @@ schema = {
                     'queue_size': {'type': 'integer', 'default': 1},
                     'use_ssl': {'type': 'boolean', 'default': False},
                     'task_delay': {'type': 'integer'},
+                    'warm_tasks': {'type': 'boolean', 'default': False},
                 },
                 'allOf': [
                     {
@@ -152,15 +157,76 @@ class MissingConfigOption(Exception):
     """Exception thrown when a config option specified in the tracker file is not on the irc config."""
 
 
+class WarmTask(Task):
+    """A task kept open between batches of announced entries.
+
+    Its start and prepare phases run once, every batch is injected and runs through the phases
+    from input to learn, without building a new task. The exit phase runs when the task is closed,
+    after `WARM_TASK_LIFETIME` or when the config or the connection changes.
+    """
+
+    def __init__(self, manager, name):
+        super().__init__(
+            manager,
+            name,
+            options={'tasks': [name], 'cron': True, 'allow_manual': True},
+            priority=5,
+            suppress_warnings=['input'],
+        )
+        self.keep_open = True
+        self.expires = datetime.now() + WARM_TASK_LIFETIME
+        self._lock = threading.Lock()
+        self._pending = []
+        self._queued = False
+        self._closing = False
+
+    @property
+    def expired(self):
+        return self.aborted or self._closing or datetime.now() > self.expires
+
+    def push(self, entries):
+        """Queue entries to be run through the task."""
+        self._enqueue(entries)
+
+    def close_later(self):
+        """Close the task from the task queue, once entries pushed before have run."""
+        self._enqueue(closing=True)
+
+    def _enqueue(self, entries=(), closing=False):
+        with self._lock:
+            self._pending.extend(entries)
+            self._closing = self._closing or closing
+            if self._queued:
+                return
+            self._queued = True
+        self.manager.task_queue.put(self)
+
+    def execute(self):
+        # Called by the task queue, runs everything pushed since it was queued
+        with self._lock:
+            entries, self._pending = self._pending, []
+            closing = self._closing
+            self._queued = False
+        if entries:
+            self.options.inject = entries
+            super().execute()
+        if closing:
+            self.close()
+
+
 class IRCConnection(SimpleIRCBot):
-    def __init__(self, config, config_name):
+    def __init__(self, config, config_name, task_manager=None):
         self.config = config
+        # Runs the tasks announced entries are injected into
+        self.task_manager = task_manager or manager
         self.connection_name = config_name
         self.tracker_config = None
         self.server_list = []
         self.announcer_list = []
         self.ignore_lines = []
         self.message_regex = []
+        self.multilinepatterns = []
+        self.linepatterns = []
 
         # If we have a tracker config file, load it
         tracker_config_file = config.get('tracker_file')
@@ -250,6 +316,7 @@ class IRCConnection(SimpleIRCBot):
 
         self.inject_before_shutdown = False
         self.entry_queue = []
+        self.warm_tasks = {}
         self.line_cache = {}
         self.processing_message = (
             False  # if set to True, it means there's a message processing queued
@@ -382,6 +449,7 @@ class IRCConnection(SimpleIRCBot):
         """
         if self.inject_before_shutdown and self.entry_queue:
             self.run_tasks()
+        self.close_warm_tasks()
         SimpleIRCBot.quit(self)
 
     def run_tasks(self):
@@ -397,13 +465,7 @@ class IRCConnection(SimpleIRCBot):
             logger.debug(
                 'Injecting {} entries into tasks {}', len(self.entry_queue), ', '.join(tasks)
             )
-            options = {
-                'tasks': tasks,
-                'cron': True,
-                'inject': self.entry_queue,
-                'allow_manual': True,
-            }
-            manager.execute(options=options, priority=5, suppress_warnings=['input'])
+            self.execute_tasks(tasks, self.entry_queue)
 
         if tasks_re:
             tasks_entry_map = {}
@@ -429,11 +491,41 @@ class IRCConnection(SimpleIRCBot):
 
             for task, entries in tasks_entry_map.items():
                 logger.debug('Injecting {} entries into task "{}"', len(entries), task)
-                options = {'tasks': [task], 'cron': True, 'inject': entries, 'allow_manual': True}
-                manager.execute(options=options, priority=5, suppress_warnings=['input'])
+                self.execute_tasks([task], entries)
 
         self.entry_queue = []
 
+    def execute_tasks(self, tasks, entries):
+        """Run entries through tasks, warm ones if enabled for this connection.
+
+        :param tasks: Task names, or patterns matching task names
+        :param entries: Entries to inject
+        """
+        if not self.config.get('warm_tasks'):
+            options = {'tasks': tasks, 'cron': True, 'inject': entries, 'allow_manual': True}
+            self.task_manager.execute(options=options, priority=5, suppress_warnings=['input'])
+            return
+        task_names = []
+        for task in tasks:
+            try:
+                task_names.extend(
+                    m for m in self.task_manager.matching_tasks(task) if m not in task_names
+                )
+            except ValueError as e:
+                logger.error(e)
+        for name in task_names:
+            task = self.warm_tasks.get(name)
+            if task is None or task.expired:
+                if task is not None:
+                    task.close_later()
+                task = self.warm_tasks[name] = WarmTask(self.task_manager, name)
+            task.push(entries)
+
+    def close_warm_tasks(self):
+        warm_tasks, self.warm_tasks = self.warm_tasks, {}
+        for task in warm_tasks.values():
+            task.close_later()
+
     def queue_entry(self, entry):
         """Store an entry in the connection entry queue, if the queue is over the size limit then submit them.
 
@@ -663,7 +755,10 @@ class IRCConnection(SimpleIRCBot):
         self.line_cache[channel].setdefault(nickname, [])
 
         self.line_cache[channel][nickname].append(msg.arguments[1])
-        if not self.processing_message:
+        if not self.multilinepatterns:
+            # Only multiline announcements need to wait for the rest of their lines
+            self.process_message(nickname, channel)
+        elif not self.processing_message:
             # Schedule a parse of the message in 1 second (for multilines)
             self.schedule.queue_command(1, partial(self.process_message, nickname, channel))
             self.processing_message = True
@@ -1026,6 +1121,10 @@ def irc_update_config(manager):
     if not manager.is_daemon:
         return
 
+    # Warm tasks keep the config they were started with, and need to see database changes
+    for connection in irc_connections.values():
+        connection.close_warm_tasks()
+
     config = manager.config.get('irc')
     # No config, no connections
     if not config:
@@ -50,7 +50,10 @@ class ListAdd:
                     )
                     continue
                 logger.verbose('adding accepted entries into {} - {}', plugin_name, plugin_config)
-                thelist |= task.accepted
+                if hasattr(thelist, 'add_many'):
+                    thelist.add_many(task.accepted)
+                else:
+                    thelist |= task.accepted
 
 
 @event('plugin.register')
@@ -41,8 +41,12 @@ class ListMatch:
                 except AttributeError:
                     raise PluginError(f'Plugin {plugin_name} does not support list interface')
                 already_accepted = []
-                for entry in task.entries:
-                    result = thelist.get(entry)
+                entries = list(task.entries)
+                if hasattr(thelist, 'get_many'):
+                    results = thelist.get_many(entries)
+                else:
+                    results = [thelist.get(entry) for entry in entries]
+                for entry, result in zip(entries, results, strict=True):
                     if not result:
                         continue
                     if config['action'] == 'accept':
@@ -77,7 +81,10 @@ class ListMatch:
                 logger.verbose(
                     'removing accepted entries from {} - {}', plugin_name, plugin_config
                 )
-                thelist -= task.accepted
+                if hasattr(thelist, 'discard_many'):
+                    thelist.discard_many(task.accepted)
+                else:
+                    thelist -= task.accepted
 
 
 @event('plugin.register')
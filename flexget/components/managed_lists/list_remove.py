@@ -43,7 +43,10 @@ class ListRemove:
                 logger.verbose(
                     'removing accepted entries from {} - {}', plugin_name, plugin_config
                 )
-                thelist -= task.accepted
+                if hasattr(thelist, 'discard_many'):
+                    thelist.discard_many(task.accepted)
+                else:
+                    thelist -= task.accepted
 
 
 @event('plugin.register')
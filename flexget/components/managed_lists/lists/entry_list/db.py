@@ -3,11 +3,22 @@ from collections.abc import MutableSet
 from datetime import datetime
 
 from loguru import logger
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Unicode, func, or_, select
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    Unicode,
+    func,
+    or_,
+    select,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.elements import and_
 
 from flexget import db_schema
+from flexget.components.managed_lists.lists.entry_lookup import StoredEntryLookup
 from flexget.db_schema import versioned_base
 from flexget.entry import Entry
 from flexget.manager import Session
@@ -16,7 +27,7 @@ from flexget.utils.database import entry_synonym, with_session
 from flexget.utils.sqlalchemy_utils import table_add_column, table_schema
 
 logger = logger.bind(name='entry_list.db')
-Base = versioned_base('entry_list', 2)
+Base = versioned_base('entry_list', 3)
 
 
 @db_schema.upgrade('entry_list')
@@ -54,6 +65,16 @@ def upgrade(ver, session):
                 table.update().where(table.c.id == row['id']).values(json=serialization.dumps(e))
             )
         ver = 2
+    if ver == 2:
+        table_add_column('entry_list_entries', 'blob', LargeBinary, session)
+        table = table_schema('entry_list_entries', session)
+        for row in session.execute(select(table.c.id, table.c.json)):
+            # Binary entries written to the json column move to their own one
+            if isinstance(row.json, bytes):
+                session.execute(
+                    table.update().where(table.c.id == row.id).values(json=None, blob=row.json)
+                )
+        ver = 3
     return ver
 
 
@@ -77,8 +98,10 @@ class EntryListEntry(Base):
     added = Column(DateTime, default=datetime.now)
     title = Column(Unicode)
     original_url = Column(Unicode)
+    # Older rows hold JSON text, newer ones binary data
     _json = Column('json', Unicode)
-    entry = entry_synonym('_json')
+    _blob = Column('blob', LargeBinary)
+    entry = entry_synonym('_json', binary_name='_blob')
 
     def __init__(self, entry, entry_list_id):
         self.title = entry['title']
@@ -107,24 +130,20 @@ class DBEntrySet(MutableSet):
     def __init__(self, config):
         self.config = config
         with Session() as session:
-            if not self._db_list(session):
-                session.add(EntryListList(name=self.config))
+            db_list = self._db_list(session)
+            if not db_list:
+                db_list = EntryListList(name=self.config)
+                session.add(db_list)
+                session.flush()
+            self._list_id = db_list.id
 
     def _entry_query(self, session, entry):
+        matches = [EntryListEntry.title == entry['title']]
+        if entry.get('original_url'):
+            matches.append(EntryListEntry.original_url == entry['original_url'])
         return (
             session.query(EntryListEntry)
-            .filter(
-                and_(
-                    EntryListEntry.list_id == self._db_list(session).id,
-                    or_(
-                        EntryListEntry.title == entry['title'],
-                        and_(
-                            EntryListEntry.original_url,
-                            EntryListEntry.original_url == entry['original_url'],
-                        ),
-                    ),
-                )
-            )
+            .filter(and_(EntryListEntry.list_id == self._list_id, or_(*matches)))
             .first()
         )
 
@@ -157,10 +176,52 @@ class DBEntrySet(MutableSet):
                 logger.debug('refreshing entry {}', entry)
                 stored_entry.entry = entry
             else:
-                logger.debug('adding entry {} to list {}', entry, self._db_list(session).name)
-                stored_entry = EntryListEntry(entry=entry, entry_list_id=self._db_list(session).id)
+                logger.debug('adding entry {} to list {}', entry, self.config)
+                stored_entry = EntryListEntry(entry=entry, entry_list_id=self._list_id)
             session.add(stored_entry)
 
+    def _lookup(self, session, entries):
+        """Find the stored entries matching any of `entries`, like :meth:`_entry_query` does for one."""
+        query = session.query(EntryListEntry).filter(EntryListEntry.list_id == self._list_id)
+        return StoredEntryLookup(query, EntryListEntry, entries)
+
+    def add_many(self, entries):
+        """Add or refresh all of `entries` in a single transaction."""
+        entries = list(entries)
+        with Session() as session:
+            lookup = self._lookup(session, entries)
+            for entry in entries:
+                stored_entry = lookup.match(entry)
+                if stored_entry:
+                    logger.debug('refreshing entry {}', entry)
+                    stored_entry.entry = entry
+                else:
+                    logger.debug('adding entry {} to list {}', entry, self.config)
+                    stored_entry = EntryListEntry(entry=entry, entry_list_id=self._list_id)
+                    session.add(stored_entry)
+                # Later entries of the batch match it like they would with single adds
+                lookup.remember(stored_entry)
+
+    def discard_many(self, entries):
+        """Remove all of `entries` in a single transaction."""
+        entries = list(entries)
+        with Session() as session:
+            lookup = self._lookup(session, entries)
+            deleted = set()
+            for entry in entries:
+                db_entry = lookup.match(entry)
+                if db_entry and db_entry.id not in deleted:
+                    deleted.add(db_entry.id)
+                    logger.debug('deleting entry {}', db_entry)
+                    session.delete(db_entry)
+
+    def contains_many(self, entries):
+        """Return whether each of `entries` is in the list, looking them all up at once."""
+        entries = list(entries)
+        with Session() as session:
+            lookup = self._lookup(session, entries)
+            return [lookup.match(entry) is not None for entry in entries]
+
     @property
     def immutable(self):
         return False
@@ -182,6 +243,17 @@ class DBEntrySet(MutableSet):
             match = self._entry_query(session=session, entry=entry)
             return Entry(match.entry) if match else None
 
+    def get_many(self, entries):
+        """Return what :meth:`get` would for each of `entries`, looking them all up at once."""
+        entries = list(entries)
+        with Session() as session:
+            lookup = self._lookup(session, entries)
+            results = []
+            for entry in entries:
+                match = lookup.match(entry)
+                results.append(Entry(match.entry) if match else None)
+            return results
+
 
 @with_session
 def get_entry_lists(name=None, session=None):
@@ -0,0 +1,40 @@
+"""Batch lookups of the entries stored by the database backed lists."""
+
+from flexget.utils.tools import chunked
+
+
+class StoredEntryLookup:
+    """Stored entries of a list matching any of a batch of entries.
+
+    An entry matches a stored one with the same title, or else one with the same original url if it
+    has one, like the single entry queries of the lists.
+
+    :param query: Query of the entries stored in the list.
+    :param model: Model of the stored entries, with `title` and `original_url` columns.
+    :param entries: Entries to look up.
+    """
+
+    def __init__(self, query, model, entries):
+        self.by_title = {}
+        self.by_url = {}
+        titles = {entry['title'] for entry in entries}
+        urls = {entry['original_url'] for entry in entries if entry.get('original_url')}
+        for chunk in chunked(list(titles)):
+            for db_entry in query.filter(model.title.in_(chunk)):
+                self.by_title.setdefault(db_entry.title, db_entry)
+        for chunk in chunked(list(urls)):
+            for db_entry in query.filter(model.original_url.in_(chunk)):
+                self.by_url.setdefault(db_entry.original_url, db_entry)
+
+    def match(self, entry):
+        """Return the stored entry matching `entry`, None if there is none."""
+        return self.by_title.get(entry['title']) or self.by_url.get(entry.get('original_url'))
+
+    def remember(self, db_entry):
+        """Let later entries of the batch match `db_entry`, which was just added or refreshed.
+
+        It is found by the title and url it is stored with, which refreshing does not change.
+        """
+        self.by_title.setdefault(db_entry.title, db_entry)
+        if db_entry.original_url:
+            self.by_url.setdefault(db_entry.original_url, db_entry)
@@ -2,6 +2,7 @@ from collections.abc import MutableSet
 
 from loguru import logger
 from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 from sqlalchemy.sql.elements import and_
 
 from flexget import plugin
@@ -52,7 +53,10 @@ class MovieList(MutableSet):
 
         db_list = self._db_list(session)
         if not db_list:
-            session.add(db.MovieListList(name=self.list_name))
+            db_list = db.MovieListList(name=self.list_name)
+            session.add(db_list)
+            session.flush()
+        self._list_id = db_list.id
 
     def __iter__(self):
         with Session() as session:
@@ -72,19 +76,24 @@ class MovieList(MutableSet):
             # Just delete and re-create to refresh
             if db_movie:
                 session.delete(db_movie)
-            db_movie = db.MovieListMovie()
-            if 'movie_name' in entry:
-                db_movie.title, db_movie.year = entry['movie_name'], entry.get('movie_year')
-            else:
-                db_movie.title, db_movie.year = split_title_year(entry['title'])
-            for id_name in MovieListBase().supported_ids:
-                if id_name in entry:
-                    db_movie.ids.append(db.MovieListID(id_name=id_name, id_value=entry[id_name]))
+            db_movie = self._new_movie(entry, MovieListBase().supported_ids)
             logger.debug('adding entry {}', entry)
             db_list.movies.append(db_movie)
             session.commit()
             return db_movie.to_entry()
 
+    @staticmethod
+    def _new_movie(entry, supported_ids):
+        db_movie = db.MovieListMovie()
+        if 'movie_name' in entry:
+            db_movie.title, db_movie.year = entry['movie_name'], entry.get('movie_year')
+        else:
+            db_movie.title, db_movie.year = split_title_year(entry['title'])
+        for id_name in supported_ids:
+            if id_name in entry:
+                db_movie.ids.append(db.MovieListID(id_name=id_name, id_value=entry[id_name]))
+        return db_movie
+
     def discard(self, entry):
         with Session() as session:
             db_movie = self._find_entry(entry, session=session)
@@ -159,6 +168,96 @@ class MovieList(MutableSet):
         match = self._find_entry(entry=entry, session=session)
         return match.to_entry() if match else None
 
+    def _lookup(self, session):
+        """Load the whole list, to match entries against it like :meth:`_find_entry` does.
+
+        :return: Tuple of dicts with the movies by (id name, id value) and by (lower case title, year)
+        """
+        by_id = {}
+        by_name = {}
+        movies = (
+            session.query(db.MovieListMovie)
+            .filter(db.MovieListMovie.list_id == self._list_id)
+            .options(selectinload(db.MovieListMovie.ids))
+            .order_by(db.MovieListMovie.id)
+        )
+        for movie in movies:
+            for movie_id in movie.ids:
+                by_id.setdefault((movie_id.id_name, str(movie_id.id_value)), movie)
+            by_name.setdefault(((movie.title or '').lower(), movie.year), movie)
+        return by_id, by_name
+
+    def _match(self, lookup, entry, supported_ids):
+        by_id, by_name = lookup
+        for id_name in supported_ids:
+            if entry.get(id_name):
+                match = by_id.get((id_name, str(entry[id_name])))
+                if match:
+                    return match
+        if not entry.get('movie_name'):
+            self._parse_title(entry)
+        if not entry.get('movie_name'):
+            logger.warning('Could not get a movie name, skipping')
+            return None
+        return by_name.get((entry['movie_name'].lower(), entry.get('movie_year') or None))
+
+    @with_session
+    def get_many(self, entries, session=None):
+        """Return what :meth:`get` would for each of `entries`, loading the list only once."""
+        supported_ids = MovieListBase().supported_ids
+        lookup = self._lookup(session)
+        results = []
+        for entry in entries:
+            match = self._match(lookup, entry, supported_ids)
+            results.append(match.to_entry() if match else None)
+        return results
+
+    @with_session
+    def contains_many(self, entries, session=None):
+        """Return whether each of `entries` is in the list, loading the list only once."""
+        supported_ids = MovieListBase().supported_ids
+        lookup = self._lookup(session)
+        return [self._match(lookup, entry, supported_ids) is not None for entry in entries]
+
+    def add_many(self, entries):
+        """Add or refresh all of `entries` in a single transaction."""
+        supported_ids = MovieListBase().supported_ids
+        with Session() as session:
+            lookup = self._lookup(session)
+            deleted = set()
+            for entry in entries:
+                db_movie = self._match(lookup, entry, supported_ids)
+                # Just delete and re-create to refresh
+                if db_movie and db_movie not in deleted:
+                    deleted.add(db_movie)
+                    if db_movie in session.new:
+                        # Added by an earlier entry
+                        session.expunge(db_movie)
+                    else:
+                        session.delete(db_movie)
+                db_movie = self._new_movie(entry, supported_ids)
+                db_movie.list_id = self._list_id
+                logger.debug('adding entry {}', entry)
+                session.add(db_movie)
+                # Later entries for the same movie refresh this one
+                by_id, by_name = lookup
+                for movie_id in db_movie.ids:
+                    by_id[movie_id.id_name, str(movie_id.id_value)] = db_movie
+                by_name[(db_movie.title or '').lower(), db_movie.year] = db_movie
+
+    def discard_many(self, entries):
+        """Remove all of `entries` in a single transaction."""
+        supported_ids = MovieListBase().supported_ids
+        with Session() as session:
+            lookup = self._lookup(session)
+            deleted = set()
+            for entry in entries:
+                db_movie = self._match(lookup, entry, supported_ids)
+                if db_movie and db_movie not in deleted:
+                    deleted.add(db_movie)
+                    logger.debug('deleting movie {}', db_movie)
+                    session.delete(db_movie)
+
 
 class PluginMovieList:
     """Remove all accepted elements from your trakt.tv watchlist/library/seen or custom list."""
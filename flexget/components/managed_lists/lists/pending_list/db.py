@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from loguru import logger
-from sqlalchemy import Boolean, Column, DateTime, Integer, Unicode, func, select
+from sqlalchemy import Boolean, Column, DateTime, Integer, LargeBinary, Unicode, func, select
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.elements import and_
 from sqlalchemy.sql.schema import ForeignKey
@@ -11,11 +11,11 @@ from flexget.db_schema import versioned_base
 from flexget.entry import Entry
 from flexget.utils import json, serialization
 from flexget.utils.database import entry_synonym, with_session
-from flexget.utils.sqlalchemy_utils import table_schema
+from flexget.utils.sqlalchemy_utils import table_add_column, table_schema
 
 plugin_name = 'pending_list'
 logger = logger.bind(name=plugin_name)
-Base = versioned_base(plugin_name, 1)
+Base = versioned_base(plugin_name, 2)
 
 
 @db_schema.upgrade(plugin_name)
@@ -36,6 +36,16 @@ def upgrade(ver, session):
                 table.update().where(table.c.id == row['id']).values(json=serialization.dumps(e))
             )
         ver = 1
+    if ver == 1:
+        table_add_column('wait_list_entries', 'blob', LargeBinary, session)
+        table = table_schema('wait_list_entries', session)
+        for row in session.execute(select(table.c.id, table.c.json)):
+            # Binary entries written to the json column move to their own one
+            if isinstance(row.json, bytes):
+                session.execute(
+                    table.update().where(table.c.id == row.id).values(json=None, blob=row.json)
+                )
+        ver = 2
     return ver
 
 
@@ -59,8 +69,10 @@ class PendingListEntry(Base):
     added = Column(DateTime, default=datetime.now)
     title = Column(Unicode)
     original_url = Column(Unicode)
+    # Older rows hold JSON text, newer ones binary data
     _json = Column('json', Unicode)
-    entry = entry_synonym('_json')
+    _blob = Column('blob', LargeBinary)
+    entry = entry_synonym('_json', binary_name='_blob')
     approved = Column(Boolean)
 
     def __init__(self, entry, pending_list_id):
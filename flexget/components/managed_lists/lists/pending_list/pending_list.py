@@ -2,9 +2,9 @@ from collections.abc import MutableSet
 
 from loguru import logger
 from sqlalchemy import or_
-from sqlalchemy.sql.elements import and_
 
 from flexget import plugin
+from flexget.components.managed_lists.lists.entry_lookup import StoredEntryLookup
 from flexget.entry import Entry
 from flexget.event import event
 from flexget.manager import Session
@@ -35,22 +35,21 @@ class PendingListSet(MutableSet):
             self.filter_approved = None
 
         with Session() as session:
-            if not self._db_list(session):
-                session.add(db.PendingListList(name=self.list_name))
+            db_list = self._db_list(session)
+            if not db_list:
+                db_list = db.PendingListList(name=self.list_name)
+                session.add(db_list)
+                session.flush()
+            self._list_id = db_list.id
 
     def _entry_query(self, session, entry, approved=None):
+        matches = [db.PendingListEntry.title == entry['title']]
+        if entry.get('original_url'):
+            matches.append(db.PendingListEntry.original_url == entry['original_url'])
         query = (
             session.query(db.PendingListEntry)
-            .filter(db.PendingListEntry.list_id == self._db_list(session).id)
-            .filter(
-                or_(
-                    db.PendingListEntry.title == entry['title'],
-                    and_(
-                        db.PendingListEntry.original_url,
-                        db.PendingListEntry.original_url == entry['original_url'],
-                    ),
-                )
-            )
+            .filter(db.PendingListEntry.list_id == self._list_id)
+            .filter(or_(*matches))
         )
 
         if approved is not None:
@@ -90,12 +89,56 @@ class PendingListSet(MutableSet):
                 logger.debug('refreshing entry {}', entry)
                 stored_entry.entry = entry
             else:
-                logger.debug('adding entry {} to list {}', entry, self._db_list(session).name)
-                stored_entry = db.PendingListEntry(
-                    entry=entry, pending_list_id=self._db_list(session).id
-                )
+                logger.debug('adding entry {} to list {}', entry, self.list_name)
+                stored_entry = db.PendingListEntry(entry=entry, pending_list_id=self._list_id)
             session.add(stored_entry)
 
+    def _lookup(self, session, entries, approved=None):
+        """Find the stored entries matching any of `entries`, like :meth:`_entry_query` does for one."""
+        query = session.query(db.PendingListEntry).filter(
+            db.PendingListEntry.list_id == self._list_id
+        )
+        if approved is not None:
+            query = query.filter(db.PendingListEntry.approved == approved)
+        return StoredEntryLookup(query, db.PendingListEntry, entries)
+
+    def add_many(self, entries):
+        """Add or refresh all of `entries` in a single transaction."""
+        entries = list(entries)
+        with Session() as session:
+            lookup = self._lookup(session, entries)
+            for entry in entries:
+                stored_entry = lookup.match(entry)
+                if stored_entry:
+                    logger.debug('refreshing entry {}', entry)
+                    stored_entry.entry = entry
+                else:
+                    logger.debug('adding entry {} to list {}', entry, self.list_name)
+                    stored_entry = db.PendingListEntry(entry=entry, pending_list_id=self._list_id)
+                    session.add(stored_entry)
+                # Later entries of the batch match it like they would with single adds
+                lookup.remember(stored_entry)
+
+    def discard_many(self, entries):
+        """Remove all of `entries` in a single transaction."""
+        entries = list(entries)
+        with Session() as session:
+            lookup = self._lookup(session, entries)
+            deleted = set()
+            for entry in entries:
+                db_entry = lookup.match(entry)
+                if db_entry and db_entry.id not in deleted:
+                    deleted.add(db_entry.id)
+                    logger.debug('deleting entry {}', db_entry)
+                    session.delete(db_entry)
+
+    def contains_many(self, entries):
+        """Return whether each of `entries` is in the list, looking them all up at once."""
+        entries = list(entries)
+        with Session() as session:
+            lookup = self._lookup(session, entries)
+            return [lookup.match(entry) is not None for entry in entries]
+
     @property
     def immutable(self):
         return False
@@ -116,6 +159,17 @@ class PendingListSet(MutableSet):
             match = self._entry_query(session=session, entry=entry, approved=self.filter_approved)
             return Entry(match.entry) if match else None
 
+    def get_many(self, entries):
+        """Return what :meth:`get` would for each of `entries`, looking them all up at once."""
+        entries = list(entries)
+        with Session() as session:
+            lookup = self._lookup(session, entries, approved=self.filter_approved)
+            results = []
+            for entry in entries:
+                match = lookup.match(entry)
+                results.append(Entry(match.entry) if match else None)
+            return results
+
 
 class PendingList:
     schema = {
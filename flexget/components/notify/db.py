@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Unicode
+
+from flexget import db_schema
+
+Base = db_schema.versioned_base('notification_queue', 1)
+
+
+@db_schema.upgrade('notification_queue')
+def upgrade(ver, session):
+    if ver is None or ver < 1:
+        # Queued notifications held their notifier config, which may have passwords and tokens
+        raise db_schema.UpgradeImpossible
+    return ver
+
+
+class QueuedNotification(Base):
+    """A notification waiting in the background dispatch queue."""
+
+    __tablename__ = 'notification_queue'
+
+    id = Column(Integer, primary_key=True)
+    notifier = Column(String, nullable=False, index=True)
+    # Hash of the rendered notifier config, messages to the same target are sent together. The
+    # config itself is not stored, it may hold passwords and tokens.
+    target = Column(String, nullable=False)
+    title = Column(Unicode)
+    message = Column(Unicode)
+    added = Column(DateTime, default=datetime.now)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return (
+            f'<QueuedNotification(id={self.id},notifier={self.notifier},attempts={self.attempts})>'
+        )
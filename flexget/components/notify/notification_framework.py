@@ -16,6 +16,10 @@ To implement a plugin that can deliver messages, it should implement a `notify`
 `(title, message, config)` as arguments. The plugin should also have a `schema` attribute which is a JSON schema that
 describes the config format for the plugin.
 
+With the `notification_queue` config key enabled, messages are queued and delivered from a background thread, see
+:mod:`notification_queue`. The `notify` method is then called with the rendered config, and should raise
+`PluginWarning` when a send fails and is worth retrying.
+
 """
 
 from jinja2 import Template
@@ -26,6 +30,8 @@ from flexget.event import event
 from flexget.plugin import PluginWarning
 from flexget.utils.template import RenderError
 
+from .notification_queue import notification_queue
+
 logger = logger.bind(name='notify')
 
 NOTIFY_VIA_SCHEMA = {
@@ -113,6 +119,14 @@ class NotificationFramework:
                         notifier_config, template_renderer, notifier_name
                     )
 
+                if (
+                    notification_queue.enabled
+                    and isinstance(title, str)
+                    and isinstance(message, str)
+                ):
+                    notification_queue.put(notifier_name, title, message, rendered_config)
+                    continue
+
                 logger.debug('Sending a notification to `{}`', notifier_name)
                 try:
                     notifier_plugin.notify(
@@ -0,0 +1,310 @@
+"""Background dispatch of notifications.
+
+When the `notification_queue` config key is enabled, :meth:`NotificationFramework.send_notification` stores
+notifications in the database instead of sending them right away, so tasks don't wait for slow notifiers. Every
+notifier gets a worker thread which sends its notifications. Messages to the same target, the same notifier with the
+same config, within the coalesce window are sent as one message. Failed sends are retried with an increasing delay.
+
+Notifications still queued when FlexGet exits are sent after the next start. Notifier configs may hold passwords and
+tokens, so they are never stored with the notifications, only their hash. Notifications are sent with the config which
+was queued along with them, or after a restart, the notifier config with the same hash in the current config. Those
+left without a config, e.g. because the config was changed or rendered from entry fields, are dropped.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from flexget import plugin
+from flexget.config_schema import register_config_key
+from flexget.event import event
+from flexget.manager import Session
+from flexget.plugin import PluginWarning
+from flexget.utils.tools import TimedDict, get_config_hash, parse_timedelta
+
+from . import db
+
+logger = logger.bind(name='notification_queue')
+
+# Seconds to wait for due notifications to be sent on shutdown
+SHUTDOWN_TIMEOUT = 30
+# Longest wait between two attempts of a failing notification
+MAX_RETRY_DELAY = timedelta(hours=1)
+# How long configs of queued notifications are remembered, longer than it takes to give up on them
+CONFIG_CACHE_TIME = '1 day'
+
+DEFAULTS = {'coalesce': '5 seconds', 'max_attempts': 5, 'retry_delay': '1 minute'}
+
+schema = {
+    'title': 'notification queue',
+    'description': 'Send notifications in the background, so tasks do not wait for them',
+    'oneOf': [
+        {'type': 'boolean'},
+        {
+            'type': 'object',
+            'properties': {
+                'coalesce': {'type': 'string', 'format': 'interval'},
+                'max_attempts': {'type': 'integer', 'minimum': 1},
+                'retry_delay': {'type': 'string', 'format': 'interval'},
+            },
+            'additionalProperties': False,
+        },
+    ],
+}
+
+
+def find_notifier_configs(config, notifiers):
+    """Yield `(notifier, notifier config)` for every notifier configured within `config`."""
+    if isinstance(config, dict):
+        for key, value in config.items():
+            if key in notifiers:
+                yield key, value
+            else:
+                yield from find_notifier_configs(value, notifiers)
+    elif isinstance(config, list):
+        for item in config:
+            yield from find_notifier_configs(item, notifiers)
+
+
+def coalesce(notifications):
+    """Combine queued notifications to the same target into one title and message."""
+    if len(notifications) == 1:
+        return notifications[0].title, notifications[0].message
+    titles = list(dict.fromkeys(n.title for n in notifications))
+    if len(titles) == 1:
+        return titles[0], '\n\n'.join(n.message for n in notifications)
+    message = '\n\n'.join(f'{n.title}\n{n.message}' for n in notifications)
+    return f'{len(notifications)} notifications', message
+
+
+class NotifierWorker(threading.Thread):
+    """Sends the queued notifications of one notifier."""
+
+    def __init__(self, queue, notifier):
+        super().__init__(name=f'notify_{notifier}', daemon=True)
+        self.queue = queue
+        self.notifier = notifier
+        self.wakeup = threading.Event()
+        self.stopping = False
+
+    def run(self):
+        while True:
+            self.wakeup.clear()
+            stopping = self.stopping
+            try:
+                next_attempt = self.queue.dispatch(self.notifier, flush=stopping)
+            except Exception:
+                logger.opt(exception=True).error(
+                    'Error while sending queued notifications to `{}`', self.notifier
+                )
+                next_attempt = datetime.now() + self.queue.retry_delay
+            if stopping:
+                return
+            timeout = None
+            if next_attempt is not None:
+                timeout = max((next_attempt - datetime.now()).total_seconds(), 0)
+            self.wakeup.wait(timeout)
+
+    def stop(self):
+        self.stopping = True
+        self.wakeup.set()
+
+
+class NotificationQueue:
+    """Persisted queue of notifications, with a worker thread per notifier."""
+
+    def __init__(self):
+        self.configure(None)
+        self._workers = {}
+        self._lock = threading.Lock()
+        # Notifier configs by target, of notifications queued by this process and of the current config
+        self._queued_configs = TimedDict(CONFIG_CACHE_TIME)
+        self._configs_lock = threading.Lock()
+        self._current_configs = {}
+
+    def configure(self, config):
+        """Apply the `notification_queue` config key."""
+        self.enabled = bool(config)
+        settings = dict(DEFAULTS, **config) if isinstance(config, dict) else DEFAULTS
+        self.coalesce_window = parse_timedelta(settings['coalesce'])
+        self.max_attempts = settings['max_attempts']
+        self.retry_delay = parse_timedelta(settings['retry_delay'])
+
+    def set_current_config(self, config):
+        """Find the notifier configs within the manager `config`, for notifications queued before a restart."""
+        notifiers = {p.name for p in plugin.get_plugins(interface='notifiers')}
+        self._current_configs = {
+            get_config_hash([notifier, notifier_config]): notifier_config
+            for notifier, notifier_config in find_notifier_configs(config, notifiers)
+        }
+
+    def get_config(self, target):
+        """Return the notifier config of `target`, None if it is not known anymore."""
+        with self._configs_lock:
+            config = self._queued_configs.get(target)
+        if config is None:
+            config = self._current_configs.get(target)
+        return config
+
+    def put(self, notifier, title, message, config):
+        """Queue a notification, it is sent by the worker of `notifier`."""
+        target = get_config_hash([notifier, config])
+        with self._configs_lock:
+            self._queued_configs[target] = config
+        with Session() as session:
+            session.add(
+                db.QueuedNotification(
+                    notifier=notifier,
+                    target=target,
+                    title=title,
+                    message=message,
+                    next_attempt=datetime.now() + self.coalesce_window,
+                )
+            )
+        logger.debug('Queued a notification to `{}`', notifier)
+        self.wake(notifier)
+
+    def wake(self, notifier):
+        """Make the worker of `notifier` look for due notifications, starting it if needed."""
+        with self._lock:
+            worker = self._workers.get(notifier)
+            if worker is None or not worker.is_alive():
+                worker = self._workers[notifier] = NotifierWorker(self, notifier)
+                worker.start()
+        worker.wakeup.set()
+
+    def resume(self):
+        """Start workers for notifications queued by a previous run."""
+        with Session() as session:
+            notifiers = [
+                name for (name,) in session.query(db.QueuedNotification.notifier).distinct().all()
+            ]
+        for notifier in notifiers:
+            logger.verbose('Resuming queued notifications to `{}`', notifier)
+            self.wake(notifier)
+
+    def stop(self, timeout=SHUTDOWN_TIMEOUT):
+        """Send the notifications which are due, ignoring the coalesce window, and stop the workers."""
+        with self._lock:
+            workers, self._workers = list(self._workers.values()), {}
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.join(max(deadline - time.monotonic(), 0))
+            if worker.is_alive():
+                logger.warning('Notifications to `{}` are still being sent', worker.notifier)
+
+    def dispatch(self, notifier, flush=False):
+        """Send the due notifications of `notifier`.
+
+        A target is due when its oldest notification is, the newer ones are coalesced into it.
+
+        :param bool flush: Also send notifications waiting for the coalesce window to pass.
+        :return: When the next notification of `notifier` is due, or None if there are none left.
+        """
+        now = datetime.now()
+        with Session() as session:
+            queued = (
+                session.query(db.QueuedNotification)
+                .filter(db.QueuedNotification.notifier == notifier)
+                .order_by(db.QueuedNotification.id)
+                .all()
+            )
+            session.expunge_all()
+        targets = {}
+        for notification in queued:
+            targets.setdefault(notification.target, []).append(notification)
+        next_attempt = None
+        for notifications in targets.values():
+            first = notifications[0]
+            if first.next_attempt > now and not (flush and not first.attempts):
+                if next_attempt is None or first.next_attempt < next_attempt:
+                    next_attempt = first.next_attempt
+                continue
+            retry_at = self.send(notifier, notifications)
+            if retry_at and (next_attempt is None or retry_at < next_attempt):
+                next_attempt = retry_at
+        return next_attempt
+
+    def send(self, notifier, notifications):
+        """Send the notifications to one target as a single message.
+
+        :return: When to retry, or None when the notifications were sent or given up on.
+        """
+        ids = [n.id for n in notifications]
+        attempts = notifications[0].attempts + 1
+        title, message = coalesce(notifications)
+        config = self.get_config(notifications[0].target)
+        retry_at = None
+        if config is None:
+            logger.warning(
+                'Dropping {} queued notifications to `{}`, their config is not known anymore',
+                len(notifications),
+                notifier,
+            )
+            self._reschedule(ids)
+            return None
+        logger.debug('Sending {} queued notifications to `{}`', len(notifications), notifier)
+        try:
+            plugin.get(notifier, 'notification_queue').notify(title, message, config)
+        except PluginWarning as e:
+            if attempts >= self.max_attempts:
+                logger.error(
+                    'Giving up sending a notification to `{}` after {} attempts: {}',
+                    notifier,
+                    attempts,
+                    e.value,
+                )
+            else:
+                delay = min(self.retry_delay * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+                retry_at = datetime.now() + delay
+                logger.warning(
+                    'Error while sending notification to `{}`, retrying in {}: {}',
+                    notifier,
+                    delay,
+                    e.value,
+                )
+        except Exception:
+            logger.opt(exception=True).error('Error while sending notification to `{}`', notifier)
+        else:
+            logger.verbose('Successfully sent a notification to `{}`', notifier)
+        self._reschedule(ids, retry_at, attempts)
+        return retry_at
+
+    def _reschedule(self, ids, retry_at=None, attempts=None):
+        """Retry the notifications with the given ids at `retry_at`, or remove them if not given."""
+        with Session() as session:
+            rows = session.query(db.QueuedNotification).filter(db.QueuedNotification.id.in_(ids))
+            if retry_at:
+                rows.update(
+                    {'attempts': attempts, 'next_attempt': retry_at}, synchronize_session=False
+                )
+            else:
+                rows.delete(synchronize_session=False)
+
+
+notification_queue = NotificationQueue()
+
+
+@event('manager.config_updated')
+def configure_queue(manager):
+    notification_queue.configure(manager.config.get('notification_queue'))
+    notification_queue.set_current_config(manager.config)
+
+
+@event('manager.startup')
+def resume_queue(manager):
+    notification_queue.resume()
+
+
+@event('manager.shutdown')
+def stop_queue(manager):
+    notification_queue.stop()
+
+
+@event('config.register')
+def register_config():
+    register_config_key('notification_queue', schema)
@@ -8,7 +8,7 @@ from flexget.entry import Entry
 from flexget.event import event
 from flexget.utils import json, serialization
 from flexget.utils.database import entry_synonym
-from flexget.utils.sqlalchemy_utils import table_schema
+from flexget.utils.sqlalchemy_utils import delete_in_chunks, table_schema
 
 logger = logger.bind(name='pending_approval')
 Base = db_schema.versioned_base('pending_approval', 1)
@@ -70,10 +70,11 @@ class PendingEntry(Base):
 @event('manager.db_cleanup')
 def db_cleanup(manager, session):
     # Clean unapproved entries older than 1 year
-    deleted = (
-        session.query(PendingEntry)
-        .filter(PendingEntry.added < datetime.now() - timedelta(days=365))
-        .delete()
+    deleted = delete_in_chunks(
+        session,
+        session.query(PendingEntry).filter(
+            PendingEntry.added < datetime.now() - timedelta(days=365)
+        ),
     )
     if deleted:
         logger.info('Purged {} pending entries older than 1 year', deleted)
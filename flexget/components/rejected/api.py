@@ -12,6 +12,7 @@ from flexget.api.app import (
     pagination_headers,
     success_response,
 )
+from flexget.utils.database import read_only
 
 from . import db
 
@@ -63,6 +64,7 @@ rejected_parser = api.pagination_parser(sort_choices=sort_choices)
 
 @rejected_api.route('/')
 class Rejected(APIResource):
+    @read_only
     @etag
     @api.response(NotFoundError)
     @api.response(200, model=rejected_entries_list_schema)
@@ -135,6 +137,7 @@ class Rejected(APIResource):
 @rejected_api.route('/<int:rejected_entry_id>/')
 @api.response(NotFoundError)
 class RejectedEntry(APIResource):
+    @read_only
     @etag
     @api.response(200, model=rejected_entry_schema)
     def get(self, rejected_entry_id, session=None):
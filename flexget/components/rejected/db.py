@@ -6,7 +6,7 @@ from sqlalchemy.orm import relationship
 
 from flexget import db_schema
 from flexget.event import event
-from flexget.utils.sqlalchemy_utils import table_add_column, table_columns
+from flexget.utils.sqlalchemy_utils import delete_in_chunks, table_add_column, table_columns
 
 logger = logger.bind(name='remember_rej')
 Base = db_schema.versioned_base('remember_rejected', 3)
@@ -65,10 +65,11 @@ Index('remember_feed_title_url', RememberEntry.task_id, RememberEntry.title, Rem
 @event('manager.db_cleanup')
 def db_cleanup(manager, session):
     # Remove entries older than 30 days
-    result = (
-        session.query(RememberEntry)
-        .filter(RememberEntry.added < datetime.now() - timedelta(days=30))
-        .delete()
+    result = delete_in_chunks(
+        session,
+        session.query(RememberEntry).filter(
+            RememberEntry.added < datetime.now() - timedelta(days=30)
+        ),
     )
     if result:
         logger.verbose('Removed {} entries from remember rejected table.', result)
@@ -13,6 +13,7 @@ from flexget.api.app import (
     pagination_headers,
     success_response,
 )
+from flexget.utils.database import read_only
 
 from . import db
 
@@ -64,6 +65,7 @@ seen_search_parser = api.pagination_parser(seen_base_parser, sort_choices)
 
 @seen_api.route('/')
 class SeenSearchAPI(APIResource):
+    @read_only
     @etag
     @api.response(NotFoundError)
     @api.response(200, 'Successfully retrieved seen objects', seen_search_schema)
@@ -158,6 +160,7 @@ class SeenSearchAPI(APIResource):
 @api.doc(params={'seen_entry_id': 'ID of seen entry'})
 @api.response(NotFoundError)
 class SeenSearchIDAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, model=seen_object_schema)
     def get(self, seen_entry_id, session):
@@ -7,12 +7,20 @@ forget (string)
     Given string can be task name, remembered field (url, imdb_url) or a title. If given value is a
     task name then everything in that task will be forgotten. With title all learned fields from it and the
     title will be forgotten. With field value only that particular field is forgotten.
+
+Seen entries older than the `compact_after` interval of the `seen_retention` root config key are
+moved into the compact table by the database cleanup. Only hashes of their title and values are
+kept, so they keep being rejected and can be forgotten by exact title, value or task, but no longer
+show up in searches.
 """
 
+import hashlib
+import re
 from datetime import datetime
 
 from loguru import logger
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -20,17 +28,26 @@ from sqlalchemy import (
     Index,
     Integer,
     Unicode,
+    insert,
     or_,
     select,
+    tuple_,
     update,
 )
 from sqlalchemy.orm import relationship
 
 from flexget import db_schema, plugin
+from flexget.config_schema import register_config_key
 from flexget.event import event
 from flexget.manager import Session
 from flexget.utils.database import with_session
-from flexget.utils.sqlalchemy_utils import table_add_column, table_schema
+from flexget.utils.sqlalchemy_utils import (
+    DELETE_CHUNK_SIZE,
+    delete_in_chunks,
+    table_add_column,
+    table_schema,
+)
+from flexget.utils.tools import parse_timedelta
 
 try:
     # NOTE: Importing other plugins is discouraged!
@@ -42,6 +59,17 @@ logger = logger.bind(name='seen.db')
 Base = db_schema.versioned_base('seen', 4)
 
 ESCAPE_QUERY = '\\'
+# Unescaped LIKE wildcards
+LIKE_PATTERN = re.compile(r'(?<!\\)[%_]')
+
+retention_schema = {
+    'type': 'object',
+    'properties': {
+        'compact_after': {'type': 'string', 'format': 'interval'},
+        'forget_after': {'type': 'string', 'format': 'interval'},
+    },
+    'additionalProperties': False,
+}
 
 
 @db_schema.upgrade('seen')
@@ -139,6 +167,31 @@ class SeenField(Base):
         }
 
 
+def value_hash(value: str) -> int:
+    """Return the fixed width hash compacted seen titles and values are stored as."""
+    digest = hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+class CompactSeen(Base):
+    """A value of a seen entry which has been compacted, one row for each value of the entry."""
+
+    __tablename__ = 'seen_compact'
+
+    id = Column(Integer, primary_key=True)
+    value_hash = Column(BigInteger, nullable=False)
+    title_hash = Column(BigInteger, nullable=False, index=True)
+    task = Column(Unicode)
+    local = Column(Boolean, nullable=False)
+    added = Column(DateTime)
+
+    # Covers the lookups done by the seen filter
+    __table_args__ = (Index('ix_seen_compact_lookup', value_hash, local, task, added),)
+
+    def __str__(self):
+        return f'<CompactSeen(task={self.task},added={self.added})>'
+
+
 @with_session
 def add(title, task_name, fields, reason=None, local=None, session=None):
     """Add seen entries to DB.
@@ -218,9 +271,54 @@ def forget(value, tasks=None, test=False):
             else:
                 logger.debug('forgetting {}', se)
                 session.delete(se)
+
+        compacted = forget_compacted(value, tasks=tasks, test=test, session=session)
+        count += compacted[0]
+        field_count += compacted[1]
     return count, field_count
 
 
+def forget_compacted(value, tasks=None, test=False, session=None):
+    """Forget compacted seen entries matching `value`, see :func:`forget`.
+
+    Only hashes are kept of compacted entries, so patterns other than a lone wildcard for all
+    entries of `tasks` can't match them.
+
+    :return: count, field_count of forgotten compacted entries
+    """
+    query = session.query(CompactSeen)
+    if tasks:
+        query = query.filter(CompactSeen.task.in_(tasks))
+    if not tasks or value != '%':
+        if tasks:
+            if LIKE_PATTERN.search(value):
+                logger.debug('Compacted seen entries are not matched by pattern `{}`', value)
+                return 0, 0
+            value = value.replace('\\%', '%').replace('\\_', '_')
+        hashed = value_hash(value)
+        # Matching any value forgets all values of the entry
+        entries = {
+            (row.title_hash, row.task, row.added)
+            for row in query.filter(
+                or_(CompactSeen.title_hash == hashed, CompactSeen.value_hash == hashed)
+            )
+        }
+        if not entries:
+            return 0, 0
+        query = session.query(CompactSeen).filter(
+            tuple_(CompactSeen.title_hash, CompactSeen.task, CompactSeen.added).in_(entries)
+        )
+    rows = query.all()
+    count = len({(row.title_hash, row.task, row.added) for row in rows})
+    if test:
+        logger.info('Testing: would forget {} compacted entries', count)
+    else:
+        logger.debug('forgetting {} compacted entries', count)
+        for row in rows:
+            session.delete(row)
+    return count, len(rows)
+
+
 @with_session
 def search_by_field_values(field_value_list, task_name, local=False, session=None):
     """Return a SeenEntry instance if it matches field values.
@@ -240,15 +338,117 @@ def search_by_field_values(field_value_list, task_name, local=False, session=Non
     return found.first()
 
 
+@with_session
+def search_compacted(field_value_list, task_name, local=False, session=None):
+    """Find a compacted entry matching field values, see :func:`search_by_field_values`.
+
+    :return: Row with `value_hash`, `task` and `added` of the compacted entry, or None
+    """
+    found = session.query(CompactSeen.value_hash, CompactSeen.task, CompactSeen.added).filter(
+        CompactSeen.value_hash.in_([value_hash(value) for value in field_value_list])
+    )
+    if local:
+        found = found.filter(CompactSeen.task == task_name)
+    else:
+        found = found.filter(~CompactSeen.local)
+    return found.first()
+
+
+def compact(session, before):
+    """Move seen entries added before `before` into the compact table.
+
+    Entries are moved a chunk at a time, each in its own transaction, so an interrupted
+    compaction continues where it stopped next time. Honors the cleanup settings in
+    :attr:`session.info` like :func:`~flexget.utils.sqlalchemy_utils.delete_in_chunks`.
+
+    :return: Number of compacted entries.
+    """
+    chunk_size = session.info.get('cleanup_chunk_size', DELETE_CHUNK_SIZE)
+    should_stop = session.info.get('cleanup_should_stop')
+    compacted = 0
+    while True:
+        entries = (
+            session.query(
+                SeenEntry.id, SeenEntry.title, SeenEntry.task, SeenEntry.local, SeenEntry.added
+            )
+            .filter(SeenEntry.added < before)
+            .order_by(SeenEntry.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not entries:
+            break
+        ids = [se.id for se in entries]
+        values = {}
+        for seen_entry_id, value in session.query(SeenField.seen_entry_id, SeenField.value).filter(
+            SeenField.seen_entry_id.in_(ids)
+        ):
+            values.setdefault(seen_entry_id, set()).add(value)
+        rows = [
+            {
+                'value_hash': value_hash(value),
+                'title_hash': value_hash(se.title),
+                'task': se.task,
+                # Entries added from CLI were having local marked as None rather than False gh#879
+                'local': bool(se.local),
+                'added': se.added,
+            }
+            for se in entries
+            for value in values.get(se.id, ())
+        ]
+        if rows:
+            session.execute(insert(CompactSeen), rows)
+        session.query(SeenField).filter(SeenField.seen_entry_id.in_(ids)).delete(
+            synchronize_session=False
+        )
+        session.query(SeenEntry).filter(SeenEntry.id.in_(ids)).delete(synchronize_session=False)
+        session.commit()
+        compacted += len(entries)
+        if len(entries) < chunk_size:
+            break
+        if should_stop and should_stop():
+            session.info['cleanup_incomplete'] = True
+            break
+    return compacted
+
+
 @event('manager.db_cleanup')
 def db_cleanup(manager, session):
-    # TODO: Look into this, is it still valid?
-    logger.debug('TODO: Disabled')
+    config = manager.config.get('seen_retention')
+    if not config:
+        return
+    if 'forget_after' in config:
+        before = datetime.now() - parse_timedelta(config['forget_after'])
+        old_entries = session.query(SeenEntry.id).filter(SeenEntry.added < before)
+        delete_in_chunks(
+            session,
+            session.query(SeenField).filter(
+                SeenField.seen_entry_id.in_(old_entries.scalar_subquery())
+            ),
+        )
+        result = delete_in_chunks(
+            session, session.query(SeenEntry).filter(SeenEntry.added < before)
+        )
+        result += delete_in_chunks(
+            session, session.query(CompactSeen).filter(CompactSeen.added < before)
+        )
+        if result:
+            logger.verbose(
+                'Forgot {} seen entries and compacted values older than {}',
+                result,
+                config['forget_after'],
+            )
+        if session.info.get('cleanup_incomplete'):
+            return
+    if 'compact_after' in config:
+        result = compact(session, datetime.now() - parse_timedelta(config['compact_after']))
+        if result:
+            logger.verbose('Compacted {} seen entries', result)
+
 
-    # Remove seen fields over a year old
-    # result = session.query(SeenField).filter(SeenField.added < datetime.now() - timedelta(days=365)).delete()
-    # if result:
-    #    log.verbose('Removed %d seen fields older than 1 year.' % result)
+@event('config.register')
+def register_config():
+    register_config_key('seen_retention', retention_schema)
 
 
 @with_session
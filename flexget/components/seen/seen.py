@@ -66,38 +66,54 @@ class FilterSeen:
         fields = config.get('fields')
         local = config.get('local')
 
+        # Skip looking into compacted entries when there are none
+        any_compacted = task.session.query(db.CompactSeen.id).first() is not None
         for entry in task.entries:
-            # construct list of values looked
-            values = []
+            # construct list of values looked, and the fields they came from
+            values = {}
             for field in fields:
                 if field not in entry:
                     continue
-                if entry[field] not in values and entry[field]:
-                    values.append(str(entry[field]))
+                if entry[field] and str(entry[field]) not in values:
+                    values[str(entry[field])] = field
             if values:
                 logger.trace('querying for: {}', ', '.join(values))
                 # check if SeenField.value is any of the values
                 found = db.search_by_field_values(
-                    field_value_list=values, task_name=task.name, local=local, session=task.session
+                    field_value_list=list(values),
+                    task_name=task.name,
+                    local=local,
+                    session=task.session,
                 )
                 if found:
-                    logger.debug(
-                        "Rejecting '{}' '{}' because of seen '{}'",
-                        entry['url'],
-                        entry['title'],
-                        found.value,
-                    )
                     se = (
                         task.session.query(db.SeenEntry)
                         .filter(db.SeenEntry.id == found.seen_entry_id)
                         .one()
                     )
-                    entry.reject(
-                        'Entry with {} `{}` is already marked seen in the task {} at {}'.format(
-                            found.field, found.value, se.task, se.added.strftime('%Y-%m-%d %H:%M')
-                        ),
-                        remember=remember_rejected,
+                    field, value, seen_task, added = found.field, found.value, se.task, se.added
+                elif any_compacted:
+                    compacted = db.search_compacted(
+                        field_value_list=list(values),
+                        task_name=task.name,
+                        local=local,
+                        session=task.session,
                     )
+                    if not compacted:
+                        continue
+                    value = next(v for v in values if db.value_hash(v) == compacted.value_hash)
+                    field, seen_task, added = values[value], compacted.task, compacted.added
+                else:
+                    continue
+                logger.debug(
+                    "Rejecting '{}' '{}' because of seen '{}'", entry['url'], entry['title'], value
+                )
+                entry.reject(
+                    'Entry with {} `{}` is already marked seen in the task {} at {}'.format(
+                        field, value, seen_task, added.strftime('%Y-%m-%d %H:%M')
+                    ),
+                    remember=remember_rejected,
+                )
 
     def on_task_learn(self, task, config):
         """Remember succeeded entries."""
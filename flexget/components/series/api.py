@@ -18,6 +18,7 @@ from flexget.api.app import (
 )
 from flexget.event import fire_event
 from flexget.plugin import PluginError
+from flexget.utils.database import read_only
 
 from . import db
 from .utils import normalize_series_name
@@ -221,6 +222,7 @@ ep_identifier_doc = (
 
 @series_api.route('/')
 class SeriesAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Series list retrieved successfully', series_list_schema)
     @api.response(NotFoundError)
@@ -373,6 +375,7 @@ delete_parser.add_argument(
 @api.doc(params={'show_id': 'ID of the show'})
 @api.response(NotFoundError)
 class SeriesShowAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Show information retrieved successfully', show_details_schema)
     @api.doc(description='Get a specific show using its ID', expect=[base_series_parser])
@@ -443,6 +446,7 @@ entity_parser = api.pagination_parser(add_sort=True)
     description="The 'Series-ID' header will be appended to the result headers",
 )
 class SeriesSeasonsAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Seasons retrieved successfully for show', season_list_schema)
     @api.doc(description='Get all show seasons via its ID', expect=[entity_parser])
@@ -521,6 +525,7 @@ class SeriesSeasonsAPI(APIResource):
 @series_api.route('/<int:show_id>/seasons/<int:season_id>/')
 @api.doc(params={'show_id': 'ID of the show', 'season_id': 'Season ID'})
 class SeriesSeasonAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Season retrieved successfully for show', season_schema)
     @api.doc(description='Get a specific season via its ID and show ID')
@@ -575,6 +580,7 @@ class SeriesSeasonAPI(APIResource):
     description="The 'Series-ID' header will be appended to the result headers",
 )
 class SeriesEpisodesAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Episodes retrieved successfully for show', episode_list_schema)
     @api.doc(description='Get all show episodes via its ID', expect=[entity_parser])
@@ -653,6 +659,7 @@ class SeriesEpisodesAPI(APIResource):
 @series_api.route('/<int:show_id>/episodes/<int:ep_id>/')
 @api.doc(params={'show_id': 'ID of the show', 'ep_id': 'Episode ID'})
 class SeriesEpisodeAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Episode retrieved successfully for show', episode_schema)
     @api.doc(description='Get a specific episode via its ID and show ID')
@@ -728,6 +735,7 @@ release_delete_parser.add_argument(
     "The 'Season-ID' header will be appended to the result headers.",
 )
 class SeriesSeasonsReleasesAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Releases retrieved successfully for season', season_release_list_schema)
     @api.doc(
@@ -881,6 +889,7 @@ class SeriesSeasonsReleasesAPI(APIResource):
     "The 'Season-ID' header will be appended to the result headers.",
 )
 class SeriesSeasonReleaseAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Release retrieved successfully for season', season_release_schema)
     @api.doc(
@@ -981,6 +990,7 @@ class SeriesSeasonReleaseAPI(APIResource):
     "The 'Episode-ID' header will be appended to the result headers.",
 )
 class SeriesEpisodeReleasesAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Releases retrieved successfully for episode', episode_release_list_schema)
     @api.doc(
@@ -1134,6 +1144,7 @@ class SeriesEpisodeReleasesAPI(APIResource):
     "The 'Episode-ID' header will be appended to the result headers.",
 )
 class SeriesEpisodeReleaseAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, 'Release retrieved successfully for episode', episode_release_schema)
     @api.doc(
@@ -5,7 +5,7 @@ from datetime import timedelta
 import flexget.components.series.utils
 from flexget import options
 from flexget.event import event
-from flexget.manager import Session
+from flexget.manager import ReadSession, Session
 from flexget.terminal import TerminalTable, colorize, console, table_parser
 
 from . import db
@@ -59,7 +59,7 @@ def display_summary(options):
         descending = options.order == 'desc'
     else:
         descending = os.environ.get(ENV_LIST_SORTBY_ORDER) == 'desc'
-    with Session() as session:
+    with ReadSession() as session:
         kwargs = {
             'configured': configured,
             'premieres': premieres,
@@ -203,7 +203,7 @@ def display_details(options):
         reverse = options.order == 'desc'
     else:
         reverse = os.environ.get(ENV_SHOW_SORTBY_ORDER) == 'desc'
-    with Session() as session:
+    with ReadSession() as session:
         name = flexget.components.series.utils.normalize_series_name(name)
         # Sort by length of name, so that partial matches always show shortest matching title
         matches = db.shows_by_name(name, session=session)
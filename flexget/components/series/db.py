@@ -34,16 +34,17 @@ from flexget.manager import Session
 from flexget.utils.database import quality_property, with_session
 from flexget.utils.sqlalchemy_utils import (
     create_index,
+    delete_in_chunks,
     drop_tables,
     table_add_column,
     table_columns,
     table_exists,
     table_schema,
 )
-from flexget.utils.tools import parse_episode_identifier
+from flexget.utils.tools import chunked, parse_episode_identifier
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
     from flexget.components.parsing.parsers.parser_common import SeriesParseResult
     from flexget.utils.qualities import Quality
@@ -722,29 +723,27 @@ def upgrade(ver: int | None, session: Session) -> int:
 @event('manager.db_cleanup')
 def db_cleanup(manager, session: Session) -> None:
     # Clean up old undownloaded releases
-    result = (
+    result = delete_in_chunks(
+        session,
         session.query(EpisodeRelease)
         .filter(~EpisodeRelease.downloaded)
-        .filter(EpisodeRelease.first_seen < datetime.now() - timedelta(days=120))
-        .delete(False)
+        .filter(EpisodeRelease.first_seen < datetime.now() - timedelta(days=120)),
     )
     if result:
         logger.verbose('Removed {} undownloaded episode releases.', result)
     # Clean up episodes without releases
-    result = (
+    result = delete_in_chunks(
+        session,
         session.query(Episode)
         .filter(~Episode.releases.any())
-        .filter(~Episode.begins_series.any())
-        .delete(False)
+        .filter(~Episode.begins_series.any()),
     )
     if result:
         logger.verbose('Removed {} episodes without releases.', result)
     # Clean up series without episodes that aren't in any tasks
-    result = (
-        session.query(Series)
-        .filter(~Series.episodes.any())
-        .filter(~Series.in_tasks.any())
-        .delete(False)
+    result = delete_in_chunks(
+        session,
+        session.query(Series).filter(~Series.episodes.any()).filter(~Series.in_tasks.any()),
     )
     if result:
         logger.verbose('Removed {} series without episodes.', result)
@@ -1410,108 +1409,194 @@ def store_parser(
     :param quality: If supplied, this will override the quality from the series parser
     :return: List of Releases
     """
-    if quality is None:
-        quality = parser.quality
-    if not series:
-        # if series does not exist in database, add new
-        series = (
-            session.query(Series)
-            .filter(Series.name == parser.name)
-            .filter(Series.id.is_not(None))
-            .first()
-        )
-        if not series:
-            logger.debug('adding series `{}` into db', parser.name)
-            series = Series()
-            series.name = parser.name
-            session.add(series)
-            logger.debug('-> added `{}`', series)
-
-    releases = []
-    for ix, identifier in enumerate(parser.identifiers):
-        if parser.season_pack:
-            # Checks if season object exist
-            season = (
-                session.query(Season)
-                .filter(Season.season == parser.season)
-                .filter(Season.series_id == series.id)
-                .filter(Season.identifier == identifier)
-                .first()
-            )
-            if not season:
-                logger.debug('adding season `{}` into series `{}`', identifier, parser.name)
-                season = Season()
-                season.identifier = identifier
-                season.identified_by = parser.id_type
-                season.season = parser.season
-                series.seasons.append(season)
-                logger.debug('-> added season `{}`', season)
-            session.flush()
-
-            # Sets the filter_by, and filter_id for later releases query
-            filter_id = season.id
-            table = SeasonRelease
-            filter_by = table.season_id
-            entity = season
+    return store_parsers(session, [(parser, quality)], series=series)[0]
+
+
+def store_parsers(
+    session: Session,
+    parsers: Sequence[tuple[SeriesParseResult, Quality | None]],
+    series: Series = None,
+) -> list[list[SeasonRelease | EpisodeRelease]]:
+    """Push information of several parsers into database at once. Returns added/existing releases.
 
+    Stores the same rows as calling :func:`store_parser` for each parser in order, but existing
+    series, seasons, episodes and releases are looked up with a few queries for the whole batch,
+    and new ones get inserted with one flush per kind.
+
+    :param session: Database session to use
+    :param parsers: Pairs of parser and quality overriding the quality from the parser, or None
+    :param series: Series in database to add releases to. Will be looked up if not provided.
+    :return: List of Releases for each parser, in the order of `parsers`
+    """
+    if series:
+        batches = [(series, list(enumerate(parsers)))]
+    else:
+        batches = []
+        by_name = {}
+        for ix, (parser, quality) in enumerate(parsers):
+            by_name.setdefault(normalize_series_name(parser.name), []).append((
+                ix,
+                (parser, quality),
+            ))
+        existing = {}
+        for chunk in chunked(list(by_name)):
+            for db_series in (
+                session.query(Series)
+                .filter(Series.name.in_(chunk))
+                .filter(Series.id.is_not(None))
+                .order_by(Series.id)
+            ):
+                existing.setdefault(db_series.name_normalized, db_series)
+        for name, items in by_name.items():
+            db_series = existing.get(name)
+            if not db_series:
+                # if series does not exist in database, add new
+                parser = items[0][1][0]
+                logger.debug('adding series `{}` into db', parser.name)
+                db_series = Series()
+                db_series.name = parser.name
+                session.add(db_series)
+                logger.debug('-> added `{}`', db_series)
+            batches.append((db_series, items))
+
+    results = [[] for _ in parsers]
+    for db_series, items in batches:
+        for ix, releases in zip(
+            (ix for ix, _ in items),
+            _store_series_parsers(session, db_series, [item for _, item in items]),
+            strict=True,
+        ):
+            results[ix] = releases
+    return results
+
+
+def _store_series_parsers(
+    session: Session,
+    series: Series,
+    parsers: Sequence[tuple[SeriesParseResult, Quality | None]],
+) -> list[list[SeasonRelease | EpisodeRelease]]:
+    """Store releases of parsers all belonging to `series`, see :func:`store_parsers`."""
+    parsers = [
+        (parser, parser.quality if quality is None else quality) for parser, quality in parsers
+    ]
+    session.flush()  # Make sure a new series has an id
+    # Existing seasons keyed by (season, identifier), episodes keyed by identifier
+    seasons = {}
+    episodes = {}
+    season_identifiers = set()
+    episode_identifiers = set()
+    for parser, _ in parsers:
+        if parser.season_pack:
+            season_identifiers.update(parser.identifiers)
         else:
-            # if episode does not exist in series, add new
-            episode = (
-                session.query(Episode)
-                .filter(Episode.series_id == series.id)
-                .filter(Episode.identifier == identifier)
-                .filter(Episode.series_id.is_not(None))
-                .first()
-            )
-            if not episode:
-                logger.debug('adding episode `{}` into series `{}`', identifier, parser.name)
-                episode = Episode()
-                episode.identifier = identifier
-                episode.identified_by = parser.id_type
-                # if episodic format
-                if parser.id_type == 'ep':
-                    episode.season = parser.season
-                    episode.number = parser.episode + ix
-                elif parser.id_type == 'sequence':
-                    episode.season = 0
-                    episode.number = parser.id + ix
-                series.episodes.append(episode)
-                logger.debug('-> added `{}`', episode)
-            session.flush()
-
-            # Sets the filter_by, and filter_id for later releases query
-            table = EpisodeRelease
-            filter_by = table.episode_id
-            filter_id = episode.id
-            entity = episode
-
-        # if release does not exists in episode or season, add new
-        #
-        # NOTE:
-        #
-        # filter(Release.episode_id != None) fixes weird bug where release had/has been added
-        # to database but doesn't have episode_id, this causes all kinds of havoc with the plugin.
-        # perhaps a bug in sqlalchemy?
-        release = (
-            session.query(table)
-            .filter(filter_by == filter_id)
-            .filter(table.title == parser.data)
-            .filter(table.quality == quality)
-            .filter(table.proper_count == parser.proper_count)
-            .filter(filter_by.is_not(None))
-            .first()
-        )
-        if not release:
-            logger.debug('adding release `{}`', parser)
-            release = table()
-            release.quality = quality
-            release.proper_count = parser.proper_count
-            release.title = parser.data
-            entity.releases.append(release)
-            logger.debug('-> added `{}`', release)
-        releases.append(release)
+            episode_identifiers.update(parser.identifiers)
+    for chunk in chunked(list(season_identifiers)):
+        for season in (
+            session.query(Season)
+            .filter(Season.series_id == series.id)
+            .filter(Season.identifier.in_(chunk))
+            .order_by(Season.id)
+        ):
+            seasons.setdefault((season.season, season.identifier), season)
+    for chunk in chunked(list(episode_identifiers)):
+        for episode in (
+            session.query(Episode)
+            .filter(Episode.series_id == series.id)
+            .filter(Episode.identifier.in_(chunk))
+            .filter(Episode.series_id.is_not(None))
+            .order_by(Episode.id)
+        ):
+            episodes.setdefault(episode.identifier, episode)
+
+    # Add missing seasons and episodes, in the order store_parser would add them
+    entities = []
+    for parser, _ in parsers:
+        parser_entities = []
+        for ix, identifier in enumerate(parser.identifiers):
+            if parser.season_pack:
+                season = seasons.get((parser.season, identifier))
+                if not season:
+                    logger.debug('adding season `{}` into series `{}`', identifier, parser.name)
+                    season = Season()
+                    season.identifier = identifier
+                    season.identified_by = parser.id_type
+                    season.season = parser.season
+                    series.seasons.append(season)
+                    seasons[(parser.season, identifier)] = season
+                    logger.debug('-> added season `{}`', season)
+                parser_entities.append(season)
+            else:
+                # if episode does not exist in series, add new
+                episode = episodes.get(identifier)
+                if not episode:
+                    logger.debug('adding episode `{}` into series `{}`', identifier, parser.name)
+                    episode = Episode()
+                    episode.identifier = identifier
+                    episode.identified_by = parser.id_type
+                    # if episodic format
+                    if parser.id_type == 'ep':
+                        episode.season = parser.season
+                        episode.number = parser.episode + ix
+                    elif parser.id_type == 'sequence':
+                        episode.season = 0
+                        episode.number = parser.id + ix
+                    series.episodes.append(episode)
+                    episodes[identifier] = episode
+                    logger.debug('-> added `{}`', episode)
+                parser_entities.append(episode)
+        entities.append(parser_entities)
+    session.flush()
+
+    # Existing releases keyed by (release class, entity id, title, quality, proper count)
+    #
+    # NOTE:
+    #
+    # filter(Release.episode_id != None) fixes weird bug where release had/has been added
+    # to database but doesn't have episode_id, this causes all kinds of havoc with the plugin.
+    # perhaps a bug in sqlalchemy?
+    releases = {}
+    for table, filter_by, found in (
+        (SeasonRelease, SeasonRelease.season_id, seasons.values()),
+        (EpisodeRelease, EpisodeRelease.episode_id, episodes.values()),
+    ):
+        titles = {parser.data for parser, _ in parsers}
+        for chunk in chunked(sorted({entity.id for entity in found})):
+            for release in (
+                session.query(table)
+                .filter(filter_by.in_(chunk))
+                .filter(filter_by.is_not(None))
+                .order_by(table.id)
+            ):
+                if release.title in titles:
+                    key = (table, getattr(release, filter_by.key), release.title)
+                    releases.setdefault((*key, release._quality, release.proper_count), release)
+
+    results = []
+    for (parser, quality), parser_entities in zip(parsers, entities, strict=True):
+        parser_releases = []
+        quality_name = quality if isinstance(quality, str) else quality.name
+        for entity in parser_entities:
+            table = SeasonRelease if entity.is_season else EpisodeRelease
+            key = (table, entity.id, parser.data, quality_name, parser.proper_count)
+            release = releases.get(key)
+            if not release:
+                # if release does not exists in episode or season, add new
+                logger.debug('adding release `{}`', parser)
+                release = table()
+                release.quality = quality
+                release.proper_count = parser.proper_count
+                release.title = parser.data
+                if entity.is_season:
+                    release.season = entity
+                else:
+                    release.episode = entity
+                session.add(release)
+                releases[key] = release
+                logger.debug('-> added `{}`', release)
+            parser_releases.append(release)
+        results.append(parser_releases)
     session.flush()  # Make sure autonumber ids are populated
-    return releases
+    return results
 
 
 def add_series_entity(
@@ -280,7 +280,9 @@ class NextSeriesEpisodes:
                 # we keep searching as long as matches are found!
                 # TODO: this should ideally be in discover so it would be more generic
                 task.max_reruns += 1
-                task.rerun(plugin='next_series_episodes', reason='Look for next episode')
+                task.rerun(
+                    plugin='next_series_episodes', reason='Look for next episode', delta=True
+                )
             elif db_release:
                 # There are know releases of this episode, but none were accepted
                 return
@@ -305,7 +307,9 @@ class NextSeriesEpisodes:
                         entry['series_name'],
                         entry['series_id'],
                     )
-                    task.rerun(plugin='next_series_episodes', reason='Look for next season')
+                    task.rerun(
+                        plugin='next_series_episodes', reason='Look for next season', delta=True
+                    )
 
 
 @event('plugin.register')
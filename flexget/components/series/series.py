@@ -509,14 +509,14 @@ class FilterSeries(FilterSeriesBase):
                     continue
 
                 series_entries = {}
-                for entry in found_series[series_name]:
-                    # store found episodes into database and save reference for later use
-                    releases = db.store_parser(
-                        session,
-                        entry['series_parser'],
-                        series=db_series,
-                        quality=entry.get('quality'),
-                    )
+                # store found episodes into database and save reference for later use
+                entries = found_series[series_name]
+                stored = db.store_parsers(
+                    session,
+                    [(entry['series_parser'], entry.get('quality')) for entry in entries],
+                    series=db_series,
+                )
+                for entry, releases in zip(entries, stored, strict=True):
                     entry['series_releases'] = [r.id for r in releases]
                     if hasattr(releases[0], 'episode'):
                         entity = releases[0].episode
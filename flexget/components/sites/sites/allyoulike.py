@@ -59,6 +59,8 @@ class UrlRewriteAllyoulike:
     """
 
     # urlrewriter API
+    url_domains = ('allyoulike.com',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         rewritable_regex = r'^https?:\/\/(www.)?allyoulike\.com\/.*'
@@ -15,6 +15,8 @@ logger = logger.bind(name='animeindex')
 class UrlRewriteAnimeIndex:
     """AnimeIndex urlrewriter."""
 
+    url_domains = ('tracker.anime-index.org',)
+
     def url_rewritable(self, task, entry):
         return entry['url'].startswith(
             'http://tracker.anime-index.org/index.php?page=torrent-details&id='
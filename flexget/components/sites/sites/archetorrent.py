@@ -10,6 +10,8 @@ class UrlRewriteArchetorrent:
     """Archetorrent urlrewriter."""
 
     # urlrewriter API
+    url_domains = ('archetorrent.com',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         return url.startswith('https://www.archetorrent.com') and url.find('download') == -1
@@ -12,6 +12,8 @@ class UrlRewriteBakaBT:
     """BakaBT urlrewriter."""
 
     # urlrewriter API
+    url_domains = ('bakabt.me',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         if url.startswith('https://bakabt.me/download/'):
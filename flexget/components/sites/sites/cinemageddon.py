@@ -11,6 +11,8 @@ logger = logger.bind(name='cinemageddon')
 class UrlRewriteCinemageddon:
     """Cinemageddon urlrewriter."""
 
+    url_domains = ('cinemageddon.net',)
+
     def url_rewritable(self, task, entry):
         return entry['url'].startswith('http://cinemageddon.net/details.php?id=')
 
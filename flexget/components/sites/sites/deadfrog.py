@@ -14,6 +14,8 @@ class UrlRewriteDeadFrog:
     """DeadFrog urlrewriter."""
 
     # urlrewriter API
+    url_domains = ('deadfrog.us',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         if url.startswith('http://www.deadfrog.us/download/'):
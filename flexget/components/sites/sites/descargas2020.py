@@ -41,6 +41,18 @@ class UrlRewriteDescargas2020:
         return self._session
 
     # urlrewriter API
+    url_domains = tuple(
+        f'{name}.{tld}'
+        for name in (
+            'descargas2020',
+            'tvsinpagar',
+            'tumejortorrent',
+            'torrentlocura',
+            'torrentrapid',
+        )
+        for tld in ('org', 'com')
+    )
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         return REWRITABLE_REGEX.match(url) and not NONREWRITABLE_REGEX.match(url)
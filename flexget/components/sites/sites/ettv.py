@@ -20,6 +20,8 @@ class UrlRewriteETTV:
     """ETTV urlrewriter."""
 
     # urlrewriter API
+    url_domains = DOMAINS
+
     def url_rewritable(self, task, entry):
         return urlparse(entry['url']).netloc in DOMAINS
 
@@ -29,6 +29,8 @@ class Eztv:
         'type': 'boolean',
     }
 
+    url_domains = ('eztv.ch',)
+
     def url_rewritable(self, task, entry):
         return urlparse(entry['url']).netloc == 'eztv.ch'
 
@@ -13,6 +13,8 @@ logger = logger.bind(name='FTDB')
 class UrlRewriteFTDB:
     """FTDB RSS url_rewrite."""
 
+    url_domains = ('frenchtorrentdb.com',)
+
     def url_rewritable(self, task, entry):
         # url = entry['url']
         return bool(
@@ -20,6 +20,8 @@ class UrlRewriteGoogleCse:
     """Google custom query urlrewriter."""
 
     # urlrewriter API
+    url_domains = ('google.com',)
+
     def url_rewritable(self, task, entry):
         if entry['url'].startswith('http://www.google.com/cse?'):
             return True
@@ -52,6 +54,8 @@ class UrlRewriteGoogleCse:
 class UrlRewriteGoogle:
     # urlrewriter API
 
+    url_domains = ('google.com',)
+
     def url_rewritable(self, task, entry):
         return bool(entry['url'].startswith('https://www.google.com/search?q='))
 
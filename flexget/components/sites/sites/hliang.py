@@ -14,6 +14,8 @@ class UrlRewriteHliang:
     """Hliang urlrewriter."""
 
     # urlrewriter API
+    url_domains = ('bt.hliang.com',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         return bool(url.startswith('http://bt.hliang.com/show-'))
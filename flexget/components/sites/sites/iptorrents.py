@@ -100,6 +100,8 @@ class UrlRewriteIPTorrents:
     }
 
     # urlrewriter API
+    url_domains = (DOMAIN,)
+
     def url_rewritable(self, task, entry):
         """Determine if the entry's URL is rewriteable (not pointing at a downloadable torrent)."""
         url = entry['url']
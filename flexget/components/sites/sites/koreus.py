@@ -14,6 +14,8 @@ class UrlRewriteKoreus:
     """Koreus urlrewriter."""
 
     # urlrewriter API
+    url_domains = ('koreus.com',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         return bool(url.startswith('http://www.koreus.com'))
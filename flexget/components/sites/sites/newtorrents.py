@@ -21,6 +21,8 @@ class NewTorrents:
         self.resolved = []
 
     # UrlRewriter plugin API
+    url_domains = ('newtorrents.info',)
+
     def url_rewritable(self, task, entry):
         # Return true only for urls that can and should be resolved
         if entry['url'].startswith('http://www.newtorrents.info/down.php?'):
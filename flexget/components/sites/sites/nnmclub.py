@@ -11,6 +11,8 @@ logger = logger.bind(name='nnm-club')
 class UrlRewriteNnmClub:
     """Nnm-club.me urlrewriter."""
 
+    url_domains = ('nnm-club.me',)
+
     def url_rewritable(self, task, entry):
         return entry['url'].startswith('http://nnm-club.me/forum/viewtopic.php?t=')
 
@@ -108,6 +108,8 @@ class UrlRewriteNyaa:
 
         return entries
 
+    url_domains = ('nyaa.si',)
+
     def url_rewritable(self, task, entry):
         return entry['url'].startswith('https://www.nyaa.si/view/')
 
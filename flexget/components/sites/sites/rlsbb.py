@@ -79,6 +79,8 @@ class UrlRewriteRlsbb:
         self.config = config
 
     # urlrewriter API
+    url_domains = ('rlsbb.ru', 'rlsbb.com')
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         rewritable_regex = r'^https?:\/\/(www.)?rlsbb\.(ru|com)\/.*'
@@ -53,6 +53,8 @@ class UrlRewriteRmz:
         self.config = config
 
     # urlrewriter API
+    url_domains = ('rmz.cr', 'rapidmoviez.com', 'rapidmoviez.eu')
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         rewritable_regex = r'^https?:\/\/(www.)?(rmz\.cr|rapidmoviez\.(com|eu))\/.*'
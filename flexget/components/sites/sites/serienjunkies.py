@@ -62,6 +62,8 @@ class UrlRewriteSerienjunkies:
         self.config = config
 
     # urlrewriter API
+    url_domains = ('serienjunkies.org',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         return bool(url.startswith(('http://www.serienjunkies.org/', 'http://serienjunkies.org/')))
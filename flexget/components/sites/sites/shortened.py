@@ -11,6 +11,8 @@ logger = logger.bind(name='shortened')
 class UrlRewriteShortened:
     """Shortened url rewriter."""
 
+    url_domains = ('bit.ly', 't.co')
+
     def url_rewritable(self, task, entry):
         return urlparse(entry['url']).netloc in ['bit.ly', 't.co']
 
@@ -39,6 +39,8 @@ class Site1337x:
     errors = False
 
     # urlrewriter API
+    url_domains = ('1337x.to',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         if url.endswith('.torrent'):
@@ -16,6 +16,8 @@ class SiteRutracker:
     base_url = 'https://api.t-ru.org'
 
     # urlrewriter API
+    url_domains = ('rutracker.org',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         return url.startswith('https://rutracker.org/forum/viewtopic.php?t=')
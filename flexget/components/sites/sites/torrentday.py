@@ -88,6 +88,8 @@ class UrlRewriteTorrentday:
     }
 
     # urlrewriter API
+    url_domains = ('torrentday.com',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         if url.find('.torrent'):
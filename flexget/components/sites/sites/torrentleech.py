@@ -69,6 +69,8 @@ class UrlRewriteTorrentleech:
     }
 
     # urlrewriter API
+    url_domains = ('torrentleech.org',)
+
     def url_rewritable(self, task, entry):
         url = entry['url']
         if url.endswith('.torrent'):
@@ -1,3 +1,5 @@
+from urllib.parse import urlparse
+
 from loguru import logger
 
 from flexget import plugin
@@ -14,11 +16,61 @@ class UrlRewritingError(Exception):
         return repr(self.value)
 
 
+def url_host(url):
+    """Return the hostname of `url` without a leading www, as used to look up urlrewriters."""
+    try:
+        host = urlparse(url).hostname
+    except (TypeError, ValueError):
+        return None
+    if host and host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+class RewriterIndex:
+    """Urlrewriters by the hosts they handle.
+
+    Urlrewriters can declare the domains of the urls they handle in an `url_domains` attribute,
+    they are only asked about urls from those domains (with or without www). Urlrewriters without
+    it are asked about every url.
+    """
+
+    def __init__(self, rewriters):
+        self.names = tuple(rewriter.name for rewriter in rewriters)
+        domains = {}
+        for rewriter in rewriters:
+            declared = getattr(rewriter.instance, 'url_domains', None)
+            if declared is not None:
+                domains[rewriter.name] = {url_host(f'//{domain}') for domain in declared}
+        self.fallback = [rewriter for rewriter in rewriters if rewriter.name not in domains]
+        # Rewriters stay in plugin order for every host
+        self.by_host = {
+            host: [
+                rewriter
+                for rewriter in rewriters
+                if rewriter.name not in domains or host in domains[rewriter.name]
+            ]
+            for host in set().union(*domains.values())
+        }
+
+    def candidates(self, url):
+        """Return the urlrewriters which may handle `url`."""
+        return self.by_host.get(url_host(url), self.fallback)
+
+
 class PluginUrlRewriting:
     """Provide URL rewriting framework."""
 
     def __init__(self):
         self.disabled_rewriters = []
+        self._index = None
+
+    def rewriters(self, url):
+        """Return the urlrewriters to ask about `url`, in plugin order."""
+        rewriters = list(plugin.get_plugins(interface='urlrewriter'))
+        if self._index is None or self._index.names != tuple(r.name for r in rewriters):
+            self._index = RewriterIndex(rewriters)
+        return self._index.candidates(url)
 
     def on_task_urlrewrite(self, task, config):
         logger.debug('Checking {} entries', len(task.accepted))
@@ -33,7 +85,7 @@ class PluginUrlRewriting:
     # API method
     def url_rewritable(self, task, entry):
         """Return True if entry is urlrewritable by registered rewriter."""
-        for urlrewriter in plugin.get_plugins(interface='urlrewriter'):
+        for urlrewriter in self.rewriters(entry['url']):
             if urlrewriter.name in self.disabled_rewriters:
                 logger.trace("Skipping rewriter {} since it's disabled", urlrewriter.name)
                 continue
@@ -54,7 +106,7 @@ class PluginUrlRewriting:
                     f'URL rewriting was left in infinite loop while rewriting url for {entry}, '
                     'some rewriter is returning always True'
                 )
-            for urlrewriter in plugin.get_plugins(interface='urlrewriter'):
+            for urlrewriter in self.rewriters(entry['url']):
                 name = urlrewriter.name
                 if name in self.disabled_rewriters:
                     logger.trace("Skipping rewriter {} since it's disabled", name)
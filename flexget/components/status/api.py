@@ -8,6 +8,7 @@ from sqlalchemy.orm.exc import NoResultFound
 
 from flexget.api.app import APIResource, NotFoundError, api, etag, pagination_headers
 from flexget.api.core.tasks import tasks_api
+from flexget.utils.database import read_only
 
 from . import db
 
@@ -50,12 +51,53 @@ class ObjectsContainer:
 
     task_status_list_schema = {'type': 'array', 'items': task_status_schema}
 
+    plugin_performance_schema = {
+        'type': 'object',
+        'properties': {
+            'phase': {'type': 'string'},
+            'plugin': {'type': 'string'},
+            'runs': {'type': 'integer'},
+            'wall_p50': {'type': 'number'},
+            'wall_p95': {'type': 'number'},
+            'cpu_p50': {'type': 'number'},
+            'cpu_p95': {'type': 'number'},
+            'queries': {'type': 'number'},
+            'requests': {'type': 'number'},
+        },
+        'additionalProperties': False,
+    }
+
+    plugin_performance_list_schema = {'type': 'array', 'items': plugin_performance_schema}
+
+    execution_performance_schema = {
+        'type': 'object',
+        'properties': {
+            'id': {'type': 'integer'},
+            'execution_id': {'type': 'integer'},
+            'phase': {'type': 'string'},
+            'plugin': {'type': 'string'},
+            'wall_time': {'type': 'number'},
+            'cpu_time': {'type': 'number'},
+            'queries': {'type': 'integer'},
+            'requests': {'type': 'integer'},
+        },
+        'additionalProperties': False,
+    }
+
+    execution_performance_list_schema = {'type': 'array', 'items': execution_performance_schema}
+
 
 task_status = api.schema_model('tasks.tasks_status', ObjectsContainer.task_status_schema)
 task_status_list = api.schema_model(
     'tasks.tasks_status_list', ObjectsContainer.task_status_list_schema
 )
 task_executions = api.schema_model('tasks.tasks_executions_list', ObjectsContainer.executions_list)
+plugin_performance_list = api.schema_model(
+    'tasks.plugin_performance_list', ObjectsContainer.plugin_performance_list_schema
+)
+execution_performance_list = api.schema_model(
+    'tasks.execution_performance_list', ObjectsContainer.execution_performance_list_schema
+)
 
 sort_choices = ('last_execution_time', 'name', 'id')
 tasks_parser = api.pagination_parser(sort_choices=sort_choices)
@@ -71,6 +113,7 @@ tasks_parser.add_argument(
 @status_api.route('/')
 @api.doc(expect=[tasks_parser])
 class TasksStatusAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, model=task_status_list)
     def get(self, session=None):
@@ -141,6 +184,7 @@ class TasksStatusAPI(APIResource):
 @status_api.route('/<int:task_id>/')
 @api.doc(params={'task_id': 'ID of the status task'}, expect=[tasks_parser])
 class TaskStatusAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, model=task_status)
     @api.response(NotFoundError)
@@ -203,6 +247,7 @@ executions_parser = api.pagination_parser(executions_parser, sort_choices=sort_c
 @status_api.route('/<int:task_id>/executions/')
 @api.doc(expect=[executions_parser], params={'task_id': 'ID of the status task'})
 class TaskStatusExecutionsAPI(APIResource):
+    @read_only
     @etag
     @api.response(200, model=task_executions)
     @api.response(NotFoundError)
@@ -270,3 +315,51 @@ class TaskStatusExecutionsAPI(APIResource):
         # Add link header to response
         rsp.headers.extend(pagination)
         return rsp
+
+
+performance_parser = api.parser()
+performance_parser.add_argument(
+    'limit', type=int, default=50, help='Amount of most recent executions to aggregate'
+)
+
+
+@tasks_api.route('/status/<int:task_id>/performance/')
+@status_api.route('/<int:task_id>/performance/')
+@api.doc(expect=[performance_parser], params={'task_id': 'ID of the status task'})
+class TaskStatusPerformanceAPI(APIResource):
+    @read_only
+    @etag
+    @api.response(200, model=plugin_performance_list)
+    @api.response(NotFoundError)
+    def get(self, task_id, session=None):
+        """Get p50/p95 timings per plugin over the latest task executions."""
+        try:
+            session.query(db.StatusTask).filter(db.StatusTask.id == task_id).one()
+        except NoResultFound:
+            raise NotFoundError(f'task status with id {task_id} not found')
+
+        args = performance_parser.parse_args()
+        return jsonify(db.get_plugin_performance(task_id, limit=args['limit'], session=session))
+
+
+@tasks_api.route('/status/<int:task_id>/executions/<int:execution_id>/performance/')
+@status_api.route('/<int:task_id>/executions/<int:execution_id>/performance/')
+@api.doc(params={'task_id': 'ID of the status task', 'execution_id': 'ID of the execution'})
+class TaskExecutionPerformanceAPI(APIResource):
+    @read_only
+    @etag
+    @api.response(200, model=execution_performance_list)
+    @api.response(NotFoundError)
+    def get(self, task_id, execution_id, session=None):
+        """Get per plugin timings of a single task execution."""
+        try:
+            execution = (
+                session.query(db.TaskExecution)
+                .filter(db.TaskExecution.task_id == task_id)
+                .filter(db.TaskExecution.id == execution_id)
+                .one()
+            )
+        except NoResultFound:
+            raise NotFoundError(f'execution with id {execution_id} not found')
+
+        return jsonify([p.to_dict() for p in execution.performance])
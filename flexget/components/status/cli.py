@@ -6,7 +6,7 @@ from sqlalchemy.orm.exc import NoResultFound
 
 from flexget import options
 from flexget.event import event
-from flexget.manager import Session
+from flexget.manager import ReadSession
 from flexget.terminal import TerminalTable, colorize, console, disable_colors, table_parser
 
 from . import db
@@ -15,7 +15,9 @@ from . import db
 def do_cli(manager, options):
     if options.table_type == 'porcelain':
         disable_colors()
-    if options.task:
+    if options.performance:
+        do_cli_performance(manager, options)
+    elif options.task:
         do_cli_task(manager, options)
     else:
         do_cli_summary(manager, options)
@@ -24,7 +26,7 @@ def do_cli(manager, options):
 def do_cli_task(manager, options):
     header = ['Start', 'Duration', 'Entries', 'Accepted', 'Rejected', 'Failed', 'Abort Reason']
     table = TerminalTable(*header, table_type=options.table_type)
-    with Session() as session:
+    with ReadSession() as session:
         try:
             task = session.query(db.StatusTask).filter(db.StatusTask.name == options.task).one()
         except NoResultFound:
@@ -54,6 +56,48 @@ def do_cli_task(manager, options):
     console(table)
 
 
+def do_cli_performance(manager, options):
+    header = [
+        'Task',
+        'Phase',
+        'Plugin',
+        'Runs',
+        'Wall p50',
+        'Wall p95',
+        'CPU p50',
+        'CPU p95',
+        'Queries',
+        'Requests',
+    ]
+    table = TerminalTable(*header, table_type=options.table_type)
+    with ReadSession() as session:
+        tasks = session.query(db.StatusTask)
+        if options.task:
+            tasks = tasks.filter(db.StatusTask.name == options.task)
+        tasks = tasks.order_by(db.StatusTask.name).all()
+        if not tasks:
+            if options.task:
+                console(f'Task name `{options.task}` does not exists or does not have any records')
+            else:
+                console('No status records found')
+            return
+        for task in tasks:
+            for row in db.get_plugin_performance(task.id, limit=options.limit, session=session):
+                table.add_row(
+                    task.name,
+                    row['phase'],
+                    row['plugin'],
+                    str(row['runs']),
+                    f'{row["wall_p50"]:.3f}s',
+                    f'{row["wall_p95"]:.3f}s',
+                    f'{row["cpu_p50"]:.3f}s',
+                    f'{row["cpu_p95"]:.3f}s',
+                    f'{row["queries"]:.1f}',
+                    f'{row["requests"]:.1f}',
+                )
+    console(table)
+
+
 def do_cli_summary(manager, options):
     header = [
         'Task',
@@ -67,7 +111,7 @@ def do_cli_summary(manager, options):
     ]
     table = TerminalTable(*header, table_type=options.table_type)
 
-    with Session() as session:
+    with ReadSession() as session:
         for task in session.query(db.StatusTask).all():
             ok = (
                 session.query(db.TaskExecution)
@@ -127,3 +171,8 @@ def register_parser_arguments():
         default=50,
         help='Limit to %(metavar)s results',
     )
+    parser.add_argument(
+        '--performance',
+        action='store_true',
+        help='Show p50/p95 timings per plugin over the last --limit executions',
+    )
@@ -2,7 +2,7 @@ import datetime
 from datetime import timedelta
 
 from loguru import logger
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, func, select
+from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, func, select
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.schema import ForeignKey
@@ -10,7 +10,12 @@ from sqlalchemy.schema import ForeignKey
 from flexget import db_schema
 from flexget.event import event
 from flexget.utils.database import with_session
-from flexget.utils.sqlalchemy_utils import create_index, drop_index, index_exists
+from flexget.utils.sqlalchemy_utils import (
+    create_index,
+    delete_in_chunks,
+    drop_index,
+    index_exists,
+)
 
 logger = logger.bind(name='status.db')
 Base = db_schema.versioned_base('status', 3)
@@ -80,6 +85,10 @@ class TaskExecution(Base):
     failed = Column(Integer)
     abort_reason = Column(String, nullable=True)
 
+    performance = relationship(
+        'PluginPerformance', backref='execution', cascade='all, delete, delete-orphan'
+    )
+
     def __repr__(self):
         return f'<TaskExecution(task_id={self.task_id},start={self.start},end={self.end},succeeded={self.succeeded},p={self.produced},a={self.accepted},r={self.rejected},f={self.failed},reason={self.abort_reason})>'
 
@@ -98,6 +107,36 @@ class TaskExecution(Base):
         }
 
 
+class PluginPerformance(Base):
+    __tablename__ = 'status_plugin_performance'
+    id = Column(Integer, primary_key=True)
+    execution_id = Column(Integer, ForeignKey('status_execution.id'), index=True)
+
+    phase = Column(String)
+    plugin = Column(String)
+    # Seconds spent in the plugin
+    wall_time = Column(Float)
+    cpu_time = Column(Float)
+    # Amount of SQL queries and HTTP requests issued by the plugin
+    queries = Column(Integer)
+    requests = Column(Integer)
+
+    def __repr__(self):
+        return f'<PluginPerformance(execution_id={self.execution_id},phase={self.phase},plugin={self.plugin},wall={self.wall_time},cpu={self.cpu_time},q={self.queries},r={self.requests})>'
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'execution_id': self.execution_id,
+            'phase': self.phase,
+            'plugin': self.plugin,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'queries': self.queries,
+            'requests': self.requests,
+        }
+
+
 @event('manager.db_cleanup')
 def db_cleanup(manager, session):
     # Purge all status data for non existing tasks
@@ -107,11 +146,20 @@ def db_cleanup(manager, session):
             session.delete(status_task)
 
     # Purge task executions older than 1 year
-    result = (
-        session.query(TaskExecution)
-        .filter(TaskExecution.start < datetime.datetime.now() - timedelta(days=365))
-        .delete()
+    old_executions = session.query(TaskExecution).filter(
+        TaskExecution.start < datetime.datetime.now() - timedelta(days=365)
+    )
+    delete_in_chunks(
+        session,
+        session.query(PluginPerformance).filter(
+            PluginPerformance.execution_id.in_(
+                old_executions.with_entities(TaskExecution.id).scalar_subquery()
+            )
+        ),
     )
+    if session.info.get('cleanup_incomplete'):
+        return
+    result = delete_in_chunks(session, old_executions)
     if result:
         logger.verbose('Removed {} task executions from history older than 1 year', result)
 
@@ -175,3 +223,55 @@ def get_executions_by_task_id(
     else:
         query = query.order_by(getattr(TaskExecution, order_by))
     return query.slice(start, stop).all()
+
+
+def percentile(values, percent):
+    """Return the `percent` percentile of `values` using linear interpolation."""
+    if not values:
+        return None
+    values = sorted(values)
+    k = (len(values) - 1) * percent / 100
+    lower = int(k)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (k - lower)
+
+
+@with_session
+def get_plugin_performance(task_id, limit=50, session=None):
+    """Aggregate per-plugin performance over the last `limit` executions of a task.
+
+    :return: List of dicts with p50/p95 wall and cpu time, and mean query and request counts,
+        for each (phase, plugin) pair. Sorted by p95 wall time, slowest first.
+    """
+    logger.debug('querying plugin performance: task_id={}, limit={}', task_id, limit)
+    executions = (
+        session.query(TaskExecution.id)
+        .filter(TaskExecution.task_id == task_id)
+        .order_by(TaskExecution.start.desc())
+        .limit(limit)
+    )
+    rows = (
+        session.query(PluginPerformance)
+        .filter(PluginPerformance.execution_id.in_(executions.scalar_subquery()))
+        .all()
+    )
+    grouped = {}
+    for row in rows:
+        grouped.setdefault((row.phase, row.plugin), []).append(row)
+    results = []
+    for (phase, plugin_name), samples in grouped.items():
+        wall = [s.wall_time for s in samples]
+        cpu = [s.cpu_time for s in samples]
+        results.append({
+            'phase': phase,
+            'plugin': plugin_name,
+            'runs': len(samples),
+            'wall_p50': percentile(wall, 50),
+            'wall_p95': percentile(wall, 95),
+            'cpu_p50': percentile(cpu, 50),
+            'cpu_p95': percentile(cpu, 95),
+            'queries': sum(s.queries for s in samples) / len(samples),
+            'requests': sum(s.requests for s in samples) / len(samples),
+        })
+    results.sort(key=lambda r: r['wall_p95'], reverse=True)
+    return results
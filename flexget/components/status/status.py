@@ -1,15 +1,60 @@
 import datetime
+import time
+import weakref
 
 from loguru import logger
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
 
 from flexget import plugin
 from flexget.event import event
 from flexget.manager import Session
+from flexget.utils.requests import request_count
+from flexget.utils.tools import ContextCounter
 
 from . import db
 
 logger = logger.bind(name='status')
 
+# Counts SQL statements executed, per thread
+_query_counter = ContextCounter('query_counter')
+
+# Per task accumulated plugin timings, {(phase, plugin): [wall, cpu, queries, requests]}
+_timings = weakref.WeakKeyDictionary()
+# Counter snapshots taken before the currently running plugin of each task
+_started = weakref.WeakKeyDictionary()
+
+
+def query_count():
+    """Return the number of SQL statements executed by the current thread so far.
+
+    Statements of work the thread ran in copies of its context are included.
+    """
+    return _query_counter.value
+
+
+@sa_event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    _query_counter.increment()
+
+
+@event('task.execute.before_plugin')
+def before_plugin(task, keyword):
+    _started[task] = (time.perf_counter(), time.thread_time(), query_count(), request_count())
+
+
+@event('task.execute.after_plugin')
+def after_plugin(task, keyword):
+    started = _started.pop(task, None)
+    if started is None:
+        return
+    wall, cpu, queries, requests = started
+    data = _timings.setdefault(task, {}).setdefault((task.current_phase, keyword), [0, 0, 0, 0])
+    data[0] += time.perf_counter() - wall
+    data[1] += time.thread_time() - cpu
+    data[2] += query_count() - queries
+    data[3] += request_count() - requests
+
 
 class Status:
     """Track health status of tasks."""
@@ -50,6 +95,17 @@ class Status:
                 self.execution.succeeded = False
                 self.execution.abort_reason = task.abort_reason
             self.execution.end = datetime.datetime.now()
+            for (phase, name), (wall, cpu, queries, requests) in _timings.pop(task, {}).items():
+                self.execution.performance.append(
+                    db.PluginPerformance(
+                        phase=phase,
+                        plugin=name,
+                        wall_time=wall,
+                        cpu_time=cpu,
+                        queries=queries,
+                        requests=requests,
+                    )
+                )
             session.merge(self.execution)
 
     on_task_abort = on_task_exit
@@ -4,6 +4,7 @@ import datetime
 import functools
 import os
 import re
+import threading
 from collections import defaultdict
 from json import JSONDecodeError
 from json import loads as json_loads
@@ -14,8 +15,9 @@ import jsonschema
 from jsonschema import ValidationError
 from loguru import logger
 from referencing import Registry as _Registry
-from referencing import Resource
+from referencing import Specification
 from referencing.exceptions import Unresolvable
+from referencing.jsonschema import DRAFT202012
 
 from flexget import options
 from flexget.event import event, fire_event
@@ -28,6 +30,9 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from re import Match, Pattern
 
+    from jsonschema.protocols import Validator
+    from referencing import Resource
+
 logger = logger.bind(name='config_schema')
 
 BASE_SCHEMA_NAME = 'draft2020-12'
@@ -36,6 +41,14 @@ BaseValidator = jsonschema.Draft202012Validator
 # Type hint for json schemas. (If we upgrade to a newer json schema version, the type might allow more than dicts.)
 JsonSchema = dict[str, Any] | bool
 schema_paths: dict[str, JsonSchema | Callable[..., JsonSchema]] = {}
+# Resolved schemas and validators are reused across validations, until any schema is (re-)registered
+_cache_lock = threading.Lock()
+_schema_generation = 0
+_resource_cache: dict[str, Resource] = {}
+_validator_cache: dict[tuple[str, bool], Validator] = {}
+# Number of format checks which looked at the file system so far. Their outcome can change while the
+# config stays the same, so validation results involving them should not be reused.
+file_system_checks = 0
 
 
 class ConfigValidationError(ValidationError):
@@ -54,6 +67,15 @@ def register_schema(path: str, schema: JsonSchema | Callable[..., JsonSchema]):
     :param schema: The schema, or function which returns the schema
     """
     schema_paths[path] = schema
+    _schemas_changed()
+
+
+def _schemas_changed() -> None:
+    global _schema_generation
+    with _cache_lock:
+        _schema_generation += 1
+        _resource_cache.clear()
+        _validator_cache.clear()
 
 
 # Validator that handles root structure of config.
@@ -125,37 +147,61 @@ def resolve_ref(uri: str) -> JsonSchema:
 
 
 def retrieve_resource(uri: str) -> Resource:
-    return Resource.from_contents(resolve_ref(uri))
+    with _cache_lock:
+        resource = _resource_cache.get(uri)
+        generation = _schema_generation
+    if resource is None:
+        contents = resolve_ref(uri)
+        # Without a $schema the referring validator's class is used for the referenced schema too,
+        # which keeps defaults being set across $refs
+        contents.pop('$schema', None)
+        resource = _specification.create_resource(contents)
+        with _cache_lock:
+            # Resolving may have loaded a lazy plugin, which registers its real schema
+            if generation == _schema_generation:
+                _resource_cache[uri] = resource
+    return resource
+
+
+def get_validator(schema: JsonSchema | str | None = None, set_defaults: bool = True) -> Validator:
+    """Return a validator for `schema`, which may also be given as the uri of a registered schema.
+
+    Validators for registered schemas (and the root config schema, when `schema` is not given) are
+    built once and shared. They can be used from several threads at once.
+
+    :param set_defaults: Whether the validator fills in defaults from the schema.
+    """
+    # Make sure all schemas have been registered
+    get_schema()
+    if schema is None:
+        schema = '/schema/config'
+    elif isinstance(schema, dict) and schema.keys() == {'$ref'}:
+        schema = schema['$ref']
+    validator_class = SchemaValidatorWDefaults if set_defaults else SchemaValidator
+    if not isinstance(schema, str):
+        return validator_class(schema, registry=Registry(), format_checker=format_checker)
+    key = (schema, set_defaults)
+    with _cache_lock:
+        validator = _validator_cache.get(key)
+        if validator is None:
+            validator = _validator_cache[key] = validator_class(
+                {'$ref': schema}, registry=Registry(), format_checker=format_checker
+            )
+    return validator
 
 
 def process_config(
-    config: Any, schema: JsonSchema | None = None, set_defaults: bool = True
+    config: Any, schema: JsonSchema | str | None = None, set_defaults: bool = True
 ) -> list[ConfigValidationError]:
     """Validate the config, and set defaults within it if `set_defaults` is set.
 
-    If schema is not given, uses the root config schema.
+    If schema is not given, uses the root config schema. It can also be the uri of a registered
+    schema, see :func:`get_validator`.
 
     :returns: A list with :class:`jsonschema.ValidationError` if any
 
     """
-    if schema is None:
-        schema = get_schema()
-
-    registry = Registry()
-    if set_defaults:
-        # Use the jsonschema 'validates' decorator to make sure our custom behavior continues across $refs
-        # which declare a $schema. https://github.com/python-jsonschema/jsonschema/issues/994
-        jsonschema.validators.validates(f'{BASE_SCHEMA_NAME} w defaults')(SchemaValidatorWDefaults)
-        validator = SchemaValidatorWDefaults(
-            schema, registry=registry, format_checker=format_checker
-        )
-    else:
-        validator = SchemaValidator(schema, registry=registry, format_checker=format_checker)
-    try:
-        errors: list[ValidationError] = list(validator.iter_errors(config))
-    finally:
-        # Make sure we don't leave the default setting validator installed
-        jsonschema.validators.validates(BASE_SCHEMA_NAME)(SchemaValidator)
+    errors: list[ValidationError] = list(get_validator(schema, set_defaults).iter_errors(config))
     # Customize the error messages
     for e in errors:
         set_error_message(e)
@@ -204,6 +250,15 @@ def parse_size(size_input: str, si: bool = False) -> int:
 
 
 Registry = functools.partial(_Registry, retrieve=retrieve_resource)
+# Registered schemas have no $id or anchors below their root. Not looking for them saves walking
+# each referenced schema again on every lookup of another $ref.
+_specification = Specification(
+    name=f'{BASE_SCHEMA_NAME} without subresources',
+    id_of=DRAFT202012.id_of,
+    subresources_of=lambda contents: (),
+    anchors_in=lambda specification, contents: (),
+    maybe_in_subresource=DRAFT202012.maybe_in_subresource,
+)
 
 
 format_checker = jsonschema.FormatChecker(('email',))
@@ -261,10 +316,16 @@ def is_regex(instance) -> bool | Pattern:
         raise ValueError(f'Error parsing regex: {e}')
 
 
+def _count_file_system_check() -> None:
+    global file_system_checks
+    file_system_checks += 1
+
+
 @format_checker.checks('file', raises=ValueError)
 def is_file(instance) -> bool:
     if not isinstance(instance, str):
         return True
+    _count_file_system_check()
     if os.path.isfile(os.path.expanduser(instance)):
         return True
     raise ValueError(f'`{instance}` does not exist')
@@ -318,6 +379,7 @@ def is_episode_or_season_id(instance):
 def is_valid_template(instance) -> bool:
     if not isinstance(instance, str):
         return True
+    _count_file_system_check()
     return get_template(instance) is not None
 
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import copy
 import functools
+import sys
 import types
 import warnings
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from enum import Enum
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import TYPE_CHECKING
 
 import pendulum
@@ -13,7 +15,7 @@ from loguru import logger
 
 from flexget import plugin
 from flexget.utils.lazy_dict import LazyDict, LazyLookup
-from flexget.utils.serialization import Serializer, deserialize, serialize
+from flexget.utils.serialization import DeferredValue, Serializer, deserialize, serialize
 from flexget.utils.template import CoercingDateTime, FlexGetTemplate, render_from_entry
 
 if TYPE_CHECKING:
@@ -54,6 +56,28 @@ class EntryState(Enum):
         return hash(self.value)
 
 
+# Field values of these types are never modified in place, copies of entries can share them
+IMMUTABLE_TYPES = (
+    str,
+    int,
+    float,
+    bytes,
+    type(None),
+    date,
+    timedelta,
+    PurePath,
+    Enum,
+    DeferredValue,
+)
+
+HOOK_ACTIONS = ('accept', 'reject', 'fail', 'complete')
+
+# Serialized field values of these types are stored as is when deserializing
+PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+# Dates need to go through __setitem__ when deserializing, they are not deferred
+EAGER_SERIALIZERS = frozenset(('DateTimeSerializer', 'DateSerializer'))
+
+
 class EntryUnicodeError(Exception):
     """Thrown when trying to set non-unicode compatible field value to entry."""
 
@@ -78,13 +102,11 @@ class Entry(LazyDict, Serializer):
     and trigger :meth:`~flexget.task.Task.abort`.
     """
 
+    __slots__ = ('_hooks', '_lazy_lookups', '_state', '_traces', 'task')
+
     def __init__(self, *args, **kwargs):
         super().__init__()
-        self.traces = []
-        self._state = EntryState.UNDECIDED
-        self._hooks = {'accept': [], 'reject': [], 'fail': [], 'complete': []}
-        self.task = None
-        self.lazy_lookups = []
+        self._reset()
 
         if len(args) == 2:
             kwargs['title'] = args[0]
@@ -94,6 +116,55 @@ class Entry(LazyDict, Serializer):
         # Make sure constructor does not escape our __setitem__ enforcement
         self.update(*args, **kwargs)
 
+    def _reset(self) -> None:
+        # Traces, hooks and lazy lookups are allocated once needed, most entries never use them
+        self._traces = None
+        self._state = EntryState.UNDECIDED
+        self._hooks = None
+        self.task = None
+        self._lazy_lookups = None
+
+    @property
+    def traces(self) -> list[tuple[str | None, str | None, str | None]]:
+        if self._traces is None:
+            self._traces = []
+        return self._traces
+
+    @property
+    def lazy_lookups(self) -> list[tuple]:
+        if self._lazy_lookups is None:
+            self._lazy_lookups = []
+        return self._lazy_lookups
+
+    def __copy__(self):
+        new = super().__copy__()
+        new._reset()
+        if self._lazy_lookups:
+            new._lazy_lookups = list(self._lazy_lookups)
+        return new
+
+    copy = __copy__
+
+    def __deepcopy__(self, memo):
+        new = type(self).__new__(type(self))
+        memo[id(self)] = new
+        mutable = {
+            key: copy.deepcopy(value, memo)
+            for key, value in self.store.items()
+            if not isinstance(value, IMMUTABLE_TYPES)
+        }
+        if mutable:
+            new.store = {**self.store, **mutable}
+            new._shared = False
+        else:
+            new._share_store(self)
+        new._state = self._state
+        new._traces = None if self._traces is None else list(self._traces)
+        new._hooks = None if self._hooks is None else {k: list(v) for k, v in self._hooks.items()}
+        new.task = self.task
+        new._lazy_lookups = copy.deepcopy(self._lazy_lookups, memo)
+        return new
+
     def trace(
         self,
         message: str | None,
@@ -114,13 +185,21 @@ class Entry(LazyDict, Serializer):
         if item not in self.traces:
             self.traces.append(item)
 
+    @property
+    def has_hooks(self) -> bool:
+        return bool(self._hooks)
+
     def run_hooks(self, action: str, **kwargs) -> None:
         """Run hooks that have been registered for given ``action``.
 
         :param action: Name of action to run hooks for
         :param kwargs: Keyword arguments that should be passed to the registered functions
         """
-        for func in self._hooks[action]:
+        if action not in HOOK_ACTIONS:
+            raise KeyError(action)
+        if not self._hooks:
+            return
+        for func in self._hooks.get(action, ()):
             func(self, **kwargs)
 
     def add_hook(self, action: str, func: Callable, **kwargs) -> None:
@@ -131,10 +210,11 @@ class Entry(LazyDict, Serializer):
         :param kwargs: Keyword arguments that should be passed to ``func``
         :raises: ValueError when given an invalid ``action``
         """
-        try:
-            self._hooks[action].append(functools.partial(func, **kwargs))
-        except KeyError:
+        if action not in HOOK_ACTIONS:
             raise ValueError(f'`{action}` is not a valid entry action')
+        if self._hooks is None:
+            self._hooks = {}
+        self._hooks.setdefault(action, []).append(functools.partial(func, **kwargs))
 
     def on_accept(self, func: Callable, **kwargs) -> None:
         """Register a function to be called when this entry is accepted.
@@ -172,7 +252,7 @@ class Entry(LazyDict, Serializer):
         if self.rejected:
             logger.debug('tried to accept rejected {!r}', self)
         elif not self.accepted:
-            self._state = EntryState.ACCEPTED
+            self._set_state(EntryState.ACCEPTED)
             self.trace(reason, operation='accept')
             # Run entry on_accept hooks
             self.run_hooks('accept', reason=reason, **kwargs)
@@ -185,7 +265,7 @@ class Entry(LazyDict, Serializer):
             self.trace(f'Tried to reject immortal {reason_str}')
             return
         if not self.rejected:
-            self._state = EntryState.REJECTED
+            self._set_state(EntryState.REJECTED)
             self.trace(reason, operation='reject')
             # Run entry on_reject hooks
             self.run_hooks('reject', reason=reason, **kwargs)
@@ -193,12 +273,19 @@ class Entry(LazyDict, Serializer):
     def fail(self, reason: str | None = None, **kwargs):
         logger.debug("Marking entry '{}' as failed", self['title'])
         if not self.failed:
-            self._state = EntryState.FAILED
+            self._set_state(EntryState.FAILED)
             self.trace(reason, operation='fail')
             logger.error('Failed {} ({})', self['title'], reason)
             # Run entry on_fail hooks
             self.run_hooks('fail', reason=reason, **kwargs)
 
+    def _set_state(self, state: EntryState) -> None:
+        previous, self._state = self._state, state
+        # Keep the state indexes of our task up to date
+        entries = getattr(self.task, 'all_entries', None)
+        if entries is not None:
+            entries.entry_state_changed(self, previous)
+
     def complete(self, **kwargs):
         # Run entry on_complete hooks
         self.run_hooks('complete', **kwargs)
@@ -224,6 +311,9 @@ class Entry(LazyDict, Serializer):
         return self._state == EntryState.UNDECIDED
 
     def __setitem__(self, key, value):
+        # Field names repeat across all entries, share one copy of each
+        if type(key) is str:
+            key = sys.intern(key)
         # Enforce unicode compatibility.
         if isinstance(value, bytes):
             raise EntryUnicodeError(key, value)
@@ -267,6 +357,11 @@ class Entry(LazyDict, Serializer):
 
         super().__setitem__(key, value)
 
+        if key in ('title', 'url'):
+            entries = getattr(self.task, 'all_entries', None)
+            if entries is not None:
+                entries.entry_changed(self)
+
     def safe_str(self) -> str:
         return f'{self["title"]} | {self["url"]}'
 
@@ -324,15 +419,19 @@ class Entry(LazyDict, Serializer):
     @classmethod
     def serialize(cls, entry: Entry) -> dict:
         fields = {}
-        for key in entry:
+        for key, value in entry.store.items():
             if key.startswith('_') or entry.is_lazy(key):
                 continue
+            if isinstance(value, DeferredValue):
+                # Never accessed since it was loaded, no need to deserialize it
+                fields[key] = value.serialized()
+                continue
             try:
                 fields[key] = serialize(entry[key])
             except TypeError as exc:
                 logger.debug('field {} was not serializable. {}', key, exc)
         lazy_lookups = []
-        for ll in entry.lazy_lookups:
+        for ll in entry._lazy_lookups or ():
             try:
                 lazy_lookups.append(serialize(ll))
             except TypeError:
@@ -344,8 +443,20 @@ class Entry(LazyDict, Serializer):
     @classmethod
     def deserialize(cls, data, version) -> Entry:
         result = cls()
+        store = result.store
         for key, value in data['fields'].items():
-            result[key] = deserialize(value)
+            if key in ('title', 'url', 'location'):
+                result[key] = deserialize(value)
+            elif type(value) in PLAIN_TYPES:
+                # These were checked when originally set
+                store[sys.intern(key)] = value
+            elif isinstance(value, DeferredValue):
+                store[sys.intern(key)] = value
+            elif isinstance(value, dict) and value.get('serializer') in EAGER_SERIALIZERS:
+                result[key] = deserialize(value)
+            else:
+                # Decoded once accessed, so loading many entries only pays for the fields used
+                store[sys.intern(key)] = DeferredValue(value)
         for lazy_lookup in deserialize(data['lazy_lookups']):
             result.add_lazy_fields(*lazy_lookup)
         return result
@@ -427,6 +538,9 @@ class LazyFunc:
             # This is a method of a plugin class, bind the function to the plugin instance
             plugin_class_name = self._func.__qualname__.split('.')[0]
             for p in plugin.plugins.values():
+                # Modules with lazy lookups are always imported, no need to load deferred plugins
+                if isinstance(p, plugin.LazyPluginInfo):
+                    continue
                 if p.plugin_class.__name__ == plugin_class_name:
                     return types.MethodType(self._func, p.instance)
             raise TypeError(
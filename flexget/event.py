@@ -94,9 +94,9 @@ def remove_event_handlers(name: str) -> None:
 
 def remove_event_handler(name: str, func: Callable) -> None:
     """Remove `func` from the handlers for event `name`."""
-    for e in list(_events.get(name, [])):
-        if e.func is func:
-            _events[name].remove(e)
+    if name in _events:
+        # Events compare equal by priority, list.remove could take out another handler
+        _events[name] = [e for e in _events[name] if e.func is not func]
 
 
 def fire_event(name: str, *args, **kwargs) -> Any:
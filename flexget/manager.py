@@ -28,11 +28,16 @@ from sqlalchemy.orm import declarative_base, sessionmaker
 
 # These need to be declared before we start importing from other flexget modules, since they might import them
 from flexget.config_schema import ConfigError
-from flexget.utils.sqlalchemy_utils import ContextSession
+from flexget.utils.sqlalchemy_utils import ContextSession, apply_sqlite_profile, is_sqlite_file
 from flexget.utils.tools import get_current_flexget_version, io_encoding, pid_exists
 
 Base = declarative_base()
 Session: type[ContextSession] = sessionmaker(class_=ContextSession)
+# Sessions which only read, these use a separate pool of connections which don't wait on the writer
+ReadSession: type[ContextSession] = sessionmaker(class_=ContextSession)
+
+# Number of pooled read-only connections to a file backed SQLite database
+READ_POOL_SIZE = 4
 
 import flexget.log  # noqa: E402
 from flexget import config_schema, db_schema, plugin  # noqa: E402
@@ -47,6 +52,7 @@ from flexget.options import (  # noqa: E402
 from flexget.task import Task  # noqa: E402
 from flexget.task_queue import TaskQueue  # noqa: E402
 from flexget.terminal import console, get_console_output  # noqa: E402
+from flexget.utils import serialization  # noqa: E402
 
 if TYPE_CHECKING:
     import argparse
@@ -59,10 +65,45 @@ if TYPE_CHECKING:
 
 logger = logger.bind(name='manager')
 
+# The libyaml based loader is several times faster, use it when PyYAML was built with it
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+# Root config sections mapping names to plugin configs, their items are validated (and cached) one by one
+CACHED_CONFIG_SECTIONS = ('tasks', 'templates')
+
 manager: Manager | None = None
 DB_CLEANUP_INTERVAL = timedelta(days=7)
 
 
+def _config_digest(config: object) -> str | None:
+    """Return digest of a config section, None if it holds values the cache cannot store."""
+    try:
+        return hashlib.sha1(serialization.dumpb(config)).hexdigest()
+    except TypeError:
+        return None
+
+
+def _added_defaults(original: object, validated: object, path: tuple = ()) -> Iterator[tuple]:
+    """Yield the path and value of every default validation added to `original`."""
+    if isinstance(original, dict) and isinstance(validated, dict):
+        for key, value in validated.items():
+            if key in original:
+                yield from _added_defaults(original[key], value, (*path, key))
+            else:
+                yield (*path, key), value
+    elif isinstance(original, list) and isinstance(validated, list):
+        for index, (item, value) in enumerate(zip(original, validated, strict=False)):
+            yield from _added_defaults(item, value, (*path, index))
+
+
+def _set_defaults(config: dict, defaults: list) -> None:
+    """Add the defaults found by :func:`_added_defaults` to `config`."""
+    for path, value in defaults:
+        target = config
+        for key in path[:-1]:
+            target = target[key]
+        target[path[-1]] = copy.deepcopy(value)
+
+
 class Manager:
     """Manager class for FlexGet.
 
@@ -114,6 +155,10 @@ class Manager:
 
     * manager.daemon.started
     * manager.daemon.completed
+    * manager.daemon.idle
+
+      Repeatedly while the daemon has no tasks to run
+
     * manager.db_cleanup
     """
 
@@ -135,7 +180,13 @@ class Manager:
         self.log_filename: str = ''
         self.db_filename: str = ''
         self.engine: Engine | None = None
+        self.read_engine: Engine | None = None
         self.lockfile: str = ''
+        self.config_cache_filename: str = ''
+        # Defaults validation added to config sections, keyed by digest of the config that went in
+        self._validated_configs: dict[str, list] | None = None
+        self._config_file_stat: tuple[int, int] | None = None
+        self._config_file_digest: str | None = None
         self.database_uri: str = ''
         self.db_upgraded = False
         self._has_lock = False
@@ -225,12 +276,13 @@ class Manager:
         plugin.load_plugins(
             extra_plugins=[self.config_base / 'plugins'],
             extra_components=[self.config_base / 'components'],
+            manifest=self.config_base / '.plugin-manifest.json',
         )
 
         # Reparse CLI options now that plugins are loaded
         self.options = get_parser().parse_args(self.args)
 
-        self.task_queue = TaskQueue()
+        self.task_queue = TaskQueue(on_idle=self._on_idle)
         self.ipc_server = IPCServer(self, self.options.ipc_port)
 
         self.setup_yaml()
@@ -374,6 +426,9 @@ class Manager:
             db_test_filename = os.path.join(self.config_base, f'test-{self.config_name}.sqlite')
             if os.path.exists(self.db_filename):
                 shutil.copy(self.db_filename, db_test_filename)
+                # Commits not yet checkpointed into the database, when the last run didn't exit cleanly
+                if os.path.exists(f'{self.db_filename}-wal'):
+                    shutil.copy(f'{self.db_filename}-wal', f'{db_test_filename}-wal')
                 logger.info('Test database created')
             self.db_filename = db_test_filename
         # No running process, we start our own to handle command
@@ -430,7 +485,7 @@ class Manager:
                     'Task queue has died unexpectedly. Restarting it. Please open an issue on Github and include'
                     ' any previous error logs.'
                 )
-                self.task_queue = TaskQueue()
+                self.task_queue = TaskQueue(on_idle=self._on_idle)
                 self.task_queue.start()
             if len(self.task_queue):
                 logger.verbose('There is a task already running, execution queued.')
@@ -609,12 +664,19 @@ class Manager:
         self._config_path = config
         self.lockfile = str(self.config_base / f'.{self.config_name}-lock')
         self.db_filename = str(self.config_base / f'db-{self.config_name}.sqlite')
+        self.config_cache_filename = str(self.config_base / f'.{self.config_name}-validated')
 
     def hash_config(self) -> str | None:
-        if not self.user_config:
+        """Return hash of the config file. It is only read again when its size or mtime changed."""
+        try:
+            stat = os.stat(self.config_path)
+        except (OSError, TypeError):
             return None
-        sha1_hash = hashlib.sha1(yaml.dump(self.user_config).encode('utf-8'))
-        return sha1_hash.hexdigest()
+        if (stat.st_mtime_ns, stat.st_size) != self._config_file_stat:
+            with open(self.config_path, 'rb') as f:
+                self._config_file_digest = hashlib.sha1(f.read()).hexdigest()
+            self._config_file_stat = (stat.st_mtime_ns, stat.st_size)
+        return self._config_file_digest
 
     def load_config(
         self, output_to_console: bool = True, config_file_hash: str | None = None
@@ -632,7 +694,7 @@ class Manager:
                 raise ValueError('Config file is not UTF-8 encoded')
         try:
             self.config_file_hash = config_file_hash or self.hash_config()
-            config = yaml.safe_load(raw_config) or {}
+            config = yaml.load(raw_config, Loader=YamlLoader) or {}
         except yaml.YAMLError as e:
             msg = str(e).replace('\n', ' ')
             msg = ' '.join(msg.split())
@@ -754,13 +816,94 @@ class Manager:
         """
         conf = config if config else self.config
         conf = fire_event('manager.before_config_validate', conf, self)
-        errors = config_schema.process_config(conf)
+        errors = self._process_config(conf)
         if errors:
             err = ConfigError('Did not pass schema validation.')
             err.errors = errors
             raise err
         return conf
 
+    def _process_config(self, config: dict) -> list[config_schema.ConfigValidationError]:
+        """Validate `config` and set defaults within it, like :func:`config_schema.process_config`.
+
+        Tasks and templates are validated one by one. Those unchanged since an earlier validation
+        only get the defaults it added. Results are remembered on disk across restarts, as long as
+        the plugins stay the same. Only digests and defaults are stored, never config values, which
+        may hold substituted secrets.
+        """
+        cache = self._load_config_cache()
+        root_schema = config_schema.get_schema()
+        to_validate = dict(config)
+        items = []
+        for section in CACHED_CONFIG_SECTIONS:
+            item_schema = root_schema['properties'].get(section, {}).get('additionalProperties')
+            if not isinstance(config.get(section), dict) or not isinstance(item_schema, dict):
+                continue
+            to_validate[section] = {}
+            # Validating against the referenced schema directly reuses its shared validator
+            item_schema = item_schema.get('$ref', item_schema)
+            items.extend((section, name, item_schema) for name in config[section])
+        errors = config_schema.process_config(to_validate)
+        # Defaults may have been set at root level
+        config.update((key, value) for key, value in to_validate.items() if key not in config)
+
+        validated = {}
+        for section, name, item_schema in items:
+            item = config[section][name]
+            digest = _config_digest(item)
+            if digest in cache:
+                _set_defaults(item, cache[digest])
+                validated[digest] = cache[digest]
+                continue
+            original = copy.deepcopy(item) if digest else None
+            file_system_checks = config_schema.file_system_checks
+            item_errors = config_schema.process_config(item, item_schema)
+            for error in item_errors:
+                error.path.extendleft((name, section))
+                error.json_pointer = '/' + '/'.join(map(str, error.path))
+            errors.extend(item_errors)
+            if (
+                digest
+                and not item_errors
+                and file_system_checks == config_schema.file_system_checks
+            ):
+                validated[digest] = copy.deepcopy(list(_added_defaults(original, item)))
+        if validated.keys() != cache.keys():
+            self._validated_configs = validated
+            self._save_config_cache()
+        return errors
+
+    def _load_config_cache(self) -> dict[str, list]:
+        if self._validated_configs is None:
+            self._validated_configs = {}
+            if self.config_cache_filename and plugin.manifest_digest:
+                try:
+                    with open(self.config_cache_filename, 'rb') as f:
+                        data = serialization.loadb(f.read())
+                    # Caches holding whole configs are not used anymore
+                    if data['plugins'] == plugin.manifest_digest and 'defaults' in data:
+                        self._validated_configs = data['defaults']
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.debug('Ignoring unreadable config cache: {}', e)
+        return self._validated_configs
+
+    def _save_config_cache(self) -> None:
+        if not (self.config_cache_filename and plugin.manifest_digest):
+            return
+        tmp_filename = self.config_cache_filename + '.tmp'
+        try:
+            data = serialization.dumpb({
+                'plugins': plugin.manifest_digest,
+                'defaults': self._validated_configs,
+            })
+            with open(tmp_filename, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_filename, self.config_cache_filename)
+        except (OSError, TypeError) as e:
+            logger.debug('Could not write config cache: {}', e)
+
     def init_sqlalchemy(self) -> None:
         """Initialize SQLAlchemy."""
         try:
@@ -783,11 +926,10 @@ class Manager:
 
         # fire up the engine
         logger.debug('Connecting to: {}', self.database_uri)
+        connect_args = {'check_same_thread': False, 'timeout': 10}
         try:
             self.engine = sqlalchemy.create_engine(
-                self.database_uri,
-                echo=self.options.debug_sql,
-                connect_args={'check_same_thread': False, 'timeout': 10},
+                self.database_uri, echo=self.options.debug_sql, connect_args=connect_args
             )
         except ImportError:
             logger.opt(exception=True).critical(
@@ -799,7 +941,20 @@ class Manager:
                 'Error:'
             )
             sys.exit(1)
+        if is_sqlite_file(self.engine):
+            apply_sqlite_profile(self.engine)
+            self.read_engine = sqlalchemy.create_engine(
+                self.database_uri,
+                echo=self.options.debug_sql,
+                connect_args=connect_args,
+                pool_size=READ_POOL_SIZE,
+            )
+            apply_sqlite_profile(self.read_engine, read_only=True)
+        else:
+            # Other databases, and in memory ones which are private to a connection, share one pool
+            self.read_engine = self.engine
         Session.configure(bind=self.engine)
+        ReadSession.configure(bind=self.read_engine)
         # create all tables, doesn't do anything to existing tables
         try:
             Base.metadata.create_all(bind=self.engine)
@@ -965,6 +1120,14 @@ class Manager:
         if self._has_lock:
             self.write_lock()
 
+    @property
+    def db_cleanup_due(self) -> bool:
+        """Whether the database cleanup interval has been met."""
+        return (
+            self.persist.get('last_cleanup', datetime(1900, 1, 1))
+            < datetime.now() - DB_CLEANUP_INTERVAL
+        )
+
     def db_cleanup(self, force: bool = False) -> None:
         """Perform database cleanup if cleanup interval has been met.
 
@@ -976,11 +1139,7 @@ class Manager:
 
         :param bool force: Run the cleanup no matter whether the interval has been met.
         """
-        expired = (
-            self.persist.get('last_cleanup', datetime(1900, 1, 1))
-            < datetime.now() - DB_CLEANUP_INTERVAL
-        )
-        if force or expired:
+        if force or self.db_cleanup_due:
             logger.info('Running database cleanup.')
             with Session() as session:
                 fire_event('manager.db_cleanup', self, session)
@@ -992,6 +1151,10 @@ class Manager:
         else:
             logger.debug('Not running db cleanup, last run {}', self.persist.get('last_cleanup'))
 
+    def _on_idle(self) -> None:
+        if self.is_daemon:
+            fire_event('manager.daemon.idle', self)
+
     def shutdown(self, finish_queue: bool = True) -> None:
         """Request manager shutdown.
 
@@ -1010,6 +1173,8 @@ class Manager:
         if not self.unit_test:  # don't scroll "nosetests" summary results when logging is enabled
             logger.debug('Shutting down')
         self.engine.dispose()
+        if self.read_engine is not self.engine:
+            self.read_engine.dispose()
         # remove temporary database used in test mode
         if self.options.test:
             if 'test' not in self.db_filename:
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
+import sys
+import threading
 import time
 from functools import total_ordering
 from http.client import BadStatusLine
@@ -17,11 +21,13 @@ from requests import RequestException
 from flexget import components as components_pkg
 from flexget import config_schema
 from flexget import plugins as plugins_pkg
+from flexget._version import __version__
+from flexget.event import _events, event, get_events, remove_event_handlers
 from flexget.event import add_event_handler as add_phase_handler
-from flexget.event import event, fire_event, remove_event_handlers
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Collection, Iterable
+    from types import ModuleType
 
     from flexget.event import Event
 
@@ -200,6 +206,13 @@ _loaded_plugins = {}
 _plugin_options = []
 _new_phase_queue: dict[str, list[str | None]] = {}
 
+# Bump when the layout of the plugin manifest changes
+MANIFEST_VERSION = 1
+# Digest of the plugin files and versions the manifest is valid for, set when loading plugins with a
+# manifest. Anything derived from plugin schemas can be cached on disk keyed by it.
+manifest_digest: str | None = None
+_lazy_load_lock = threading.RLock()
+
 
 def register_task_phase(name: str, before: str | None = None, after: str | None = None):
     """Add a new task phase to the available phases."""
@@ -296,7 +309,7 @@ class PluginInfo(dict):
         self.plugin_class: type = plugin_class
         self.instance: object = None
 
-        if self.name in plugins:
+        if self.name in plugins and not isinstance(plugins[self.name], LazyPluginInfo):
             PluginInfo.dupe_counter += 1
             logger.critical(
                 'Error while registering plugin {}. A plugin with the same name is already registered',
@@ -345,6 +358,11 @@ class PluginInfo(dict):
                 event.plugin = self
                 self.phase_handlers[phase] = event
 
+    @property
+    def phases(self) -> list[str]:
+        """Phases this plugin has handlers for."""
+        return list(self.phase_handlers)
+
     def __getattr__(self, attr: str):
         if attr in self:
             return self[attr]
@@ -371,6 +389,95 @@ class PluginInfo(dict):
     __repr__ = __str__
 
 
+class LazyPluginInfo(PluginInfo):
+    """Stand-in for a plugin listed in the plugin manifest, whose module has not been imported yet.
+
+    Everything the manifest knows (name, interfaces, phases, ...) is available right away. Accessing
+    anything else, like the plugin instance or its phase handlers, imports the plugin module and
+    forwards to the real :class:`PluginInfo`, which replaces this one in the registry.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        module: str,
+        phases: list[str],
+        schema_id: str | None,
+        interfaces: list[str],
+        builtin: bool,
+        debug: bool,
+        api_ver: int,
+        category: str | None,
+    ) -> None:
+        dict.__init__(
+            self,
+            name=name,
+            module=module,
+            interfaces=interfaces,
+            builtin=builtin,
+            debug=debug,
+            api_ver=api_ver,
+            category=category,
+            schema_id=schema_id,
+        )
+        self._phases = phases
+
+    @property
+    def phases(self) -> list[str]:
+        return self._phases
+
+    def initialize(self) -> None:
+        # Config validation only needs schemas of the plugins actually configured somewhere
+        if self.schema_id is not None:
+            config_schema.register_schema(self.schema_id, self._load_schema)
+
+    def _load_schema(self, **kwargs) -> config_schema.JsonSchema:
+        try:
+            return self.load().schema
+        except DependencyError as e:
+            return {'not': {}, 'error': e.message}
+
+    def load(self) -> PluginInfo:
+        """Import the plugin module, if needed.
+
+        :returns: The real :class:`PluginInfo`
+        :raises DependencyError: If the module no longer registers this plugin.
+        """
+        with _lazy_load_lock:
+            if plugins.get(self.name) is self:
+                logger.debug('Loading plugin {} from {}', self.name, self.module)
+                _import_plugin(self.module, self.module)
+                _register_plugins()
+                for plugin in list(plugins.values()):
+                    plugin.initialize()
+            info = plugins.get(self.name, self)
+            if info is self:
+                plugins.pop(self.name, None)
+                raise DependencyError(
+                    missing=self.name,
+                    message=f'Plugin `{self.name}` could not be loaded from `{self.module}`',
+                )
+        return info
+
+    def __getattr__(self, attr: str):
+        if attr in self:
+            return self[attr]
+        if attr.startswith('_'):
+            return dict.__getattribute__(self, attr)
+        return getattr(self.load(), attr)
+
+    def __setattr__(self, attr: str, value):
+        if attr.startswith('_'):
+            dict.__setattr__(self, attr, value)
+        else:
+            self[attr] = value
+
+    def __str__(self):
+        return f'<LazyPluginInfo(name={self.name})>'
+
+    __repr__ = __str__
+
+
 register = PluginInfo
 
 
@@ -442,13 +549,10 @@ def _import_plugin(module_name: str, plugin_path: str | Path) -> None:
         logger.trace('Loaded module {} from {}', module_name, plugin_path)
 
 
-def _load_plugins_from_dirs(dirs: list[Path]) -> None:
-    """:param list dirs: Directories from where plugins are loaded from"""
-    logger.debug('Trying to load plugins from: {}', dirs)
-    dir_paths = [d for d in dirs if d.is_dir()]
-    # add all dirs to plugins_pkg load path so that imports work properly from any of the plugin dirs
-    plugins_pkg.__path__ = [str(d) for d in dir_paths]
-    for plugins_dir in dir_paths:
+def _find_plugin_modules(dirs: list[Path], package: ModuleType) -> dict[str, Path]:
+    """Map module names to the paths of all plugin files found in `dirs`."""
+    modules = {}
+    for plugins_dir in dirs:
         for plugin_path in plugins_dir.glob('**/*.py'):
             if plugin_path.name == '__init__.py':
                 continue
@@ -456,30 +560,39 @@ def _load_plugins_from_dirs(dirs: list[Path]) -> None:
             plugin_subpackages = [
                 _f for _f in plugin_path.relative_to(plugins_dir).parent.parts if _f
             ]
-            module_name = '.'.join([plugins_pkg.__name__, *plugin_subpackages, plugin_path.stem])
+            module_name = '.'.join([package.__name__, *plugin_subpackages, plugin_path.stem])
+            modules[module_name] = plugin_path
+    return modules
+
+
+def _load_plugins_from_dirs(dirs: list[Path], skip: Collection[str] = ()) -> None:
+    """Load plugins from directories.
+
+    :param list dirs: Directories from where plugins are loaded from
+    :param skip: Names of modules not to import
+    """
+    logger.debug('Trying to load plugins from: {}', dirs)
+    dir_paths = [d for d in dirs if d.is_dir()]
+    # add all dirs to plugins_pkg load path so that imports work properly from any of the plugin dirs
+    plugins_pkg.__path__ = [str(d) for d in dir_paths]
+    for module_name, plugin_path in _find_plugin_modules(dir_paths, plugins_pkg).items():
+        if module_name not in skip:
             _import_plugin(module_name, plugin_path)
     _check_phase_queue()
 
 
 # TODO: this is now identical to _load_plugins_from_dirs, REMOVE
-def _load_components_from_dirs(dirs: list[Path]) -> None:
-    """:param list dirs: Directories where plugin components are loaded from"""
+def _load_components_from_dirs(dirs: list[Path], skip: Collection[str] = ()) -> None:
+    """Load plugin components from directories.
+
+    :param list dirs: Directories where plugin components are loaded from
+    :param skip: Names of modules not to import
+    """
     logger.debug('Trying to load components from: {}', dirs)
     dir_paths = [d for d in dirs if d.is_dir()]
-    for component_dir in dir_paths:
-        for component_path in component_dir.glob('**/*.py'):
-            if component_path.name == '__init__.py':
-                continue
-            # Split the relative path from the plugins dir to current file's parent dir to find subpackage names
-            plugin_subpackages = [
-                _f for _f in component_path.relative_to(component_dir).parent.parts if _f
-            ]
-            package_name = '.'.join([
-                components_pkg.__name__,
-                *plugin_subpackages,
-                component_path.stem,
-            ])
-            _import_plugin(package_name, component_path)
+    for module_name, component_path in _find_plugin_modules(dir_paths, components_pkg).items():
+        if module_name not in skip:
+            _import_plugin(module_name, component_path)
     _check_phase_queue()
 
 
@@ -517,15 +630,156 @@ def _load_plugins_from_packages() -> None:
     _check_phase_queue()
 
 
+def _register_plugins() -> tuple[dict[str, str], set[str]]:
+    """Fire the `plugin.register` event one handler at a time, then remove the handlers.
+
+    :returns: Dict mapping names of the newly registered plugins to the module registering them,
+        and the set of modules which changed task phases or schemas while registering.
+    """
+    registered_by = {}
+    unsafe = set()
+    # Handlers may import modules registering more handlers
+    while 'plugin.register' in _events:
+        handlers = get_events('plugin.register')
+        # Plugins should only be registered once, remove their handlers first
+        remove_event_handlers('plugin.register')
+        for handler in handlers:
+            known = {
+                name for name, info in plugins.items() if not isinstance(info, LazyPluginInfo)
+            }
+            phases = list(task_phases)
+            schemas = set(config_schema.schema_paths)
+            handler()
+            module = getattr(handler.func, '__module__', None)
+            registered_by.update(
+                (name, module)
+                for name, info in plugins.items()
+                if name not in known and not isinstance(info, LazyPluginInfo)
+            )
+            if task_phases != phases or set(config_schema.schema_paths) != schemas:
+                unsafe.add(module)
+    return registered_by, unsafe
+
+
+def _manifest_key(modules: dict[str, Path]) -> dict:
+    """Everything that invalidates the plugin manifest when changed."""
+    files = {}
+    for module_name, path in modules.items():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        files[module_name] = [str(path), stat.st_mtime_ns, stat.st_size]
+    # Plugins installed via PIP change along with their package
+    packages = {
+        entrypoint.dist.name: entrypoint.dist.version
+        for entrypoint in entry_points(group='FlexGet.plugins')
+        if entrypoint.dist is not None
+    }
+    return {
+        'manifest': MANIFEST_VERSION,
+        'flexget': __version__,
+        'python': sys.version,
+        'files': files,
+        'packages': packages,
+    }
+
+
+def _read_manifest(path: Path, key: dict) -> dict | None:
+    try:
+        with path.open(encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug('Could not read plugin manifest {}: {}', path, e)
+        return None
+    if not isinstance(manifest, dict) or manifest.get('key') != key:
+        logger.debug('Plugin manifest {} is out of date', path)
+        return None
+    return manifest
+
+
+def _write_manifest(path: Path, manifest: dict) -> None:
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        tmp_path.write_text(json.dumps(manifest), encoding='utf-8')
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.debug('Could not write plugin manifest {}: {}', path, e)
+
+
+def _modules_with_side_effects(module_names: Iterable[str]) -> set[str]:
+    """Find modules which do more than register plugins when imported.
+
+    Those have to be imported on every start, even if their plugins are not used.
+    """
+    from sqlalchemy import Table
+
+    from flexget.entry import lazy_func_registry
+
+    modules = set()
+    for name, handlers in _events.items():
+        # Phase handlers of the plugins themselves are fine
+        if not name.startswith('plugin.'):
+            modules.update(getattr(handler.func, '__module__', None) for handler in handlers)
+    modules.update(lazy_func._func.__module__ for lazy_func in lazy_func_registry.values())
+    modules.update(
+        getattr(func, '__module__', None)
+        for func, _ in config_schema.format_checker.checkers.values()
+    )
+    for module_name in module_names:
+        module = sys.modules.get(module_name)
+        for value in vars(module).values() if module else ():
+            if isinstance(value, Table) or (
+                isinstance(value, type)
+                and value.__module__ == module_name
+                and hasattr(value, '__table__')
+            ):
+                modules.add(module_name)
+                break
+    return modules
+
+
+def _build_manifest(key: dict, registered_by: dict[str, str], unsafe: set[str]) -> dict:
+    candidates = set(registered_by.values()) & set(key['files']) - unsafe
+    lazy_modules = candidates - _modules_with_side_effects(candidates)
+    return {
+        'key': key,
+        'lazy_modules': sorted(lazy_modules),
+        'plugins': [
+            {
+                'name': info.name,
+                'module': registered_by.get(name),
+                'phases': info.phases,
+                'schema_id': info.schema_id,
+                'interfaces': info.interfaces,
+                'builtin': info.builtin,
+                'debug': info.debug,
+                'api_ver': info.api_ver,
+                'category': info.category,
+            }
+            for name, info in plugins.items()
+        ],
+    }
+
+
 def load_plugins(
-    extra_plugins: list[Path] | None = None, extra_components: list[Path] | None = None
+    extra_plugins: list[Path] | None = None,
+    extra_components: list[Path] | None = None,
+    manifest: Path | None = None,
 ) -> None:
     """Load plugins from the standard plugin and component paths.
 
+    When a `manifest` path is given, the first load in the process records which module registers
+    each plugin there. Following starts only import the plugin modules a task, the config schema or
+    another plugin asks for, as long as no plugin file changed.
+
     :param list extra_plugins: Extra directories from where plugins are loaded.
     :param list extra_components: Extra directories from where components are loaded.
+    :param manifest: Path of the plugin manifest file.
     """
-    global plugins_loaded
+    global manifest_digest, plugins_loaded
 
     if extra_plugins is None:
         extra_plugins = []
@@ -537,21 +791,45 @@ def load_plugins(
     extra_components.extend(_get_standard_components_path())
 
     start_time = time.time()
+    manifest_key = manifest_data = None
+    # The manifest describes a fresh process, plugins imported already don't register again
+    if manifest is not None and not plugins_loaded:
+        manifest_key = _manifest_key({
+            **_find_plugin_modules([d for d in extra_plugins if d.is_dir()], plugins_pkg),
+            **_find_plugin_modules([d for d in extra_components if d.is_dir()], components_pkg),
+        })
+        manifest_data = _read_manifest(manifest, manifest_key)
+        manifest_digest = hashlib.sha1(
+            json.dumps(manifest_key, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+    lazy_modules = set(manifest_data['lazy_modules']) if manifest_data else set()
+    if manifest_data:
+        # Stand-ins for all plugins, in the order of a full load, eager ones get replaced right away
+        for info in manifest_data['plugins']:
+            if info['name'] not in plugins:
+                plugins[info['name']] = LazyPluginInfo(**info)
     # Import all the plugins
-    _load_plugins_from_dirs(extra_plugins)
-    _load_components_from_dirs(extra_components)
+    _load_plugins_from_dirs(extra_plugins, skip=lazy_modules)
+    _load_components_from_dirs(extra_components, skip=lazy_modules)
     _load_plugins_from_packages()
     # Register them
-    fire_event('plugin.register')
-    # Plugins should only be registered once, remove their handlers after
-    remove_event_handlers('plugin.register')
+    registered_by, unsafe = _register_plugins()
+    for name, info in list(plugins.items()):
+        if isinstance(info, LazyPluginInfo) and info.module not in lazy_modules:
+            # Module was imported but did not register this plugin anymore
+            del plugins[name]
     # After they have all been registered, instantiate them
     for plugin in list(plugins.values()):
         plugin.initialize()
+    if manifest_key is not None and manifest_data is None:
+        _write_manifest(manifest, _build_manifest(manifest_key, registered_by, unsafe))
     took = time.time() - start_time
     plugins_loaded = True
     logger.debug(
-        'Plugins took {:.2f} seconds to load. {} plugins in registry.', took, len(plugins.keys())
+        'Plugins took {:.2f} seconds to load. {} plugins in registry, {} modules deferred.',
+        took,
+        len(plugins.keys()),
+        len(lazy_modules),
     )
 
 
@@ -575,7 +853,7 @@ def get_plugins(
     def matches(plugin):
         if phase is not None and phase not in phase_methods:
             raise ValueError(f'Unknown phase {phase}')
-        if phase and phase not in plugin.phase_handlers:
+        if phase and phase not in plugin.phases:
             return False
         if interface and interface not in plugin.interfaces:
             return False
@@ -606,7 +884,7 @@ def register_schema():
 
 def get_phases_by_plugin(name: str) -> list[str]:
     """Return all phases plugin :name: hooks."""
-    return list(get_plugin_by_name(name).phase_handlers)
+    return list(get_plugin_by_name(name).phases)
 
 
 def get_plugin_by_name(name: str, issued_by: str = '???') -> PluginInfo:
@@ -1,81 +1,916 @@
+"""Benchmark suite for FlexGet hot paths.
+
+Every benchmark builds its own synthetic, deterministic fixtures, so results can be compared
+between runs and versions without network access or a populated user database. Benchmarks that
+need a database run against a throwaway SQLite file.
+"""
+
+import contextlib
+import copy
+import importlib.util
+import os
+import platform
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
 from loguru import logger
+from sqlalchemy import create_engine
 
-from flexget import options
+import flexget
+from flexget import __version__, options
 from flexget.event import event
-from flexget.manager import Session
-from flexget.terminal import console
+from flexget.manager import Base, ReadSession, Session
+from flexget.terminal import TerminalTable, colorize, console, table_parser
+from flexget.utils import json
 
 logger = logger.bind(name='perftests')
 
-TESTS = ['imdb_query']
+BENCHMARKS = {}
+
+
+class Benchmark:
+    """A registered benchmark.
+
+    :param name: Name used on the command line and in result files.
+    :param func: Called once per repetition with the manager and params. Builds fixtures and
+        returns a callable, only the callable is timed. When the callable returns a dict, its
+        values are recorded as extra measurements, e.g. ``rss`` in bytes.
+    :param params: Default size parameters, multiplied by ``--scale``.
+    :param database: Run against a fresh temporary database.
+    :param live: Uses the live user database, only ran when explicitly named.
+    :param requires: Name of an optional module the benchmark needs.
+    """
+
+    def __init__(self, name, func, description, params, database=False, live=False, requires=None):
+        self.name = name
+        self.func = func
+        self.description = description
+        self.params = params
+        self.database = database
+        self.live = live
+        self.requires = requires
+
+    @property
+    def available(self):
+        return self.requires is None or importlib.util.find_spec(self.requires) is not None
+
+    def scaled_params(self, scale):
+        return {key: max(1, int(value * scale)) for key, value in self.params.items()}
+
+
+def benchmark(name, description, database=False, live=False, requires=None, **params):
+    """Register decorated function as a benchmark. Keyword arguments are the default sizes."""
+
+    def decorator(func):
+        BENCHMARKS[name] = Benchmark(name, func, description, params, database, live, requires)
+        return func
+
+    return decorator
+
+
+@contextlib.contextmanager
+def temporary_database(manager):
+    """Point :class:`Session` and :class:`ReadSession` to a fresh database for the duration of the context.
+
+    Nothing else may use the database meanwhile, so benchmarks are not run in the daemon.
+    """
+    with tempfile.TemporaryDirectory(prefix='flexget-bench-') as tmp:
+        engine = create_engine(
+            f'sqlite:///{os.path.join(tmp, "bench.sqlite")}',
+            connect_args={'check_same_thread': False},
+        )
+        Base.metadata.create_all(bind=engine)
+        Session.configure(bind=engine)
+        ReadSession.configure(bind=engine)
+        try:
+            yield engine
+        finally:
+            Session.configure(bind=manager.engine)
+            ReadSession.configure(bind=manager.read_engine)
+            engine.dispose()
+
+
+def run_benchmark(manager, bench, repeat=5, scale=1.0, memory=False):
+    params = bench.scaled_params(scale)
+    times = []
+    measurements = {}
+    peak = None
+    for _ in range(repeat):
+        with contextlib.ExitStack() as stack:
+            if bench.database:
+                stack.enter_context(temporary_database(manager))
+            func = bench.func(manager, **params)
+            start = time.perf_counter()
+            extra = func()
+            times.append(time.perf_counter() - start)
+        if isinstance(extra, dict):
+            for key, value in extra.items():
+                measurements.setdefault(key, []).append(value)
+    if memory:
+        # Measured in a separate run, tracemalloc slows everything down considerably
+        with contextlib.ExitStack() as stack:
+            if bench.database:
+                stack.enter_context(temporary_database(manager))
+            func = bench.func(manager, **params)
+            tracemalloc.start()
+            try:
+                func()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return {
+        'params': params,
+        'repeat': repeat,
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'peak_memory': peak,
+        **{key: statistics.median(values) for key, values in measurements.items()},
+    }
+
+
+def compare_results(results, baseline, threshold):
+    """Compare median times against a baseline result file.
+
+    :return: Dict of benchmark name to (ratio, regressed) for benchmarks present in both.
+    """
+    comparison = {}
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base or base.get('params') != result['params']:
+            continue
+        ratio = result['median'] / base['median'] if base['median'] else 0
+        comparison[name] = (ratio, ratio > 1 + threshold / 100)
+    return comparison
 
 
 def cli_perf_test(manager, options):
-    if options.test_name not in TESTS:
-        console(f'Unknown performance test {options.test_name}')
+    if manager.is_daemon:
+        # Benchmarks replace the database, which the daemon keeps using
+        console('Performance tests cannot run in the daemon, stop the daemon first.')
+        return
+    if options.list:
+        table = TerminalTable('Name', 'Description', 'Sizes', table_type=options.table_type)
+        for bench in BENCHMARKS.values():
+            sizes = ', '.join(f'{k}={v}' for k, v in bench.params.items())
+            table.add_row(
+                bench.name, bench.description + (' (live db)' if bench.live else ''), sizes
+            )
+        console(table)
         return
-    session = Session()
+
+    names = options.test_name or [
+        b.name for b in BENCHMARKS.values() if not b.live and b.available
+    ]
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        console(f'Unknown performance test {", ".join(unknown)}')
+        return
+    unavailable = [name for name in names if not BENCHMARKS[name].available]
+    if unavailable:
+        console(
+            f'Performance test {", ".join(unavailable)} needs '
+            f'{", ".join(sorted({BENCHMARKS[name].requires for name in unavailable}))} installed'
+        )
+        return
+
+    baseline = None
+    if options.compare:
+        with open(options.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    # Silence log output of the code being measured
+    logger.disable('flexget')
     try:
-        if options.test_name == 'imdb_query':
-            imdb_query(session)
+        for name in names:
+            bench = BENCHMARKS[name]
+            if not options.json:
+                console(f'Running {name} ...')
+            results[name] = run_benchmark(
+                manager, bench, repeat=options.repeat, scale=options.scale, memory=options.memory
+            )
     finally:
-        session.close()
+        logger.enable('flexget')
+
+    output = {
+        'flexget': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    if options.save:
+        with open(options.save, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2)
+    comparison = compare_results(results, baseline, options.threshold) if baseline else {}
+    if options.json:
+        if comparison:
+            output['comparison'] = {
+                name: {'ratio': ratio, 'regressed': regressed}
+                for name, (ratio, regressed) in comparison.items()
+            }
+        console(json.dumps(output, indent=2))
+        return
+
+    header = ['Benchmark', 'Sizes', 'Min', 'Median', 'Mean']
+    if options.memory:
+        header.append('Peak memory')
+    show_rss = any('rss' in result for result in results.values())
+    if show_rss:
+        header.append('RSS')
+    show_latency = any('p50' in result for result in results.values())
+    if show_latency:
+        header.append('Latency p50/p90/p99')
+    if baseline:
+        header.append('vs baseline')
+    table = TerminalTable(*header, table_type=options.table_type)
+    for name, result in results.items():
+        row = [
+            name,
+            ', '.join(f'{k}={v}' for k, v in result['params'].items()),
+            f'{result["min"]:.4f}s',
+            f'{result["median"]:.4f}s',
+            f'{result["mean"]:.4f}s',
+        ]
+        if options.memory:
+            row.append(f'{result["peak_memory"] / 1024 / 1024:.1f} MiB')
+        if show_rss:
+            row.append(f'{result["rss"] / 1024 / 1024:.1f} MiB' if 'rss' in result else '-')
+        if show_latency:
+            row.append(
+                '/'.join(f'{result[p] * 1000:.1f}' for p in ('p50', 'p90', 'p99')) + ' ms'
+                if 'p50' in result
+                else '-'
+            )
+        if baseline:
+            if name in comparison:
+                ratio, regressed = comparison[name]
+                change = f'{(ratio - 1) * 100:+.1f}%'
+                row.append(colorize('red' if regressed else 'green', change))
+            else:
+                row.append('-')
+        table.add_row(*row)
+    console(table)
+    if any(regressed for _, regressed in comparison.values()):
+        sys.exit(1)
+
+
+# Synthetic fixtures
+
+SHOW_NAMES = [
+    'Alpha Station',
+    'Blue Harbour',
+    'Crimson Peak Files',
+    'Deep Orbit',
+    'Echo Valley',
+    'Frozen Assets',
+    'Golden Hour',
+    'Hidden Signal',
+]
+QUALITIES = [
+    '720p HDTV x264',
+    '1080p WEB-DL DD5.1 H.264',
+    '2160p WEB h265 HDR',
+    'HDTV XviD',
+    '1080p BluRay x264 DTS',
+    '720p WEBRip AAC2.0',
+]
+
+
+def show_name(index):
+    base = SHOW_NAMES[index % len(SHOW_NAMES)]
+    return f'{base} {index // len(SHOW_NAMES)}' if index >= len(SHOW_NAMES) else base
+
+
+def release_title(index, shows):
+    quality = QUALITIES[index % len(QUALITIES)]
+    season = index % 7 + 1
+    episode = index % 23 + 1
+    return f'{show_name(index % shows).replace(" ", ".")}.S{season:02d}E{episode:02d}.{quality.replace(" ", ".")}-GRP{index % 13}'
+
+
+def movie_title(index):
+    return f'Synthetic Movie {index} {1950 + index % 70} {QUALITIES[index % len(QUALITIES)]}'
+
+
+def synthetic_entries(count, shows=100):
+    from flexget.entry import Entry
+
+    return [
+        Entry(
+            title=release_title(i, shows),
+            url=f'http://localhost/download/{i}.torrent',
+            description=f'Synthetic entry number {i}',
+            content_size=100 + i % 5000,
+        )
+        for i in range(count)
+    ]
+
+
+def percentiles(values):
+    """Return the 50th, 90th and 99th percentile of `values`."""
+    if len(values) < 2:
+        return dict.fromkeys(('p50', 'p90', 'p99'), values[0])
+    cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return {'p50': cuts[49], 'p90': cuts[89], 'p99': cuts[98]}
+
+
+def run_task(manager, name, config):
+    from flexget.task import Task
+
+    Task.validate_config(config)
+    task = Task(manager, name, config=config, options={'allow_manual': True})
+    task.execute()
+    return task
+
+
+STARTUP_SCRIPT = """
+import sys
+from pathlib import Path
+
+from flexget import plugin
+
+plugin.load_plugins(manifest=Path(sys.argv[1]) if len(sys.argv) > 1 else None)
+try:
+    import resource
+except ImportError:
+    print(0)
+else:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes, except on macOS
+    print(rss if sys.platform == 'darwin' else rss * 1024)
+"""
+
+
+def start_flexget(*args):
+    """Load plugins in a fresh interpreter, return its peak resident memory."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([
+        os.path.dirname(os.path.dirname(flexget.__file__)),
+        env.get('PYTHONPATH', ''),
+    ])
+    output = subprocess.run(
+        [sys.executable, '-c', STARTUP_SCRIPT, *args],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return {'rss': int(output.splitlines()[-1])}
+
+
+class FakeIRCServer:
+    """IRC server on localhost which registers a single client, and sends announces to it."""
+
+    def __init__(self, channel, announcer):
+        self.channel = channel
+        self.announcer = announcer
+        self.nickname = None
+        self.registered = threading.Event()
+        self._conn = None
+        self._lock = threading.Lock()
+        self._sock = socket.create_server(('127.0.0.1', 0))
+        self.port = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self.serve, name='fake_irc', daemon=True)
+        self._thread.start()
+
+    def serve(self):
+        try:
+            self._conn, _ = self._sock.accept()
+        except OSError:
+            return
+        buffer = b''
+        with self._conn:
+            while True:
+                try:
+                    data = self._conn.recv(4096)
+                except OSError:
+                    return
+                if not data:
+                    return
+                *lines, buffer = (buffer + data).split(b'\r\n')
+                for line in lines:
+                    self.handle(line.decode())
+
+    def handle(self, line):
+        command, _, args = line.partition(' ')
+        if command == 'NICK':
+            self.nickname = args
+            self.send(f':fake 001 {args} :Welcome')
+            self.send(f':fake 376 {args} :End of MOTD')
+            self.registered.set()
+        elif command == 'JOIN':
+            self.send(f':{self.nickname}!bot@localhost JOIN {args.split()[0]}')
+        elif command == 'PING':
+            self.send(f':fake PONG fake :{args}')
+
+    def send(self, line):
+        with self._lock:
+            self._conn.sendall(f'{line}\r\n'.encode())
+
+    def announce(self, message):
+        self.send(f':{self.announcer}!bot@localhost PRIVMSG {self.channel} :{message}')
+
+    def close(self):
+        self._sock.close()
+        if self._conn:
+            with contextlib.suppress(OSError):
+                self._conn.shutdown(socket.SHUT_RDWR)
+        self._thread.join(5)
+
+
+ANNOUNCE_TRACKER = """<trackerinfo type="bench" shortName="bench" longName="Bench" siteName="localhost">
+  <settings/>
+  <servers>
+    <server network="bench" serverNames="127.0.0.1" channelNames="#announce"
+            announcerNames="announcer"/>
+  </servers>
+  <parseinfo>
+    <linepatterns>
+      <extract>
+        <regex value="^New: (.+) - (https?://\\S+)$"/>
+        <vars><var name="torrentName"/><var name="torrentUrl"/></vars>
+      </extract>
+    </linepatterns>
+    <linematched/>
+  </parseinfo>
+</trackerinfo>
+"""
+
+
+def irc_announce(manager, announces, warm):
+    """Send announces through a fake IRC server, measure until each reaches the output phase."""
+    from flexget.components.irc import irc
+    from flexget.event import add_event_handler, remove_event_handler
+    from flexget.task import Task
+    from flexget.task_queue import TaskQueue
+
+    shows = 8
+    task_config = {'series': [show_name(i) for i in range(shows)], 'mock_output': True}
+    Task.validate_config(task_config)
+    tmp = tempfile.mkdtemp(prefix='flexget-bench-')
+    tracker_file = os.path.join(tmp, 'bench.tracker')
+    with open(tracker_file, 'w', encoding='utf-8') as f:
+        f.write(ANNOUNCE_TRACKER)
+
+    sent = {}
+    latencies = []
+    output = threading.Event()
+
+    def on_output(task, keyword):
+        if keyword != 'mock_output' or task.current_phase != 'output':
+            return
+        now = time.perf_counter()
+        for entry in task.all_entries:
+            start = sent.pop(entry['title'], None)
+            if start is not None:
+                latencies.append(now - start)
+        output.set()
+
+    def run():
+        # Tasks run on a copy of the manager, with its own config and task queue
+        bench_manager = copy.copy(manager)
+        bench_manager.config = {**manager.config, 'tasks': {'bench_irc': task_config}}
+        bench_manager.task_queue = TaskQueue()
+        bench_manager.task_queue.start()
+        add_event_handler('task.execute.after_plugin', on_output)
+        server = FakeIRCServer('#announce', 'announcer')
+        connection = irc.IRCConnection(
+            {
+                'tracker_file': tracker_file,
+                'port': server.port,
+                'nickname': 'flexget-bench',
+                'task': 'bench_irc',
+                'queue_size': 1,
+                'warm_tasks': warm,
+            },
+            'bench',
+            task_manager=bench_manager,
+        )
+        connection.thread.start()
+        try:
+            if not server.registered.wait(30):
+                raise RuntimeError('IRC connection to the fake server failed')
+            for i in range(announces):
+                title = release_title(i, shows)
+                output.clear()
+                sent[title] = time.perf_counter()
+                server.announce(f'New: {title} - http://localhost/download/{i}.torrent')
+                if not output.wait(30):
+                    raise RuntimeError(f'Announce {title} did not reach the task')
+                # Let the connection get back to waiting for messages, like between real announces
+                time.sleep(0.25)
+        finally:
+            connection.quit()
+            server.close()
+            bench_manager.task_queue.shutdown(finish_queue=True)
+            bench_manager.task_queue.wait()
+            remove_event_handler('task.execute.after_plugin', on_output)
+            shutil.rmtree(tmp, ignore_errors=True)
+        return percentiles(latencies)
+
+    return run
+
+
+# Benchmarks
+
+
+@benchmark('startup', 'Import and register all plugins in a fresh interpreter')
+def bench_startup(manager):
+    return start_flexget
+
+
+@benchmark('startup_manifest', 'Start a fresh interpreter using the plugin manifest')
+def bench_startup_manifest(manager):
+    tmp = tempfile.mkdtemp(prefix='flexget-bench-')
+    manifest = os.path.join(tmp, 'plugin-manifest.json')
+    # First start writes the manifest
+    start_flexget(manifest)
 
+    def run():
+        try:
+            return start_flexget(manifest)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
 
-def imdb_query(session):
-    import time
+    return run
 
-    from rich.progress import track
+
+@benchmark('entry', 'Construct entries with a handful of fields', entries=20000)
+def bench_entry(manager, entries):
+    def run():
+        synthetic_entries(entries)
+
+    return run
+
+
+@benchmark(
+    'entry_memory',
+    'Build entries and copies of them, use --memory to see their footprint',
+    entries=100000,
+)
+def bench_entry_memory(manager, entries):
+    def run():
+        entry_list = synthetic_entries(entries)
+        copies = [entry.copy() for entry in entry_list]
+        deep_copies = [copy.deepcopy(entry) for entry in entry_list]
+        return entry_list, copies, deep_copies
+
+    return run
+
+
+@benchmark('serialization', 'Store and load entries as JSON and binary', entries=5000)
+def bench_serialization(manager, entries):
+    from flexget.utils import serialization
+
+    entry_list = synthetic_entries(entries)
+
+    def run():
+        for entry in entry_list:
+            serialization.loads(serialization.dumps(entry))['title']
+            serialization.loadb(serialization.dumpb(entry))['title']
+
+    return run
+
+
+@benchmark('quality', 'Parse quality from release titles', titles=5000)
+def bench_quality(manager, titles):
+    from flexget.utils.qualities import Quality
+
+    texts = [release_title(i, 50) for i in range(titles)]
+
+    def run():
+        for text in texts:
+            Quality(text)
+
+    return run
+
+
+@benchmark('series_parser', 'Parse release titles with SeriesParser', titles=2000)
+def bench_series_parser(manager, titles):
+    from flexget.utils.parsers.series import SeriesParser
+
+    texts = [(show_name(i % 50), release_title(i, 50)) for i in range(titles)]
+
+    def run():
+        for name, text in texts:
+            SeriesParser(name=name).parse(text)
+
+    return run
+
+
+@benchmark('movie_parser', 'Parse release titles with MovieParser', titles=2000)
+def bench_movie_parser(manager, titles):
+    from flexget.utils.parsers.movie import MovieParser
+
+    texts = [movie_title(i) for i in range(titles)]
+
+    def run():
+        for text in texts:
+            MovieParser().parse(text)
+
+    return run
+
+
+@benchmark('template', 'Render a template against entries', entries=2000)
+def bench_template(manager, entries):
+    from flexget.utils.template import render_from_entry
+
+    entry_list = synthetic_entries(entries)
+    template = '{{ title }} - {{ url|lower }} ({{ content_size }} MB)'
+
+    def run():
+        for entry in entry_list:
+            render_from_entry(template, entry)
+
+    return run
+
+
+def synthetic_index_page(links, shows=100):
+    """Build a large index page, like the ones the html input is pointed at."""
+    rows = []
+    for i in range(links):
+        title = release_title(i, shows)
+        rows.append(
+            f'<tr><td><a href="/details/{i}" title="{title}">{title}</a></td>'
+            f'<td><a href="/download/{i}/{title}.torrent"><img src="dl.png"></a></td>'
+            f'<td><a href="//mirror.localhost/{i}.torrent">mirror</a></td>'
+            f'<td class=size>{i % 4000} MB<td></tr>'
+        )
+    return (
+        '<html><head><title>Index</title></head><body>'
+        '<div class=nav><a href="/">index</a> <a href="/page/2">next</a></div>'
+        f'<table>{"".join(rows)}</table></body></html>'
+    ).encode()
+
+
+def html_links(links, parser):
+    from flexget.plugins.input.html import InputHtml
+    from flexget.utils.soup import get_soup
+
+    page = synthetic_index_page(links)
+    html = InputHtml()
+
+    def run():
+        soup = get_soup(page, parser)
+        html.create_entries('http://localhost/index', soup, {})
+
+    return run
+
+
+@benchmark('html_links', 'Parse an index page with html5lib and harvest its links', links=2000)
+def bench_html_links(manager, links):
+    return html_links(links, 'html5lib')
+
+
+@benchmark(
+    'html_links_fast', 'Parse an index page with the fast parser and harvest its links', links=2000
+)
+def bench_html_links_fast(manager, links):
+    return html_links(links, 'fast')
+
+
+def synthetic_torrent(files):
+    return {
+        'announce': 'http://localhost/announce',
+        'announce-list': [['http://localhost/announce'], ['udp://localhost:6969/announce']],
+        'comment': 'synthetic torrent',
+        'created by': 'FlexGet benchmark',
+        'creation date': 1700000000,
+        'info': {
+            'name': 'Synthetic Torrent',
+            'piece length': 262144,
+            'pieces': bytes(range(256)) * (files // 10 + 1),
+            'files': [
+                {'length': 1000 + i, 'path': [f'dir{i % 20}', f'file {i}.bin']}
+                for i in range(files)
+            ],
+        },
+    }
+
+
+@benchmark('bencode', 'Encode a multi-file torrent', files=5000)
+def bench_bencode(manager, files):
+    from flexget.utils.bittorrent import bencode
+
+    data = synthetic_torrent(files)
+
+    def run():
+        bencode(data)
+
+    return run
+
+
+@benchmark('bdecode', 'Decode a multi-file torrent', files=5000)
+def bench_bdecode(manager, files):
+    from flexget.utils.bittorrent import bdecode, bencode
+
+    raw = bencode(synthetic_torrent(files))
+
+    def run():
+        bdecode(raw)
+
+    return run
+
+
+@benchmark('torrent', 'Load a multi-file torrent and calculate its info hash', files=5000)
+def bench_torrent(manager, files):
+    from flexget.utils.bittorrent import Torrent, bencode, metadata_cache
+
+    raw = bencode(synthetic_torrent(files))
+    # Measure decoding, not the metadata cache
+    metadata_cache.clear()
+
+    def run():
+        torrent = Torrent(raw)
+        torrent.info_hash  # noqa: B018 the property does the work being measured
+        torrent.size  # noqa: B018
+
+    return run
+
+
+@benchmark(
+    'task', 'Execute a task with mock input and common filters', database=True, entries=2000
+)
+def bench_task(manager, entries):
+    config = {
+        'mock': [
+            {'title': release_title(i, 100), 'url': f'http://localhost/{i}'}
+            for i in range(entries)
+        ],
+        'regexp': {'accept': ['s0[1-4]e'], 'reject': ['xvid']},
+        'quality': '720p+',
+        'disable': ['seen'],
+    }
+
+    def run():
+        run_task(manager, 'bench_task', config)
+
+    return run
+
+
+@benchmark(
+    'seen',
+    'Seen filter against a pre-populated seen database',
+    database=True,
+    entries=2000,
+    rows=20000,
+)
+def bench_seen(manager, entries, rows):
+    from flexget.components.seen.db import SeenEntry, SeenField
+
+    with Session() as session:
+        for i in range(rows):
+            se = SeenEntry(f'Seen title {i}', 'bench_seen')
+            se.fields.append(SeenField('title', f'Seen title {i}'))
+            se.fields.append(SeenField('url', f'http://localhost/seen/{i}'))
+            session.add(se)
+    # Every other entry has already been seen
+    config = {
+        'mock': [
+            {'title': f'Seen title {i * 2}', 'url': f'http://localhost/seen/{i * 2}'}
+            for i in range(entries)
+        ],
+        'accept_all': True,
+    }
+
+    def run():
+        run_task(manager, 'bench_seen', config)
+
+    return run
+
+
+@benchmark(
+    'series',
+    'Series metainfo and filter against configured shows',
+    database=True,
+    entries=500,
+    shows=50,
+)
+def bench_series(manager, entries, shows):
+    config = {
+        'mock': [
+            {'title': release_title(i, shows), 'url': f'http://localhost/{i}'}
+            for i in range(entries)
+        ],
+        'series': [show_name(i) for i in range(shows)],
+        'disable': ['seen'],
+    }
+
+    def run():
+        run_task(manager, 'bench_series', config)
+
+    return run
+
+
+@benchmark(
+    'irc_announce',
+    'Announces from a fake IRC server through a warm task, latency per announce',
+    database=True,
+    requires='irc_bot',
+    announces=50,
+)
+def bench_irc_announce(manager, announces):
+    return irc_announce(manager, announces, warm=True)
+
+
+@benchmark(
+    'irc_announce_cold',
+    'Announces from a fake IRC server through a new task each, latency per announce',
+    database=True,
+    requires='irc_bot',
+    announces=50,
+)
+def bench_irc_announce_cold(manager, announces):
+    return irc_announce(manager, announces, warm=False)
+
+
+@benchmark('imdb_query', 'Query every cached IMDb movie', live=True)
+def bench_imdb_query(manager):
     from sqlalchemy.orm import joinedload
     from sqlalchemy.sql.expression import select
 
     # NOTE: importing other plugins directly is discouraged
     from flexget.components.imdb.db import Movie
-    from flexget.plugins.cli.performance import log_query_count
 
-    imdb_urls = []
-
-    logger.info('Getting imdb_urls ...')
-    # query so that we avoid loading whole object (maybe cached?)
-    for _, url in session.execute(select(Movie.id, Movie.url)):
-        imdb_urls.append(url)
-    logger.info('Got {} urls from database', len(imdb_urls))
-    if not imdb_urls:
-        logger.info('so .. aborting')
-        return
-
-    # commence testing
-
-    log_query_count('test')
-    start_time = time.time()
-    for url in track(imdb_urls, description='Benchmarking...'):
-        # movie = session.query(Movie).filter(Movie.url == url).first()
-        # movie = session.query(Movie).options(subqueryload(Movie.genres)).filter(Movie.url == url).one()
-
-        movie = (
-            session.query(Movie)
-            .options(
-                joinedload(Movie.genres),
-                joinedload(Movie.languages),
-                joinedload(Movie.actors),
-                joinedload(Movie.directors),
-            )
-            .filter(Movie.url == url)
-            .first()
-        )
+    with Session() as session:
+        imdb_urls = [url for _, url in session.execute(select(Movie.id, Movie.url))]
 
-        # access it's members so they're loaded
-        [x.name for x in movie.genres]
-        [x.name for x in movie.directors]
-        [x.name for x in movie.actors]
-        [x.language for x in movie.languages]
+    def run():
+        with Session() as session:
+            for url in imdb_urls:
+                movie = (
+                    session.query(Movie)
+                    .options(
+                        joinedload(Movie.genres),
+                        joinedload(Movie.languages),
+                        joinedload(Movie.actors),
+                        joinedload(Movie.directors),
+                    )
+                    .filter(Movie.url == url)
+                    .first()
+                )
+                # access it's members so they're loaded
+                [x.name for x in movie.genres]
+                [x.name for x in movie.directors]
+                [x.name for x in movie.actors]
+                [x.language for x in movie.languages]
 
-    log_query_count('test')
-    took = time.time() - start_time
-    logger.debug('Took {:.2f} seconds to query {} movies', took, len(imdb_urls))
+    return run
 
 
 @event('options.register')
 def register_parser_arguments():
-    perf_parser = options.register_command('perf-test', cli_perf_test)
-    perf_parser.add_argument('test_name', metavar='<test name>', choices=TESTS)
+    perf_parser = options.register_command(
+        'perf-test',
+        cli_perf_test,
+        help='Run benchmarks of FlexGet internals',
+        parents=[table_parser],
+    )
+    perf_parser.add_argument(
+        'test_name',
+        metavar='<test name>',
+        nargs='*',
+        help='Benchmarks to run. Runs all benchmarks not using the live database by default',
+    )
+    perf_parser.add_argument('--list', action='store_true', help='List available benchmarks')
+    perf_parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        metavar='NUM',
+        help='Repeat each benchmark %(metavar)s times',
+    )
+    perf_parser.add_argument(
+        '--scale',
+        type=float,
+        default=1.0,
+        metavar='FACTOR',
+        help='Multiply benchmark fixture sizes by %(metavar)s',
+    )
+    perf_parser.add_argument(
+        '--memory',
+        action='store_true',
+        help='Also measure peak memory allocated by each benchmark',
+    )
+    perf_parser.add_argument('--json', action='store_true', help='Output results as JSON')
+    perf_parser.add_argument('--save', metavar='FILE', help='Save results as JSON to %(metavar)s')
+    perf_parser.add_argument(
+        '--compare', metavar='FILE', help='Compare results against a baseline saved with --save'
+    )
+    perf_parser.add_argument(
+        '--threshold',
+        type=float,
+        default=10.0,
+        metavar='PERCENT',
+        help='Slowdown in median time considered a regression when comparing (default: %(default)s)',
+    )
@@ -3,6 +3,7 @@ import os
 import re
 import sys
 import time
+from contextlib import suppress
 from pathlib import Path
 
 import pendulum
@@ -11,6 +12,7 @@ from loguru import logger
 from flexget import plugin
 from flexget.entry import Entry
 from flexget.event import event
+from flexget.utils.client_mirror import ClientMirror, full_sync_interval, incremental_schema
 from flexget.utils.pathscrub import pathscrub
 from flexget.utils.template import RenderError
 
@@ -117,6 +119,8 @@ class InputDeluge(DelugePlugin):
                     'username': {'type': 'string'},
                     'password': {'type': 'string'},
                     'config_path': {'type': 'string', 'format': 'path'},
+                    'fields': {'type': 'array', 'items': {'type': 'string'}},
+                    'incremental': incremental_schema,
                     'filter': {
                         'type': 'object',
                         'properties': {
@@ -153,6 +157,9 @@ class InputDeluge(DelugePlugin):
     def on_task_input(self, task, config):
         """Generate and return a list of entries from the deluge daemon."""
         config = self.prepare_config(config)
+        full_sync = full_sync_interval(config.get('incremental'))
+        if full_sync and not task.options.test:
+            return self.generate_changed_entries(task, config, full_sync)
         # Reset the entries list
         client = self.setup_client(config)
 
@@ -167,38 +174,93 @@ class InputDeluge(DelugePlugin):
         client.disconnect()
         return entries
 
+    def status_keys(self, config):
+        # Without a list of status keys deluge sends all of them, pieces and file lists included
+        if config.get('fields'):
+            return sorted({*config['fields'], 'name', 'hash'})
+        return []
+
     def generate_entries(self, client, config):
-        entries = []
         filter = config.get('filter', {})
-        torrents = client.call('core.get_torrents_status', filter or {}, [])
-        for hash, torrent_dict in torrents.items():
-            # Make sure it has a url so no plugins crash
-            entry = Entry(deluge_id=hash, url='')
-            if config.get('config_path'):
-                config_path = Path(config['config_path']).expanduser()
-                torrent_path = config_path / 'state' / f'{hash}.torrent'
-                if torrent_path.is_file():
-                    entry['location'] = torrent_path
-                    entry['url'] = torrent_path.as_uri()
-                else:
-                    logger.warning('Did not find torrent file at {}', torrent_path)
-            # Pieces is just a really long list, cluttering up the entry and --dump output
-            blacklist_fields = ['pieces']
-            for key, value in torrent_dict.items():
-                # All fields (except a few) provided by deluge get placed under the deluge_ namespace
-                if key in blacklist_fields:
-                    continue
-                entry['deluge_' + key] = value
-                # Some fields also get special handling
-                if key in self.settings_map:
-                    flexget_key = self.settings_map[key]
-                    if isinstance(flexget_key, tuple):
-                        flexget_key, format_func = flexget_key
-                        value = format_func(value)
-                    entry[flexget_key] = value
-            entries.append(entry)
+        torrents = client.call('core.get_torrents_status', filter or {}, self.status_keys(config))
+        return [
+            self.make_entry(hash, torrent_dict, config) for hash, torrent_dict in torrents.items()
+        ]
 
-        return entries
+    def generate_changed_entries(self, task, config, full_sync):
+        """Generate entries for torrents which changed since the last run of the task.
+
+        The connection to deluge is kept open between runs, deluge then only sends the status keys
+        which changed since the previous call on that connection. A new connection starts with the
+        full status of all torrents, which is how full syncs are done.
+        """
+        key = (config['host'], config['port'], config.get('username'))
+        mirror = ClientMirror.get(task, 'from_deluge', key, full_sync)
+        filter = config.get('filter', {})
+        client = mirror.state.get('client')
+        full = client is None or mirror.needs_full_sync
+        torrents = None
+        if not full:
+            try:
+                torrents = client.call(
+                    'core.get_torrents_status', filter, self.status_keys(config), True
+                )
+            except Exception as exc:
+                logger.debug('Lost connection to deluge daemon, doing a full sync: {}', exc)
+                full = True
+        if full:
+            if client is not None:
+                with suppress(Exception):
+                    client.disconnect()
+            client = mirror.state['client'] = self.setup_client(config)
+            try:
+                client.connect()
+                torrents = client.call(
+                    'core.get_torrents_status', filter, self.status_keys(config), True
+                )
+            except ConnectionError as exc:
+                ClientMirror.discard(task, 'from_deluge', key)
+                raise plugin.PluginError(
+                    f'Error connecting to deluge daemon: {exc}', logger=logger
+                ) from exc
+        changed = mirror.update(
+            torrents, removed=mirror.torrents.keys() - torrents.keys(), full=full
+        )
+        return [self.make_entry(hash, mirror.torrents[hash], config) for hash in changed]
+
+    def make_entry(self, hash, torrent_dict, config):
+        # Make sure it has a url so no plugins crash
+        entry = Entry(deluge_id=hash, url='')
+        if config.get('config_path'):
+            config_path = Path(config['config_path']).expanduser()
+            torrent_path = config_path / 'state' / f'{hash}.torrent'
+            if torrent_path.is_file():
+                entry['location'] = torrent_path
+                entry['url'] = torrent_path.as_uri()
+            else:
+                logger.warning('Did not find torrent file at {}', torrent_path)
+        # Pieces is just a really long list, cluttering up the entry and --dump output
+        blacklist_fields = ['pieces']
+        for key, value in torrent_dict.items():
+            # All fields (except a few) provided by deluge get placed under the deluge_ namespace
+            if key in blacklist_fields:
+                continue
+            entry['deluge_' + key] = value
+            # Some fields also get special handling
+            if key in self.settings_map:
+                flexget_key = self.settings_map[key]
+                if isinstance(flexget_key, tuple):
+                    flexget_key, format_func = flexget_key
+                    value = format_func(value)
+                entry[flexget_key] = value
+        return entry
+
+    def on_task_abort(self, task, config):
+        config = self.prepare_config(config)
+        # Entries of an aborted run were never acted on, emit everything again on next run
+        ClientMirror.discard(
+            task, 'from_deluge', (config['host'], config['port'], config.get('username'))
+        )
 
 
 class OutputDeluge(DelugePlugin):
@@ -355,7 +417,7 @@ class OutputDeluge(DelugePlugin):
                         client.call('label.add', label)
 
         # add the torrents
-        torrent_ids = client.call('core.get_session_state')
+        torrent_ids = set(client.call('core.get_session_state'))
         for entry in task.accepted:
             # Generate deluge options dict for torrent add
             add_opts = {}
@@ -480,9 +542,11 @@ class OutputDeluge(DelugePlugin):
                     logger.error('There was an error adding {} to deluge.', entry['title'])
                 else:
                     logger.info('{} successfully added to deluge.', entry['title'])
+                    torrent_ids.add(added_torrent)
                     self._set_torrent_options(client, added_torrent, entry, modify_opts)
             if config['action'] in ('remove', 'purge'):
                 client.call('core.remove_torrent', torrent_id, config['action'] == 'purge')
+                torrent_ids.discard(torrent_id)
                 logger.info('{} removed from deluge.', entry['title'])
             elif config['action'] == 'pause':
                 client.call('core.pause_torrent', [torrent_id])
@@ -8,6 +8,7 @@ from requests.exceptions import RequestException
 from flexget import plugin
 from flexget.entry import Entry
 from flexget.event import event
+from flexget.utils.client_mirror import ClientMirror, full_sync_interval, incremental_schema
 from flexget.utils.template import RenderError
 from flexget.utils.tools import parse_timedelta
 
@@ -132,44 +133,55 @@ class OutputQBitTorrent:
         logger.debug('Successfully connected to qBittorrent')
         self.connected = True
 
-    def check_torrent_exists(self, hash_torrent, verify_cert):
+    def get_existing_hashes(self, hashes, verify_cert):
+        """Return the info hashes out of `hashes` which are already loaded in qBittorrent.
+
+        All hashes are looked up with a single request.
+        """
         if not self.connected:
             raise plugin.PluginError('Not connected.')
 
-        if not isinstance(hash_torrent, str):
-            logger.error('Error getting torrent info, invalid hash {}', hash_torrent)
-            return False
-
-        hash_torrent = hash_torrent.lower()
+        hashes = {h.lower() for h in hashes}
+        if not hashes:
+            return set()
 
-        logger.debug('Checking if torrent with hash {!r} already in session.', hash)
+        logger.debug('Checking if {} torrent(s) already in session.', len(hashes))
 
         url = f'{self.url}{self.api_url_info}'
-        params = {'hashes': hash_torrent}
+        params = {'hashes': '|'.join(sorted(hashes))}
 
         try:
-            respose = self.session.request(
+            response = self.session.request(
                 'get',
                 url,
                 params=params,
                 verify=verify_cert,
             )
         except RequestException:
-            logger.error('Error getting torrent info, request to hash {} failed', hash_torrent)
-            return False
+            logger.error('Error getting torrent info, request for {} hashes failed', len(hashes))
+            return set()
 
-        if respose.status_code != 200:
+        if response.status_code != 200:
             logger.error(
-                'Error getting torrent info, hash {} search returned',
-                hash_torrent,
-                respose.status_code,
+                'Error getting torrent info, hash search returned {}', response.status_code
             )
-            return False
+            return set()
 
-        check_file = respose.json()
+        torrents = response.json()
+        if not isinstance(torrents, list):
+            return set()
+        # Older api versions ignore the hashes parameter and list the whole session
+        return {
+            t['hash'].lower() for t in torrents if isinstance(t, dict) and 'hash' in t
+        } & hashes
 
-        if isinstance(check_file, list) and check_file:
-            logger.warning('File with hash {} already in qbittorrent', hash_torrent)
+    def check_torrent_exists(self, hash_torrent, verify_cert):
+        if not isinstance(hash_torrent, str):
+            logger.error('Error getting torrent info, invalid hash {}', hash_torrent)
+            return False
+
+        if hash_torrent.lower() in self.get_existing_hashes([hash_torrent], verify_cert):
+            logger.warning('File with hash {} already in qbittorrent', hash_torrent.lower())
             return True
 
         return False
@@ -228,6 +240,16 @@ class OutputQBitTorrent:
         return config
 
     def add_entries(self, task, config):
+        existing_hashes = set()
+        if not task.manager.options.test:
+            existing_hashes = self.get_existing_hashes(
+                [
+                    entry['torrent_info_hash']
+                    for entry in task.accepted
+                    if isinstance(entry.get('torrent_info_hash'), str)
+                ],
+                config.get('verify_cert'),
+            )
         for entry in task.accepted:
             form_data = {}
             try:
@@ -301,9 +323,11 @@ class OutputQBitTorrent:
                 )
                 continue
 
-            if self.check_torrent_exists(
-                entry.get('torrent_info_hash'), config.get('verify_cert')
-            ):
+            info_hash = entry.get('torrent_info_hash')
+            if not isinstance(info_hash, str):
+                logger.error('Error getting torrent info, invalid hash {}', info_hash)
+            elif info_hash.lower() in existing_hashes:
+                logger.warning('File with hash {} already in qbittorrent', info_hash.lower())
                 continue
 
             if not is_magnet:
@@ -319,6 +343,8 @@ class OutputQBitTorrent:
                 self.add_torrent_file(entry, form_data, config['verify_cert'])
             else:
                 self.add_torrent_url(entry, form_data, config['verify_cert'])
+            if isinstance(info_hash, str):
+                existing_hashes.add(info_hash.lower())
 
     @plugin.priority(120)
     def on_task_download(self, task, config):
@@ -340,6 +366,38 @@ class OutputQBitTorrent:
 
 
 class FromQBitTorrent:
+    # Entry fields which may be left out with the `fields` option, with the torrent info key they
+    # come from and an optional conversion. `content_files` costs an extra request per torrent.
+    optional_fields = {
+        'content_files': (None, lambda torrent: [f['name'] for f in torrent.files]),
+        'torrent_seeds': ('num_seeds', None),
+        'torrent_peers': ('num_leechs', None),
+        'qbittorrent_ratio': ('ratio', None),
+        'qbittorrent_category': ('category', None),
+        'qbittorrent_state': ('state', None),
+        'qbittorrent_eta': ('eta', None),
+        'qbittorrent_added_on': (
+            'added_on',
+            lambda torrent: pendulum.from_timestamp(torrent['added_on']),
+        ),
+        'qbittorrent_completion_on': (
+            'completion_on',
+            lambda torrent: pendulum.from_timestamp(torrent['completion_on']),
+        ),
+        'qbittorrent_completed_path': ('content_path', None),
+        'qbittorrent_download_path': ('download_path', None),
+        'qbittorrent_save_path': ('save_path', None),
+        'qbittorrent_size': ('size', None),
+        'qbittorrent_dl_speed': ('dlspeed', None),
+        'qbittorrent_up_speed': ('upspeed', None),
+        'qbittorrent_is_checking': ('state', lambda torrent: torrent.state_enum.is_checking),
+        'qbittorrent_is_complete': ('state', lambda torrent: torrent.state_enum.is_complete),
+        'qbittorrent_is_downloading': ('state', lambda torrent: torrent.state_enum.is_downloading),
+        'qbittorrent_is_errored': ('state', lambda torrent: torrent.state_enum.is_errored),
+        'qbittorrent_is_paused': ('state', lambda torrent: torrent.state_enum.is_paused),
+        'qbittorrent_is_uploading': ('state', lambda torrent: torrent.state_enum.is_uploading),
+    }
+
     schema = {
         'type': 'object',
         'properties': {
@@ -349,6 +407,11 @@ class FromQBitTorrent:
             'password': {'type': 'string'},
             'host': {'type': 'string'},
             'port': {'type': 'integer'},
+            'fields': {
+                'type': 'array',
+                'items': {'type': 'string', 'enum': list(optional_fields)},
+            },
+            'incremental': incremental_schema,
         },
         'additionalProperties': False,
         'required': ['username', 'password', 'host', 'port'],
@@ -364,12 +427,23 @@ class FromQBitTorrent:
 
         return qbittorrentapi.Client(host=host, port=port, username=username, password=password)
 
+    @staticmethod
+    def mirror_key(config):
+        return config['host'], int(config['port']), config['username']
+
     def on_task_input(self, task, config):
-        client = self.client(
-            config['host'], int(config['port']), config['username'], config['password']
-        )
+        fields = config.get('fields', self.optional_fields)
+        full_sync = full_sync_interval(config.get('incremental'))
+        if full_sync and not task.options.test:
+            torrents = self.changed_torrents(task, config, full_sync)
+        else:
+            client = self.client(
+                config['host'], int(config['port']), config['username'], config['password']
+            )
+            # Let qBittorrent filter by category instead of sending the whole session
+            torrents = client.torrents_info(category=config.get('category'))
 
-        for torrent in client.torrents_info():
+        for torrent in torrents:
             if 'category' in config:
                 logger.debug('filtered `{}` by wrong category', torrent['name'])
                 if torrent['category'] != config['category']:
@@ -379,34 +453,54 @@ class FromQBitTorrent:
                 logger.debug('filtered `{}` by not completed', torrent['name'])
                 continue
 
-            yield Entry(
+            entry = Entry(
                 title=torrent['name'],
                 url=torrent['magnet_uri'],
-                content_files=[f['name'] for f in torrent.files],
                 content_size=torrent['size'],
                 torrent_info_hash=torrent['infohash_v1'],
                 torrent_info_hash_v2=torrent['infohash_v2'],
-                torrent_seeds=torrent['num_seeds'],
-                torrent_peers=torrent['num_leechs'],
-                qbittorrent_ratio=torrent['ratio'],
-                qbittorrent_category=torrent['category'],
-                qbittorrent_state=torrent['state'],
-                qbittorrent_eta=torrent['eta'],
-                qbittorrent_added_on=pendulum.from_timestamp(torrent['added_on']),
-                qbittorrent_completion_on=pendulum.from_timestamp(torrent['completion_on']),
-                qbittorrent_completed_path=torrent['content_path'],
-                qbittorrent_download_path=torrent['download_path'],
-                qbittorrent_save_path=torrent['save_path'],
-                qbittorrent_size=torrent['size'],
-                qbittorrent_dl_speed=torrent['dlspeed'],
-                qbittorrent_up_speed=torrent['upspeed'],
-                qbittorrent_is_checking=torrent.state_enum.is_checking,
-                qbittorrent_is_complete=torrent.state_enum.is_complete,
-                qbittorrent_is_downloading=torrent.state_enum.is_downloading,
-                qbittorrent_is_errored=torrent.state_enum.is_errored,
-                qbittorrent_is_paused=torrent.state_enum.is_paused,
-                qbittorrent_is_uploading=torrent.state_enum.is_uploading,
             )
+            for field in fields:
+                key, convert = self.optional_fields[field]
+                entry[field] = convert(torrent) if convert else torrent[key]
+            yield entry
+
+    def changed_torrents(self, task, config, full_sync):
+        """Return the torrents which changed since the last run of the task.
+
+        The client is kept between runs along with the response id of its last sync, so
+        qBittorrent only sends the torrent fields which changed since then.
+        """
+        from qbittorrentapi import TorrentDictionary
+
+        mirror = ClientMirror.get(task, 'from_qbittorrent', self.mirror_key(config), full_sync)
+        client = mirror.state.get('client')
+        if client is None:
+            client = mirror.state['client'] = self.client(
+                config['host'], int(config['port']), config['username'], config['password']
+            )
+        full = mirror.needs_full_sync
+        data = client.sync_maindata(rid=0 if full else mirror.state.get('rid', 0))
+        mirror.state['rid'] = data['rid']
+        # Sync data is keyed by hash, torrent info has it as a field
+        torrents = {
+            info_hash: {**fields, 'hash': info_hash}
+            for info_hash, fields in data.get('torrents', {}).items()
+        }
+        if data.get('full_update'):
+            removed = mirror.torrents.keys() - torrents.keys()
+        else:
+            removed = data.get('torrents_removed', [])
+        watch = {'name', 'magnet_uri', 'size', 'infohash_v1', 'infohash_v2'}
+        watch.update(
+            self.optional_fields[field][0] for field in config.get('fields', self.optional_fields)
+        )
+        changed = mirror.update(torrents, removed=removed, full=full, watch=watch)
+        return [TorrentDictionary(dict(mirror.torrents[h]), client) for h in changed]
+
+    def on_task_abort(self, task, config):
+        # Entries of an aborted run were never acted on, emit everything again on next run
+        ClientMirror.discard(task, 'from_qbittorrent', self.mirror_key(config))
 
 
 @event('plugin.register')
@@ -3,6 +3,7 @@ from __future__ import annotations
 import importlib.metadata
 import os
 import re
+import weakref
 from datetime import datetime, timedelta
 from fnmatch import fnmatch
 from functools import partial
@@ -21,6 +22,7 @@ from flexget import plugin
 from flexget.config_schema import one_or_more
 from flexget.entry import Entry
 from flexget.event import event
+from flexget.utils.client_mirror import ClientMirror, full_sync_interval, incremental_schema
 from flexget.utils.pathscrub import pathscrub
 from flexget.utils.template import RenderError
 from flexget.utils.tools import parse_timedelta
@@ -50,6 +52,98 @@ __version__ = '>=7.0.3,<8.0.0'
 __package__ = 'transmission-rpc'
 __requirement__ = packaging.specifiers.SpecifierSet(__version__)
 
+# Fields the output plugin needs to find and handle torrents already loaded in transmission
+SNAPSHOT_FIELDS = ['id', 'hashString', 'name', 'status', 'downloadDir', 'totalSize']
+# Fields used by check_seed_limits
+SEED_LIMIT_FIELDS = [
+    'activityDate',
+    'seedIdleLimit',
+    'seedIdleMode',
+    'seedRatioLimit',
+    'seedRatioMode',
+    'uploadRatio',
+]
+# Fields used by torrent_info
+TORRENT_INFO_FIELDS = ['downloadDir', 'files', 'priorities', 'totalSize', 'wanted']
+
+# Transmission reports torrents active within this window as recently active
+RECENTLY_ACTIVE = timedelta(seconds=60)
+# Fields too big to fetch for all torrents on incremental runs
+HEAVY_FIELDS = {'trackers'}
+
+# Torrent snapshots of each task, {task: {(host, port, username): TransmissionSnapshot}}
+_snapshots = weakref.WeakKeyDictionary()
+
+
+class TransmissionSnapshot:
+    """Torrents loaded in a transmission session, indexed by info hash and id.
+
+    The snapshot is shared by all transmission plugins of a task, so the session torrents are
+    only fetched once. Only the requested fields are fetched, asking for fields which were not
+    fetched yet loads the torrents again with the fields from both requests.
+    """
+
+    def __init__(self, client: transmission_rpc.Client):
+        self.client = client
+        # Fetched fields, None when all fields were fetched
+        self.fields: set[str] | None = set()
+        self._torrents: dict[int, Torrent] | None = None
+        self._by_hash: dict[str, Torrent] = {}
+
+    def torrents(self, fields=None, refresh=False) -> list[Torrent]:
+        """Return the torrents in the session.
+
+        :param fields: Rpc fields needed by the caller, all fields when None.
+        :param refresh: Load the torrents again even if the snapshot has the needed fields.
+        """
+        if fields is not None:
+            fields = {*fields, 'id', 'hashString'}
+        if self._torrents is not None:
+            covered = self.fields is None or (fields is not None and fields <= self.fields)
+            if covered and not refresh:
+                return list(self._torrents.values())
+            # Keep what other plugins of the task asked for
+            fields = None if fields is None or self.fields is None else fields | self.fields
+        logger.debug(
+            'Fetching {} fields of torrents in transmission',
+            'all' if fields is None else ', '.join(sorted(fields)),
+        )
+        torrents = self.client.get_torrents(arguments=sorted(fields) if fields else None)
+        self.fields = fields
+        self._torrents = {}
+        self._by_hash = {}
+        for torrent in torrents:
+            self.add(torrent)
+        return torrents
+
+    def get(self, info_hash=None, torrent_id=None) -> Torrent | None:
+        """Find a torrent by info hash or transmission id."""
+        if self._torrents is None:
+            self.torrents(SNAPSHOT_FIELDS)
+        if info_hash:
+            torrent = self._by_hash.get(info_hash.lower())
+            if torrent is not None:
+                return torrent
+        if torrent_id is not None:
+            return self._torrents.get(torrent_id)
+        return None
+
+    def add(self, torrent: Torrent):
+        """Add or replace a torrent in the snapshot."""
+        if self._torrents is None:
+            return
+        self._torrents[torrent.id] = torrent
+        self._by_hash[torrent.hashString.lower()] = torrent
+
+    def discard(self, torrent_ids):
+        """Remove torrents with the given ids from the snapshot."""
+        if self._torrents is None:
+            return
+        for torrent_id in torrent_ids:
+            torrent = self._torrents.pop(torrent_id, None)
+            if torrent is not None:
+                self._by_hash.pop(torrent.hashString.lower(), None)
+
 
 class TransmissionBase:
     def prepare_config(self, config):
@@ -106,6 +200,14 @@ class TransmissionBase:
             raise plugin.PluginError('Error connecting to transmission')
         return cli
 
+    def get_snapshot(self, task, config) -> TransmissionSnapshot:
+        """Return the snapshot of the configured transmission session, shared by the plugins of `task`."""
+        snapshots = _snapshots.setdefault(task, {})
+        key = (config['host'], config['port'], config.get('username'))
+        if key not in snapshots:
+            snapshots[key] = TransmissionSnapshot(self.create_rpc_client(config))
+        return snapshots[key]
+
     def torrent_info(self, torrent: Torrent, config):
         done = torrent.total_size > 0
         vloc = None
@@ -167,7 +269,7 @@ class TransmissionBase:
         config = self.prepare_config(config)
         if config['enabled'] and task.options.test:
             logger.info('Trying to connect to transmission...')
-            client = self.create_rpc_client(config)
+            client = self.get_snapshot(task, config).client
             if client:
                 logger.info('Successfully connected to transmission.')
             else:
@@ -175,6 +277,42 @@ class TransmissionBase:
 
 
 class PluginTransmissionInput(TransmissionBase):
+    # transmission_<name> entry fields, with the Torrent attribute providing them and its rpc fields
+    attributes = {
+        'id': ('id', ['id']),
+        'activityDate': ('activity_date', ['activityDate']),
+        'comment': ('comment', ['comment']),
+        'desiredAvailable': ('desired_available', ['desiredAvailable']),
+        'downloadDir': ('download_dir', ['downloadDir']),
+        'isFinished': ('is_finished', ['isFinished']),
+        'isPrivate': ('is_private', ['isPrivate']),
+        'isStalled': ('is_stalled', ['isStalled']),
+        'leftUntilDone': ('left_until_done', ['leftUntilDone']),
+        'ratio': ('ratio', ['uploadRatio']),
+        'status': ('status', ['status']),
+        'date_active': ('activity_date', ['activityDate']),
+        'date_added': ('added_date', ['addedDate']),
+        'date_done': ('done_date', ['doneDate']),
+        'date_started': ('start_date', ['startDate']),
+        'errorString': ('error_string', ['errorString']),
+        'priority': ('priority', ['bandwidthPriority']),
+        'progress': ('progress', ['percentDone', 'sizeWhenDone', 'leftUntilDone']),
+        'secondsDownloading': ('seconds_downloading', ['secondsDownloading']),
+        'secondsSeeding': ('seconds_seeding', ['secondsSeeding']),
+        'torrentFile': ('torrent_file', ['torrentFile']),
+        'labels': ('labels', ['labels']),
+    }
+    # transmission_<name> entry fields computed from several rpc fields
+    computed = {
+        'availability': ['desiredAvailable', 'leftUntilDone'],
+        'trackers': ['trackers'],
+        'seed_ratio_ok': SEED_LIMIT_FIELDS,
+        'idle_limit_ok': SEED_LIMIT_FIELDS,
+        'error_state': ['error'],
+    }
+    # Fields always needed to create the entries
+    base_fields = ['name', 'totalSize', 'torrentFile']
+
     schema = {
         'anyOf': [
             {'type': 'boolean'},
@@ -188,6 +326,11 @@ class PluginTransmissionInput(TransmissionBase):
                     'password': {'type': 'string'},
                     'enabled': {'type': 'boolean'},
                     'only_complete': {'type': 'boolean'},
+                    'fields': {
+                        'type': 'array',
+                        'items': {'type': 'string', 'enum': [*attributes, *computed]},
+                    },
+                    'incremental': incremental_schema,
                 },
                 'additionalProperties': False,
             },
@@ -199,88 +342,158 @@ class PluginTransmissionInput(TransmissionBase):
         config.setdefault('only_complete', False)
         return config
 
+    def rpc_fields(self, config):
+        """Return the rpc fields needed for the configured entry fields."""
+        fields = set(self.base_fields)
+        if config['only_complete']:
+            fields.update(SEED_LIMIT_FIELDS, self.attributes['progress'][1])
+        for name in config.get('fields', [*self.attributes, *self.computed]):
+            if name in self.computed:
+                fields.update(self.computed[name])
+            else:
+                fields.update(self.attributes[name][1])
+            if name == 'date_done':
+                # transmission_date_done falls back to the added date of completed torrents
+                fields.update(['addedDate', *self.attributes['progress'][1]])
+        return fields
+
+    def watched_fields(self, config):
+        """Return the rpc fields whose changes make incremental runs emit a torrent."""
+        fields = {'name', 'totalSize', 'seed_limits'}
+        for name in config.get('fields', [*self.attributes, *self.computed]):
+            if name in self.attributes:
+                fields.update(self.attributes[name][1])
+            elif name in ('availability', 'error_state'):
+                # Seed limits are watched through their outcome, not the fields they come from
+                fields.update(self.computed[name])
+        return fields
+
     def on_task_input(self, task, config):
         config = self.prepare_config(config)
         if not config['enabled']:
             return None
 
-        client = self.create_rpc_client(config)
+        snapshot = self.get_snapshot(task, config)
+        client = snapshot.client
         entries = []
+        wanted = config.get('fields', [*self.attributes, *self.computed])
 
         session = client.get_session()
 
-        for torrent in client.get_torrents():
+        full_sync = full_sync_interval(config.get('incremental'))
+        if full_sync and not task.options.test:
+            torrents = self.changed_torrents(task, config, client, session, full_sync)
+        else:
+            torrents = snapshot.torrents(self.rpc_fields(config), refresh=True)
+
+        for torrent in torrents:
             seed_ratio_ok, idle_limit_ok = self.check_seed_limits(torrent, session)
             if config['only_complete'] and not (
                 seed_ratio_ok and idle_limit_ok and torrent.progress == 100
             ):
                 continue
-            entry = Entry(
-                title=torrent.name,
-                url='',
-                torrent_info_hash=torrent.hashString,
-                content_size=torrent.total_size,
+            entries.append(self.make_entry(torrent, config, wanted, seed_ratio_ok, idle_limit_ok))
+        return entries
+
+    def changed_torrents(self, task, config, client, session, full_sync):
+        """Return the torrents which changed since the last run of the task.
+
+        A mirror of the session is kept between runs. When the last run is recent enough,
+        transmission tells which torrents were recently active. Otherwise the small fields of all
+        torrents are compared with the mirror, and big ones are only fetched for changed torrents.
+        """
+        fields = self.rpc_fields(config)
+        watch = self.watched_fields(config)
+        key = (config['host'], config['port'], config.get('username'))
+        mirror = ClientMirror.get(task, 'from_transmission', key, full_sync)
+
+        def mirrored(torrents):
+            # Seed limits can be reached with nothing changing but time, watch their outcome
+            return {
+                t.hashString: {**t.fields, 'seed_limits': self.check_seed_limits(t, session)}
+                for t in torrents
+            }
+
+        if mirror.needs_full_sync:
+            torrents = client.get_torrents(arguments=sorted(fields))
+            changed = mirror.update(mirrored(torrents), full=True)
+        elif mirror.since_sync < RECENTLY_ACTIVE:
+            torrents, removed_ids = client.get_recently_active_torrents(arguments=sorted(fields))
+            removed = [mirror.find('id', torrent_id) for torrent_id in removed_ids]
+            changed = mirror.update(
+                mirrored(torrents), removed=[h for h in removed if h], watch=watch
             )
-            # Location of torrent is only valid if transmission is on same machine as flexget
-            if config['host'] in ('localhost', '127.0.0.1'):
-                entry['location'] = Path(torrent.torrent_file)
-                entry['url'] = Path(torrent.torrent_file).as_uri()
-            for attr, field in {
-                'id': 'id',
-                'activityDate': 'activity_date',
-                'comment': 'comment',
-                'desiredAvailable': 'desired_available',
-                'downloadDir': 'download_dir',
-                'isFinished': 'is_finished',
-                'isPrivate': 'is_private',
-                'isStalled': 'is_stalled',
-                'leftUntilDone': 'left_until_done',
-                'ratio': 'ratio',
-                'status': 'status',
-                'date_active': 'activity_date',
-                'date_added': 'added_date',
-                'date_done': 'done_date',
-                'date_started': 'start_date',
-                'errorString': 'error_string',
-                'priority': 'priority',
-                'progress': 'progress',
-                'secondsDownloading': 'seconds_downloading',
-                'secondsSeeding': 'seconds_seeding',
-                'torrentFile': 'torrent_file',
-                'labels': 'labels',
-            }.items():
-                try:
-                    value = getattr(torrent, field)
-                except Exception:
-                    logger.opt(exception=True).debug(
-                        'error when requesting transmissionrpc attribute {}', attr
-                    )
-                else:
-                    entry['transmission_' + attr] = value
-            # Availability in percent
+        else:
+            torrents = client.get_torrents(arguments=sorted(fields - HEAVY_FIELDS))
+            current = mirrored(torrents)
+            changed = mirror.update(
+                current, removed=mirror.torrents.keys() - current.keys(), watch=watch
+            )
+            if changed and fields & HEAVY_FIELDS:
+                for torrent in client.get_torrents(
+                    ids=[mirror.torrents[h]['id'] for h in changed],
+                    arguments=sorted(fields & HEAVY_FIELDS),
+                ):
+                    mirror.torrents[torrent.hashString].update(torrent.fields)
+        return [transmission_rpc.Torrent(fields=mirror.torrents[h]) for h in changed]
+
+    def make_entry(self, torrent, config, wanted, seed_ratio_ok, idle_limit_ok):
+        entry = Entry(
+            title=torrent.name,
+            url='',
+            torrent_info_hash=torrent.hashString,
+            content_size=torrent.total_size,
+        )
+        # Location of torrent is only valid if transmission is on same machine as flexget
+        if config['host'] in ('localhost', '127.0.0.1'):
+            entry['location'] = Path(torrent.torrent_file)
+            entry['url'] = Path(torrent.torrent_file).as_uri()
+        for attr in wanted:
+            if attr not in self.attributes:
+                continue
+            try:
+                value = getattr(torrent, self.attributes[attr][0])
+            except Exception:
+                logger.opt(exception=True).debug(
+                    'error when requesting transmissionrpc attribute {}', attr
+                )
+            else:
+                entry['transmission_' + attr] = value
+        # Availability in percent
+        if 'availability' in wanted:
             entry['transmission_availability'] = (
                 (torrent.desired_available / torrent.left_until_done)
                 if torrent.left_until_done
                 else 0
             )
 
+        if 'trackers' in wanted:
             entry['transmission_trackers'] = [t.announce for t in torrent.trackers]
+        if 'seed_ratio_ok' in wanted:
             entry['transmission_seed_ratio_ok'] = seed_ratio_ok
+        if 'idle_limit_ok' in wanted:
             entry['transmission_idle_limit_ok'] = idle_limit_ok
-            st_error_to_desc = {
-                0: 'OK',
-                1: 'tracker_warning',
-                2: 'tracker_error',
-                3: 'local_error',
-            }
+        st_error_to_desc = {
+            0: 'OK',
+            1: 'tracker_warning',
+            2: 'tracker_error',
+            3: 'local_error',
+        }
+        if 'error_state' in wanted:
             entry['transmission_error_state'] = st_error_to_desc[torrent.error]
-            # Built in done_date doesn't work when user adds an already completed file to transmission
-            if torrent.progress == 100:
-                date_done = torrent.done_date or torrent.added_date
-                entry['transmission_date_done'] = date_done
+        # Built in done_date doesn't work when user adds an already completed file to transmission
+        if 'date_done' in wanted and torrent.progress == 100:
+            date_done = torrent.done_date or torrent.added_date
+            entry['transmission_date_done'] = date_done
 
-            entries.append(entry)
-        return entries
+        return entry
+
+    def on_task_abort(self, task, config):
+        config = self.prepare_config(config)
+        # Entries of an aborted run were never acted on, emit everything again on next run
+        ClientMirror.discard(
+            task, 'from_transmission', (config['host'], config['port'], config.get('username'))
+        )
 
 
 class PluginTransmission(TransmissionBase):
@@ -384,30 +597,29 @@ class PluginTransmission(TransmissionBase):
         # Do not run if there is nothing to do
         if not task.accepted:
             return
-        client = self.create_rpc_client(config)
+        snapshot = self.get_snapshot(task, config)
+        client = snapshot.client
         if client:
             logger.debug('Successfully connected to transmission.')
         else:
             raise plugin.PluginError("Couldn't connect to transmission.")
-        session_torrents = client.get_torrents()
+        # Executions of a task kept open share the snapshot, torrents may have changed since
+        snapshot.torrents(SNAPSHOT_FIELDS, refresh=True)
         for entry in task.accepted:
             if task.options.test:
                 logger.info('Would {} {} in transmission.', config['action'], entry['title'])
                 continue
             # Compile user options into appropriate dict
             options = self._make_torrent_options_dict(config, entry)
-            torrent_info = None
-            for t in session_torrents:
-                if t.hashString.lower() == entry.get(
-                    'torrent_info_hash', ''
-                ).lower() or t.id == entry.get('transmission_id'):
-                    torrent_info = t
-                    logger.debug(
-                        'Found {} already loaded in transmission as {}',
-                        entry['title'],
-                        torrent_info.name,
-                    )
-                    break
+            torrent_info = snapshot.get(
+                entry.get('torrent_info_hash'), entry.get('transmission_id')
+            )
+            if torrent_info:
+                logger.debug(
+                    'Found {} already loaded in transmission as {}',
+                    entry['title'],
+                    torrent_info.name,
+                )
 
             if not torrent_info:
                 if config['action'] != 'add':
@@ -452,6 +664,7 @@ class PluginTransmission(TransmissionBase):
                 logger.info('"{}" torrent added to transmission', entry['title'])
                 # The info returned by the add call is incomplete, refresh it
                 torrent_info = client.get_torrent(torrent_info.id)
+                snapshot.add(torrent_info)
             # Torrent already loaded in transmission
             elif options['add'].get('download_dir'):
                 logger.log(
@@ -652,6 +865,7 @@ class PluginTransmission(TransmissionBase):
                     client.remove_torrent(
                         [torrent_info.id], delete_data=config['action'] == 'purge'
                     )
+                    snapshot.discard([torrent_info.id])
                     logger.info('{}d {} from transmission', config['action'], torrent_info.name)
                 elif config['action'] == 'pause':
                     client.stop_torrent([torrent_info.id])
@@ -872,7 +1086,8 @@ class PluginTransmissionClean(TransmissionBase):
         config = self.prepare_config(config)
         if not config['enabled'] or task.options.learn:
             return
-        client = self.create_rpc_client(config)
+        snapshot = self.get_snapshot(task, config)
+        client = snapshot.client
         tracker_re = re.compile(config['tracker'], re.IGNORECASE) if 'tracker' in config else None
         preserve_tracker_re = (
             re.compile(config['preserve_tracker'], re.IGNORECASE)
@@ -883,7 +1098,16 @@ class PluginTransmissionClean(TransmissionBase):
         session = client.get_session()
 
         remove_ids = []
-        for torrent in client.get_torrents():
+        fields = [
+            *SNAPSHOT_FIELDS,
+            *SEED_LIMIT_FIELDS,
+            *TORRENT_INFO_FIELDS,
+            'addedDate',
+            'doneDate',
+            'trackers',
+        ]
+        # The exit phase of a task kept open runs long after the snapshot was loaded
+        for torrent in snapshot.torrents(fields, refresh=True):
             logger.log(
                 'VERBOSE',
                 'Torrent "{}": status: "{}" - ratio: {} - date added: {}',
@@ -926,6 +1150,14 @@ class PluginTransmissionClean(TransmissionBase):
             remove_ids.append(torrent.id)
         if remove_ids:
             client.remove_torrent(remove_ids, config.get('delete_files'))
+            snapshot.discard(remove_ids)
+
+
+@event('task.execute.started')
+@event('task.execute.completed')
+def drop_snapshots(task):
+    """Don't let a task which stays loaded between runs see torrents from an earlier run."""
+    _snapshots.pop(task, None)
 
 
 @event('plugin.register')
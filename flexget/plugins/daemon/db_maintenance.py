@@ -0,0 +1,113 @@
+"""Database cleanup and vacuuming done by the daemon while it has no tasks to run."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from flexget.event import event, fire_event, get_events
+from flexget.manager import Session
+from flexget.plugins.generic.db_vacuum import vacuum_step
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from flexget.manager import Manager
+
+logger = logger.bind(name='db_maintenance')
+
+# Seconds a cleanup step may run before giving way, it stops sooner when a task gets queued
+STEP_TIME = 1.0
+# Seconds to wait between maintenance steps, so readers and other processes get a turn
+STEP_PAUSE = 2.0
+# Seconds between checks whether maintenance is due
+CHECK_INTERVAL = 60.0
+
+
+class DBMaintenance:
+    """Runs `manager.db_cleanup` handlers and incremental vacuuming in small steps.
+
+    Steps are taken from the task queue thread while it is idle, so they never overlap with a
+    running task. Handlers deleting through
+    :func:`~flexget.utils.sqlalchemy_utils.delete_in_chunks` commit every chunk, and stop early
+    when a task gets queued. Such handlers are called again on the next step, until they finish.
+    """
+
+    def __init__(self) -> None:
+        self._steps: Iterator[None] | None = None
+        self._next_step = 0.0
+
+    def reset(self) -> None:
+        if self._steps is not None:
+            self._steps.close()
+        self._steps = None
+        self._next_step = 0.0
+
+    def on_idle(self, manager: Manager) -> None:
+        now = time.monotonic()
+        if now < self._next_step:
+            return
+        if self._steps is None:
+            self._steps = self.steps(manager)
+        try:
+            next(self._steps)
+        except StopIteration:
+            self._steps = None
+            self._next_step = time.monotonic() + CHECK_INTERVAL
+            return
+        except Exception:
+            logger.opt(exception=True).error('Database maintenance failed, retrying later.')
+            self._steps = None
+            self._next_step = time.monotonic() + CHECK_INTERVAL
+            return
+        self._next_step = time.monotonic() + STEP_PAUSE
+
+    def steps(self, manager: Manager) -> Iterator[None]:
+        """Yield after each bounded piece of maintenance work."""
+        if manager.db_cleanup_due:
+            logger.info('Running database cleanup in the background.')
+            yield from self.cleanup_steps(manager)
+            # Just in case some plugin was overzealous in its cleaning, mark the config changed
+            manager.config_changed()
+            manager.persist['last_cleanup'] = datetime.now()
+            logger.verbose('Database cleanup finished.')
+            if vacuum_step() is None:
+                # Not in incremental auto-vacuum mode yet, the next full VACUUM switches it over
+                fire_event('manager.db_vacuum', manager)
+                yield
+        left = vacuum_step()
+        while left:
+            logger.debug('{} free database pages left to vacuum', left)
+            yield
+            left = vacuum_step()
+
+    def cleanup_steps(self, manager: Manager) -> Iterator[None]:
+        for handler in list(get_events('manager.db_cleanup')):
+            while True:
+                deadline = time.monotonic() + STEP_TIME
+                with Session() as session:
+                    session.info['cleanup_should_stop'] = lambda deadline=deadline: (
+                        time.monotonic() > deadline or len(manager.task_queue) > 0
+                    )
+                    handler(manager, session)
+                    incomplete = session.info.get('cleanup_incomplete')
+                yield
+                if not incomplete:
+                    break
+                logger.debug('Continuing {} on next step', handler)
+
+
+maintenance = DBMaintenance()
+
+
+@event('manager.daemon.idle')
+def on_idle(manager):
+    maintenance.on_idle(manager)
+
+
+@event('manager.daemon.completed')
+def on_daemon_completed(manager):
+    maintenance.reset()
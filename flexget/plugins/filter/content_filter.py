@@ -165,10 +165,10 @@ class FilterContentFilter:
 
         for entry in task.accepted:
             if self.process_entry(task, entry, config):
-                task.rerun(plugin='content_filter')
+                task.rerun(plugin='content_filter', delta=True)
             elif 'content_files' not in entry and config.get('strict'):
                 entry.reject('no content files parsed for entry', remember=True)
-                task.rerun(plugin='content_filter')
+                task.rerun(plugin='content_filter', delta=True)
 
 
 @event('plugin.register')
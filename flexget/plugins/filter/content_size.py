@@ -88,7 +88,7 @@ class FilterContentSize:
         if len(task.rejected) > num_rejected:
             # Since we are rejecting after the filter event,
             # re-run this task to see if there is an alternate entry to accept
-            task.rerun()
+            task.rerun(delta=True)
 
 
 @event('plugin.register')
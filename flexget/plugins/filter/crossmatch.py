@@ -2,7 +2,7 @@ from loguru import logger
 
 from flexget import plugin
 from flexget.event import event
-from flexget.utils.tools import aggregate_inputs
+from flexget.utils.tools import FieldIndex, aggregate_inputs
 
 logger = logger.bind(name='crossmatch')
 
@@ -46,19 +46,18 @@ class CrossMatch:
             return
 
         match_entries = aggregate_inputs(task, config['from'])
+        index = FieldIndex(
+            match_entries,
+            fields,
+            exact=config.get('exact'),
+            case_sensitive=config.get('case_sensitive'),
+        )
 
         # perform action on intersecting entries
         for entry in task.entries:
-            for generated_entry in match_entries:
-                logger.trace('checking if {} matches {}', entry['title'], generated_entry['title'])
-                common = self.entry_intersects(
-                    entry,
-                    generated_entry,
-                    fields,
-                    config.get('exact'),
-                    config.get('case_sensitive'),
-                )
-                if common and (not all_fields or len(common) == len(fields)):
+            for generated_entry, common in index.matches(entry):
+                logger.trace('{} matches {}', entry['title'], generated_entry['title'])
+                if not all_fields or len(common) == len(fields):
                     msg = 'intersects with {} on field(s) {}'.format(
                         generated_entry['title'],
                         ', '.join(common),
@@ -71,44 +70,6 @@ class CrossMatch:
                     if action == 'accept':
                         entry.accept(msg)
 
-    def entry_intersects(self, e1, e2, fields=None, exact=True, case_sensitive=True):
-        """Return list of field names in common.
-
-        :param e1: First :class:`flexget.entry.Entry`
-        :param e2: Second :class:`flexget.entry.Entry`
-        :param fields: List of fields which are checked
-        """
-        if fields is None:
-            fields = []
-
-        common_fields = []
-
-        for field in fields:
-            # Doesn't really make sense to match if field is not in both entries
-            if field not in e1 or field not in e2:
-                logger.trace('field {} is not in both entries', field)
-                continue
-
-            if not case_sensitive and isinstance(e1[field], str):
-                v1 = e1[field].lower()
-            else:
-                v1 = e1[field]
-            if not case_sensitive and isinstance(e1[field], str):
-                v2 = e2[field].lower()
-            else:
-                v2 = e2[field]
-
-            try:
-                if v1 == v2 or (not exact and (v2 in v1 or v1 in v2)):
-                    common_fields.append(field)
-                else:
-                    logger.trace('not matching')
-            except TypeError as e:
-                # argument of type <type> is not iterable
-                logger.trace('error matching fields: {}', str(e))
-
-        return common_fields
-
 
 @event('plugin.register')
 def register_plugin():
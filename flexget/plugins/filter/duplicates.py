@@ -2,6 +2,7 @@ from loguru import logger
 
 from flexget import plugin
 from flexget.event import event
+from flexget.utils.tools import FieldIndex
 
 logger = logger.bind(name='duplicates')
 
@@ -26,18 +27,21 @@ class Duplicates:
     def on_task_filter(self, task, config):
         field = config['field']
         action = config['action']
+        index = FieldIndex(task.entries, [field])
         for entry in task.entries:
-            for prospect in task.entries:
-                if entry == prospect:
+            if entry.get(field) is None:
+                continue
+            for prospect, _ in index.matches(entry):
+                # Like task.entries, skip those rejected or failed by now
+                if entry == prospect or not (prospect.undecided or prospect.accepted):
                     continue
-                if entry.get(field) is not None and entry[field] == prospect.get(field):
-                    msg = 'Field {} value {} equals on {} and {}'.format(
-                        field, entry[field], entry['title'], prospect['title']
-                    )
-                    if action == 'accept':
-                        entry.accept(msg)
-                    else:
-                        entry.reject(msg)
+                msg = 'Field {} value {} equals on {} and {}'.format(
+                    field, entry[field], entry['title'], prospect['title']
+                )
+                if action == 'accept':
+                    entry.accept(msg)
+                else:
+                    entry.reject(msg)
 
 
 @event('plugin.register')
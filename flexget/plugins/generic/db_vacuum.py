@@ -7,18 +7,37 @@ from sqlalchemy.exc import OperationalError
 from flexget.event import event
 from flexget.manager import Session
 from flexget.utils.simple_persistence import SimplePersistence
+from flexget.utils.sqlalchemy_utils import incremental_vacuum
 
 logger = logger.bind(name='db_vacuum')
 VACUUM_INTERVAL = timedelta(weeks=24)  # 6 months
+# Free pages released per incremental vacuum step, 4 MiB with the default page size
+VACUUM_STEP_PAGES = 1024
+
+
+def vacuum_step(pages: int = VACUUM_STEP_PAGES) -> int | None:
+    """Release up to `pages` free database pages.
+
+    :return: Number of free pages left, None if the database is not in incremental auto-vacuum mode.
+    """
+    with Session() as session:
+        return incremental_vacuum(session, pages)
 
 
 # Run after the cleanup is actually finished, but before analyze
 @event('manager.db_vacuum', 1)
 def on_cleanup(manager):
+    left = vacuum_step()
+    if left is not None:
+        # Incremental auto-vacuum, release what the cleanup freed a step at a time
+        while left:
+            left = vacuum_step()
+        return
     # Vacuum can take a long time, and is not needed frequently
     persistence = SimplePersistence('db_vacuum')
     last_vacuum = persistence.get('last_vacuum')
     if not last_vacuum or last_vacuum < datetime.now() - VACUUM_INTERVAL:
+        # This also switches the database to incremental auto-vacuum, it is the last full VACUUM
         logger.info('Running VACUUM on database to improve performance and decrease db size.')
         with Session() as session:
             try:
@@ -29,6 +29,9 @@ class InputHtml:
     to match only to desired content.
     """
 
+    # Same entries on every run, reruns can reuse them
+    rerun_stable = True
+
     schema = {
         'oneOf': [
             {'type': 'string'},
@@ -41,6 +44,7 @@ class InputHtml:
                     'dump': {'type': 'string'},
                     'title_from': {'type': 'string'},
                     'allow_empty_links': {'type': 'boolean'},
+                    'parser': {'type': 'string', 'enum': ['html5lib', 'fast']},
                     'links_re': {'type': 'array', 'items': {'type': 'string', 'format': 'regex'}},
                     'increment': {
                         'oneOf': [
@@ -148,7 +152,7 @@ class InputHtml:
         logger.verbose('Requesting: {}', url)
         page = task.requests.get(url, auth=auth)
         logger.verbose('Response: {} ({})', page.status_code, page.reason)
-        soup = get_soup(page.content)
+        soup = get_soup(page.content, config.get('parser', 'html5lib'))
 
         # dump received content into a file
         if dump_name:
@@ -182,23 +186,17 @@ class InputHtml:
         return parse.unquote_plus(name)
 
     def create_entries(self, page_url, soup, config):
-        queue = []
-        duplicates = {}
-        duplicate_limit = 4
-
-        def title_exists(title):
-            """Return True if title is already added to entries."""
-            for entry in queue:
-                if entry['title'] == title:
-                    return True
-            return None
-
-        for link in soup.find_all('a'):
-            # not a valid link
-            if not link.has_attr('href'):
-                continue
+        # Walk the document once, picking titles may need another go over the links
+        links = list(self._find_links(page_url, soup, config))
+        return self._entries_from_links(links, config)
+
+    def _find_links(self, page_url, soup, config):
+        """Yield url and tag of the links on the page which can become entries."""
+        allow_empty_links = config.get('allow_empty_links', False)
+        regexps = [re.compile(regexp) for regexp in config.get('links_re') or []]
+        for link in soup.find_all('a', href=True):
             # no content in the link
-            if not link.contents and not config.get('allow_empty_links', False):
+            if not link.contents and not allow_empty_links:
                 continue
 
             url = link['href']
@@ -208,22 +206,24 @@ class InputHtml:
             elif not url.startswith('http://') or not url.startswith('https://'):
                 url = parse.urljoin(page_url, url)
 
-            log_link = url
-            log_link = log_link.replace('\n', '')
-            log_link = log_link.replace('\r', '')
-
             # get only links matching regexp
-            regexps = config.get('links_re', None)
-            if regexps:
-                accept = False
-                for regexp in regexps:
-                    if re.search(regexp, url):
-                        accept = True
-                if not accept:
-                    logger.debug('url does not match any "links_re": {}', url)
-                    continue
+            if regexps and not any(regexp.search(url) for regexp in regexps):
+                logger.debug('url does not match any "links_re": {}', url)
+                continue
+
+            yield url, link
+
+    def _entries_from_links(self, links, config):
+        queue = []
+        # Titles of the entries in queue
+        titles = set()
+        duplicates = {}
+        duplicate_limit = 4
+
+        title_from = config.get('title_from', 'auto')
+        for url, link in links:
+            log_link = url.replace('\n', '').replace('\r', '')
 
-            title_from = config.get('title_from', 'auto')
             if title_from == 'url':
                 title = self._title_from_url(url)
                 logger.debug('title from url: {}', title)
@@ -239,7 +239,7 @@ class InputHtml:
                     continue
                 # automatic mode, check if title is unique
                 # if there are too many duplicate titles, switch to title_from: url
-                if title_exists(title):
+                if title in titles:
                     # ignore index links as a counter
                     if 'index' in title and len(title) < 10:
                         logger.debug('ignored index title {}', title)
@@ -259,7 +259,7 @@ class InputHtml:
                         )
                         config['title_from'] = switch_to
                         # start from the beginning  ...
-                        return self.create_entries(page_url, soup, config)
+                        return self._entries_from_links(links, config)
             elif title_from in ('link', 'contents'):
                 # link from link name
                 title = self._title_from_link(link, log_link)
@@ -281,13 +281,13 @@ class InputHtml:
             if title.lower().find('.torrent') > 0:
                 title = title[: title.lower().find('.torrent')]
 
-            if title_exists(title):
+            if title in titles:
                 # title link should be unique, add CRC32 to end if it's not
                 hash = zlib.crc32(url.encode('utf-8'))
                 crc32 = '%08X' % (hash & 0xFFFFFFFF)
                 title = f'{title} [{crc32}]'
                 # truly duplicate, title + url crc already exists in queue
-                if title_exists(title):
+                if title in titles:
                     continue
                 logger.debug('uniqued title to {}', title)
 
@@ -298,6 +298,7 @@ class InputHtml:
             if 'username' in config and 'password' in config:
                 entry['download_auth'] = (config['username'], config['password'])
 
+            titles.add(title)
             queue.append(entry)
 
         # add from queue to task
@@ -22,6 +22,9 @@ class Mock:
     If url is not given a random url pointing to localhost will be generated.
     """
 
+    # Same entries on every run, reruns can reuse them
+    rerun_stable = True
+
     schema = {
         'type': 'array',
         'items': {
@@ -1,3 +1,7 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from urllib.parse import urlencode
 from xml.etree import ElementTree as ET
 
@@ -5,62 +9,100 @@ from loguru import logger
 
 from flexget import plugin
 from flexget.components.sites.utils import torrent_availability
+from flexget.config_schema import one_or_more
 from flexget.entry import Entry
 from flexget.event import event
 from flexget.plugin import PluginError
 from flexget.utils.requests import RequestException
+from flexget.utils.simple_persistence import SimplePersistence
 from flexget.utils.tools import parse_timedelta
 
 logger = logger.bind(name='torznab')
 
+# Capabilities of the indexers, {base_url: {'caps': xml, 'fetched': datetime}}
+persist = SimplePersistence('torznab')
 
-class Torznab:
-    """Torznab search plugin.
 
-    Handles searching for tv shows and movies, with fallback to simple query strings if these are not available.
+class IndexerPool:
+    """Searches indexers concurrently, with a limited number of connections to each indexer.
+
+    Every indexer gets its own thread pool, sized by the connection limit it is configured with.
     """
 
-    @property
-    def schema(self):
-        """The schema of the plugin."""
-        return {
-            'type': 'object',
-            'properties': {
-                'apikey': {'type': 'string'},
-                'categories': {'type': 'array', 'items': {'type': 'integer'}, 'default': []},
-                'searcher': {
-                    'type': 'string',
-                    'enum': ['movie', 'tv', 'tvsearch', 'search'],
-                    'default': 'search',
-                },
-                'website': {'type': 'string', 'format': 'url'},
-                'timeout': {'type': 'string', 'format': 'interval'},
-            },
-            'required': ['website', 'apikey'],
-            'additionalProperties': False,
-        }
+    def __init__(self):
+        self._executors = {}
+        self._lock = threading.Lock()
+
+    def submit(self, base_url, max_connections, fn, *args):
+        key = (base_url, max_connections)
+        with self._lock:
+            executor = self._executors.get(key)
+            if executor is None:
+                executor = self._executors[key] = ThreadPoolExecutor(
+                    max_workers=max_connections, thread_name_prefix='torznab'
+                )
+        # Requests and queries of the search count towards the plugin in the status component
+        return executor.submit(contextvars.copy_context().run, fn, *args)
 
-    def search(self, task, entry, config=None):
-        """Search interface."""
-        self._setup(task, config)
-        params = {}
-        if self.params['t'] == 'movie':
-            params = self._convert_query_parameters(entry, ['imdbid'])
-        elif self.params['t'] == 'tvsearch':
-            params = self._convert_query_parameters(
-                entry, ['rid', 'tvdbid', 'traktid', 'tvmazeid', 'imdbid', 'tmdbid', 'season', 'ep']
-            )
+    def shutdown(self):
+        with self._lock:
+            executors, self._executors = list(self._executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        query = entry['title'] if 'q' not in params else params['q']
 
-        entries = []
-        for search_string in entry.get('search_strings', [query]):
-            params['q'] = search_string
-            results = self.create_entries_from_query(self._build_url(**params), task)
-            entries.extend(results)
-        return entries
+pool = IndexerPool()
+
 
-    def _build_url(self, **kwargs):
+class TorznabIndexer:
+    """An indexer, with the searcher and parameters picked from its capabilities."""
+
+    def __init__(self, website, apikey, timeout):
+        self.base_url = website.rstrip('/')
+        self.timeout = timeout
+        self.supported_params = []
+        self.params = {'apikey': apikey, 'extended': 1}
+
+    def setup(self, task, config):
+        """Match the capabilities of the indexer with the configuration."""
+        caps = self._get_caps(task, parse_timedelta(config['caps_cache_time']))
+        try:
+            root = ET.fromstring(caps)
+        except ET.ParseError as e:
+            # Don't keep broken capabilities around
+            persist.pop(self.base_url, None)
+            raise PluginError(f'Invalid capabilities from {self.base_url}: {e}')
+        self._setup_searcher(root, config['searcher'], config['categories'])
+        return self
+
+    def _get_caps(self, task, cache_time):
+        """Get the capabilities of the indexer, fetched again once they are older than `cache_time`."""
+        cached = persist.get(self.base_url)
+        if cached and datetime.now() - cached['fetched'] < cache_time:
+            logger.debug('Using capabilities of {} from {}', self.base_url, cached['fetched'])
+            return cached['caps']
+        try:
+            caps = self._fetch_caps(task)
+        except PluginError as e:
+            if not cached:
+                raise
+            logger.warning(
+                'Could not refresh capabilities of {}, using the ones from {}: {}',
+                self.base_url,
+                cached['fetched'],
+                e,
+            )
+            return cached['caps']
+        persist[self.base_url] = {'caps': caps, 'fetched': datetime.now()}
+        return caps
+
+    @plugin.internet(logger)
+    def _fetch_caps(self, task):
+        response = task.requests.get(self.build_url(t='caps'), timeout=self.timeout)
+        logger.debug('Raw caps response {}', response.content)
+        return response.text
+
+    def build_url(self, **kwargs):
         """Build the url with query parameters from the arguments."""
         params = self.params.copy()
         params.update(kwargs)
@@ -68,27 +110,15 @@ class Torznab:
         url = f'{self.base_url}/api?'
         return f'{url}{urlencode(params)}'
 
-    def _setup(self, task, config):
-        """Set up parameters."""
-        self.base_url = config['website'].rstrip('/')
-        config.setdefault('timeout', '30 seconds')
-        self.timeout = parse_timedelta(config['timeout']).total_seconds()
-        self.supported_params = []
-        if config['searcher'] == 'tv':
-            config['searcher'] = 'tvsearch'
-
-        self.params = {'apikey': config['apikey'], 'extended': 1}
-
-        logger.debug('Config: {}', config)
-        self._setup_caps(task, config['searcher'], config['categories'])
-
-    @plugin.internet(logger)
-    def _setup_caps(self, task, searcher, categories):
-        """Get the capabilities of the torznab indexer and match it with the provided configuration."""
-        response = task.requests.get(self._build_url(t='caps'), timeout=self.timeout)
-        logger.debug('Raw caps response {}', response.content)
-        root = ET.fromstring(response.content)
-        self._setup_searcher(root, searcher, categories)
+    def query_params(self, entry):
+        """Get the query parameters the searcher of this indexer supports for `entry`."""
+        if self.params['t'] == 'movie':
+            return self._convert_query_parameters(entry, ['imdbid'])
+        if self.params['t'] == 'tvsearch':
+            return self._convert_query_parameters(
+                entry, ['rid', 'tvdbid', 'traktid', 'tvmazeid', 'imdbid', 'tmdbid', 'season', 'ep']
+            )
+        return {}
 
     def _setup_searcher(self, xml_root, searcher, categories):
         """Get the available searchers (tv, movie, etc) for the indexer and their supported parameters."""
@@ -152,13 +182,147 @@ class Torznab:
             logger.debug('Setting search categories to {}', used_categories)
             self.params['cat'] = ','.join(str(e) for e in used_categories)
 
+    def _convert_query_parameters(self, entry, fields):
+        """Convert from Flexget fields to query parameters for torznab.
+
+        https://flexget.com/Entry
+        https://github.com/nZEDb/nZEDb/blob/0.x/docs/newznab_api_specification.txt#L441
+        """
+        params = {}
+        dictionary = {
+            'rid': 'tvrage_id',
+            'tvdbid': 'tvdb_id',
+            'traktid': 'trakt_show_id',
+            'tvmazeid': 'tvmaze_series_id',
+            'imdbid': 'imdb_id',
+            'tmdbid': 'tmdb_id',
+            'season': 'series_season',
+            'ep': 'series_episode',
+        }
+
+        for k, v in dictionary.items():
+            if k not in self.supported_params or k not in fields:
+                continue
+            if entry.get(v):
+                params[k] = entry[v]
+        for k in [
+            'tvdb_series_name',
+            'trakt_series_name',
+            'tvmaze_series_name',
+            'imdb_name',
+            'series_name',
+        ]:
+            if entry.get(k):
+                params['q'] = entry[k]
+                break
+
+        return params
+
+
+class Torznab:
+    """Torznab search plugin.
+
+    Handles searching for tv shows and movies, with fallback to simple query strings if these are not available.
+    Several indexers, like the ones of a Jackett or Prowlarr instance, can be searched at once.
+    """
+
+    @property
+    def schema(self):
+        """The schema of the plugin."""
+        return {
+            'type': 'object',
+            'properties': {
+                'apikey': {'type': 'string'},
+                'categories': {'type': 'array', 'items': {'type': 'integer'}, 'default': []},
+                'searcher': {
+                    'type': 'string',
+                    'enum': ['movie', 'tv', 'tvsearch', 'search'],
+                    'default': 'search',
+                },
+                'website': one_or_more({'type': 'string', 'format': 'url'}),
+                'timeout': {'type': 'string', 'format': 'interval'},
+                'caps_cache_time': {
+                    'type': 'string',
+                    'format': 'interval',
+                    'default': '1 day',
+                },
+                'max_connections': {'type': 'integer', 'minimum': 1, 'default': 2},
+            },
+            'required': ['website', 'apikey'],
+            'additionalProperties': False,
+        }
+
+    def search(self, task, entry, config=None):
+        """Search interface."""
+        indexers = self._setup(task, config)
+        searches = []
+        for indexer in indexers:
+            params = indexer.query_params(entry)
+            query = entry['title'] if 'q' not in params else params['q']
+            for search_string in entry.get('search_strings', [query]):
+                params['q'] = search_string
+                url = indexer.build_url(**params)
+                future = pool.submit(
+                    indexer.base_url,
+                    config['max_connections'],
+                    self.create_entries_from_query,
+                    url,
+                    task,
+                    indexer.timeout,
+                )
+                searches.append((indexer, future))
+
+        entries = []
+        errors = []
+        for indexer, future in searches:
+            try:
+                entries.extend(future.result())
+            except PluginError as e:
+                errors.append((indexer, e))
+        if errors and len(errors) == len(searches):
+            raise errors[0][1]
+        for indexer, e in errors:
+            logger.error('Error searching {}: {}', indexer.base_url, e)
+        return entries
+
+    def _setup(self, task, config):
+        """Set up the indexers, the ones which fail are left out."""
+        config.setdefault('timeout', '30 seconds')
+        timeout = parse_timedelta(config['timeout']).total_seconds()
+        if config['searcher'] == 'tv':
+            config['searcher'] = 'tvsearch'
+        logger.debug('Config: {}', config)
+
+        websites = config['website']
+        if not isinstance(websites, list):
+            websites = [websites]
+        setups = []
+        for website in websites:
+            indexer = TorznabIndexer(website, config['apikey'], timeout)
+            future = pool.submit(
+                indexer.base_url, config['max_connections'], indexer.setup, task, config
+            )
+            setups.append((indexer, future))
+        indexers = []
+        errors = []
+        for indexer, future in setups:
+            try:
+                indexers.append(future.result())
+            except PluginError as e:
+                errors.append((indexer, e))
+        if not indexers:
+            raise errors[0][1]
+        for indexer, e in errors:
+            logger.error('Leaving out {}: {}', indexer.base_url, e)
+        return indexers
+
     @plugin.internet(logger)
-    def create_entries_from_query(self, url, task):
+    def create_entries_from_query(self, url, task, timeout=30):
         """Fetch feed and fill entries from."""
         logger.info('Fetching URL: {}', url)
 
         try:
-            response = task.requests.get(url, timeout=self.timeout)
+            response = task.requests.get(url, timeout=timeout)
         except RequestException as e:
             raise PluginError(f"Failed fetching '{url}': {e}")
 
@@ -239,41 +403,10 @@ class Torznab:
                 entry['torrent_seeds'], entry['torrent_leeches']
             )
 
-    def _convert_query_parameters(self, entry, fields):
-        """Convert from Flexget fields to query parameters for torznab.
 
-        https://flexget.com/Entry
-        https://github.com/nZEDb/nZEDb/blob/0.x/docs/newznab_api_specification.txt#L441
-        """
-        params = {}
-        dictionary = {
-            'rid': 'tvrage_id',
-            'tvdbid': 'tvdb_id',
-            'traktid': 'trakt_show_id',
-            'tvmazeid': 'tvmaze_series_id',
-            'imdbid': 'imdb_id',
-            'tmdbid': 'tmdb_id',
-            'season': 'series_season',
-            'ep': 'series_episode',
-        }
-
-        for k, v in dictionary.items():
-            if k not in self.supported_params or k not in fields:
-                continue
-            if entry.get(v):
-                params[k] = entry[v]
-        for k in [
-            'tvdb_series_name',
-            'trakt_series_name',
-            'tvmaze_series_name',
-            'imdb_name',
-            'series_name',
-        ]:
-            if entry.get(k):
-                params['q'] = entry[k]
-                break
-
-        return params
+@event('manager.shutdown')
+def shutdown(manager):
+    pool.shutdown()
 
 
 @event('plugin.register')
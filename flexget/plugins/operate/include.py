@@ -40,7 +40,7 @@ class PluginInclude:
             with file.open(encoding='utf-8') as inc_file:
                 include = yaml.safe_load(inc_file)
                 inc_file.flush()
-            errors = process_config(include, plugin.plugin_schemas(interface='task'))
+            errors = process_config(include, '/schema/plugins?interface=task')
             if errors:
                 logger.error('Included file {} has invalid config:', file)
                 for error in errors:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import bisect
 import collections.abc
 import contextlib
 import copy
+import heapq
 import itertools
 import random
 import string
@@ -23,7 +25,6 @@ from flexget.plugin import (
     PluginWarning,
     get_plugins,
     phase_methods,
-    plugin_schemas,
     task_phases,
 )
 from flexget.plugin import plugins as all_plugins
@@ -102,15 +103,20 @@ class EntryIterator:
         self.all_entries = entries
         if isinstance(states, EntryState):
             states = [states]
-        self.filter = lambda e: e._state in states
+        self.states = frozenset(states)
+        self.filter = lambda e: e._state in self.states
 
     def __iter__(self) -> Iterator[Entry]:
+        if isinstance(self.all_entries, EntryContainer):
+            return self.all_entries.iter_states(self.states)
         return filter(self.filter, self.all_entries)
 
     def __bool__(self):
-        return any(e for e in self)
+        return len(self) > 0
 
     def __len__(self):
+        if isinstance(self.all_entries, EntryContainer):
+            return self.all_entries.count_states(self.states)
         return sum(1 for _e in self)
 
     def __add__(self, other):
@@ -136,11 +142,37 @@ class EntryIterator:
         self.all_entries.sort(*args, **kwargs)
 
 
+def _invalidating(name):
+    """Wrap list method `name` so it drops the indexes of :class:`EntryContainer`."""
+    method = getattr(list, name)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._invalidate()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class EntryContainer(list):
-    """Container for a list of entries, also contains accepted, rejected failed iterators over them."""
+    """Container for a list of entries, also contains accepted, rejected failed iterators over them.
+
+    Entries are indexed by state, so the iterators only visit matching entries and know their
+    length without walking the whole list. Entries report state changes through their task back
+    reference, if the container holds entries which don't belong to its task it falls back to
+    filtering the list.
+    """
+
+    # Fields which can be looked up by value with :meth:`candidates`
+    indexed_fields = ('title', 'url')
 
     def __init__(self, iterable: list | None = None):
         list.__init__(self, iterable or [])
+        self._indexed = False
+        self._by_state: dict[EntryState, list[Entry]] = {}
+        self._positions: dict[int, int] = {}
+        self._untracked = 0
+        self._field_index: dict[str, dict | None] = {}
 
         self._entries = EntryIterator(self, [EntryState.UNDECIDED, EntryState.ACCEPTED])
         self._accepted = EntryIterator(
@@ -162,6 +194,139 @@ class EntryContainer(list):
     def __repr__(self) -> str:
         return f'<EntryContainer({list.__repr__(self)})>'
 
+    def _tracks(self, entry: Entry) -> bool:
+        """Return True if state changes of `entry` will be reported to this container."""
+        return getattr(getattr(entry, 'task', None), 'all_entries', None) is self
+
+    def _index_entry(self, position: int, entry: Entry) -> None:
+        if id(entry) in self._positions or not self._tracks(entry):
+            self._untracked += 1
+        self._positions[id(entry)] = position
+        self._by_state[entry._state].append(entry)
+
+    def _build_index(self) -> None:
+        self._by_state = {state: [] for state in EntryState}
+        self._positions = {}
+        self._untracked = 0
+        for position, entry in enumerate(self):
+            self._index_entry(position, entry)
+        self._indexed = True
+
+    def _invalidate(self) -> None:
+        self._indexed = False
+        self._field_index = {}
+
+    def _position(self, entry: Entry) -> int:
+        return self._positions[id(entry)]
+
+    def entry_state_changed(self, entry: Entry, previous: EntryState) -> None:
+        """Move `entry` to the index of its new state, called by :class:`Entry` on state changes."""
+        if not self._indexed or self._untracked:
+            return
+        position = self._positions.get(id(entry))
+        if position is None or list.__getitem__(self, position) is not entry:
+            # Not one of ours, eg. a copy of an entry in this container
+            return
+        old = self._by_state[previous]
+        index = bisect.bisect_left(old, position, key=self._position)
+        if index < len(old) and old[index] is entry:
+            del old[index]
+            bisect.insort(self._by_state[entry._state], entry, key=self._position)
+        else:
+            self._invalidate()
+
+    def entry_changed(self, entry: Entry) -> None:
+        """Drop field indexes, called by :class:`Entry` when an indexed field changes."""
+        self._field_index = {}
+
+    def iter_states(self, states: frozenset[EntryState]) -> Iterator[Entry]:
+        """Iterate entries in any of the `states`, in container order."""
+        if not self._indexed:
+            self._build_index()
+        if self._untracked:
+            return (e for e in list.__iter__(self) if e._state in states)
+        indexes = [self._by_state[state] for state in states if self._by_state[state]]
+        if not indexes:
+            return iter(())
+        if len(indexes) == 1:
+            snapshot = list(indexes[0])
+        else:
+            positions = self._positions
+            snapshot = list(heapq.merge(*indexes, key=lambda e: positions[id(e)]))
+        # Entries may change state while being iterated
+        return (e for e in snapshot if e._state in states)
+
+    def count_states(self, states: frozenset[EntryState]) -> int:
+        """Return number of entries in any of the `states`."""
+        if not self._indexed:
+            self._build_index()
+        if self._untracked:
+            return sum(1 for e in list.__iter__(self) if e._state in states)
+        return sum(len(self._by_state[state]) for state in states)
+
+    def _get_field_index(self, field: str) -> dict | None:
+        if field not in self._field_index:
+            index = {}
+            for entry in list.__iter__(self):
+                if field not in entry:
+                    continue
+                if entry.is_lazy(field):
+                    index = None
+                    break
+                try:
+                    index.setdefault(entry[field], []).append(entry)
+                except TypeError:
+                    index = None
+                    break
+            self._field_index[field] = index
+        return self._field_index[field]
+
+    def candidates(self, states: frozenset[EntryState], values: dict) -> list[Entry] | None:
+        """Return entries in `states` which may match `values`, using field indexes.
+
+        :return: List of candidates in container order, or None if no index can be used.
+        """
+        if not self._indexed:
+            self._build_index()
+        if self._untracked:
+            return None
+        for field in self.indexed_fields:
+            if field not in values:
+                continue
+            index = self._get_field_index(field)
+            if index is None:
+                continue
+            try:
+                matches = index.get(values[field], ())
+            except TypeError:
+                return None
+            return [e for e in matches if e._state in states]
+        return None
+
+    def append(self, entry: Entry) -> None:
+        if self._indexed:
+            self._index_entry(len(self), entry)
+        self._field_index = {}
+        list.append(self, entry)
+
+    def extend(self, iterable: Iterable[Entry]) -> None:
+        for entry in iterable:
+            self.append(entry)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    insert = _invalidating('insert')
+    remove = _invalidating('remove')
+    pop = _invalidating('pop')
+    clear = _invalidating('clear')
+    sort = _invalidating('sort')
+    reverse = _invalidating('reverse')
+    __setitem__ = _invalidating('__setitem__')
+    __delitem__ = _invalidating('__delitem__')
+    __imul__ = _invalidating('__imul__')
+
 
 class TaskAbort(Exception):
     def __init__(self, reason: str, silent: bool = False) -> None:
@@ -268,6 +433,12 @@ class Task:
         self._rerun_count = 0
         self._max_reruns = Task.RERUN_DEFAULT
         self._reruns_locked = False
+        # None until a rerun is requested, stays True while every request allows a delta rerun
+        self._rerun_delta = None
+        # Entries produced by each input plugin during this run, replayed on delta reruns
+        self._input_snapshots = {}
+        # Input plugins which looked at the rerun state, their entries may differ on reruns
+        self._rerun_aware_inputs = set()
 
         self.config_modified = None
 
@@ -286,6 +457,13 @@ class Task:
         self._all_entries = EntryContainer()
         self._rerun = False
 
+        # Postpone the exit phase, see execute
+        self.keep_open = False
+        # True while the start and prepare phases have run, and the exit phase has not
+        self._open = False
+        # Entries of the executions since the task was opened, the exit phase sees all of them
+        self._open_entries = []
+
         self.disabled_phases = []
         self.disabled_plugins = []
 
@@ -323,12 +501,19 @@ class Task:
 
     @property
     def is_rerun(self):
+        self._note_rerun_aware()
         return bool(self._rerun_count)
 
     @property
     def rerun_count(self):
+        self._note_rerun_aware()
         return self._rerun_count
 
+    def _note_rerun_aware(self):
+        # An input plugin asking whether this is a rerun may produce other entries on reruns
+        if self.current_phase == 'input' and self.current_plugin:
+            self._rerun_aware_inputs.add(self.current_plugin)
+
     @property
     def undecided(self):
         """.. deprecated:: Use API v3.
@@ -427,7 +612,10 @@ class Task:
         cat = getattr(self, category)
         if not isinstance(cat, EntryIterator):
             raise TypeError('category must be a EntryIterator')
-        for entry in cat:
+        candidates = None
+        if isinstance(cat.all_entries, EntryContainer):
+            candidates = cat.all_entries.candidates(cat.states, values)
+        for entry in cat if candidates is None else candidates:
             for k, v in values.items():
                 if not (k in entry and entry[k] == v):
                     break
@@ -443,13 +631,12 @@ class Task:
         :return:
           An iterator over configured :class:`flexget.plugin.PluginInfo` instances enabled on this task.
         """
+        plugins = get_plugins(phase=phase) if phase else all_plugins.values()
+        # Filter before looking at handlers, plugins this task doesn't use need not be loaded
+        plugins = [p for p in plugins if p.name in self.config or p.builtin]
         if phase:
-            plugins = sorted(
-                get_plugins(phase=phase), key=lambda p: p.phase_handlers[phase], reverse=True
-            )
-        else:
-            plugins = iter(all_plugins.values())
-        return (p for p in plugins if p.name in self.config or p.builtin)
+            plugins.sort(key=lambda p: p.phase_handlers[phase], reverse=True)
+        return iter(plugins)
 
     def __run_task_phase(self, phase):
         """Execute task phase, ie. call all enabled plugins on the task.
@@ -488,6 +675,12 @@ class Task:
                 return
             if plugin.name in self.disabled_plugins:
                 continue
+            if phase == 'input' and plugin.name in self._input_snapshots:
+                logger.debug('delta rerun, reusing entries produced by {}', plugin.name)
+                for e in copy.deepcopy(self._input_snapshots[plugin.name]):
+                    e.task = self
+                    self.all_entries.append(e)
+                continue
             # store execute info, except during entry events
             self.current_phase = phase
             self.current_plugin = plugin.name
@@ -511,6 +704,7 @@ class Task:
                         for e in response:
                             e.task = self
                             self.all_entries.append(e)
+                        self._snapshot_input(plugin, response)
                 finally:
                     fire_event('task.execute.after_plugin', self, plugin.name)
                 self.session = None
@@ -576,11 +770,34 @@ class Task:
         else:
             return result
 
-    def rerun(self, plugin=None, reason=None):
+    def _snapshot_input(self, plugin, entries):
+        """Keep copies of the entries produced by an input plugin, for delta reruns.
+
+        Only inputs which declare that they produce the same entries on a rerun, with a
+        `rerun_stable` class attribute, are kept. Those which look at the rerun state anyway, or
+        whose entries carry hooks, are still run again.
+        """
+        if (
+            not getattr(plugin.instance, 'rerun_stable', False)
+            or plugin.name in self._rerun_aware_inputs
+            or any(e.has_hooks for e in entries)
+        ):
+            return
+        try:
+            self._input_snapshots[plugin.name] = copy.deepcopy(entries)
+        except (TypeError, copy.Error) as e:
+            # Some entry field cannot be copied, the input is just run again
+            logger.debug('Not keeping entries of input {} for delta reruns: {}', plugin.name, e)
+
+    def rerun(self, plugin=None, reason=None, delta=False):
         """Immediately re-run the task after execute has completed, task can be re-run up to :attr:`.max_reruns` times.
 
         :param str plugin: Plugin name
         :param str reason: Why the rerun is done
+        :param bool delta: The rerun only needs entries which plugins produce differently on reruns,
+          e.g. the next episodes to search for. When all requests for the rerun allow it, input
+          plugins marked `rerun_stable` are not run again, the entries they produced on the first
+          run are reused. Decisions are the same as with a full rerun.
         """
         msg = f'Plugin {self.current_plugin if plugin is None else plugin} has requested task to be ran again after execution has completed.'
         if reason:
@@ -591,6 +808,7 @@ class Task:
         else:
             logger.info(msg)
         self._rerun = True
+        self._rerun_delta = delta and self._rerun_delta is not False
 
     def config_changed(self):
         """Set config_modified flag to True for the remainder of this run.
@@ -609,7 +827,7 @@ class Task:
         """Check the task's config hash and update the hash if necessary."""
         # Save current config hash and set config_modified flag
         config_hash = get_config_hash(self.config)
-        if self.is_rerun:
+        if self._rerun_count:
             # Restore the config to state right after start phase
             if self.prepared_config:
                 self.config = copy.deepcopy(self.prepared_config)
@@ -644,7 +862,9 @@ class Task:
         if self.options.inject:
             # If entries are passed for this execution (eg. rerun), disable the input phase
             self.disable_phase('input')
-            self.all_entries.extend(copy.deepcopy(self.options.inject))
+            for entry in copy.deepcopy(self.options.inject):
+                entry.task = self
+                self.all_entries.append(entry)
 
         # run phases
         try:
@@ -661,7 +881,7 @@ class Task:
                                     phase,
                                 )
                     continue
-                if phase in ('start', 'prepare') and self.is_rerun:
+                if phase in ('start', 'prepare') and (self._rerun_count or self._open):
                     logger.debug('skipping phase {} during rerun', phase)
                     continue
                 if phase == 'exit':
@@ -672,18 +892,24 @@ class Task:
                     if self._rerun and self._rerun_count < self.max_reruns:
                         logger.debug('not running task_exit yet because task will rerun')
                         continue
+                    if self.keep_open:
+                        logger.debug('not running task_exit yet because task is kept open')
+                        continue
                 # run all plugins with this phase
                 self.__run_task_phase(phase)
                 if phase == 'start':
                     # Store a copy of the config state after start phase to restore for reruns
                     self.prepared_config = copy.deepcopy(self.config)
         except TaskAbort:
-            try:
-                self.__run_task_phase('abort')
-            except TaskAbort:
-                logger.exception('abort handlers aborted')
+            self._run_abort_phase()
             raise
 
+    def _run_abort_phase(self):
+        try:
+            self.__run_task_phase('abort')
+        except TaskAbort:
+            logger.exception('abort handlers aborted')
+
     @use_task_logging
     def execute(self):
         """Execute the task.
@@ -695,12 +921,24 @@ class Task:
           for this execution.
         - :attr:`.options.inject` is a list of :class:`Entry` instances used instead
           of running input phase.
+
+        When :attr:`.keep_open` is set the exit phase is postponed until :meth:`close`. The task
+        can be executed again with new :attr:`.options.inject` entries until then, these
+        executions skip the start and prepare phases like reruns do. Each execution only handles
+        its own entries, the exit phase gets the entries of all of them.
         """
         self.finished_event.clear()
         try:
-            if self.options.cron:
-                self.manager.db_cleanup()
-            fire_event('task.execute.started', self)
+            if self._open:
+                self._rerun_count = 0
+                self._input_snapshots.clear()
+                self._open_entries.extend(self._all_entries)
+                self._all_entries = EntryContainer()
+            else:
+                # The daemon cleans up the database while it has no tasks to run
+                if self.options.cron and not self.manager.is_daemon:
+                    self.manager.db_cleanup()
+                fire_event('task.execute.started', self)
             while True:
                 self._execute()
                 # rerun task
@@ -709,10 +947,18 @@ class Task:
                     and self._rerun_count < self.max_reruns
                     and self._rerun_count < Task.RERUN_MAX
                 ):
+                    if not self._rerun_delta:
+                        self._input_snapshots.clear()
+                    elif self._input_snapshots:
+                        logger.verbose(
+                            'Reusing entries from inputs {} on rerun.',
+                            ', '.join(self._input_snapshots),
+                        )
                     logger.info('Rerunning the task in case better resolution can be achieved.')
                     self._rerun_count += 1
                     self._all_entries = EntryContainer()
                     self._rerun = False
+                    self._rerun_delta = None
                     continue
                 if self._rerun:
                     logger.info(
@@ -720,17 +966,41 @@ class Task:
                         self._rerun_count,
                     )
                 break
-            fire_event('task.execute.completed', self)
+            self._open = self.keep_open and self.enabled
+            if not self._open:
+                fire_event('task.execute.completed', self)
+        except Exception:
+            # Abort handlers have run instead of the exit phase
+            self._open = False
+            raise
         finally:
             self.finished_event.set()
+            if not self._open:
+                self.requests.close()
+
+    @use_task_logging
+    def close(self):
+        """Run the postponed exit phase of a task executed with :attr:`.keep_open`."""
+        self.keep_open = False
+        if not self._open:
+            return
+        self._open = False
+        self._all_entries = EntryContainer(self._open_entries + self._all_entries)
+        self._open_entries = []
+        try:
+            try:
+                self.__run_task_phase('exit')
+            except TaskAbort:
+                self._run_abort_phase()
+                raise
+            fire_event('task.execute.completed', self)
+        finally:
             self.requests.close()
 
     @staticmethod
     def validate_config(config):
-        schema = plugin_schemas(interface='task')
-        # Don't validate commented out plugins
-        schema['patternProperties'] = {'^_': {}}
-        return config_schema.process_config(config, schema)
+        # Commented out plugins are not validated, plugin schemas allow keys starting with _
+        return config_schema.process_config(config, '/schema/plugins?interface=task')
 
     def __copy__(self):
         new = type(self)(self.manager, self.name, self.config, self.options)
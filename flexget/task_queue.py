@@ -11,6 +11,8 @@ from sqlalchemy.exc import OperationalError, ProgrammingError
 from flexget.task import TaskAbort
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from flexget.task import Task
 
 logger = logger.bind(name='task_queue')
@@ -20,10 +22,13 @@ class TaskQueue:
     """Task processing thread.
 
     Only executes one task at a time, if more are requested they are queued up and run in turn.
+    While there is nothing to run `on_idle` is called every half a second, it should return
+    quickly since queued tasks wait for it.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, on_idle: Callable[[], None] | None = None) -> None:
         self.run_queue: queue.PriorityQueue[Task] = queue.PriorityQueue()
+        self.on_idle = on_idle
         self._shutdown_now = False
         self._shutdown_when_finished = False
 
@@ -46,6 +51,8 @@ class TaskQueue:
             except queue.Empty:
                 if self._shutdown_when_finished:
                     self._shutdown_now = True
+                elif self.on_idle:
+                    self.on_idle()
                 continue
             try:
                 self.current_task.execute()
@@ -5,9 +5,12 @@
 from __future__ import annotations
 
 import binascii
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from loguru import logger
 
@@ -109,6 +112,7 @@ def tokenize(
     text: bytes,
     match=re.compile(rb'([idel])|(\d+):|(-?\d+)').match,  # type: Callable[[bytes, int], Match[bytes]]
 ) -> Generator[bytes, None, None]:
+    """Split bencoded `text` into tokens. Not used by :func:`bdecode` anymore, kept for compatibility."""
     i = 0
     while i < len(text):
         m = match(text, i)
@@ -123,6 +127,7 @@ def tokenize(
 
 
 def decode_item(src_iter: Iterator[bytes], token: bytes) -> bytes | str | int | list | dict:
+    """Decode one item from a :func:`tokenize` token stream. Kept for compatibility."""
     data: bytes | str | int | list | dict
     if token == b'i':
         # integer: "i" value "e"
@@ -150,15 +155,120 @@ def decode_item(src_iter: Iterator[bytes], token: bytes) -> bytes | str | int |
     return data
 
 
+# Sentinel for a dictionary waiting for its next key
+_NO_KEY = object()
+
+
+def _bdecode(text: bytes, info_key: str | None = None) -> tuple[Any, tuple[int, int] | None]:
+    """Decode `text` iteratively, working on offsets instead of tokens.
+
+    Strings are decoded straight from a memoryview of `text`, so only the resulting values are
+    allocated.
+
+    :param info_key: If given, also return the ``(start, end)`` byte span of the value of this
+        key in the top level dictionary.
+    :return: Tuple of decoded data and the span of `info_key` (or None).
+    """
+    view = memoryview(text)
+    find = text.index
+    length = len(text)
+    pos = 0
+    # Each frame is [container, pending dict key or _NO_KEY, is_dict]
+    stack: list[list] = []
+    frame = None
+    span_start = -1
+    span = None
+    while pos < length:
+        char = text[pos]
+        if char == 0x65:  # 'e', end of container
+            if frame is None:
+                raise ValueError(f'unexpected end marker at offset {pos}')
+            value, key, _ = stack.pop()
+            if key is not _NO_KEY:
+                raise ValueError(f'dictionary key {key!r} without value')
+            pos += 1
+        else:
+            if info_key is not None and len(stack) == 1 and frame[1] == info_key:
+                span_start = pos
+            if char in {0x64, 0x6C}:  # 'd' or 'l', start of container
+                if frame is not None and frame[2] and frame[1] is _NO_KEY:
+                    raise ValueError(f'container used as dictionary key at offset {pos}')
+                frame = [{} if char == 0x64 else [], _NO_KEY, char == 0x64]
+                stack.append(frame)
+                pos += 1
+                continue
+            if char == 0x69:  # 'i', integer
+                end = find(b'e', pos + 1)
+                digits = text[pos + 1 : end]
+                if not (digits.isdigit() or (digits[:1] == b'-' and digits[1:].isdigit())):
+                    raise ValueError(f'invalid integer {digits!r} at offset {pos}')
+                value = int(digits)
+                pos = end + 1
+            else:  # string, "<length>:<data>"
+                colon = find(b':', pos)
+                digits = text[pos:colon]
+                if not digits.isdigit():
+                    raise ValueError(f'invalid string length {digits!r} at offset {pos}')
+                pos = colon + 1 + int(digits)
+                if pos > length:
+                    raise ValueError('string runs past end of data')
+                chunk = view[colon + 1 : pos]
+                # Strings in torrent file are defined as utf-8 encoded.
+                # The pieces field is a byte string, and should be left as such.
+                try:
+                    value = str(chunk, 'utf-8')
+                except UnicodeDecodeError:
+                    value = bytes(chunk)
+
+        # Place the finished value in its parent container
+        if not stack:
+            if pos != length:
+                raise SyntaxError('trailing junk')
+            return value, span
+        frame = stack[-1]
+        if not frame[2]:
+            frame[0].append(value)
+        elif frame[1] is _NO_KEY:
+            frame[1] = value
+        else:
+            if span_start >= 0 and len(stack) == 1 and frame[1] == info_key:
+                span = (span_start, pos)
+            frame[0][frame[1]] = value
+            frame[1] = _NO_KEY
+    raise ValueError('unexpected end of data')
+
+
 def bdecode(text: bytes) -> dict[str, Any]:
     try:
-        src_iter = tokenize(text)
-        data = decode_item(src_iter, next(src_iter))
-        for _ in src_iter:  # look for more tokens
-            raise SyntaxError('trailing junk')
-    except (AttributeError, ValueError, StopIteration, TypeError) as e:
+        return _bdecode(bytes(text))[0]
+    except (AttributeError, ValueError, IndexError, TypeError) as e:
         raise SyntaxError(f'syntax error: {e}') from e
-    return data
+
+
+def _encode(data: bytes | str | int | list | dict, out: list[bytes]) -> None:
+    """Append the bencoded chunks of `data` to `out`."""
+    if isinstance(data, bytes):
+        out.append(b'%d:' % len(data))
+        out.append(data)
+    elif isinstance(data, str):
+        data = data.encode('utf-8')
+        out.append(b'%d:' % len(data))
+        out.append(data)
+    elif isinstance(data, int):
+        out.append(b'i%de' % data)
+    elif isinstance(data, list):
+        out.append(b'l')
+        for item in data:
+            _encode(item, out)
+        out.append(b'e')
+    elif isinstance(data, dict):
+        out.append(b'd')
+        for key, value in sorted(data.items()):
+            _encode(key, out)
+            _encode(value, out)
+        out.append(b'e')
+    else:
+        raise TypeError(f'Unknown type for bencode: {type(data)}')
 
 
 # encoding implementation by d0b
@@ -175,41 +285,88 @@ def encode_integer(data: int) -> bytes:
 
 
 def encode_list(data: list) -> bytes:
-    encoded = b'l'
-    for item in data:
-        encoded += bencode(item)
-    encoded += b'e'
-    return encoded
+    out = []
+    _encode(data, out)
+    return b''.join(out)
 
 
 def encode_dictionary(data: dict) -> bytes:
-    encoded = b'd'
-    items = list(data.items())
-    items.sort()
-    for key, value in items:
-        encoded += bencode(key)
-        encoded += bencode(value)
-    encoded += b'e'
-    return encoded
+    out = []
+    _encode(data, out)
+    return b''.join(out)
 
 
 def bencode(data: bytes | str | int | list | dict) -> bytes:
-    if isinstance(data, bytes):
-        return encode_bytes(data)
-    if isinstance(data, str):
-        return encode_string(data)
-    if isinstance(data, int):
-        return encode_integer(data)
-    if isinstance(data, list):
-        return encode_list(data)
-    if isinstance(data, dict):
-        return encode_dictionary(data)
+    out = []
+    _encode(data, out)
+    return b''.join(out)
+
+
+class TorrentMetadata(NamedTuple):
+    """Summary of a torrent, small enough to be cached without the pieces field."""
+
+    info_hash: str
+    name: str
+    size: int
+    files: tuple[dict[str, str | int], ...]
+    trackers: tuple[str, ...]
+    private: int | bool
+    is_multi_file: bool
+    piece_size: int
+
+
+class TorrentMetadataCache:
+    """Bounded LRU cache of :class:`TorrentMetadata`, keyed by torrent file digest and info hash.
 
-    raise TypeError(f'Unknown type for bencode: {type(data)}')
+    Lets reruns and tasks which see the same .torrent file skip decoding it again.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self.max_size = max_size
+        self._by_digest: OrderedDict[bytes, TorrentMetadata] = OrderedDict()
+        self._by_info_hash: dict[str, TorrentMetadata] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._by_digest)
+
+    def get(self, digest: bytes) -> TorrentMetadata | None:
+        with self._lock:
+            metadata = self._by_digest.get(digest)
+            if metadata is not None:
+                self._by_digest.move_to_end(digest)
+            return metadata
+
+    def get_by_info_hash(self, info_hash: str) -> TorrentMetadata | None:
+        """Return metadata of a torrent seen recently with given (case insensitive) info hash."""
+        with self._lock:
+            return self._by_info_hash.get(info_hash.upper())
+
+    def add(self, digest: bytes, metadata: TorrentMetadata) -> None:
+        with self._lock:
+            self._by_digest[digest] = metadata
+            self._by_digest.move_to_end(digest)
+            self._by_info_hash[metadata.info_hash] = metadata
+            while len(self._by_digest) > self.max_size:
+                _, evicted = self._by_digest.popitem(last=False)
+                if self._by_info_hash.get(evicted.info_hash) is evicted:
+                    del self._by_info_hash[evicted.info_hash]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_digest.clear()
+            self._by_info_hash.clear()
+
+
+metadata_cache = TorrentMetadataCache()
 
 
 class Torrent:
-    """Represents a torrent."""
+    """Represents a torrent.
+
+    Torrents already seen by :data:`metadata_cache` are not decoded until :attr:`content` is
+    accessed, the summary properties are answered from the cached metadata.
+    """
 
     # string type used for keys, if this ever changes, stuff like "x in y"
     # gets broken unless you coerce to this type
@@ -224,10 +381,71 @@ class Torrent:
     def __init__(self, content: bytes) -> None:
         """Accept torrent file as string."""
         # Make sure there is no trailing whitespace. see #1592
-        content = content.strip()
-        # decoded torrent structure
-        self.content = bdecode(content)
-        self.modified = False
+        self._raw = bytes(content).strip()
+        # decoded torrent structure, see content property
+        self._content = None
+        # Original bytes of the info dictionary, the info hash is calculated from these as long
+        # as the torrent is not modified
+        self._info_raw = None
+        self._modified = False
+        # Once content has been handed out it may be changed in place, cached metadata is not
+        # used after that.
+        self._content_accessed = False
+        digest = hashlib.sha1(self._raw).digest()
+        self._metadata = metadata_cache.get(digest)
+        if self._metadata is None:
+            self._decode()
+            # Torrents without an info dictionary (e.g. rtorrent magnet files) are not cached
+            with suppress(KeyError, TypeError, AttributeError, ValueError):
+                self._metadata = TorrentMetadata(
+                    info_hash=self.info_hash,
+                    name=self.name,
+                    size=self.size,
+                    files=tuple(self.get_filelist()),
+                    trackers=tuple(self.trackers),
+                    private=self.private,
+                    is_multi_file=self.is_multi_file,
+                    piece_size=self.piece_size,
+                )
+                metadata_cache.add(digest, self._metadata)
+            self._content_accessed = False
+
+    def _decode(self) -> None:
+        try:
+            self._content, span = _bdecode(self._raw, info_key='info')
+        except (AttributeError, ValueError, IndexError, TypeError) as e:
+            raise SyntaxError(f'syntax error: {e}') from e
+        if span and not self._modified:
+            self._info_raw = self._raw[span[0] : span[1]]
+
+    @property
+    def _use_metadata(self) -> bool:
+        return self._metadata is not None and not self._content_accessed
+
+    @property
+    def content(self) -> dict[str, Any]:
+        if self._content is None:
+            self._decode()
+        self._content_accessed = True
+        return self._content
+
+    @content.setter
+    def content(self, content: dict[str, Any]) -> None:
+        self._content = content
+        self._content_accessed = True
+        self._info_raw = None
+
+    @property
+    def modified(self) -> bool:
+        return self._modified
+
+    @modified.setter
+    def modified(self, modified: bool) -> None:
+        # Code modifying content in place must flag the torrent as modified, after which the
+        # info hash is calculated from the (possibly changed) decoded info dictionary.
+        self._modified = modified
+        if modified:
+            self._info_raw = None
 
     def __repr__(self) -> str:
         return '{}({}, {})'.format(
@@ -241,6 +459,8 @@ class Torrent:
 
     def get_filelist(self) -> list[dict[str, str | int]]:
         """Return array containing fileinfo dictionaries (name, length, path)."""
+        if self._use_metadata:
+            return [dict(item) for item in self._metadata.files]
         files = []
         if 'length' in self.content['info']:
             # single file torrent
@@ -281,16 +501,22 @@ class Torrent:
     @property
     def is_multi_file(self) -> bool:
         """Return True if the torrent is a multi-file torrent."""
+        if self._use_metadata:
+            return self._metadata.is_multi_file
         return 'files' in self.content['info']
 
     @property
     def name(self) -> str:
         """Return name of the torrent."""
+        if self._use_metadata:
+            return self._metadata.name
         return self.content['info'].get('name', '')
 
     @property
     def size(self) -> int:
         """Return total size of the torrent."""
+        if self._use_metadata:
+            return self._metadata.size
         size = 0
         # single file torrent
         if 'length' in self.content['info']:
@@ -303,11 +529,15 @@ class Torrent:
 
     @property
     def private(self) -> int | bool:
+        if self._use_metadata:
+            return self._metadata.private
         return self.content['info'].get('private', False)
 
     @property
     def trackers(self) -> list[str]:
         """:returns: List of trackers, supports single-tracker and multi-tracker implementations"""
+        if self._use_metadata:
+            return list(self._metadata.trackers)
         trackers = []
         # the spec says, if announce-list present use ONLY that
         # funny iteration because of nesting, ie:
@@ -321,11 +551,13 @@ class Torrent:
     @property
     def info_hash(self) -> str:
         """Return Torrent info hash."""
-        import hashlib
-
+        if self._use_metadata:
+            return self._metadata.info_hash
         sha1_hash = hashlib.sha1()
-        info_data = encode_dictionary(self.content['info'])
-        sha1_hash.update(info_data)
+        if self._info_raw is not None:
+            sha1_hash.update(self._info_raw)
+        else:
+            sha1_hash.update(bencode(self.content['info']))
         return str(sha1_hash.hexdigest().upper())
 
     @property
@@ -339,6 +571,8 @@ class Torrent:
 
     @property
     def piece_size(self) -> int:
+        if self._use_metadata:
+            return self._metadata.piece_size
         return int(self.content['info']['piece length'])
 
     @property
@@ -371,4 +605,7 @@ class Torrent:
         return f'<Torrent instance. Files: {self.get_filelist()}>'
 
     def encode(self) -> bytes:
+        if not self._content_accessed:
+            # Nothing could have changed, skip re-encoding
+            return self._raw
         return bencode(self.content)
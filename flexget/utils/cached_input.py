@@ -17,7 +17,7 @@ from flexget.manager import Session
 from flexget.plugin import PluginError
 from flexget.utils import json, serialization
 from flexget.utils.database import entry_synonym
-from flexget.utils.sqlalchemy_utils import table_add_column, table_schema
+from flexget.utils.sqlalchemy_utils import delete_in_chunks, table_add_column, table_schema
 from flexget.utils.tools import TimedDict, get_config_hash, parse_timedelta
 
 logger = logger.bind(name='input_cache')
@@ -98,10 +98,9 @@ class InputCacheEntry(Base):
 @event('manager.db_cleanup')
 def db_cleanup(manager, session: DBSession) -> None:
     """Remove old input caches from plugins that are no longer configured."""
-    result = (
-        session.query(InputCache)
-        .filter(InputCache.added < datetime.now() - timedelta(days=7))
-        .delete()
+    result = delete_in_chunks(
+        session,
+        session.query(InputCache).filter(InputCache.added < datetime.now() - timedelta(days=7)),
     )
     if result:
         logger.verbose('Removed {} old input caches.', result)
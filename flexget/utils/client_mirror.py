@@ -0,0 +1,132 @@
+"""Copies of torrent client state kept between task runs, for incremental client inputs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from loguru import logger
+
+from flexget.utils.tools import parse_timedelta
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Mapping
+    from datetime import timedelta
+
+    from flexget.task import Task
+
+logger = logger.bind(name='client_mirror')
+
+DEFAULT_FULL_SYNC = '1 hour'
+
+# Schema for the `incremental` option of client inputs, `yes` or the interval between full syncs
+incremental_schema = {'oneOf': [{'type': 'boolean'}, {'type': 'string', 'format': 'interval'}]}
+
+
+def full_sync_interval(incremental: bool | str | None) -> timedelta | None:
+    """Return the interval between full syncs for an `incremental` option, None when disabled."""
+    if not incremental:
+        return None
+    return parse_timedelta(DEFAULT_FULL_SYNC if incremental is True else incremental)
+
+
+class ClientMirror:
+    """Torrent client state as seen by the last run of a task.
+
+    Torrents are kept as dicts of client fields keyed by info hash. Inputs merge what the client
+    reports changed into the mirror, and only create entries for torrents whose watched fields
+    changed. All torrents are emitted again at least once every `full_sync` interval.
+
+    Mirrors live in memory, so they only pay off when tasks run from the daemon. They are
+    dropped when a task aborts, so entries never get lost when nothing ran on them.
+    """
+
+    _mirrors: ClassVar[dict[tuple, ClientMirror]] = {}
+
+    def __init__(self, full_sync: timedelta):
+        self.full_sync = full_sync
+        self.torrents: dict[str, dict[str, Any]] = {}
+        # Client specific delta state, such as a response id or a connected client
+        self.state: dict[str, Any] = {}
+        self.synced_at: datetime | None = None
+        self.full_synced_at: datetime | None = None
+
+    @classmethod
+    def get(cls, task: Task, plugin: str, key: Iterable, full_sync: timedelta) -> ClientMirror:
+        """Return the mirror of `plugin` in `task` for the client identified by `key`."""
+        mirror_key = (task.name, plugin, *key)
+        mirror = cls._mirrors.get(mirror_key)
+        if mirror is None or mirror.full_sync != full_sync:
+            mirror = cls._mirrors[mirror_key] = cls(full_sync)
+        return mirror
+
+    @classmethod
+    def discard(cls, task: Task, plugin: str, key: Iterable) -> None:
+        """Forget the mirror of `plugin` in `task`, next run will do a full sync."""
+        cls._mirrors.pop((task.name, plugin, *key), None)
+
+    @classmethod
+    def clear_all(cls) -> None:
+        """Forget all mirrors.
+
+        Used by tests to make sure artifacts don't leak between tests.
+        """
+        cls._mirrors.clear()
+
+    @property
+    def needs_full_sync(self) -> bool:
+        return (
+            self.full_synced_at is None or datetime.now() - self.full_synced_at >= self.full_sync
+        )
+
+    @property
+    def since_sync(self) -> timedelta | None:
+        return datetime.now() - self.synced_at if self.synced_at else None
+
+    def find(self, field: str, value: Any) -> str | None:
+        """Return the info hash of a mirrored torrent having `value` in `field`."""
+        for info_hash, torrent in self.torrents.items():
+            if torrent.get(field) == value:
+                return info_hash
+        return None
+
+    def update(
+        self,
+        torrents: Mapping[str, Mapping[str, Any]],
+        removed: Iterable[str] = (),
+        full: bool = False,
+        watch: Collection[str] | None = None,
+    ) -> list[str]:
+        """Merge torrent fields reported by the client into the mirror.
+
+        :param torrents: Dict mapping info hash to the (possibly partial) fields of torrents.
+        :param removed: Info hashes of torrents no longer in the client.
+        :param full: `torrents` is the complete client state, emit all of it.
+        :param watch: Fields whose changes cause a torrent to be emitted, None for all.
+        :return: Info hashes of new torrents and of torrents where a watched field changed.
+        """
+        now = datetime.now()
+        if full:
+            self.torrents = {h: dict(fields) for h, fields in torrents.items()}
+            self.synced_at = self.full_synced_at = now
+            logger.debug('Full sync of {} torrents', len(self.torrents))
+            return list(self.torrents)
+        for info_hash in removed:
+            self.torrents.pop(info_hash, None)
+        changed = []
+        for info_hash, fields in torrents.items():
+            mirrored = self.torrents.get(info_hash)
+            if mirrored is None:
+                self.torrents[info_hash] = dict(fields)
+                changed.append(info_hash)
+                continue
+            if any(
+                mirrored.get(field) != value
+                for field, value in fields.items()
+                if watch is None or field in watch
+            ):
+                changed.append(info_hash)
+            mirrored.update(fields)
+        self.synced_at = now
+        logger.debug('{} of {} torrents changed since last sync', len(changed), len(self.torrents))
+        return changed
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import functools
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -9,7 +8,7 @@ from sqlalchemy.ext.hybrid import Comparator, hybrid_property
 from sqlalchemy.orm import synonym
 
 from flexget.entry import Entry
-from flexget.manager import Session
+from flexget.manager import ReadSession, Session
 from flexget.utils import json, qualities, serialization
 
 if TYPE_CHECKING:
@@ -22,14 +21,15 @@ def with_session(*args, **kwargs):
     Automatically commits and closes the session if one was created, caller is responsible for commit if passed in.
 
     If arguments are given when used as a decorator, they will automatically be passed to the created Session when
-    one is not supplied.
+    one is not supplied. Functions marked with :func:`read_only` get a :data:`ReadSession` instead.
     """
 
     def decorator(func):
         def wrapper(*args, **kwargs):
             if kwargs.get('session'):
                 return func(*args, **kwargs)
-            with _Session() as session:
+            session_class = ReadSession if getattr(func, 'read_only_session', False) else Session
+            with session_class(*session_args, **session_kwargs) as session:
                 kwargs['session'] = session
                 return func(*args, **kwargs)
 
@@ -38,13 +38,23 @@ def with_session(*args, **kwargs):
     if len(args) == 1 and not kwargs and callable(args[0]):
         # Used without arguments, e.g. @with_session
         # We default to expire_on_commit being false, in case the decorated function returns db instances
-        _Session = functools.partial(Session, expire_on_commit=False)  # noqa: N806 It's acting as a class
+        session_args, session_kwargs = (), {'expire_on_commit': False}
         return decorator(args[0])
     # Arguments were specified, turn them into arguments for Session creation e.g. @with_session(autocommit=True)
-    _Session = functools.partial(Session, *args, **kwargs)  # noqa: N806 It's acting as a class
+    session_args, session_kwargs = args, kwargs
     return decorator
 
 
+def read_only(func):
+    """Mark `func` as only reading from the database.
+
+    When :func:`with_session` creates the session for it, the session comes from the pool of read-only
+    connections, which keep working while a task holds the write lock.
+    """
+    func.read_only_session = True
+    return func
+
+
 def pipe_list_synonym(name: str) -> SynonymProperty:
     """Convert pipe separated text into a list."""
 
@@ -82,21 +92,35 @@ def text_date_synonym(name: str) -> SynonymProperty:
     return synonym(name, descriptor=property(getter, setter))
 
 
-def entry_synonym(name: str) -> SynonymProperty:
-    """Use serialization system to store Entries in db."""
+def entry_synonym(name: str, binary_name: str | None = None) -> SynonymProperty:
+    """Use serialization system to store Entries in db.
+
+    :param binary_name: Attribute of a binary column. When given, entries are stored there in the
+      compact binary format rather than as JSON in `name`. Rows holding JSON can still be loaded.
+    """
 
     def getter(self) -> Any:
+        if binary_name and getattr(self, binary_name) is not None:
+            return serialization.loadb(getattr(self, binary_name))
         return serialization.loads(getattr(self, name))
 
     def setter(self, entry: dict | Entry) -> None:
         if isinstance(entry, dict):
             if entry.get('serializer') == 'Entry' and 'version' in entry and 'value' in entry:
                 # This is already a serialized form of entry
-                setattr(self, name, json.dumps(entry))
-                return
-            entry = Entry(entry)
+                if binary_name:
+                    entry = serialization.deserialize(entry)
+                else:
+                    setattr(self, name, json.dumps(entry))
+                    return
+            else:
+                entry = Entry(entry)
         if isinstance(entry, Entry):
-            setattr(self, name, serialization.dumps(entry))
+            if binary_name:
+                setattr(self, binary_name, serialization.dumpb(entry))
+                setattr(self, name, None)
+            else:
+                setattr(self, name, serialization.dumps(entry))
         else:
             raise TypeError(f'{type(entry)!r} is not type Entry or dict.')
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
 from typing import TYPE_CHECKING, Any, NamedTuple
 
@@ -18,13 +19,25 @@ class LazyCallee(NamedTuple):
     kwargs: Mapping
 
 
-class LazyLookup:
+class LazyValue(ABC):
+    """Base for placeholder values in a LazyDict which are replaced by their real value once accessed."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def resolve(self, store: LazyDict, key) -> Any:
+        """Return the real value for `key` in `store`."""
+
+
+class LazyLookup(LazyValue):
     """Store the information to do a lazy lookup for a LazyDict.
 
     An instance is stored as a placeholder value for any key that can be lazily looked up.
     There should be one instance of this class per LazyDict.
     """
 
+    __slots__ = ('callee_list', 'store')
+
     def __init__(self, store: LazyDict) -> None:
         self.store = store
         self.callee_list: list[LazyCallee] = []
@@ -32,6 +45,9 @@ class LazyLookup:
     def add_func(self, func: Callable, keys: Sequence, args: Sequence, kwargs: Mapping) -> None:
         self.callee_list.append(LazyCallee(func, keys, args, kwargs))
 
+    def resolve(self, store: LazyDict, key) -> Any:
+        return self[key]
+
     def __getitem__(self, key) -> Any:
         from flexget.plugin import PluginError
 
@@ -62,11 +78,26 @@ class LazyLookup:
 
 
 class LazyDict(MutableMapping):
+    __slots__ = ('_shared', 'store')
+
     def __init__(self, *args, **kwargs):
         self.store = dict(*args, **kwargs)
+        # True while the store dict may be shared with copies, it is copied before modifying
+        self._shared = False
+
+    def _share_store(self, other: LazyDict) -> None:
+        """Use the store of `other` until either of them is modified."""
+        self.store = other.store
+        self._shared = other._shared = True
+
+    def _own_store(self) -> dict:
+        if self._shared:
+            self.store = dict(self.store)
+            self._shared = False
+        return self.store
 
     def __setitem__(self, key, value):
-        self.store[key] = value
+        self._own_store()[key] = value
 
     def __len__(self):
         return len(self.store)
@@ -75,16 +106,22 @@ class LazyDict(MutableMapping):
         return iter(self.store)
 
     def __delitem__(self, key):
-        del self.store[key]
+        del self._own_store()[key]
+
+    def __contains__(self, key):
+        # Lazy values are present, no need to resolve them to find out
+        return key in self.store
 
     def __getitem__(self, key):
         item = self.store[key]
-        if isinstance(item, LazyLookup):
-            return item[key]
+        if isinstance(item, LazyValue):
+            return item.resolve(self, key)
         return item
 
     def __copy__(self):
-        return type(self)(self.store)
+        new = type(self).__new__(type(self))
+        new._share_store(self)
+        return new
 
     copy = __copy__
 
@@ -94,10 +131,11 @@ class LazyDict(MutableMapping):
         :param bool eval_lazy: If False, the default will be returned rather than evaluating a lazy field.
         """
         item = self.store.get(key, default)
-        if isinstance(item, LazyLookup):
-            if eval_lazy:
+        if isinstance(item, LazyValue):
+            # Only lookups are expensive, other lazy values are always resolved
+            if eval_lazy or not isinstance(item, LazyLookup):
                 try:
-                    return item[key]
+                    return item.resolve(self, key)
                 except KeyError:
                     return default
             else:
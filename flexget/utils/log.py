@@ -12,7 +12,7 @@ from sqlalchemy import Column, DateTime, Index, Integer, String
 from flexget import db_schema
 from flexget.event import event
 from flexget.utils.database import with_session
-from flexget.utils.sqlalchemy_utils import table_schema
+from flexget.utils.sqlalchemy_utils import delete_in_chunks, table_schema
 
 logger = logger.bind(name='util.log')
 
@@ -56,7 +56,7 @@ def purge(manager, session: Session) -> None:
     """Purge old messages from database."""
     old = datetime.now() - timedelta(days=365)
 
-    result = session.query(LogMessage).filter(LogMessage.added < old).delete()
+    result = delete_in_chunks(session, session.query(LogMessage).filter(LogMessage.added < old))
     if result:
         logger.verbose('Purged {} entries from log_once table.', result)
 
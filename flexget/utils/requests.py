@@ -17,7 +17,7 @@ from loguru import logger
 from requests import RequestException
 
 from flexget import __version__ as version
-from flexget.utils.tools import TimedDict, parse_timedelta
+from flexget.utils.tools import ContextCounter, TimedDict, parse_timedelta
 
 # If we use just 'requests' here, we'll get the logger created by requests, rather than our own
 logger = logger.bind(name='utils.requests')
@@ -31,6 +31,8 @@ logging.getLogger('urllib3').setLevel(logging.WARNING)
 WAIT_TIME = timedelta(seconds=60)
 # Remembers sites that have timed out
 unresponsive_hosts = TimedDict(WAIT_TIME)
+# Counts requests made through our Session, per thread
+_request_counter = ContextCounter('request_counter')
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -168,6 +170,14 @@ def _wrap_urlopen(url: str, timeout: int | None = None) -> requests.Response:
     return resp
 
 
+def request_count() -> int:
+    """Return the number of requests made through :class:`Session` by the current thread so far.
+
+    Requests of work the thread ran in copies of its context are included.
+    """
+    return _request_counter.value
+
+
 def limit_domains(url: str, limit_dict: dict[str, DomainLimiter]) -> None:
     """If this url matches a domain in `limit_dict`, run the limiter.
 
@@ -256,6 +266,7 @@ class Session(requests.Session):
 
         kwargs.setdefault('timeout', self.timeout)
         raise_status = kwargs.pop('raise_status', True)
+        _request_counter.increment()
 
         # If we do not have an adapter for this url, pass it off to urllib
         if not any(url.startswith(adapter) for adapter in self.adapters):
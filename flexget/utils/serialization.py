@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import datetime
+import struct
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -6,6 +9,7 @@ import yaml
 from loguru import logger
 
 from flexget.utils import json
+from flexget.utils.lazy_dict import LazyValue
 
 DATE_FMT = '%Y-%m-%d'
 DATETIME_FMT = '%Y-%m-%dT%H:%M:%SZ'
@@ -67,6 +71,28 @@ def loads(value: str) -> Any:
     return deserialize(json.loads(value))
 
 
+def dumpb(value: Any) -> bytes:
+    """Dump an object to the compact binary format using the serialization system."""
+    out = bytearray(BINARY_MAGIC)
+    _pack(serialize(value), out)
+    return bytes(out)
+
+
+def loadb(value: bytes) -> Any:
+    """Restore an object from binary data created by `dumpb`.
+
+    Fields of entries are only decoded once they are accessed.
+    """
+    if not value.startswith(BINARY_MAGIC):
+        raise ValueError('Not FlexGet binary serialized data')
+    return deserialize(_Unpacker(value, len(BINARY_MAGIC), lazy=True).read())
+
+
+def is_binary(value: str | bytes) -> bool:
+    """Return True if `value` was created by `dumpb` rather than `dumps`."""
+    return isinstance(value, bytes) and value.startswith(BINARY_MAGIC)
+
+
 def yaml_dump(data, *args, **kwargs):
     """Dump an object to YAML text using the serialization system."""
     data = serialize(data)
@@ -79,12 +105,25 @@ def yaml_load(stream):
     return yaml.load(stream, Loader=FGLoader)
 
 
+# Caches for looking up serializers, cleared whenever a new serializer is defined
+_serializers_by_type: dict[type, type[Serializer] | None] = {}
+_serializers_by_name: dict[str, type[Serializer]] = {}
+
+
 class Serializer(ABC):
     """Any data types that should be serializable should subclass this, and implement the `serialize` and `deserialize` methods.
 
     This is important for data that is stored in `Entry` fields so that it can be stored to the database.
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A new serializer may handle types which were looked up already
+        _serializers_by_type.clear()
+        _serializers_by_name.clear()
+
     @classmethod
     def serializer_name(cls) -> str:
         """Return name of the serializer defaults to class name.
@@ -104,7 +143,10 @@ class Serializer(ABC):
 
     @classmethod
     def serializer_handles(cls, value: Any) -> bool:
-        """Return True if this serializer can handle `value`."""
+        """Return True if this serializer can handle `value`.
+
+        The answer is cached for the type of `value`, so it should not depend on anything else.
+        """
         return isinstance(value, cls)
 
     @classmethod
@@ -200,17 +242,233 @@ class TupleSerializer(Serializer):
 
 
 def _serializer_for(value) -> type[Serializer] | None:
+    try:
+        return _serializers_by_type[type(value)]
+    except KeyError:
+        pass
+    serializer = None
     for s in Serializer.__subclasses__():
         if s.serializer_handles(value):
-            return s
-    return None
+            serializer = s
+            break
+    _serializers_by_type[type(value)] = serializer
+    return serializer
 
 
 def _deserializer_for(serializer_name: str) -> type[Serializer]:
-    for s in Serializer.__subclasses__():
-        if serializer_name == s.serializer_name():
-            return s
-    raise ValueError(f'No deserializer for {serializer_name}')
+    if not _serializers_by_name:
+        for s in reversed(Serializer.__subclasses__()):
+            _serializers_by_name[s.serializer_name()] = s
+    try:
+        return _serializers_by_name[serializer_name]
+    except KeyError:
+        raise ValueError(f'No deserializer for {serializer_name}') from None
+
+
+class DeferredValue(LazyValue):
+    """Serialized field value, which is only deserialized once it is accessed."""
+
+    __slots__ = ('_binary', '_data')
+
+    def __init__(self, data: Any, binary: bool = False) -> None:
+        self._data = data
+        self._binary = binary
+
+    def serialized(self) -> Any:
+        """Return the value in the form returned by `serialize`."""
+        if self._binary:
+            return _Unpacker(self._data).read()
+        return self._data
+
+    def resolve(self, store, key) -> Any:
+        if self._binary:
+            value = deserialize(_Unpacker(self._data, lazy=True).read())
+        else:
+            value = deserialize(self._data)
+        store[key] = value
+        return store.store[key]
+
+    def __repr__(self):
+        return f'<DeferredValue({self.serialized()!r})>'
+
+
+# Compact binary format, a msgpack style encoding of the output of `serialize`.
+# Every value starts with a tag byte. Lists and dicts are prefixed by their size in bytes so
+# they can be skipped without decoding them, which allows entry fields to be decoded lazily.
+BINARY_MAGIC = b'\xf6FGB1'
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT, _OBJECT = range(9)
+
+# Type registry for serialized objects, ids are stored in the data so must never be changed.
+# Objects of serializers not listed here are stored with their name.
+BINARY_TYPE_IDS = {
+    'Entry': 1,
+    'DateTimeSerializer': 2,
+    'DateSerializer': 3,
+    'SetSerializer': 4,
+    'TupleSerializer': 5,
+    'Quality': 6,
+}
+_BINARY_TYPE_NAMES = {type_id: name for name, type_id in BINARY_TYPE_IDS.items()}
+
+_double = struct.Struct('>d')
+
+
+def _pack_varint(value: int, out: bytearray) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _pack(value: Any, out: bytearray) -> None:
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        # zigzag encoding keeps small negative numbers small
+        _pack_varint(value * 2 if value >= 0 else -value * 2 - 1, out)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _double.pack(value)
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        out.append(_STR)
+        _pack_varint(len(data), out)
+        out += data
+    elif isinstance(value, dict) and all(
+        key in value for key in ('serializer', 'version', 'value')
+    ):
+        out.append(_OBJECT)
+        type_id = BINARY_TYPE_IDS.get(value['serializer'], 0)
+        _pack_varint(type_id, out)
+        if not type_id:
+            _pack(value['serializer'], out)
+        _pack_varint(value['version'], out)
+        _pack(value['value'], out)
+    elif isinstance(value, (list, dict)):
+        body = bytearray()
+        _pack_varint(len(value), body)
+        if isinstance(value, dict):
+            out.append(_DICT)
+            for k, v in value.items():
+                _pack(k, body)
+                _pack(v, body)
+        else:
+            out.append(_LIST)
+            for v in value:
+                _pack(v, body)
+        _pack_varint(len(body), out)
+        out += body
+    else:
+        raise TypeError(f'`{value!r}` of type {type(value)!r} is not serializable')
+
+
+class _Unpacker:
+    """Decode binary data to the form returned by `serialize`.
+
+    If `lazy` is set, entry fields which need deserialization are returned as `DeferredValue`.
+    """
+
+    def __init__(self, data: bytes, pos: int = 0, lazy: bool = False) -> None:
+        self.data = data
+        self.pos = pos
+        self.lazy = lazy
+
+    def varint(self) -> int:
+        data = self.data
+        result = shift = 0
+        while True:
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def skip(self) -> None:
+        """Move past the next value without decoding it."""
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == _INT:
+            self.varint()
+        elif tag == _FLOAT:
+            self.pos += 8
+        elif tag in (_STR, _LIST, _DICT):
+            length = self.varint()
+            self.pos += length
+        elif tag == _OBJECT:
+            if not self.varint():
+                self.skip()
+            self.varint()
+            self.skip()
+
+    def read(self) -> Any:
+        data = self.data
+        tag = data[self.pos]
+        self.pos += 1
+        if tag == _STR:
+            length = self.varint()
+            self.pos += length
+            return str(data[self.pos - length : self.pos], 'utf-8')
+        if tag == _INT:
+            value = self.varint()
+            return value >> 1 if not value & 1 else -(value >> 1) - 1
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _FLOAT:
+            self.pos += 8
+            return _double.unpack_from(data, self.pos - 8)[0]
+        if tag == _LIST:
+            self.varint()
+            return [self.read() for _ in range(self.varint())]
+        if tag == _DICT:
+            self.varint()
+            result = {}
+            for _ in range(self.varint()):
+                key = self.read()
+                result[key] = self.read()
+            return result
+        if tag == _OBJECT:
+            type_id = self.varint()
+            name = _BINARY_TYPE_NAMES[type_id] if type_id else self.read()
+            version = self.varint()
+            value = self.read_entry() if name == 'Entry' and self.lazy else self.read()
+            return {'serializer': name, 'version': version, 'value': value}
+        raise ValueError(f'Invalid binary serialized data, unknown tag {tag}')
+
+    def read_entry(self) -> Any:
+        """Read serialized entry, leaving fields which need deserialization encoded."""
+        if self.data[self.pos] != _DICT:
+            return self.read()
+        self.pos += 1
+        self.varint()
+        value = {}
+        for _ in range(self.varint()):
+            key = self.read()
+            if key != 'fields' or self.data[self.pos] != _DICT:
+                value[key] = self.read()
+                continue
+            self.pos += 1
+            self.varint()
+            fields = value[key] = {}
+            for _ in range(self.varint()):
+                field = self.read()
+                if self.data[self.pos] in (_LIST, _DICT, _OBJECT):
+                    start = self.pos
+                    self.skip()
+                    fields[field] = DeferredValue(self.data[start : self.pos], binary=True)
+                else:
+                    fields[field] = self.read()
+        return value
 
 
 def _yaml_representer(dumper, data):
@@ -17,7 +17,12 @@ from flexget.event import event
 from flexget.manager import Session
 from flexget.utils import json
 from flexget.utils.database import json_synonym
-from flexget.utils.sqlalchemy_utils import create_index, table_add_column, table_schema
+from flexget.utils.sqlalchemy_utils import (
+    create_index,
+    delete_in_chunks,
+    table_add_column,
+    table_schema,
+)
 
 logger = logger.bind(name='util.simple_persistence')
 Base = db_schema.versioned_base('simple_persistence', 4)
@@ -85,8 +90,8 @@ def db_cleanup(manager, session):
     """Clean up values in the db from tasks which no longer exist."""
     # SKVs not associated with any task use None as task tame
     existing_tasks = [*list(manager.tasks), None]
-    session.query(SimpleKeyValue).filter(~SimpleKeyValue.task.in_(existing_tasks)).delete(
-        synchronize_session=False
+    delete_in_chunks(
+        session, session.query(SimpleKeyValue).filter(~SimpleKeyValue.task.in_(existing_tasks))
     )
 
 
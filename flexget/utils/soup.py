@@ -1,6 +1,7 @@
 # Hack, hide DataLossWarnings
 # Based on html5lib code namespaceHTMLElements=False should do it, but nope ...
 # Also it doesn't seem to be available in older version from html5lib, removing it
+import importlib.util
 import warnings
 from typing import IO
 
@@ -9,6 +10,18 @@ from html5lib.constants import DataLossWarning
 
 warnings.simplefilter('ignore', DataLossWarning)
 
+# Tree builder used for parser='fast', lxml when it is installed, the parser of the stdlib otherwise
+FAST_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
 
 def get_soup(obj: str | IO | bytes, parser: str = 'html5lib') -> BeautifulSoup:
+    """Parse a document with BeautifulSoup.
+
+    :param obj: The document
+    :param parser: Tree builder to use. The default html5lib parses broken markup like browsers
+        do, but is slow. `fast` uses :data:`FAST_PARSER`, which is many times faster on large
+        pages. Any other name is passed on to BeautifulSoup, eg. `xml`.
+    """
+    if parser == 'fast':
+        parser = FAST_PARSER
     return BeautifulSoup(obj, parser)
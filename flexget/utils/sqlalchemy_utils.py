@@ -5,13 +5,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
-from sqlalchemy import ColumnDefault, Index, Sequence, text
+from sqlalchemy import ColumnDefault, Index, Sequence, event, inspect, text
 from sqlalchemy.exc import NoSuchTableError, OperationalError
 from sqlalchemy.orm import Session
 from sqlalchemy.schema import MetaData, Table
 from sqlalchemy.types import TypeEngine
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Query
     from typing_extensions import Self
 
 logger = logger.bind(name='sql_utils')
@@ -167,6 +169,107 @@ def create_index(table_name: str, session: Session, *column_names: str) -> None:
         logger.opt(exception=True).debug('Error creating index.')
 
 
+# Rows deleted per transaction by delete_in_chunks
+DELETE_CHUNK_SIZE = 500
+
+
+def delete_in_chunks(session: Session, query: Query, chunk_size: int | None = None) -> int:
+    """Delete the rows matched by `query`, committing every `chunk_size` rows.
+
+    Meant for `manager.db_cleanup` handlers, big cleanups then never hold the write lock for long.
+    Whoever runs the cleanup may set these in :attr:`session.info`:
+
+    - ``cleanup_chunk_size``: default for `chunk_size`
+    - ``cleanup_should_stop``: callable, when it returns True deleting stops after the current
+      chunk and ``cleanup_incomplete`` is set in :attr:`session.info`
+
+    :param query: Query of a single mapped class with a single column primary key.
+    :return: Number of deleted rows.
+    """
+    chunk_size = chunk_size or session.info.get('cleanup_chunk_size', DELETE_CHUNK_SIZE)
+    should_stop = session.info.get('cleanup_should_stop')
+    mapped = query.column_descriptions[0]['entity']
+    (primary_key,) = inspect(mapped).primary_key
+    deleted = 0
+    while True:
+        ids = [row[0] for row in query.with_entities(primary_key).limit(chunk_size)]
+        if not ids:
+            break
+        deleted += (
+            session.query(mapped).filter(primary_key.in_(ids)).delete(synchronize_session=False)
+        )
+        session.commit()
+        if len(ids) < chunk_size:
+            break
+        if should_stop and should_stop():
+            session.info['cleanup_incomplete'] = True
+            break
+    return deleted
+
+
+# Pragmas applied to every connection of a file backed SQLite database
+SQLITE_PRAGMAS = {
+    # Normal is durable with WAL, only a power loss may roll back the last commits
+    'synchronous': 'NORMAL',
+    # Negative values are in KiB, 32 MiB page cache per connection
+    'cache_size': -32000,
+    # Map up to 256 MiB of the database file instead of copying pages through read calls
+    'mmap_size': 268435456,
+    'temp_store': 'MEMORY',
+}
+
+
+def is_sqlite_file(engine: Engine) -> bool:
+    """Return True if `engine` is connected to an SQLite database stored in a file."""
+    return engine.dialect.name == 'sqlite' and engine.url.database not in (None, '', ':memory:')
+
+
+def apply_sqlite_profile(engine: Engine, read_only: bool = False) -> None:
+    """Tune connections of a file backed SQLite `engine` as they are opened.
+
+    The database is switched to write-ahead logging, which lets readers carry on while a writer
+    holds its transaction open. Connections of a `read_only` engine refuse to write.
+    """
+    pragmas = dict(SQLITE_PRAGMAS)
+    if read_only:
+        pragmas['query_only'] = 'ON'
+    else:
+        # Persistent in the database file, readers pick it up from there. Auto-vacuum only takes
+        # effect on new databases, existing ones switch over on their next VACUUM.
+        pragmas = {'auto_vacuum': 'INCREMENTAL', 'journal_mode': 'WAL', **pragmas}
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+                if name == 'journal_mode' and cursor.fetchone()[0].lower() != 'wal':
+                    logger.warning('Database does not support WAL journaling, using default')
+        finally:
+            cursor.close()
+
+
+def incremental_vacuum(session: Session, pages: int | None = None) -> int | None:
+    """Release up to `pages` free pages of an SQLite database back to the filesystem, all when None.
+
+    Unlike VACUUM this only locks the database for as long as it takes to move `pages` pages.
+
+    :return: Number of free pages left, None if the database is not in incremental auto-vacuum mode.
+    """
+    if session.get_bind().dialect.name != 'sqlite':
+        return None
+    # 2 is INCREMENTAL
+    if session.execute(text('PRAGMA auto_vacuum')).scalar() != 2:
+        return None
+    pragma = (
+        'PRAGMA incremental_vacuum' if pages is None else f'PRAGMA incremental_vacuum({pages:d})'
+    )
+    # The pragma releases one page per step, pysqlite only steps it to the end in scripts
+    session.connection().connection.driver_connection.executescript(pragma)
+    return session.execute(text('PRAGMA freelist_count')).scalar()
+
+
 class ContextSession(Session):
     """:class:`sqlalchemy.orm.Session` which automatically commits when used as context manager without errors."""
 
@@ -11,9 +11,11 @@ import operator
 import queue
 import re
 import sys
+import threading
 import weakref
 from collections import defaultdict
 from collections.abc import MutableMapping
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from html.entities import name2codepoint
 from pprint import pformat
@@ -280,6 +282,34 @@ class TimedDict(MutableMapping):
             store.clear()
 
 
+class ContextCounter:
+    """Counter kept per thread, which work handed to other threads can count towards.
+
+    Every thread has a context of its own, so each one counts separately. Work run in a copy of a
+    thread's context, with :func:`contextvars.copy_context`, counts towards that thread.
+    """
+
+    def __init__(self, name: str):
+        self._var: ContextVar[list[int]] = ContextVar(name)
+        self._lock = threading.Lock()
+
+    def _cell(self) -> list[int]:
+        cell = self._var.get(None)
+        if cell is None:
+            cell = [0]
+            self._var.set(cell)
+        return cell
+
+    def increment(self) -> None:
+        cell = self._cell()
+        with self._lock:
+            cell[0] += 1
+
+    @property
+    def value(self) -> int:
+        return self._cell()[0]
+
+
 class BufferQueue(queue.Queue):
     """Used in place of a file-like object to capture text and access it safely from another thread."""
 
@@ -483,6 +513,118 @@ def group_entries(entries: Iterable[Entry], identifier: str) -> dict[str, list[E
     return grouped_entries
 
 
+class FieldIndex:
+    """Index entries by the values of some of their fields.
+
+    Finds the indexed entries which have the same value as another entry in any of the fields,
+    without comparing the entry against all of them. With `exact` off, values also match when one
+    contains the other. Strings are then indexed by their character trigrams, only entries sharing
+    the right ones with the looked up value get compared.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(
+        self,
+        entries: Iterable[Entry],
+        fields: Iterable[str],
+        exact: bool = True,
+        case_sensitive: bool = True,
+    ) -> None:
+        self.entries = list(entries)
+        self.fields = list(fields)
+        self.exact = exact
+        self.case_sensitive = case_sensitive
+        # Normalized field values of each entry, by position
+        self._values: list[dict[str, Any]] = []
+        # {field: {value: [positions]}}
+        self._by_value: dict[str, dict[Any, list[int]]] = {field: {} for field in self.fields}
+        # {field: {gram: [positions]}}, of all grams and of the rarest gram of string values
+        self._by_gram: dict[str, dict[str, list[int]]] = {field: {} for field in self.fields}
+        self._by_rare_gram: dict[str, dict[str, list[int]]] = {field: {} for field in self.fields}
+        # {field: [positions]} of values which cannot be looked up, these are always compared
+        self._unindexed: dict[str, list[int]] = {field: [] for field in self.fields}
+        for position, entry in enumerate(self.entries):
+            values = {}
+            for field in self.fields:
+                if field not in entry:
+                    continue
+                values[field] = value = self._normalize(entry[field])
+                self._index(field, value, position)
+            self._values.append(values)
+        if not self.exact:
+            for field, by_gram in self._by_gram.items():
+                for position, values in enumerate(self._values):
+                    value = values.get(field)
+                    if isinstance(value, str) and len(value) >= self.GRAM_SIZE:
+                        rarest = min(self._grams(value), key=lambda gram: len(by_gram[gram]))
+                        self._by_rare_gram[field].setdefault(rarest, []).append(position)
+
+    def _normalize(self, value: Any) -> Any:
+        if not self.case_sensitive and isinstance(value, str):
+            return value.lower()
+        return value
+
+    def _grams(self, value: str) -> set[str]:
+        return {value[i : i + self.GRAM_SIZE] for i in range(len(value) - self.GRAM_SIZE + 1)}
+
+    def _index(self, field: str, value: Any, position: int) -> None:
+        if self.exact:
+            try:
+                self._by_value[field].setdefault(value, []).append(position)
+            except TypeError:
+                self._unindexed[field].append(position)
+        elif isinstance(value, str) and len(value) >= self.GRAM_SIZE:
+            for gram in self._grams(value):
+                self._by_gram[field].setdefault(gram, []).append(position)
+        else:
+            self._unindexed[field].append(position)
+
+    def _candidates(self, field: str, value: Any) -> Iterable[int]:
+        candidates = set(self._unindexed[field])
+        if self.exact:
+            try:
+                candidates.update(self._by_value[field].get(value, ()))
+            except TypeError:
+                return range(len(self.entries))
+        elif isinstance(value, str) and len(value) >= self.GRAM_SIZE:
+            grams = self._grams(value)
+            # Indexed values within this one have all their grams in it, including the rarest
+            for gram in grams:
+                candidates.update(self._by_rare_gram[field].get(gram, ()))
+            # Indexed values containing this one have all its grams, so are among those having
+            # the rarest of them
+            by_gram = self._by_gram[field]
+            candidates.update(min((by_gram.get(gram, ()) for gram in grams), key=len))
+        else:
+            return range(len(self.entries))
+        return candidates
+
+    def _equal(self, value1: Any, value2: Any) -> bool:
+        try:
+            return value1 == value2 or (not self.exact and (value2 in value1 or value1 in value2))
+        except TypeError:
+            # argument of type <type> is not iterable
+            return False
+
+    def matches(self, entry: Entry) -> list[tuple[Entry, list[str]]]:
+        """Find indexed entries matching `entry`.
+
+        :return: List of (indexed entry, names of the fields matching), in the order the entries
+            were indexed.
+        """
+        common = defaultdict(list)
+        for field in self.fields:
+            if field not in entry:
+                continue
+            value = self._normalize(entry[field])
+            for position in self._candidates(field, value):
+                values = self._values[position]
+                if field in values and self._equal(value, values[field]):
+                    common[position].append(field)
+        return [(self.entries[position], common[position]) for position in sorted(common)]
+
+
 def aggregate_inputs(task: Task, inputs: list[dict]) -> list[Entry]:
     from flexget import plugin
 
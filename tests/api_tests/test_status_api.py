@@ -105,6 +105,52 @@ class TestStatusAPI:
         assert len(data) == 1
 
 
+class TestStatusPerformanceAPI:
+    config = """
+        tasks:
+          test_task:
+            mock:
+              - {title: 'entry 1'}
+              - {title: 'entry 2'}
+            accept_all: yes
+    """
+
+    def test_plugin_performance(self, api_client, execute_task, schema_match):
+        for _ in range(3):
+            execute_task('test_task')
+
+        rsp = api_client.get('/status/1/performance/')
+        assert rsp.status_code == 200
+        data = json.loads(rsp.get_data(as_text=True))
+
+        errors = schema_match(OC.plugin_performance_list_schema, data)
+        assert not errors
+
+        rows = {(row['phase'], row['plugin']): row for row in data}
+        assert ('input', 'mock') in rows
+        assert ('filter', 'accept_all') in rows
+        assert rows['input', 'mock']['runs'] == 3
+        assert rows['input', 'mock']['wall_p95'] >= rows['input', 'mock']['wall_p50'] >= 0
+
+        rsp = api_client.get('/status/1/performance/?limit=1')
+        data = json.loads(rsp.get_data(as_text=True))
+        assert all(row['runs'] == 1 for row in data)
+
+    def test_execution_performance(self, api_client, execute_task, schema_match):
+        execute_task('test_task')
+
+        rsp = api_client.get('/status/1/executions/1/performance/')
+        assert rsp.status_code == 200
+        data = json.loads(rsp.get_data(as_text=True))
+
+        errors = schema_match(OC.execution_performance_list_schema, data)
+        assert not errors
+        assert {'mock', 'accept_all'} <= {row['plugin'] for row in data}
+
+        rsp = api_client.get('/status/1/executions/2/performance/')
+        assert rsp.status_code == 404
+
+
 class TestTaskStatusPagination:
     config = "'tasks': {}"
 
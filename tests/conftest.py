@@ -299,9 +299,11 @@ def chdir(pytestconfig, request):
 @pytest.fixture(autouse=True)
 def clear_caches():
     """Make sure cached_input, and other caches are cleared between tests."""
+    from flexget.utils.client_mirror import ClientMirror
     from flexget.utils.tools import TimedDict
 
     TimedDict.clear_all()
+    ClientMirror.clear_all()
 
 
 class CrashReport(Exception):
@@ -0,0 +1,118 @@
+from datetime import datetime
+
+import pytest
+
+from flexget.components.notify.db import QueuedNotification
+from flexget.components.notify.notification_queue import notification_queue
+from flexget.manager import Session
+from flexget.plugin import PluginWarning, get_plugin_by_name
+from flexget.utils.tools import get_config_hash
+from tests.conftest import MockManager
+
+
+def queued():
+    with Session() as session:
+        return [(n.title, n.attempts) for n in session.query(QueuedNotification)]
+
+
+class TestNotificationQueue:
+    config = """
+        notification_queue:
+          coalesce: 1 hour
+          retry_delay: 1 hour
+          max_attempts: 2
+        tasks:
+          test_queued:
+            mock:
+             - {title: 'foo', url: 'http://bla.com'}
+             - {title: 'bar', url: 'http://bla2.com'}
+            accept_all: yes
+            notify:
+              entries:
+                title: "{{title}}"
+                message: "{{url}}"
+                via:
+                  - debug_notification:
+                      api_key: apikey
+        """
+
+    @pytest.fixture
+    def manager(self, request, tmp_path):
+        # Workers run in their own threads, which don't see an in memory database
+        database_uri = f'sqlite:///{tmp_path / "queue.sqlite"}'
+        mockmanager = MockManager(
+            self.config, request.cls.__name__, db_uri=database_uri, tmp_path=tmp_path
+        )
+        yield mockmanager
+        mockmanager.shutdown()
+
+    @pytest.fixture
+    def failing(self, monkeypatch):
+        failures = []
+
+        def notify(title, message, config):
+            failures.append(title)
+            raise PluginWarning('endpoint timed out')
+
+        monkeypatch.setattr(get_plugin_by_name('debug_notification').instance, 'notify', notify)
+        return failures
+
+    def test_coalesced(self, debug_notifications, execute_task):
+        execute_task('test_queued')
+        # The task does not wait for the notifier
+        assert debug_notifications == []
+        assert queued() == [('foo', 0), ('bar', 0)]
+
+        notification_queue.stop()
+        assert debug_notifications == [
+            (
+                '2 notifications',
+                'foo\nhttp://bla.com\n\nbar\nhttp://bla2.com',
+                {'api_key': 'apikey'},
+            )
+        ]
+        assert queued() == []
+
+    def test_retry(self, failing, execute_task):
+        execute_task('test_queued')
+        retry_at = notification_queue.dispatch('debug_notification', flush=True)
+        assert retry_at > datetime.now()
+        assert failing == ['2 notifications']
+        assert queued() == [('foo', 1), ('bar', 1)]
+        # Retries wait for their delay, even when flushing
+        assert notification_queue.dispatch('debug_notification', flush=True) == retry_at
+        assert len(failing) == 1
+
+        with Session() as session:
+            session.query(QueuedNotification).update({'next_attempt': datetime.now()})
+        assert notification_queue.dispatch('debug_notification') is None
+        assert len(failing) == 2
+        # Given up after max_attempts
+        assert queued() == []
+
+    def test_config_not_stored(self, manager, execute_task, tmp_path):
+        execute_task('test_queued')
+        assert queued() == [('foo', 0), ('bar', 0)]
+        assert b'apikey' not in (tmp_path / 'queue.sqlite').read_bytes()
+
+    @pytest.mark.parametrize(
+        ('config', 'sent'),
+        [({'api_key': 'apikey'}, True), ({'api_key': 'changed'}, False)],
+        ids=['in_config', 'not_in_config'],
+    )
+    def test_resume(self, manager, debug_notifications, config, sent):
+        # Left in the database by a previous run, the config is found in the current one
+        with Session() as session:
+            session.add(
+                QueuedNotification(
+                    notifier='debug_notification',
+                    target=get_config_hash(['debug_notification', config]),
+                    title='title',
+                    message='message',
+                    next_attempt=datetime.now(),
+                )
+            )
+        notification_queue.resume()
+        notification_queue.stop()
+        assert debug_notifications == ([('title', 'message', config)] if sent else [])
+        assert queued() == []
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 
+from flexget import config_schema, plugin
 from flexget.manager import Manager
 
 config_utf8 = Path(__file__).parent / 'config_utf8.yml'
@@ -11,7 +12,9 @@ class TestConfig:
     config = 'tasks: {}'
 
     @pytest.fixture
-    def manager(self, manager):
+    def manager(self, manager, monkeypatch):
+        # Don't leave a validated config cache next to the test config
+        monkeypatch.setattr(plugin, 'manifest_digest', None)
         # Replace config loading methods of MockManager with the real ones
         manager._init_config = Manager._init_config.__get__(manager, manager.__class__)
         manager.load_config = Manager.load_config.__get__(manager, manager.__class__)
@@ -24,3 +27,94 @@ class TestConfig:
         manager._init_config()
         manager.load_config()
         assert manager.config, "Config didn't load"
+
+
+class TestValidatedConfigCache:
+    config = 'tasks: {}'
+
+    @pytest.fixture
+    def validations(self, monkeypatch):
+        """Record the configs validated on their own, which are the tasks not found in cache."""
+        validated = []
+        process_config = config_schema.process_config
+
+        def spy(config, schema=None, set_defaults=True):
+            if schema is not None:
+                validated.append(config)
+            return process_config(config, schema, set_defaults)
+
+        monkeypatch.setattr(config_schema, 'process_config', spy)
+        return validated
+
+    @staticmethod
+    def make_config(**tasks):
+        tasks.setdefault('a', {'mock': [{'title': 'a'}], 'accept_all': True})
+        tasks.setdefault('b', {'mock': [{'title': 'b'}], 'seen': 'local'})
+        return {'tasks': tasks}
+
+    def test_unchanged_tasks_are_not_validated_again(self, manager, validations):
+        first = manager.validate_config(self.make_config())
+        assert len(validations) == 2
+        validations.clear()
+        second = manager.validate_config(self.make_config(b={'mock': [{'title': 'c'}]}))
+        assert validations == [{'mock': [{'title': 'c'}]}]
+        assert second['tasks']['a'] == first['tasks']['a']
+
+    def test_cached_config_is_a_copy(self, manager, validations):
+        first = manager.validate_config(self.make_config())
+        second = manager.validate_config(self.make_config())
+        assert len(validations) == 2
+        assert second == first
+        second['tasks']['a']['accept_all'] = False
+        assert manager.validate_config(self.make_config())['tasks']['a']['accept_all'] is True
+
+    def test_invalid_task(self, manager, validations):
+        config = self.make_config(c={'mock': [{'title': 'c'}], 'no_such_plugin': True})
+        with pytest.raises(config_schema.ConfigError) as e:
+            manager.validate_config(config)
+        assert [error.json_pointer for error in e.value.errors] == ['/tasks/c']
+        validations.clear()
+        with pytest.raises(config_schema.ConfigError):
+            manager.validate_config(config)
+        assert validations == [config['tasks']['c']]
+
+    def test_file_checks_are_not_cached(self, manager, validations):
+        config = self.make_config(c={'mock': [{'title': 'c'}], 'cookies': __file__})
+        manager.validate_config(config)
+        validations.clear()
+        manager.validate_config(
+            self.make_config(c={'mock': [{'title': 'c'}], 'cookies': __file__})
+        )
+        assert len(validations) == 1
+
+    def test_cache_on_disk(self, manager, validations, tmp_path, monkeypatch):
+        monkeypatch.setattr(plugin, 'manifest_digest', 'plugins')
+        manager.config_cache_filename = str(tmp_path / '.config-validated')
+        manager.validate_config(self.make_config())
+        assert (tmp_path / '.config-validated').exists()
+
+        validations.clear()
+        manager._validated_configs = None
+        manager.validate_config(self.make_config())
+        assert not validations
+
+        # Cache is only valid for the same plugins
+        monkeypatch.setattr(plugin, 'manifest_digest', 'other plugins')
+        manager._validated_configs = None
+        manager.validate_config(self.make_config())
+        assert len(validations) == 2
+
+    def test_cache_holds_no_config_values(self, manager, validations, tmp_path, monkeypatch):
+        monkeypatch.setattr(plugin, 'manifest_digest', 'plugins')
+        manager.config_cache_filename = str(tmp_path / '.config-validated')
+        medusa = {'base_url': 'http://localhost', 'username': 'flexget', 'password': 'hunter2'}
+        first = manager.validate_config(self.make_config(c={'medusa': dict(medusa)}))
+        assert first['tasks']['c']['medusa']['port'] == 8081
+        assert b'hunter2' not in (tmp_path / '.config-validated').read_bytes()
+
+        # Defaults are still set from the cache
+        validations.clear()
+        manager._validated_configs = None
+        second = manager.validate_config(self.make_config(c={'medusa': dict(medusa)}))
+        assert not validations
+        assert second == first
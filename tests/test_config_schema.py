@@ -1,6 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 import jsonschema
+import pytest
 from jsonschema.validators import validator_for
 
 from flexget import config_schema
@@ -167,6 +169,74 @@ class TestSchemaValidator:
         assert config['p'] == 'foo'
 
 
+class TestValidatorCache:
+    @pytest.fixture
+    def schema_path(self, monkeypatch):
+        path = '/schema/test/validator_cache'
+        monkeypatch.setitem(config_schema.schema_paths, path, {})
+        config_schema.register_schema(
+            path,
+            {
+                'type': 'object',
+                'properties': {
+                    'p': {'type': 'integer', 'default': 5},
+                    'child': {'$ref': '/schema/test/validator_cache_child'},
+                },
+            },
+        )
+        monkeypatch.setitem(config_schema.schema_paths, f'{path}_child', {})
+        config_schema.register_schema(
+            f'{path}_child', {'type': 'object', 'properties': {'c': {'default': 'foo'}}}
+        )
+        return path
+
+    def test_validators_are_reused(self, schema_path):
+        validator = config_schema.get_validator(schema_path)
+        assert config_schema.get_validator(schema_path) is validator
+        assert config_schema.get_validator({'$ref': schema_path}) is validator
+        assert config_schema.get_validator(schema_path, set_defaults=False) is not validator
+        assert config_schema.get_validator() is config_schema.get_validator()
+
+    def test_registering_schema_invalidates(self, schema_path):
+        assert config_schema.process_config({'p': 'a'}, schema_path)
+        validator = config_schema.get_validator(schema_path)
+        config_schema.register_schema(
+            schema_path, {'type': 'object', 'properties': {'p': {'type': 'string'}}}
+        )
+        assert config_schema.get_validator(schema_path) is not validator
+        assert not config_schema.process_config({'p': 'a'}, schema_path)
+        assert config_schema.process_config({'p': 1}, schema_path)
+
+    def test_defaults_across_refs(self, schema_path):
+        config = {'child': {}}
+        assert not config_schema.process_config(config, schema_path)
+        assert config == {'p': 5, 'child': {'c': 'foo'}}
+        config = {'child': {}}
+        assert not config_schema.process_config(config, schema_path, set_defaults=False)
+        assert config == {'child': {}}
+        # Setting defaults must not change the validator others get for the same schema version
+        assert validator_for({'$schema': config_schema.BASE_SCHEMA_URI}) is (
+            config_schema.SchemaValidator
+        )
+
+    def test_concurrent_validation(self, schema_path):
+        def validate(index):
+            set_defaults = index % 2 == 0
+            config = {'child': {}}
+            errors = config_schema.process_config(config, schema_path, set_defaults)
+            errors += config_schema.process_config({'p': 'a'}, schema_path, set_defaults)
+            return set_defaults, config, [e.json_pointer for e in errors]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(validate, range(200)))
+        for set_defaults, config, errors in results:
+            assert errors == ['/p']
+            if set_defaults:
+                assert config == {'p': 5, 'child': {'c': 'foo'}}
+            else:
+                assert config == {'child': {}}
+
+
 class TestSchemaFormats:
     def _test_format(self, format, items, invalid=False):
         failures = []
@@ -11,9 +11,28 @@ class TestCrossmatch:
                 - title: entry 2
               action: reject
               fields: [title]
+          test_not_exact:
+            mock:
+            - title: Some Show S01E01 720p
+            - title: Other Show S01E01
+            - title: Show
+            crossmatch:
+              from:
+              - mock:
+                - title: some show
+              action: accept
+              fields: [title]
+              exact: no
+              case_sensitive: no
     """
 
     def test_reject_title(self, execute_task):
         task = execute_task('test_title')
         assert task.find_entry('rejected', title='entry 2')
         assert len(task.rejected) == 1
+
+    def test_not_exact(self, execute_task):
+        task = execute_task('test_not_exact')
+        assert task.find_entry('accepted', title='Some Show S01E01 720p')
+        assert task.find_entry('accepted', title='Show')
+        assert len(task.accepted) == 2
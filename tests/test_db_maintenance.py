@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from itertools import pairwise
+
+import pytest
+from sqlalchemy import text
+
+from flexget.components.history.db import History
+from flexget.manager import Session
+from flexget.plugins.daemon import db_maintenance
+from flexget.plugins.generic.db_vacuum import vacuum_step
+from flexget.utils import sqlalchemy_utils
+
+from .conftest import MockManager
+
+
+def add_history(count, age):
+    with Session() as session:
+        for i in range(count):
+            item = History()
+            item.title = f'item {i}'
+            item.time = datetime.now() - age
+            session.add(item)
+
+
+def history_count():
+    with Session() as session:
+        return session.query(History).count()
+
+
+class TestBackgroundCleanup:
+    config = 'tasks: {}'
+
+    def test_cleanup_in_chunks(self, manager, monkeypatch):
+        monkeypatch.setattr(sqlalchemy_utils, 'DELETE_CHUNK_SIZE', 10)
+        # Give way after every chunk
+        monkeypatch.setattr(db_maintenance, 'STEP_TIME', -1)
+        add_history(35, timedelta(days=400))
+        add_history(5, timedelta(days=1))
+        manager.persist['last_cleanup'] = datetime.now() - timedelta(days=30)
+
+        counts = [history_count()]
+        counts.extend(history_count() for _ in db_maintenance.DBMaintenance().steps(manager))
+        # Each step deleted at most a chunk of the old history
+        assert all(0 <= a - b <= 10 for a, b in pairwise(counts))
+        assert counts[-1] == 5
+        assert not manager.db_cleanup_due
+
+    def test_stops_for_queued_task(self, manager, monkeypatch):
+        monkeypatch.setattr(sqlalchemy_utils, 'DELETE_CHUNK_SIZE', 10)
+        monkeypatch.setattr(type(manager.task_queue), '__len__', lambda self: 1)
+        add_history(35, timedelta(days=400))
+        manager.persist['last_cleanup'] = datetime.now() - timedelta(days=30)
+
+        for _ in db_maintenance.DBMaintenance().steps(manager):
+            if history_count() < 35:
+                break
+        assert history_count() == 25
+
+    def test_not_due(self, manager):
+        add_history(5, timedelta(days=400))
+        manager.persist['last_cleanup'] = datetime.now()
+        for _ in db_maintenance.DBMaintenance().steps(manager):
+            pass
+        assert history_count() == 5
+
+
+class TestIncrementalVacuum:
+    config = 'tasks: {}'
+
+    @pytest.fixture
+    def file_manager(self, request, tmp_path):
+        database_uri = f'sqlite:///{tmp_path / "vacuum.sqlite"}'
+        mockmanager = MockManager(
+            self.config, request.cls.__name__, db_uri=database_uri, tmp_path=tmp_path
+        )
+        yield mockmanager
+        mockmanager.shutdown()
+
+    def test_paced_vacuum(self, file_manager):
+        with file_manager.engine.connect() as conn:
+            assert conn.execute(text('PRAGMA auto_vacuum')).scalar() == 2
+        add_history(2000, timedelta(days=400))
+        with Session() as session:
+            session.query(History).delete()
+        left = vacuum_step(pages=5)
+        assert left > 0
+        assert vacuum_step(pages=5) == left - 5
+        while left:
+            left = vacuum_step()
+        assert left == 0
+
+    def test_memory_database(self, manager):
+        assert vacuum_step() is None
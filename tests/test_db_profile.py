@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from flexget.db_schema import PluginSchema
+from flexget.manager import ReadSession, Session
+
+from .conftest import MockManager
+
+
+class TestSQLiteProfile:
+    config = 'tasks: {}'
+
+    @pytest.fixture
+    def file_manager(self, request, tmp_path):
+        database_uri = f'sqlite:///{tmp_path / "profile.sqlite"}'
+        mockmanager = MockManager(
+            self.config, request.cls.__name__, db_uri=database_uri, tmp_path=tmp_path
+        )
+        yield mockmanager
+        mockmanager.shutdown()
+
+    def test_pragmas(self, file_manager):
+        with file_manager.engine.connect() as conn:
+            assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+            assert conn.execute(text('PRAGMA synchronous')).scalar() == 1
+            assert conn.execute(text('PRAGMA temp_store')).scalar() == 2
+            assert conn.execute(text('PRAGMA cache_size')).scalar() == -32000
+            assert conn.execute(text('PRAGMA query_only')).scalar() == 0
+        with file_manager.read_engine.connect() as conn:
+            assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+            assert conn.execute(text('PRAGMA query_only')).scalar() == 1
+
+    def test_read_while_writing(self, file_manager):
+        with Session() as session:
+            session.add(PluginSchema('committed', 1))
+
+        with Session() as writer:
+            writer.execute(text('BEGIN EXCLUSIVE'))
+            writer.add(PluginSchema('uncommitted', 1))
+            writer.flush()
+            with ReadSession() as reader:
+                names = {schema.plugin for schema in reader.query(PluginSchema)}
+            assert 'committed' in names
+            assert 'uncommitted' not in names
+
+    def test_read_session_refuses_writes(self, file_manager):
+        with ReadSession() as session:
+            session.add(PluginSchema('readonly', 1))
+            with pytest.raises(OperationalError, match='readonly'):
+                session.flush()
+            session.rollback()
+
+    def test_memory_database_shares_engine(self, manager):
+        assert manager.read_engine is manager.engine
@@ -1,7 +1,10 @@
 from datetime import datetime, timedelta
 
+import pytest
+
 from flexget import plugin
 from flexget.entry import Entry
+from flexget.task import Task
 
 
 class SearchPlugin:
@@ -281,3 +284,63 @@ class TestEmitSeriesInDiscover:
         )
         task = execute_task('test_next_series_seasons')
         assert task.find_entry(title='My Show 2 S03')
+
+
+class TestDeltaRerun:
+    config = """
+        tasks:
+          test_delta_rerun:
+            discover:
+              release_estimations: ignore
+              what:
+              - next_series_episodes: yes
+              from:
+              - test_search: yes
+            mock:
+            - title: My Show S01E03 720p
+            - title: My Show S01E05 720p
+            - title: Other Show S01E01
+            series:
+            - My Show:
+                begin: s01e01
+                identified_by: ep
+            mock_output: yes
+            max_reruns: 3
+    """
+
+    @pytest.mark.parametrize('delta', [True, False], ids=['delta', 'full'])
+    def test_same_decisions(self, execute_task, monkeypatch, delta):
+        if not delta:
+            rerun = Task.rerun
+            monkeypatch.setattr(
+                Task,
+                'rerun',
+                lambda self, plugin=None, reason=None, delta=False: rerun(self, plugin, reason),
+            )
+        mock_input = plugin.get_plugin_by_name('mock').phase_handlers['input']
+        calls = []
+        func = mock_input.func
+        monkeypatch.setattr(mock_input, 'func', lambda *args: calls.append(1) or func(*args))
+
+        task = execute_task('test_delta_rerun')
+        assert sorted(e['title'] for e in task.mock_output) == [
+            'My Show S01E01',
+            'My Show S01E02',
+            'My Show S01E03 720p',
+            'My Show S01E05 720p',
+        ]
+        assert task.rerun_count == 2
+        # The mock input produces the same entries on every run, delta reruns reuse them
+        assert len(calls) == (1 if delta else 3)
+
+    def test_inputs_not_marked_stable_run_again(self, execute_task, monkeypatch):
+        mock_plugin = plugin.get_plugin_by_name('mock')
+        monkeypatch.setattr(mock_plugin.instance, 'rerun_stable', False)
+        mock_input = mock_plugin.phase_handlers['input']
+        calls = []
+        func = mock_input.func
+        monkeypatch.setattr(mock_input, 'func', lambda *args: calls.append(1) or func(*args))
+
+        task = execute_task('test_delta_rerun')
+        assert task.rerun_count == 2
+        assert len(calls) == 3
@@ -1,6 +1,7 @@
 from flexget.components.managed_lists.lists.entry_list.db import EntryListEntry, EntryListList
 from flexget.entry import Entry
 from flexget.manager import Session
+from flexget.utils import serialization
 
 
 class TestEntryListSearch:
@@ -86,3 +87,100 @@ class TestEntryListQuality:
         task = execute_task('verify_quality_2')
         entry = task.find_entry(title='foo.bar.720p.hdtv-Flexget')
         assert entry['quality'] == '720p hdtv'
+
+    def test_json_rows_still_load(self, execute_task):
+        execute_task('verify_quality_1')
+        with Session() as session:
+            db_entry = session.query(EntryListEntry).one()
+            assert db_entry._blob is not None
+            assert db_entry._json is None
+            # Rows stored before the binary format was introduced
+            db_entry._json = serialization.dumps(db_entry.entry)
+            db_entry._blob = None
+        task = execute_task('verify_quality_2')
+        entry = task.find_entry(title='foo.bar.720p.hdtv-Flexget')
+        assert entry['quality'] == '720p hdtv'
+
+
+class TestEntryListMatch:
+    config = """
+        templates:
+          global:
+            disable: seen
+        tasks:
+          fill_list:
+            mock:
+            - {title: 'foo', url: 'http://foo'}
+            - {title: 'bar', url: 'http://bar'}
+            accept_all: yes
+            list_add:
+            - entry_list: match
+          match_list:
+            mock:
+            - {title: 'foo', url: 'http://other'}
+            - {title: 'bar', url: 'http://bar'}
+            - {title: 'baz', url: 'http://baz'}
+            list_match:
+              from:
+              - entry_list: match
+    """
+
+    def test_get_many(self, execute_task):
+        from flexget.components.managed_lists.lists.entry_list.db import DBEntrySet
+
+        execute_task('fill_list')
+        entries = [
+            Entry(title='foo', original_url='http://other'),
+            Entry(title='renamed bar', original_url='http://bar'),
+            Entry(title='baz', original_url='http://baz'),
+        ]
+        entry_list = DBEntrySet('match')
+        expected = [entry_list.get(entry) for entry in entries]
+        results = entry_list.get_many(entries)
+        assert results[0]['title'] == 'foo'
+        assert results[2] is None
+        assert [result and result['title'] for result in results] == [
+            result and result['title'] for result in expected
+        ]
+
+    def test_list_match(self, execute_task):
+        execute_task('fill_list')
+        task = execute_task('match_list')
+        assert len(task.accepted) == 2
+        assert task.find_entry('accepted', title='bar')
+        assert not task.find_entry('accepted', title='baz')
+
+    def test_bulk_membership(self, execute_task):
+        from flexget.components.managed_lists.lists.entry_list.db import DBEntrySet
+
+        execute_task('fill_list')
+        entry_list = DBEntrySet('match')
+        entries = [
+            Entry(title='foo', url='http://foo', original_url='http://foo', quality='720p'),
+            Entry(title='new', url='http://new', original_url='http://new'),
+            Entry(title='new', url='http://new', original_url='http://new', quality='1080p'),
+        ]
+        assert entry_list.contains_many(entries) == [True, False, False]
+        entry_list.add_many(entries)
+        assert len(entry_list) == 3
+        assert entry_list.contains_many(entries) == [True, True, True]
+        assert entry_list.get(entries[0])['quality'] == '720p'
+        assert entry_list.get(entries[1])['quality'] == '1080p'
+        entry_list.discard_many(entries)
+        assert [entry['title'] for entry in entry_list] == ['bar']
+
+    def test_add_many_same_url(self, execute_task):
+        from flexget.components.managed_lists.lists.entry_list.db import DBEntrySet
+
+        entries = [
+            Entry(title='first', url='http://same'),
+            Entry(title='second', url='http://same'),
+        ]
+        batch = DBEntrySet('batch')
+        batch.add_many(entries)
+        single = DBEntrySet('single')
+        for entry in entries:
+            single.add(entry)
+        # The second entry matches the first by url and refreshes it
+        assert len(batch) == len(single) == 1
+        assert [e['title'] for e in batch] == [e['title'] for e in single] == ['second']
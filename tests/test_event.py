@@ -0,0 +1,21 @@
+from flexget.event import add_event_handler, fire_event, remove_event_handler
+
+
+def test_remove_event_handler():
+    fired = []
+
+    def first():
+        fired.append('first')
+
+    def second():
+        fired.append('second')
+
+    add_event_handler('test.remove_handler', first)
+    add_event_handler('test.remove_handler', second)
+    # Both have the same priority, only the given one is removed
+    remove_event_handler('test.remove_handler', second)
+    fire_event('test.remove_handler')
+    assert fired == ['first']
+    remove_event_handler('test.remove_handler', first)
+    fire_event('test.remove_handler')
+    assert fired == ['first']
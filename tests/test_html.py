@@ -0,0 +1,47 @@
+import pytest
+
+from flexget.plugins.input.html import InputHtml
+from flexget.utils.soup import get_soup
+
+PAGE = """<html><body>
+<a href="/details/1">Some.Show.S01E01.720p</a>
+<a href="http://mirror.localhost/1.torrent">Some.Show.S01E01.720p</a>
+<a href="/details/2">Other.Show.S02E02.1080p</a>
+<a href="/details/2">Other.Show.S02E02.1080p</a>
+<a href="/details/2">Other.Show.S02E02.1080p</a>
+<a href="/download/3.torrent">Third.Show.S03E03.torrent</a>
+<a name="anchor">Not a link</a>
+<a href="/empty"></a>
+</body></html>"""
+
+
+@pytest.mark.parametrize('parser', ['html5lib', 'fast'])
+class TestHtmlLinks:
+    config = 'tasks: {}'
+
+    def entries(self, parser, config, page=PAGE):
+        soup = get_soup(page, parser)
+        return InputHtml().create_entries('http://localhost/index', soup, config)
+
+    def test_titles(self, parser):
+        entries = self.entries(parser, {})
+        assert [(e['title'], e['url']) for e in entries] == [
+            ('Some.Show.S01E01.720p', 'http://localhost/details/1'),
+            ('Some.Show.S01E01.720p [6D9CCA2D]', 'http://mirror.localhost/1.torrent'),
+            ('Other.Show.S02E02.1080p', 'http://localhost/details/2'),
+            # Same title and url crc, the third link is dropped
+            ('Other.Show.S02E02.1080p [EE2B2D4C]', 'http://localhost/details/2'),
+            ('Third.Show.S03E03', 'http://localhost/download/3.torrent'),
+        ]
+
+    def test_links_re(self, parser):
+        entries = self.entries(parser, {'links_re': [r'\.torrent$']})
+        assert [e['url'] for e in entries] == [
+            'http://mirror.localhost/1.torrent',
+            'http://localhost/download/3.torrent',
+        ]
+
+    def test_switch_to_url(self, parser):
+        page = ''.join(f'<a href="/files/{i}.torrent">download</a>' for i in range(10))
+        entries = self.entries(parser, {}, page)
+        assert [e['title'] for e in entries] == [str(i) for i in range(10)]
@@ -1,3 +1,4 @@
+import copy
 import datetime
 import os
 import stat
@@ -175,6 +176,41 @@ class TestEntryCoercion:
         assert isinstance(e['date'], pendulum.Date)
 
 
+class TestEntryCopy:
+    def test_copy_shares_unchanged_fields(self):
+        e = Entry('title', 'url', tags=['a'])
+        e.accept()
+        c = e.copy()
+        assert c.store is e.store
+        assert c.undecided
+        c['title'] = 'other'
+        assert e['title'] == 'title'
+        assert c['title'] == 'other'
+        e['new'] = 1
+        assert 'new' not in c
+
+    def test_deepcopy(self):
+        e = Entry('title', 'url', tags=['a'])
+        e.add_hook('accept', lambda entry, **kwargs: None)
+        e.accept('because')
+        c = copy.deepcopy(e)
+        assert c.accepted
+        assert c.traces == e.traces
+        c['tags'].append('b')
+        assert e['tags'] == ['a']
+        c['title'] = 'other'
+        assert e['title'] == 'title'
+
+    def test_lazy_containers(self):
+        e = Entry('title', 'url')
+        assert not hasattr(e, '__dict__')
+        assert e._hooks is None
+        assert e._traces is None
+        e.complete()
+        with pytest.raises(ValueError, match='not a valid entry action'):
+            e.add_hook('invalid', print)
+
+
 class TestFilterRequireField:
     config = """
         tasks:
@@ -22,6 +22,15 @@ class TestListInterface:
             list_add:
               - movie_list: test_list
 
+          test_list_add_same_movie:
+            mock:
+              - {title: 'title 1', url: "http://mock.url/file1.torrent", imdb_id: 'tt1234567'}
+              - {title: 'other title', url: "http://mock.url/file2.torrent", imdb_id: 'tt1234567'}
+              - {title: 'title 1', url: "http://mock.url/file3.torrent"}
+            accept_all: yes
+            list_add:
+              - movie_list: test_list
+
           list_1_add:
             mock:
               - {title: 'title 1', url: "http://mock.url/file1.torrent"}
@@ -130,6 +139,18 @@ class TestListInterface:
         task = execute_task('list_get')
         assert len(task.entries) == 2
 
+    def test_list_add_same_movie(self, execute_task):
+        execute_task('test_list_add')
+        execute_task('test_list_add_same_movie')
+        task = execute_task('list_get')
+        # Entries for a movie already in the list, or added by an earlier entry, replace it
+        assert sorted(entry['title'] for entry in task.entries) == [
+            'Title 1',
+            'Title 2',
+            'other title',
+        ]
+        assert task.find_entry(title='other title', imdb_id='tt1234567')
+
     def test_allowed_identifiers(self, execute_task):
         task = execute_task('test_allowed_identifiers')
         assert len(task.entries) == 1
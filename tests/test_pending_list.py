@@ -1,4 +1,5 @@
 from flexget.components.managed_lists.lists.pending_list.db import PendingListList
+from flexget.entry import Entry
 from flexget.manager import Session
 
 
@@ -100,3 +101,21 @@ class TestListInterface:
 
         task = execute_task('list_get_approved')
         assert len(task.entries) == 1
+
+    def test_add_many_same_url(self, manager):
+        from flexget.components.managed_lists.lists.pending_list.pending_list import (
+            PendingListSet,
+        )
+
+        entries = [
+            Entry(title='title 1', url='http://mock.url/same.torrent'),
+            Entry(title='title 2', url='http://mock.url/same.torrent'),
+        ]
+        batch = PendingListSet({'list_name': 'batch', 'include': 'all'})
+        batch.add_many(entries)
+        single = PendingListSet({'list_name': 'single', 'include': 'all'})
+        for entry in entries:
+            single.add(entry)
+        # The second entry matches the first by url and refreshes it
+        assert len(batch) == len(single) == 1
+        assert [e['title'] for e in batch] == [e['title'] for e in single] == ['title 2']
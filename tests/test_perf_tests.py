@@ -0,0 +1,61 @@
+import argparse
+
+import pytest
+
+from flexget.plugins.cli import perf_tests
+
+
+class TestPerfTests:
+    config = 'tasks: {}'
+
+    @pytest.mark.parametrize(
+        'name',
+        [
+            pytest.param(
+                name,
+                marks=pytest.mark.skipif(
+                    not bench.available, reason=f'{bench.requires} is not installed'
+                ),
+            )
+            for name, bench in perf_tests.BENCHMARKS.items()
+            if not bench.live
+        ],
+    )
+    def test_benchmark_runs(self, manager, name):
+        result = perf_tests.run_benchmark(
+            manager, perf_tests.BENCHMARKS[name], repeat=1, scale=0.01, memory=True
+        )
+        assert len(result['times']) == 1
+        assert result['median'] >= 0
+        assert result['peak_memory'] > 0
+
+    def test_database_is_restored(self, manager):
+        engine = manager.engine
+        perf_tests.run_benchmark(manager, perf_tests.BENCHMARKS['seen'], repeat=1, scale=0.01)
+        assert perf_tests.Session.kw['bind'] is engine
+        assert perf_tests.ReadSession.kw['bind'] is manager.read_engine
+
+    def test_refused_in_daemon(self, manager, monkeypatch):
+        monkeypatch.setattr(manager, 'is_daemon', True)
+        ran = []
+        monkeypatch.setattr(perf_tests, 'run_benchmark', lambda *args, **kwargs: ran.append(args))
+        perf_tests.cli_perf_test(manager, argparse.Namespace(list=False, test_name=['seen']))
+        assert not ran
+
+    def test_compare_results(self):
+        results = {
+            'fast': {'params': {'n': 1}, 'median': 1.0},
+            'slow': {'params': {'n': 1}, 'median': 2.0},
+            'resized': {'params': {'n': 2}, 'median': 1.0},
+        }
+        baseline = {
+            'results': {
+                'fast': {'params': {'n': 1}, 'median': 1.05},
+                'slow': {'params': {'n': 1}, 'median': 1.0},
+                'resized': {'params': {'n': 1}, 'median': 1.0},
+            }
+        }
+        comparison = perf_tests.compare_results(results, baseline, threshold=10)
+        assert not comparison['fast'][1]
+        assert comparison['slow'] == (2.0, True)
+        assert 'resized' not in comparison
@@ -1,10 +1,13 @@
+import json
 import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
-from flexget import plugin, plugins
-from flexget.event import event, fire_event
+from flexget import config_schema, plugin, plugins
+from flexget.event import event, fire_event, remove_event_handlers
 
 
 class TestPluginApi:
@@ -81,3 +84,135 @@ class TestExternalPluginLoading:
         # TODO: This isn't working because calling load_plugins again doesn't cause the schema for tasks to regenerate
         task = execute_task('ext_plugin')
         assert task.find_entry(title='test entry'), 'External plugin did not create entry'
+
+
+LAZY_PLUGIN = """
+from flexget import plugin
+from flexget.entry import Entry
+from flexget.event import event
+
+
+class LazyPlugin:
+    schema = {'type': 'boolean'}
+
+    def on_task_input(self, task, config):
+        return [Entry('lazy entry', 'http://localhost/lazy')]
+
+
+@event('plugin.register')
+def register_plugin():
+    plugin.register(LazyPlugin, 'lazy_plugin', api_ver=2)
+"""
+
+
+class TestLazyPlugins:
+    @pytest.fixture
+    def lazy_plugin(self, tmp_path, monkeypatch):
+        (tmp_path / 'lazy_plugin_module.py').write_text(LAZY_PLUGIN)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        info = plugin.LazyPluginInfo(
+            name='lazy_plugin',
+            module='lazy_plugin_module',
+            phases=['input'],
+            schema_id='/schema/plugin/lazy_plugin',
+            interfaces=['task'],
+            builtin=False,
+            debug=False,
+            api_ver=2,
+            category=None,
+        )
+        plugin.plugins[info.name] = info
+        info.initialize()
+        yield info
+        plugin.plugins.pop(info.name, None)
+        config_schema.schema_paths.pop(info.schema_id, None)
+        remove_event_handlers('plugin.lazy_plugin.input')
+        sys.modules.pop('lazy_plugin_module', None)
+
+    def test_manifest_info_does_not_import(self, lazy_plugin):
+        assert lazy_plugin in plugin.get_plugins(phase='input')
+        assert lazy_plugin not in plugin.get_plugins(phase='filter')
+        assert lazy_plugin.builtin is False
+        assert 'lazy_plugin_module' not in sys.modules
+
+    def test_schema_imports_plugin(self, lazy_plugin):
+        schema = config_schema.resolve_ref('/schema/plugin/lazy_plugin')
+        assert schema['type'] == 'boolean'
+        assert 'lazy_plugin_module' in sys.modules
+        assert not isinstance(plugin.plugins['lazy_plugin'], plugin.LazyPluginInfo)
+
+    def test_instance_imports_plugin(self, lazy_plugin):
+        instance = plugin.get('lazy_plugin', 'test')
+        assert type(instance).__name__ == 'LazyPlugin'
+        assert (
+            lazy_plugin.phase_handlers['input']
+            is plugin.plugins['lazy_plugin'].phase_handlers['input']
+        )
+        assert plugin.PluginInfo.dupe_counter == 0
+
+    def test_missing_module(self, lazy_plugin):
+        lazy_plugin.module = 'no_such_lazy_plugin_module'
+        with pytest.raises(plugin.DependencyError):
+            lazy_plugin.load()
+        assert 'lazy_plugin' not in plugin.plugins
+
+
+MANIFEST_SCRIPT = """
+import json
+import sys
+from pathlib import Path
+
+from flexget import plugin
+
+plugin.load_plugins(manifest=Path(sys.argv[1]))
+lazy = plugin.plugins['regexp']
+result = {
+    'lazy': isinstance(lazy, plugin.LazyPluginInfo),
+    'imported': 'flexget.plugins.filter.regexp' in sys.modules,
+    'phases': lazy.phases,
+}
+lazy.instance
+result['loaded'] = not isinstance(plugin.plugins['regexp'], plugin.LazyPluginInfo)
+print(json.dumps(result))
+"""
+
+
+class TestPluginManifest:
+    def run(self, manifest):
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([
+            str(Path(plugins.__file__).parents[2]),
+            env.get('PYTHONPATH', ''),
+        ])
+        output = subprocess.run(
+            [sys.executable, '-c', MANIFEST_SCRIPT, str(manifest)],
+            env=env,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        return json.loads(output.splitlines()[-1])
+
+    def test_manifest(self, tmp_path):
+        manifest_path = tmp_path / 'manifest.json'
+        result = self.run(manifest_path)
+        assert not result['lazy'], 'first start should load every plugin'
+        manifest = json.loads(manifest_path.read_text())
+        assert 'flexget.plugins.filter.regexp' in manifest['lazy_modules']
+        # Hooks into task execution events, has to be imported every time
+        assert 'flexget.components.status.status' not in manifest['lazy_modules']
+
+        result = self.run(manifest_path)
+        assert result['lazy']
+        assert not result['imported']
+        assert result['phases'] == ['filter']
+        assert result['loaded']
+
+    def test_stale_manifest_is_rebuilt(self, tmp_path):
+        manifest_path = tmp_path / 'manifest.json'
+        manifest_path.write_text(
+            json.dumps({'key': {'manifest': 0}, 'lazy_modules': [], 'plugins': []})
+        )
+        result = self.run(manifest_path)
+        assert not result['lazy']
+        assert json.loads(manifest_path.read_text())['lazy_modules']
@@ -1,5 +1,9 @@
+from unittest import mock
+
 import pytest
 
+from flexget.plugins.clients.qbittorrent import OutputQBitTorrent
+
 
 @pytest.mark.online
 @pytest.mark.require_optional_deps
@@ -26,3 +30,73 @@ class TestQbittorrent:
     def test_ratio_limit(self, execute_task):
         task = execute_task('ratio_limit')
         assert task.accepted
+
+
+class TestQbittorrentExistingHashes:
+    def test_single_request(self):
+        qbittorrent = OutputQBitTorrent()
+        qbittorrent.url = 'http://localhost:8080'
+        qbittorrent.api_url_info = '/api/v2/torrents/info'
+        qbittorrent.connected = True
+        response = mock.Mock(status_code=200)
+        # Old api versions list the whole session regardless of the hashes asked for
+        response.json.return_value = [{'hash': 'aaaa'}, {'hash': 'cccc'}]
+        with mock.patch.object(qbittorrent.session, 'request', return_value=response) as request:
+            assert qbittorrent.get_existing_hashes(['AAAA', 'bbbb'], True) == {'aaaa'}
+        request.assert_called_once_with(
+            'get',
+            'http://localhost:8080/api/v2/torrents/info',
+            params={'hashes': 'aaaa|bbbb'},
+            verify=True,
+        )
+
+
+@pytest.mark.require_optional_deps
+class TestFromQbittorrentIncremental:
+    config = """
+        tasks:
+          incremental:
+            from_qbittorrent:
+              username: user
+              password: pass
+              host: localhost
+              port: 8080
+              fields: [qbittorrent_state, qbittorrent_is_complete]
+              incremental: yes
+    """
+
+    @staticmethod
+    def torrent(name, state, speed=0):
+        return {
+            'name': name,
+            'magnet_uri': f'magnet:?xt=urn:btih:{name}',
+            'size': 100,
+            'infohash_v1': name,
+            'infohash_v2': '',
+            'state': state,
+            'upspeed': speed,
+        }
+
+    def test_sync_deltas(self, execute_task):
+        client = mock.Mock()
+        client.sync_maindata.side_effect = [
+            {
+                'rid': 1,
+                'full_update': True,
+                'torrents': {
+                    'a': self.torrent('a', 'downloading'),
+                    'b': self.torrent('b', 'uploading'),
+                },
+            },
+            # Fields nobody asked for changing don't make an entry
+            {'rid': 2, 'torrents': {'a': {'state': 'uploading'}, 'b': {'upspeed': 10}}},
+        ]
+        with mock.patch(
+            'flexget.plugins.clients.qbittorrent.FromQBitTorrent.client', return_value=client
+        ):
+            task = execute_task('incremental')
+            assert len(task.all_entries) == 2
+            task = execute_task('incremental')
+        assert [e['title'] for e in task.all_entries] == ['a']
+        assert task.all_entries[0]['qbittorrent_is_complete']
+        assert client.sync_maindata.call_args_list == [mock.call(rid=0), mock.call(rid=1)]
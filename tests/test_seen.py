@@ -1,3 +1,9 @@
+from datetime import datetime, timedelta
+
+from flexget.components.seen import db
+from flexget.manager import Session
+
+
 class TestFilterSeen:
     config = """
         templates:
@@ -198,3 +204,92 @@ class TestFilterSeenMovies:
         task = execute_task('test_2')
         msg = 'Changing scope should not have rejected Seen movie title 13'
         assert not task.find_entry('rejected', title='Seen movie title 13'), msg
+
+
+class TestSeenRetention:
+    config = """
+        seen_retention:
+          compact_after: 30 days
+          forget_after: 260 weeks
+
+        templates:
+          global:
+            accept_all: true
+
+        tasks:
+          test:
+            mock:
+              - {title: 'Seen title 1', url: 'http://localhost/seen1'}
+              - {title: 'Seen title 2', url: 'http://localhost/seen2'}
+              - {title: 'Seen title 3', url: 'http://localhost/seen3'}
+
+          test2:
+            mock:
+              - {title: 'Other title 1', url: 'http://localhost/seen1'} # duplicate by url
+              - {title: 'Seen title 2', url: 'http://localhost/other2'} # duplicate by title
+              - {title: 'Other title 4', url: 'http://localhost/other4'} # new
+    """
+
+    @staticmethod
+    def age_seen(days):
+        with Session() as session:
+            session.query(db.SeenEntry).update({'added': datetime.now() - timedelta(days=days)})
+
+    def test_compacted_still_rejected(self, execute_task, manager):
+        execute_task('test')
+        self.age_seen(60)
+        manager.db_cleanup(force=True)
+        with Session() as session:
+            assert not session.query(db.SeenEntry).count()
+            assert session.query(db.CompactSeen).count() == 6
+
+        task = execute_task('test')
+        assert len(task.rejected) == 3
+        assert (
+            'is already marked seen in the task test'
+            in task.find_entry('rejected', title='Seen title 1')['reason']
+        )
+        task = execute_task('test2')
+        assert task.find_entry('rejected', title='Other title 1')
+        assert task.find_entry('rejected', title='Seen title 2')
+        assert task.find_entry('accepted', title='Other title 4')
+
+    def test_forget_compacted(self, execute_task, manager):
+        execute_task('test')
+        self.age_seen(60)
+        manager.db_cleanup(force=True)
+
+        # By title, the url of the entry goes too
+        assert db.forget('Seen title 1') == (1, 2)
+        # By value
+        assert db.forget('http://localhost/seen2') == (1, 2)
+        # Patterns can't match hashes, the task can
+        assert db.forget('Seen%', tasks=['test']) == (0, 0)
+        assert db.forget('%', tasks=['test']) == (1, 2)
+        with Session() as session:
+            assert not session.query(db.CompactSeen).count()
+
+        task = execute_task('test')
+        assert len(task.accepted) == 3
+
+    def test_forget_after(self, execute_task, manager):
+        execute_task('test')
+        self.age_seen(365 * 6)
+        manager.db_cleanup(force=True)
+        with Session() as session:
+            assert not session.query(db.SeenEntry).count()
+            assert not session.query(db.CompactSeen).count()
+
+    def test_compaction_resumes(self, execute_task, manager):
+        execute_task('test')
+        self.age_seen(60)
+        before = datetime.now() - timedelta(days=30)
+        with Session() as session:
+            session.info['cleanup_chunk_size'] = 1
+            session.info['cleanup_should_stop'] = lambda: True
+            assert db.compact(session, before) == 1
+            assert session.info['cleanup_incomplete']
+            assert session.query(db.SeenEntry).count() == 2
+        with Session() as session:
+            assert db.compact(session, before) == 2
+            assert session.query(db.CompactSeen).count() == 6
@@ -11,21 +11,26 @@ def lazy_func(entry):
     entry['lazyfield'] = 'value a'
 
 
+def make_entry():
+    return entry.Entry({
+        'title': 'blah',
+        'url': 'http://blah',
+        'listfield': ['a', 'b', 1, 2],
+        'dictfield': {'a': 1, 'b': 2},
+        'intfield': 5,
+        'floatfield': 5.5,
+        'datefield': datetime.date(1999, 9, 9),
+        'datetimefield': datetime.datetime(1999, 9, 9, 9, 9),
+        'qualityfield': qualities.Quality('720p hdtv'),
+        'nestedlist': [qualities.Quality('1080p')],
+        'nesteddict': {'a': datetime.date(1999, 9, 9)},
+        'negative': -300,
+    })
+
+
 class TestSerialization:
     def test_entry_serialization(self):
-        entry1 = entry.Entry({
-            'title': 'blah',
-            'url': 'http://blah',
-            'listfield': ['a', 'b', 1, 2],
-            'dictfield': {'a': 1, 'b': 2},
-            'intfield': 5,
-            'floatfield': 5.5,
-            'datefield': datetime.date(1999, 9, 9),
-            'datetimefield': datetime.datetime(1999, 9, 9, 9, 9),
-            'qualityfield': qualities.Quality('720p hdtv'),
-            'nestedlist': [qualities.Quality('1080p')],
-            'nesteddict': {'a': datetime.date(1999, 9, 9)},
-        })
+        entry1 = make_entry()
         entry1.add_lazy_fields('lazy function', ['lazyfield'])
         assert entry1.is_lazy('lazyfield')
         serialized = serialization.dumps(entry1)
@@ -55,3 +60,61 @@ class TestSerialization:
             serialization.serialize(value)
         with pytest.raises(TypeError):
             serialization.dumps(value)
+
+    @pytest.mark.parametrize(
+        ('dump', 'load'),
+        [
+            (serialization.dumps, serialization.loads),
+            (serialization.dumpb, serialization.loadb),
+        ],
+    )
+    def test_lazy_deserialization(self, dump, load):
+        entry1 = make_entry()
+        entry2 = load(dump(entry1))
+        assert isinstance(entry2.store['qualityfield'], serialization.DeferredValue)
+        assert isinstance(entry2.store['nestedlist'], serialization.DeferredValue)
+        assert len(entry2) == len(entry1)
+        assert 'qualityfield' in entry2
+        # Untouched fields are written back without being deserialized
+        assert load(dump(entry2)) == entry1
+        assert dump(entry2) == dump(entry1)
+        assert entry2['qualityfield'] == qualities.Quality('720p hdtv')
+        assert isinstance(entry2.store['qualityfield'], qualities.Quality)
+        assert dict(entry1) == dict(entry2)
+
+    def test_lazy_deserialization_copy(self):
+        entry1 = serialization.loadb(serialization.dumpb(make_entry()))
+        # Copies made before a field was accessed decode it for themselves
+        entry2 = entry1.copy()
+        entry2['nestedlist'].append(1)
+        assert entry1['nestedlist'] == [qualities.Quality('1080p')]
+
+    def test_binary_serialization(self):
+        value = {
+            'a': 'aoeu',
+            'b': [1, 2, 3.5, -1, 2**70, None, True, False],
+            'c': (1, datetime.datetime(2019, 12, 12, 12, 12)),
+            'd': {'a', 1, datetime.date(2019, 11, 11)},
+            'e': [make_entry()],
+        }
+        out = serialization.dumpb(value)
+        assert serialization.is_binary(out)
+        assert not serialization.is_binary(serialization.dumps(value))
+        backin = serialization.loadb(out)
+        assert backin == value
+        assert len(out) < len(serialization.dumps(value))
+
+    def test_serializer_cache(self):
+        class Custom(serialization.Serializer):
+            @classmethod
+            def serialize(cls, value):
+                return None
+
+            @classmethod
+            def deserialize(cls, data, version):
+                return cls()
+
+        # Defining a serializer drops lookups cached before it existed
+        assert isinstance(serialization.loads(serialization.dumps(Custom())), Custom)
+        assert serialization.serialize(Custom())['serializer'] == 'Custom'
+        assert serialization.serialize('a') == 'a'
@@ -3,6 +3,7 @@ from io import StringIO
 import pytest
 from jinja2 import Template
 
+from flexget import plugin
 from flexget.components.series import db
 from flexget.entry import Entry
 from flexget.manager import Session, get_parser
@@ -236,6 +237,66 @@ class TestDatabase:
         task = execute_task('progress_2')
         assert not task.accepted, 'doppelgangers accepted'
 
+    def test_store_parsers(self, execute_task):
+        """Series plugin: storing many releases at once."""
+        parsing = plugin.get('parsing', 'series.db')
+        titles = [
+            'Batch.S01E01.720p',
+            'Batch.S01E01.720p',
+            'Batch.S01E01.1080p',
+            'Batch.S01E01.720p.PROPER',
+            'Batch.S01E02E03.HDTV',
+            'Batch.S02.720p',
+            'Batch.S01E02.HDTV',
+        ]
+        parsers = [parsing.parse_series(title, name='Batch') for title in titles]
+        with Session() as session:
+            stored = db.store_parsers(session, [(parser, None) for parser in parsers])
+            first_ids = [[r.id for r in releases] for releases in stored]
+            assert [
+                [
+                    (
+                        (r.season if isinstance(r, db.SeasonRelease) else r.episode).identifier,
+                        r.title,
+                        r.quality.name,
+                        r.proper_count,
+                    )
+                    for r in releases
+                ]
+                for releases in stored
+            ] == [
+                [('S01E01', 'Batch.S01E01.720p', '720p', 0)],
+                [('S01E01', 'Batch.S01E01.720p', '720p', 0)],
+                [('S01E01', 'Batch.S01E01.1080p', '1080p', 0)],
+                [('S01E01', 'Batch.S01E01.720p.PROPER', '720p', 1)],
+                [
+                    ('S01E02', 'Batch.S01E02E03.HDTV', 'hdtv', 0),
+                    ('S01E03', 'Batch.S01E02E03.HDTV', 'hdtv', 0),
+                ],
+                [('S02', 'Batch.S02.720p', '720p', 0)],
+                [('S01E02', 'Batch.S01E02.HDTV', 'hdtv', 0)],
+            ]
+            # The same release parsed twice is stored once
+            assert first_ids[0] == first_ids[1]
+            assert [
+                (e.identifier, e.season, e.number) for e in stored[4][0].episode.series.episodes
+            ] == [
+                ('S01E01', 1, 1),
+                ('S01E02', 1, 2),
+                ('S01E03', 1, 3),
+            ]
+        # Storing again finds everything, storing one by one gives the same rows
+        with Session() as session:
+            assert [
+                [r.id for r in releases]
+                for releases in db.store_parsers(session, [(parser, None) for parser in parsers])
+            ] == first_ids
+            assert [
+                [r.id for r in db.store_parser(session, parser)] for parser in parsers
+            ] == first_ids
+            assert session.query(db.EpisodeRelease).count() == 6
+            assert session.query(db.SeasonRelease).count() == 1
+
 
 class TestFilterSeries:
     config = """
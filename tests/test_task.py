@@ -1,3 +1,10 @@
+import pytest
+
+from flexget.entry import Entry
+from flexget.event import add_event_handler, remove_event_handler
+from flexget.task import Task
+
+
 class TestTemplate:
     config = """
         templates:
@@ -25,3 +32,122 @@ class TestTemplate:
 
         task = execute_task('test')
         assert len(task.entries) == 2, 'Should have emitted House S01E02 and Hawaii Five-O S01E01'
+
+
+class TestEntryContainer:
+    config = """
+        tasks:
+          test:
+            mock:
+              - {title: 'a', url: 'http://a'}
+              - {title: 'b', url: 'http://b'}
+              - {title: 'c', url: 'http://c'}
+              - {title: 'd', url: 'http://d'}
+            accept_all: yes
+    """
+
+    def test_state_views(self, execute_task):
+        task = execute_task('test', options={'disable_phases': ['filter']})
+        assert len(task.undecided) == 4
+        assert not task.accepted
+        task.find_entry(title='c').accept()
+        task.find_entry(title='a').accept()
+        task.find_entry(title='b').reject()
+        assert [e['title'] for e in task.accepted] == ['a', 'c']
+        assert [e['title'] for e in task.entries] == ['a', 'c', 'd']
+        assert [e['title'] for e in task.rejected] == ['b']
+        assert len(task.accepted) == 2
+        assert task.accepted[1]['title'] == 'c'
+        task.find_entry(title='c').reject()
+        assert [e['title'] for e in task.rejected] == ['b', 'c']
+        assert len(task.entries) == 2
+
+    def test_reordering(self, execute_task):
+        task = execute_task('test')
+        task.all_entries.sort(key=lambda e: e['title'], reverse=True)
+        assert [e['title'] for e in task.accepted] == ['d', 'c', 'b', 'a']
+        task.find_entry(title='b').reject()
+        assert [e['title'] for e in task.accepted] == ['d', 'c', 'a']
+        del task.all_entries[0]
+        assert [e['title'] for e in task.accepted] == ['c', 'a']
+
+    def test_reject_while_iterating(self, execute_task):
+        task = execute_task('test')
+        c = task.find_entry(title='c')
+        for entry in task.accepted:
+            c.reject()
+            assert entry['title'] != 'c'
+
+    def test_find_entry(self, execute_task):
+        task = execute_task('test')
+        assert task.find_entry(url='http://b')['title'] == 'b'
+        assert task.find_entry(title='b', url='http://a') is None
+        task.find_entry(title='b').reject()
+        assert task.find_entry('accepted', title='b') is None
+        assert task.find_entry('rejected', title='b')['url'] == 'http://b'
+        # Changed fields are found by their new value
+        task.find_entry(title='a')['title'] = 'z'
+        assert task.find_entry(title='a') is None
+        assert task.find_entry(title='z')['url'] == 'http://a'
+
+    def test_foreign_entries(self, execute_task):
+        from flexget.task import EntryContainer
+
+        task = execute_task('test')
+        container = EntryContainer(list(task.all_entries))
+        assert len(container.accepted) == 4
+        # These entries report state changes to their task, the container must still notice
+        task.find_entry(title='a').reject()
+        assert len(container.accepted) == 3
+        assert len(task.accepted) == 3
+
+
+class TestKeepOpen:
+    config = """
+        tasks:
+          test:
+            series:
+              - Some Show
+            mock_output: yes
+    """
+
+    @pytest.fixture
+    def fired(self):
+        fired = {'started': [], 'completed': []}
+        handlers = {name: fired[name].append for name in fired}
+        for name, handler in handlers.items():
+            add_event_handler(f'task.execute.{name}', handler)
+        yield fired
+        for name, handler in handlers.items():
+            remove_event_handler(f'task.execute.{name}', handler)
+
+    def test_batches(self, manager, fired):
+        task = Task(manager, 'test', options={'allow_manual': True})
+        task.keep_open = True
+        for titles in (['Some Show S01E01'], ['Some Show S01E01', 'Some Show S01E02']):
+            task.options.inject = [Entry(title=t, url=f'http://localhost/{t}') for t in titles]
+            task.execute()
+            assert task.finished_event.is_set()
+        # The builtin phase checker of the test suite fails when start or prepare run twice
+        assert fired['started'] == [task]
+        assert not fired['completed']
+        # Only entries of the last batch are left in the task
+        assert len(task.all_entries) == 2
+        assert [e['title'] for e in task.accepted] == ['Some Show S01E02']
+        assert task.find_entry('rejected', title='Some Show S01E01')
+
+        task.close()
+        assert fired['completed'] == [task]
+        assert len(task.all_entries) == 3
+        assert [e['title'] for e in task.mock_output] == ['Some Show S01E01', 'Some Show S01E02']
+        # Closing again does nothing
+        task.close()
+        assert fired['completed'] == [task]
+
+    def test_not_kept_open(self, manager, fired):
+        task = Task(manager, 'test', options={'allow_manual': True})
+        task.options.inject = [Entry(title='Some Show S01E01', url='http://localhost/1')]
+        task.execute()
+        assert fired['completed'] == [task]
+        task.close()
+        assert fired['completed'] == [task]
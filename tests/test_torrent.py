@@ -1,9 +1,19 @@
+import hashlib
+import struct
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
-from flexget.utils.bittorrent import Torrent
+from flexget.utils.bittorrent import (
+    Torrent,
+    TorrentMetadata,
+    TorrentMetadataCache,
+    bdecode,
+    bencode,
+    metadata_cache,
+)
+from flexget.utils.tools import TimedDict
 
 
 class TestInfoHash:
@@ -321,6 +331,86 @@ class TestTorrentAlive:
         assert get_udp_seeds('udp://127.0.0.1:PORT/announce', 'HASH') == 0
         assert get_udp_seeds('udp://127.0.0.1:65536/announce', 'HASH') == 0
 
+    def test_batched_scrape_url(self):
+        from flexget.components.bittorrent.torrent_alive import get_scrape_url
+
+        url = get_scrape_url('http://tracker/announce?key=1', ['00' * 20, 'FF' * 20])
+        assert url == (
+            'http://tracker/scrape?key=1'
+            '&info_hash=%00%00%00%00%00%00%00%00%00%00%00%00%00%00%00%00%00%00%00%00'
+            '&info_hash=%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF%FF'
+        )
+
+    @mock.patch('flexget.utils.requests.get')
+    def test_scraper_batches_and_caches(self, mocked_request):
+        from flexget.components.bittorrent.torrent_alive import TrackerScraper
+
+        hashes = ['AA' * 20, 'BB' * 20]
+        mocked_request.return_value.content = bencode({
+            'files': {
+                bytes.fromhex(hashes[0]): {'complete': 5},
+                bytes.fromhex(hashes[1]): {'complete': 0},
+            }
+        })
+        scraper = TrackerScraper(max_workers=2)
+        try:
+            torrents = {hashes[0]: ['http://a/announce'], hashes[1]: ['http://a/announce']}
+            assert scraper.scrape(torrents) == {hashes[0]: 5, hashes[1]: 0}
+            assert mocked_request.call_count == 1, 'Both hashes should be scraped in one request'
+            # Reruns are answered from the cache
+            assert scraper.scrape(torrents) == {hashes[0]: 5, hashes[1]: 0}
+            assert mocked_request.call_count == 1
+        finally:
+            scraper.shutdown()
+
+    @mock.patch('flexget.utils.requests.get')
+    def test_scraper_falls_back_to_single_requests(self, mocked_request):
+        from flexget.components.bittorrent.torrent_alive import TrackerScraper
+
+        def scrape(url):
+            response = mock.Mock()
+            if url.count('info_hash=') > 1:
+                response.content = b'de'
+            else:
+                response.content = bencode({'files': {'mangled': {'complete': 3}}})
+            return response
+
+        mocked_request.side_effect = scrape
+        scraper = TrackerScraper(max_workers=1)
+        try:
+            torrents = {'AA' * 20: ['http://a/announce'], 'BB' * 20: ['http://a/announce']}
+            assert scraper.scrape(torrents) == {'AA' * 20: 3, 'BB' * 20: 3}
+            assert mocked_request.call_count == 3
+            # Batched scrapes are tried again once the tracker is no longer marked
+            scraper._single_only = TimedDict('0 seconds')
+            scraper._cache.clear()
+            scraper.scrape(torrents)
+            assert mocked_request.call_count == 6
+        finally:
+            scraper.shutdown()
+
+    def test_scraper_broken_tracker(self):
+        from flexget.components.bittorrent import torrent_alive
+
+        def seeds(url, info_hashes):
+            if url.startswith('udp'):
+                raise struct.error('unpack requires a buffer of 16 bytes')
+            return {}
+
+        scraper = torrent_alive.TrackerScraper(max_workers=2)
+        torrents = {'AA' * 20: ['udp://a:80/announce', 'http://b/announce']}
+        try:
+            with mock.patch.object(torrent_alive, 'get_tracker_seeds_many', side_effect=seeds):
+                assert scraper.scrape(torrents) == {'AA' * 20: 0}
+            # Trackers which did not answer are not cached
+            with mock.patch.object(
+                torrent_alive, 'get_tracker_seeds_many', return_value={'AA' * 20: 4}
+            ) as get_seeds:
+                assert scraper.scrape(torrents) == {'AA' * 20: 4}
+                assert get_seeds.call_count == 2
+        finally:
+            scraper.shutdown()
+
 
 class TestRtorrentMagnet:
     __tmp__ = True
@@ -342,3 +432,100 @@ class TestRtorrentMagnet:
             fullpath.read_text()
             == 'd10:magnet-uri76:magnet:?xt=urn:btih:HASH&dn=title&tr=http://torrent.ubuntu.com:6969/announcee'
         )
+
+
+class TestBencode:
+    def test_round_trip(self):
+        data = {
+            'announce': 'http://localhost/announce',
+            'info': {
+                'files': [{'length': 10, 'path': ['dir', 'fïle']}, {'length': -3, 'path': ['b']}],
+                'name': 'name',
+                'pieces': b'\xff\x00\xfe',
+            },
+            'list': [[], {}, '', 0],
+        }
+        encoded = bencode(data)
+        assert encoded.startswith(b'd8:announce')
+        assert bdecode(encoded) == data
+        assert bdecode(memoryview(encoded)) == data
+
+    @pytest.mark.parametrize(
+        'data',
+        [
+            b'',
+            b'i12',
+            b'i1_0e',
+            b'ie',
+            b'd3:abc',
+            b'l',
+            b'e',
+            b'5:abc',
+            b'i1ei2e',
+            b'3a:abc',
+            b'dlee1:ae',
+        ],
+    )
+    def test_invalid(self, data):
+        with pytest.raises(SyntaxError):
+            bdecode(data)
+
+    def test_info_hash_from_original_bytes(self):
+        # Keys are not sorted, so re-encoding would produce a different info dict
+        info = b'd4:name4:test6:lengthi5e12:piece lengthi16e6:pieces0:e'
+        torrent = Torrent(b'd8:announce9:http://a/4:info' + info + b'e')
+        assert torrent.info_hash == hashlib.sha1(info).hexdigest().upper()
+        assert torrent.name == 'test'
+        assert torrent.size == 5
+
+        torrent.content['info']['private'] = 1
+        torrent.modified = True
+        assert (
+            torrent.info_hash == hashlib.sha1(bencode(torrent.content['info'])).hexdigest().upper()
+        )
+
+    def test_info_hash_matches_reencoded(self):
+        torrent = Torrent((Path(__file__).parent / 'multi.torrent').read_bytes())
+        assert (
+            torrent.info_hash == hashlib.sha1(bencode(torrent.content['info'])).hexdigest().upper()
+        )
+        assert bdecode(torrent.encode()) == torrent.content
+
+
+class TestTorrentMetadataCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        metadata_cache.clear()
+        yield
+        metadata_cache.clear()
+
+    def test_cached_torrent_is_not_decoded(self):
+        data = (Path(__file__).parent / 'multi.torrent').read_bytes()
+        first = Torrent(data)
+        second = Torrent(data)
+        assert second._content is None
+        for attr in ('info_hash', 'name', 'size', 'trackers', 'private', 'is_multi_file'):
+            assert getattr(first, attr) == getattr(second, attr)
+        assert first.get_filelist() == second.get_filelist()
+        assert second._content is None
+        assert second.encode() == data.strip()
+        assert metadata_cache.get_by_info_hash(first.info_hash.lower()).name == first.name
+
+        # Accessing content decodes lazily, and changes are reflected from then on
+        second.add_multitracker('http://new/announce')
+        assert 'http://new/announce' in second.trackers
+        assert 'http://new/announce' not in Torrent(data).trackers
+
+    def test_cache_is_bounded(self):
+        cache = TorrentMetadataCache(max_size=2)
+        for i in range(3):
+            cache.add(bytes([i]), TorrentMetadata(str(i), 'name', 0, (), (), False, False, 1))
+        assert len(cache) == 2
+        assert cache.get(bytes([0])) is None
+        assert cache.get_by_info_hash('0') is None
+        assert cache.get_by_info_hash('2').info_hash == '2'
+
+    def test_torrent_without_info(self):
+        torrent = Torrent(b'd10:magnet-uri8:magnet:?e')
+        assert len(metadata_cache) == 0
+        assert torrent.content == {'magnet-uri': 'magnet:?'}
@@ -0,0 +1,174 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from flexget.plugins.input.torznab import persist
+from flexget.utils.requests import request_count
+
+CAPS = """<?xml version="1.0" encoding="UTF-8"?>
+<caps>
+  <searching>
+    <search available="yes" supportedParams="q"/>
+    <tv-search available="yes" supportedParams="q,season,ep"/>
+  </searching>
+  <categories><category id="5000" name="TV"/></categories>
+</caps>"""
+
+RESULTS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:torznab="http://torznab.com/schemas/2015/feed">
+  <channel>
+    <item>
+      <title>{title}</title>
+      <enclosure url="http://localhost/{title}.torrent" length="1000" type="application/x-bittorrent"/>
+      <torznab:attr name="seeders" value="5"/>
+    </item>
+  </channel>
+</rss>"""
+
+
+class FakeTorznab(ThreadingHTTPServer):
+    """Torznab indexers at /<name>/api, /broken/api fails. Searches take a while to answer."""
+
+    daemon_threads = True
+    delay = 0.2
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), TorznabHandler)
+        self.requests = []
+        self.lock = threading.Lock()
+        # Searches being answered and the most at once, by indexer and overall
+        self.active = {}
+        self.peak = {}
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_port}'
+
+    def searching(self, indexer, change):
+        with self.lock:
+            self.active[indexer] = self.active.get(indexer, 0) + change
+            for key, count in ((indexer, self.active[indexer]), (None, sum(self.active.values()))):
+                self.peak[key] = max(self.peak.get(key, 0), count)
+
+
+class TorznabHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlsplit(self.path)
+        indexer = url.path.split('/')[1]
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        with self.server.lock:
+            self.server.requests.append((indexer, query['t']))
+        if indexer == 'broken':
+            self.send_error(500)
+            return
+        if query['t'] == 'caps':
+            body = CAPS
+        else:
+            self.server.searching(indexer, 1)
+            time.sleep(self.server.delay)
+            self.server.searching(indexer, -1)
+            body = RESULTS.format(title=f'{query["q"]}.{indexer}')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml')
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTorznab:
+    _config = """
+        tasks:
+          test_indexers:
+            discover: &discover
+              interval: 0 seconds
+              release_estimations: ignore
+              what:
+              - mock:
+                - title: Foo
+                  search_strings: [Foo.S01E01, Foo.1x01]
+              from:
+              - torznab:
+                  website: [__server__/alpha, __server__/beta]
+                  apikey: key
+                  max_connections: 1
+          test_broken_indexer:
+            discover:
+              <<: *discover
+              from:
+              - torznab:
+                  website: [__server__/broken, __server__/alpha]
+                  apikey: key
+          test_all_broken:
+            discover:
+              <<: *discover
+              from:
+              - torznab:
+                  website: __server__/broken
+                  apikey: key
+    """
+
+    @pytest.fixture
+    def server(self):
+        # A new port for every test, so no capabilities are cached yet
+        server = FakeTorznab()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def config(self, server):
+        """Point the indexers to the fake server."""
+        return self._config.replace('__server__', server.url)
+
+    @pytest.fixture
+    def no_requests(self):
+        """Allow requests, searches go to the fake torznab server."""
+
+    def test_concurrent_indexers(self, execute_task, server):
+        task = execute_task('test_indexers')
+        assert sorted(e['title'] for e in task.entries) == [
+            'Foo.1x01.alpha',
+            'Foo.1x01.beta',
+            'Foo.S01E01.alpha',
+            'Foo.S01E01.beta',
+        ]
+        assert task.find_entry(title='Foo.S01E01.beta')['torrent_seeds'] == 5
+        # Indexers are searched at the same time, each with a single connection
+        assert server.peak == {'alpha': 1, 'beta': 1, None: 2}
+
+    def test_requests_counted(self, execute_task, server):
+        # Searches made by the indexer threads count towards the thread running the task
+        before = request_count()
+        execute_task('test_indexers')
+        assert request_count() - before == len(server.requests) == 6
+
+    def test_caps_cached(self, execute_task, server):
+        execute_task('test_indexers')
+        execute_task('test_indexers')
+        assert sorted(r for r in server.requests if r[1] == 'caps') == [
+            ('alpha', 'caps'),
+            ('beta', 'caps'),
+        ]
+
+        # Fetched again once expired
+        cached = persist[f'{server.url}/alpha']
+        cached['fetched'] = datetime.now() - timedelta(days=2)
+        server.requests.clear()
+        execute_task('test_indexers')
+        assert [r for r in server.requests if r[1] == 'caps'] == [('alpha', 'caps')]
+
+    def test_broken_indexer(self, execute_task):
+        task = execute_task('test_broken_indexer')
+        assert sorted(e['title'] for e in task.entries) == ['Foo.1x01.alpha', 'Foo.S01E01.alpha']
+
+    def test_all_broken(self, execute_task):
+        task = execute_task('test_all_broken')
+        assert not task.entries
@@ -1,7 +1,10 @@
+from datetime import datetime, timedelta
 from unittest import mock
 
 import pytest
 
+from flexget.utils.client_mirror import ClientMirror
+
 
 @pytest.mark.require_optional_deps
 @mock.patch('flexget.plugins.clients.transmission.transmission_rpc')
@@ -23,6 +26,24 @@ class TestTransmissionTorrentPlugin:
                       - z
                       - aaa
                       - "{{title}}"
+            pause:
+                mock:
+                    - {title: 'title2', url: 'url2', torrent_info_hash: 'BBBB'}
+                accept_all: yes
+                transmission:
+                    host: localhost
+                    action: pause
+            input_fields:
+                from_transmission:
+                    host: remote
+                    fields:
+                      - status
+            incremental:
+                from_transmission:
+                    host: remote
+                    fields:
+                      - status
+                    incremental: yes
     """
 
     def test_output_labels_order(self, mocked_transmission, execute_task):
@@ -38,3 +59,83 @@ class TestTransmissionTorrentPlugin:
         mocked_client.change_torrent.assert_called_with(
             '321', labels=['3', '1', 'z', 'aaa', 'title1']
         )
+
+    def test_output_finds_loaded_torrent_by_hash(self, mocked_transmission, execute_task):
+        mocked_client = mocked_transmission.Client.return_value
+        torrents = []
+        for torrent_id, info_hash in enumerate(['AAAA', 'BBBB', 'CCCC']):
+            torrent = mock.Mock()
+            torrent.id = torrent_id
+            torrent.hashString = info_hash.lower()
+            torrents.append(torrent)
+        mocked_client.get_torrents.return_value = torrents
+
+        execute_task('pause')
+
+        mocked_client.get_torrents.assert_called_once_with(
+            arguments=['downloadDir', 'hashString', 'id', 'name', 'status', 'totalSize']
+        )
+        mocked_client.stop_torrent.assert_called_once_with([1])
+
+    def test_snapshot_dropped_after_task(self, mocked_transmission, execute_task):
+        from flexget.plugins.clients.transmission import _snapshots
+
+        mocked_client = mocked_transmission.Client.return_value
+        mocked_client.get_torrents.return_value = []
+
+        task = execute_task('pause')
+
+        assert task not in _snapshots
+
+    def test_input_fields(self, mocked_transmission, execute_task):
+        mocked_client = mocked_transmission.Client.return_value
+        torrent = mock.Mock()
+        torrent.name = 'torrent1'
+        torrent.hashString = 'abcd'
+        torrent.total_size = 100
+        torrent.status = 'seeding'
+        mocked_client.get_torrents.return_value = [torrent]
+
+        task = execute_task('input_fields')
+
+        mocked_client.get_torrents.assert_called_once_with(
+            arguments=['hashString', 'id', 'name', 'status', 'torrentFile', 'totalSize']
+        )
+        entry = task.find_entry(title='torrent1')
+        assert entry['transmission_status'] == 'seeding'
+        assert 'transmission_trackers' not in entry
+
+    def test_input_incremental(self, mocked_transmission, execute_task):
+        from transmission_rpc import Torrent
+
+        def torrent(torrent_id, status):
+            return Torrent(
+                fields={
+                    'id': torrent_id,
+                    'hashString': f'hash{torrent_id}',
+                    'name': f'torrent{torrent_id}',
+                    'status': status,
+                    'totalSize': 100,
+                    'torrentFile': f'/torrents/{torrent_id}.torrent',
+                }
+            )
+
+        mocked_transmission.Torrent = Torrent
+        mocked_client = mocked_transmission.Client.return_value
+        mocked_client.get_torrents.return_value = [torrent(1, 4), torrent(2, 4)]
+        task = execute_task('incremental')
+        assert len(task.all_entries) == 2
+
+        # Shortly after the last run, transmission tells which torrents were recently active
+        mocked_client.get_recently_active_torrents.return_value = ([torrent(2, 6)], [])
+        task = execute_task('incremental')
+        assert [e['title'] for e in task.all_entries] == ['torrent2']
+        assert task.all_entries[0]['transmission_status'] == 'seeding'
+
+        # Later on the whole session is compared with the mirror
+        mirror = next(iter(ClientMirror._mirrors.values()))
+        mirror.synced_at = datetime.now() - timedelta(minutes=10)
+        mocked_client.get_torrents.return_value = [torrent(2, 6), torrent(3, 4)]
+        task = execute_task('incremental')
+        assert [e['title'] for e in task.all_entries] == ['torrent3']
+        assert list(mirror.torrents) == ['hash2', 'hash3']
@@ -95,6 +95,44 @@ class TestURLRewriters:
         )
 
 
+class TestRewriterDispatch:
+    config = """
+        tasks:
+          test:
+            mock:
+              - {title: 'nyaa', url: 'https://www.nyaa.si/view/15'}
+              - {title: 'cinemageddon', url: 'http://cinemageddon.net/details.php?id=1234'}
+              - {title: 'magnet', url: 'magnet:?xt=urn:btih:38527C88CFE76411EF0C20FDF36B84DFE2C2D210'}
+    """
+
+    @pytest.fixture
+    def asked(self, monkeypatch):
+        asked = []
+        for name in ('nyaa', 'cinemageddon', 'piratebay'):
+            instance = get_plugin_by_name(name).instance
+
+            def url_rewritable(task, entry, name=name, original=instance.url_rewritable):
+                asked.append((name, entry['title']))
+                return original(task, entry)
+
+            monkeypatch.setattr(instance, 'url_rewritable', url_rewritable)
+        return asked
+
+    def test_dispatch_by_domain(self, execute_task, asked):
+        task = execute_task('test')
+        urlrewriting = get_plugin_by_name('urlrewriting').instance
+        for entry in task.entries:
+            assert urlrewriting.url_rewritable(task, entry) == (entry['title'] != 'magnet')
+        # piratebay does not declare its domains, it handles configurable mirrors
+        assert sorted(asked) == [
+            ('cinemageddon', 'cinemageddon'),
+            ('nyaa', 'nyaa'),
+            ('piratebay', 'cinemageddon'),
+            ('piratebay', 'magnet'),
+            ('piratebay', 'nyaa'),
+        ]
+
+
 class TestRegexpurlrewriter:
     # TODO: this test is broken?
 
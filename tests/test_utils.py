@@ -2,8 +2,9 @@ from datetime import datetime
 
 import pytest
 
+from flexget.entry import Entry
 from flexget.utils import json
-from flexget.utils.tools import merge_dict_from_to, parse_filesize, split_title_year
+from flexget.utils.tools import FieldIndex, merge_dict_from_to, parse_filesize, split_title_year
 
 
 class TestJson:
@@ -131,3 +132,47 @@ class TestDictMerge:
         d2 = {'setting': 'string_2'}
         merge_dict_from_to(d1, d2)
         assert d2 == {'setting': 'string_2'}
+
+
+class TestFieldIndex:
+    values = ['Foo', 'foo', 'foo bar', 'Some Foo Bar', 'ba', '', 5, ['foo', 'x'], None]
+
+    @staticmethod
+    def brute_force(entries, probe, field, exact, case_sensitive):
+        def normalize(value):
+            return value.lower() if not case_sensitive and isinstance(value, str) else value
+
+        result = []
+        for entry in entries:
+            if field not in entry or field not in probe:
+                continue
+            v1, v2 = normalize(probe[field]), normalize(entry[field])
+            try:
+                if v1 == v2 or (not exact and (v2 in v1 or v1 in v2)):
+                    result.append(entry)
+            except TypeError:
+                pass
+        return result
+
+    @pytest.mark.parametrize('exact', [True, False])
+    @pytest.mark.parametrize('case_sensitive', [True, False])
+    def test_matches_like_comparing_all(self, exact, case_sensitive):
+        entries = [Entry(title=str(i), field=value) for i, value in enumerate(self.values)]
+        entries.append(Entry(title='no field'))
+        index = FieldIndex(entries, ['field'], exact=exact, case_sensitive=case_sensitive)
+        for probe_value in [*self.values, 'FOO BAR BAZ', 'oo', 'zzz']:
+            probe = Entry(title='probe', field=probe_value)
+            expected = self.brute_force(entries, probe, 'field', exact, case_sensitive)
+            assert [entry for entry, _ in index.matches(probe)] == expected, probe_value
+
+    def test_common_fields(self):
+        entries = [
+            Entry(title='a', url='http://a', imdb_id='tt1'),
+            Entry(title='b', url='http://a', imdb_id='tt2'),
+        ]
+        index = FieldIndex(entries, ['imdb_id', 'url'])
+        matches = index.matches(Entry(title='c', url='http://a', imdb_id='tt2'))
+        assert [(entry['title'], fields) for entry, fields in matches] == [
+            ('a', ['url']),
+            ('b', ['imdb_id', 'url']),
+        ]